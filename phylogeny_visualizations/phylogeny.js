@@ -1,7 +1,30 @@
 var selected = new Set();
-var pairwise_data = new Map();
+// directory written by pylib.pairwise.export_pairwise_mrca_index from the
+// pairwise_mrca_estimates table, generated alongside it by running
+// binder/phylogenetic-inference/phylogeny_simulation_mill.ipynb, or from an
+// existing table, from the binder/phylogenetic-inference directory, with
+//   python3 -m pylib.pairwise \
+//     a=pairwise_mrca_estimates+source=nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv.gz \
+//     a=pairwise_mrca_index+source=nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv
+var pairwise_index_dir = "../binder/phylogenetic-inference/a=pairwise_mrca_index+source=nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv/";
+var pairwise_index = d3.json(pairwise_index_dir + "index.json").then(function(index) {
+    index.taxon_codes = new Map(index.taxa.map((taxon, code) => [taxon, code]));
+    index.value_bytes = index.dtype == "<f4" ? 4 : 8;
+    // shard number -> promise of its ArrayBuffer, each fetched on first use
+    index.shard_buffers = new Map();
+    return index;
+});
+// directory written by pylib.phylogeny.export_phylogeny_layout from the
+// phylogeny CSV, generated by running
+// binder/phylogenetic-inference/phylogeny_simulation_mill.ipynb, or, from the
+// binder/phylogenetic-inference directory, with
+//   python3 -m pylib.phylogeny --extant-time 5000 \
+//     ../../data/osfstorage/phylogenetic-inference/template-phylogenies/nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv \
+//     a=phylogeny_layout+source=nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv
+var layout_dir = "../binder/phylogenetic-inference/a=phylogeny_layout+source=nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv/";
+var extant_time;
 var age_scale;
-var root;
+var nodes;
 var color_scale = d3.scaleOrdinal(d3.schemeCategory10);
 var strokeWidth = 5;
 var axis;
@@ -13,7 +36,7 @@ const svg = d3.select("svg");
 
 function update_tree() {
 
-    root.each(d => {
+    nodes.forEach(d => {
         d.y = age_scale(d.data.origin_time);
       });
 
@@ -28,7 +51,7 @@ function update_tree() {
     svg.selectAll("rect")
         .attr("width", function(d) {
             var end = d.data.destruction_time;
-            if (end == 5000) {
+            if (end == extant_time) {
                 extant[d.id] = d;
             }
             return age_scale(end) - d.y;
@@ -58,12 +81,55 @@ $(".policy_control").on("input change", function() {
     estimate = pol+diff+target;
 });
 
+// number of pairs preceding row i of the strict upper triangle
+function pair_offset(i, num_taxa) {
+    return i * (num_taxa - 1) - i * (i - 1) / 2;
+}
+
+// MRCA bounds of one taxon pair for one configuration, fetching only the
+// index shard that holds the pair
+function lookup_mrca_bounds(k1, k2, config_key) {
+    return pairwise_index.then(function(index) {
+        var c1 = index.taxon_codes.get(k1);
+        var c2 = index.taxon_codes.get(k2);
+        var config = index.configurations.indexOf(config_key);
+        if (c1 === undefined || c2 === undefined || config < 0) {
+            return null;
+        }
+        var i = Math.min(c1, c2);
+        var j = Math.max(c1, c2);
+        var shard = d3.bisectRight(index.row_boundaries, i) - 1;
+        if (!index.shard_buffers.has(shard)) {
+            index.shard_buffers.set(shard, fetch(pairwise_index_dir + index.shards[shard]).then(function(response) {
+                if (!response.ok) {
+                    index.shard_buffers.delete(shard);
+                    throw new Error("failed to fetch " + index.shards[shard]);
+                }
+                return response.arrayBuffer();
+            }));
+        }
+        return index.shard_buffers.get(shard).then(function(buffer) {
+            var num_taxa = index.taxa.length;
+            var shard_begin = pair_offset(index.row_boundaries[shard], num_taxa);
+            var num_pairs = pair_offset(index.row_boundaries[shard + 1], num_taxa) - shard_begin;
+            var position = pair_offset(i, num_taxa) - shard_begin + j - i - 1;
+            var view = new DataView(buffer);
+            // shard values have shape (configurations, 2 bounds, pairs)
+            function read(bound) {
+                var offset = ((config * 2 + bound) * num_pairs + position) * index.value_bytes;
+                return index.value_bytes == 4 ? view.getFloat32(offset, true) : view.getFloat64(offset, true);
+            }
+            return {lower_bound: read(0), upper_bound: read(1)};
+        });
+    });
+}
+
 function handle_click(event, d) {
     console.log(d);
     var sel = d3.select(this);
     if (selected.has(d.id)) {
         sel.style("fill", "black")
-           .attr("r", function(d){return d.data.destruction_time == 5000 ? 3 : 0;});
+           .attr("r", function(d){return d.data.destruction_time == extant_time ? 3 : 0;});
 
         selected.delete(d.id);
         return;
@@ -72,7 +138,7 @@ function handle_click(event, d) {
     if (selected.size >= 2) {
         d3.selectAll("circle")
           .style("fill", "black")
-          .attr("r", function(d){return d.data.destruction_time == 5000 ? 3 : 0;});
+          .attr("r", function(d){return d.data.destruction_time == extant_time ? 3 : 0;});
         selected.clear();
     }
 
@@ -84,68 +150,58 @@ function handle_click(event, d) {
         var iter = selected.keys();
         var k1 = iter.next().value;
         var k2 = iter.next().value;
-        var mrca_info = pairwise_data.get(k1).get(k2);
-        console.log(mrca_info.get(estimate));
-        svg.selectAll(".conf_int")
-           .data([mrca_info.get(estimate)])
-           .join("rect")
-           .classed("conf_int", true)
-           .attr("width", function(d) {return age_scale(d.upper_bound) - age_scale(d.lower_bound) + 1})
-           .attr("x", function(d) {return age_scale(d.lower_bound);})
-           .attr("y", 0)
-           .attr("height", 2000)
-           .style("fill", "yellow")
-           .style("fill-opacity", .2);
+        lookup_mrca_bounds(k1, k2, estimate).then(function(mrca_bounds) {
+            console.log(mrca_bounds);
+            svg.selectAll(".conf_int")
+               .data(mrca_bounds === null ? [] : [mrca_bounds])
+               .join("rect")
+               .classed("conf_int", true)
+               .attr("width", function(d) {return age_scale(d.upper_bound) - age_scale(d.lower_bound) + 1})
+               .attr("x", function(d) {return age_scale(d.lower_bound);})
+               .attr("y", 0)
+               .attr("height", 2000)
+               .style("fill", "yellow")
+               .style("fill-opacity", .2);
+        });
     }
 }
 
 
 var extant = {};
 
-function CalcOffsets(node, in_use={}) {
-    var to_remove = [];
-    for (var num in in_use) {
-        // console.log(num, in_use, in_use[num], node.data.origin_time);
-        if (in_use[num] <= node.data.origin_time) {
-            to_remove.push(num);
-            // console.log("removing");
-        }
-    }
-
-    for (var num in to_remove) {
-        delete in_use[num];
-    }
-
-    for (var i of [0, 1, -1, 2, -2, 3, -3, 4, -4, 5, -5, 6, -6, 7, -7, 8, -8, 9, -9, 10, -10]) {
-        if (!(i in in_use)) {
-            break;
-        }
-    }
-    // console.log(i, in_use);
-    node.data.offset = i;
-    in_use[i] = node.data.destruction_time;
-    if (node.children === undefined || node.children.length > 1) {
-        in_use = {};
-    }
-
-    for (var child in node.children) {
-        let new_in_use = Object.assign({}, in_use);
-        CalcOffsets(node.children[child], new_in_use);
-    }
-    // console.log(node);
+// typed array for each column dtype of layout.json, whose little-endian
+// byte order browsers share
+var typed_arrays = {"|i1": Int8Array, "<i4": Int32Array, "<f4": Float32Array, "<f8": Float64Array};
+
+// Columns of node positions, lane offsets, and times precomputed by
+// pylib.phylogeny.export_phylogeny_layout, viewed without copying
+function load_layout(dir) {
+    return d3.json(dir + "layout.json").then(function(layout) {
+        return fetch(dir + "layout.bin").then(function(response) {
+            if (!response.ok) {
+                throw new Error("failed to fetch layout.bin");
+            }
+            return response.arrayBuffer();
+        }).then(function(buffer) {
+            var columns = {};
+            for (var name in layout.columns) {
+                var info = layout.columns[name];
+                columns[name] = new typed_arrays[info.dtype](buffer, info.offset, layout.num_nodes);
+            }
+            return {
+                num_tips: layout.num_tips,
+                extant_time: layout.extant_time,
+                columns: columns
+            };
+        });
+    });
 }
 
 // Copyright 2021 Observable, Inc.
 // Released under the ISC license.
 // https://observablehq.com/@d3/tree
-function Tree(data, { // data is either tabular (array of objects) or hierarchy (nested objects)
-    path, // as an alternative to id and parentId, returns an array identifier, imputing internal nodes
-    id = Array.isArray(data) ? d => d.id : null, // if tabular data, given a d in data, returns a unique identifier (string)
-    parentId = Array.isArray(data) ? d => d.parentId : null, // if tabular data, given a node d, returns its parent’s identifier
-    children, // if hierarchical data, given a d in data, returns its children
-    tree = d3.tree, // layout algorithm (typically d3.tree or d3.cluster)
-    sort, // how to sort nodes prior to layout (e.g., (a, b) => d3.descending(a.height, b.height))
-    label, // given a node d, returns the display name
+// adapted to draw a precomputed layout
+function Tree(layout, {
     title, // given a node d, returns its hover text
     link, // given a node d, its link (if any)
     linkTarget = "_blank", // the target attribute for links (if any)
@@ -160,54 +216,44 @@ function Tree(data, { // data is either tabular (array of objects) or hierarchy
     strokeOpacity = 0.4, // stroke opacity for links
     strokeLinejoin, // stroke line join for links
     strokeLinecap, // stroke line cap for links
-    halo = "#fff", // color of label halo
-    haloWidth = 3, // padding around the labels
     axis_space = 20
   } = {}) {
 
-    age_scale = d3.scalePow().exponent(10).domain([0,5000]).range([padding, width - 2*padding]);
+    extant_time = layout.extant_time;
+    age_scale = d3.scalePow().exponent(10).domain([0, extant_time]).range([padding, width - 2*padding]);
     scale_range = age_scale.range();
     axis = d3.axisTop(age_scale)
             //  .ticks(3);
-             .tickValues([0, 4000, 4500, 4750, 5000]);
-    // If id and parentId options are specified, or the path option, use d3.stratify
-    // to convert tabular data to a hierarchy; otherwise we assume that the data is
-    // specified as an object {children} with nested objects (a.k.a. the “flare.json”
-    // format), and use d3.hierarchy.
-    root = path != null ? d3.stratify().path(path)(data)
-        : id != null || parentId != null ? d3.stratify().id(id).parentId(parentId)(data)
-        : d3.hierarchy(data, children);
-
-    // Compute labels and titles.
-    const descendants = root.descendants();
-    const L = label == null ? null : descendants.map(d => label(d.data, d));
-
-    // Sort the nodes.
-    if (sort != null) root.sort(sort);
-
-    // Compute the layout.
-    const dx = 10 + axis_space;
-    const dy = width / (root.height + padding);
-    // tree().nodeSize([dx, dy])(root);
-    tree().size([height - 2*padding - axis_space, 1])(root);
-    // tree()(root);
-
-    // Center the tree.
-    let x0 = Infinity;
-    let x1 = -x0;
-    root.each(d => {
-      if (d.x > x1) x1 = d.x;
-      if (d.x < x0) x0 = d.x;
-      //   console.log(d.y, d.data.origin_time, age_scale(d.data.origin_time));
-      d.y = age_scale(d.data.origin_time);
+             .tickValues([0, .8, .9, .95, 1].map(f => f * extant_time));
+
+    // Position nodes, tips on rows 1 through num_tips.
+    const columns = layout.columns;
+    const row_scale = d3.scaleLinear()
+        .domain([1, Math.max(layout.num_tips, 2)])
+        .range([0, height - 2*padding - axis_space]);
+    nodes = Array.from(columns.id, (id, i) => ({
+        id: String(id),
+        x: row_scale(columns.row[i]),
+        y: age_scale(columns.origin_time[i]),
+        data: {
+            origin_time: columns.origin_time[i],
+            destruction_time: columns.destruction_time[i],
+            offset: columns.offset[i]
+        }
+    }));
+    const links = [];
+    columns.parent.forEach((parent, i) => {
+        if (parent >= 0) links.push({source: nodes[parent], target: nodes[i]});
     });
 
-    CalcOffsets(root);
+    // Center the tree.
+    const dx = 10 + axis_space;
+    const [x0, x1] = d3.extent(nodes, d => d.x);
 
     // Compute the default height.
     if (height === undefined) height = x1 - x0 + dx * 2 + axis_space;
 
-    svg.attr("viewBox", [-dy * padding / 2, x0 - dx, width, height])
+    svg.attr("viewBox", [0, x0 - dx, width, height])
         .attr("width", width)
         .attr("height", height)
         // .attr("style", "max-width: 100%; height: auto; height: intrinsic;")
@@ -222,7 +268,7 @@ function Tree(data, { // data is either tabular (array of objects) or hierarchy
         .attr("stroke-linejoin", strokeLinejoin)
         .attr("stroke-width", strokeWidth)
       .selectAll("path")
-        .data(root.links())
+        .data(links)
         .join("path")
           .attr("d", d3.linkHorizontal()
               .x(d => d.y)
@@ -231,7 +277,7 @@ function Tree(data, { // data is either tabular (array of objects) or hierarchy
 
     const node = svg.append("g")
       .selectAll("a")
-      .data(root.descendants())
+      .data(nodes)
       .join("a")
         .attr("xlink:href", link == null ? null : d => link(d.data, d))
         .attr("target", link == null ? null : linkTarget)
@@ -239,16 +285,9 @@ function Tree(data, { // data is either tabular (array of objects) or hierarchy
 
     node.append("rect")
         .attr("height", strokeWidth)
-        // .attr("height", function(d) {
-        //     var end = d.data.destruction_time;
-        //     if (isNaN(end)) {
-        //         end = 5000;
-        //     }
-        //     return age_scale(end) - d.y;
-        // })
         .attr("width", function(d) {
             var end = d.data.destruction_time;
-            if (end == 5000) {
+            if (end == extant_time) {
                 extant[d.id] = d;
             }
             return age_scale(end) - d.y;
@@ -262,24 +301,13 @@ function Tree(data, { // data is either tabular (array of objects) or hierarchy
 
     node.append("circle")
         .attr("fill", fill)
-        .attr("r", function(d){return d.data.destruction_time == 5000 ? 3 : 0;})
+        .attr("r", function(d){return d.data.destruction_time == extant_time ? 3 : 0;})
         .on("click", handle_click);
 
 
     if (title != null) node.append("title")
         .text(d => title(d.data, d));
 
-    if (L) node.append("text")
-        .attr("dy", "0.32em")
-        .attr("x", d => d.children ? -6 : 6)
-        .attr("text-anchor", d => d.children ? "end" : "start")
-        .text((d, i) => L[i])
-        .call(text => text.clone(true))
-        .attr("fill", "none")
-        .attr("stroke", halo)
-        .attr("stroke-width", haloWidth);
-    // console.log(extant);
-
     axis_g = svg.append("g")
        .attr("transform", "translate(0,"+ (x0 - dx + axis_space) + ")")
        .call(axis);
@@ -294,77 +322,16 @@ function Tree(data, { // data is either tabular (array of objects) or hierarchy
     return svg.node();
   }
 
-d3.csv("../binder/phylogenetic-inference/a=pairwise_mrca_estimates+source=nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv", function(row) {
-    return {
-        from: row["Taxon Compared From"],
-        to: row["Taxon Compared To"],
-        lower_bound: +row["Generation Of MRCA Lower Bound (inclusive)"],
-        upper_bound: +row["Generation Of MRCA Upper Bound (exclusive)"],
-        confidence: +row["MRCA Bound Confidence"],
-        config: row["Column Configuration"],
-        differentia: row["Differentia Bit Width"],
-        policy: row["Stratum Retention Policy"],
-        target_bits: row["Stratigraphic Column Target Retained Bits"]
-    };
-}).then(
-    function(data){
-        // console.log("loaded");
-        for (var row of data) {
-            var config_key = row.policy + row.differentia + row.target_bits;
-            if (!pairwise_data.has(row.from)) {
-                // console.log(row);
-                pairwise_data.set(row.from, new Map([[row.to, new Map([[config_key, row]])]]));
-            } else {
-                if (!pairwise_data.get(row.from).has(row.to)) {
-                    pairwise_data.get(row.from).set(row.to, new Map([[config_key, row]]));
-                } else {
-                    pairwise_data.get(row.from).get(row.to).set(config_key, row);
-                }
-            }
-            if (!pairwise_data.has(row.to)) {
-                // console.log(row);
-                pairwise_data.set(row.to, new Map([[row.from, new Map([[config_key, row]])]]));
-            } else {
-                if (!pairwise_data.get(row.to).has(row.from)) {
-                    pairwise_data.get(row.to).set(row.from, new Map([[config_key, row]]));
-                } else {
-                    pairwise_data.get(row.to).get(row.from).set(config_key, row);
-                }
-            }
-        }
-    }
-).then( function(orig_data) {
-    // d3.csv("example.csv", function(data){
-    //
-    // d3.csv("https://files.osf.io/v1/resources/4sm72/providers/osfstorage/6218eef419ba8b044ae128ba",
-    d3.csv("../data/osfstorage/phylogenetic-inference/template-phylogenies/nk_randomselection_seed7_pop100_mut.01_snapshot_5000.csv",
-    function(d) {
-        return {
-            id: d.id,
-            parentId: d.ancestor_list == "[NONE]" ? null : JSON.parse(d.ancestor_list)[0],
-            origin_time: +d.origin_time,
-            destruction_time: isNaN(+d.destruction_time) ? 5000 : +d.destruction_time
-        };
-    }
-    ).then(
-        function(data) {
-            // console.log(pairwise_data);
-            var chart = Tree(data, {
-                // id: function(d){return d.id},
-                // parentId: function(d){
-                //     if (d.ancestor_list == "[NONE]") {
-                //         return null;
-                //     }
-                //     return JSON.parse(d.ancestor_list)[0];
-                // },
-                width: 1500,
-                height: 800,
-                padding: 10,
-                fill: "black",
-                axis_space: 40,
-                strokeWidth: strokeWidth
-            });
+load_layout(layout_dir).then(
+    function(layout) {
+        var chart = Tree(layout, {
+            width: 1500,
+            height: 800,
+            padding: 10,
+            fill: "black",
+            axis_space: 40,
+            strokeWidth: strokeWidth
+        });
 
-        }
-    );
-});
+    }
+);
@@ -1,7 +1,10 @@
-from .draw_biopython_tree_with_origin_time_bounds \
-    import draw_biopython_tree_with_origin_time_bounds
+from .helpers import install_lazy_attrs
 
 # adapted from https://stackoverflow.com/a/31079085
 __all__ = [
     'draw_biopython_tree_with_origin_time_bounds',
 ]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
@@ -0,0 +1,98 @@
+import typing
+
+from matplotlib import artist as mpartist
+from matplotlib import text as mptext
+from matplotlib import transforms as mptransforms
+import numpy as np
+
+
+class TextCollection(mpartist.Artist):
+    """Single artist that draws many text labels.
+
+    Adding a separate `matplotlib.text.Text` to the axes for every label scales
+    poorly for trees with many tips. This artist instead stores label positions,
+    strings, and colors as arrays and draws each label through one reusable
+    `Text` instance at render time.
+    """
+
+    def __init__(
+        self: 'TextCollection',
+        x: typing.Sequence[float],
+        y: typing.Sequence[float],
+        texts: typing.Sequence[str],
+        colors: typing.Optional[typing.Sequence[typing.Any]]=None,
+        **text_kwargs,
+    ) -> None:
+        """Construct the collection.
+
+        Parameters
+        ----------
+        x : sequence of float
+            Horizontal positions of labels, in data coordinates.
+        y : sequence of float
+            Vertical positions of labels, in data coordinates.
+        texts : sequence of str
+            Label strings.
+        colors : sequence of matplotlib colors, optional
+            Per-label colors. If None, all labels are drawn in the color given
+            by `text_kwargs` (black by default).
+        **text_kwargs
+            Properties shared by all labels, forwarded to `matplotlib.text.Text`
+            (e.g., `fontsize`, `verticalalignment`). As with `Axes.text`,
+            `clip_on` defaults to False.
+        """
+        super(TextCollection, self).__init__()
+        self._x = np.asarray(x, dtype=float)
+        self._y = np.asarray(y, dtype=float)
+        self._texts = list(texts)
+        assert len(self._x) == len(self._y) == len(self._texts)
+        self._colors = None if colors is None else list(colors)
+        assert self._colors is None or len(self._colors) == len(self._texts)
+        # like Axes.text, labels are not clipped to the axes by default
+        clip_on = text_kwargs.pop('clip_on', False)
+        self._text = mptext.Text(**text_kwargs)
+        self.set_zorder(self._text.get_zorder())
+        self.set_clip_on(clip_on)
+
+    def __len__(self: 'TextCollection') -> int:
+        return len(self._texts)
+
+    def _iter_texts(self: 'TextCollection') -> typing.Iterator[mptext.Text]:
+        """Yield the shared Text instance configured for each label in turn."""
+        text = self._text
+        text.set_figure(self.figure)
+        text.set_transform(self.get_transform())
+        text.set_clip_on(self.get_clip_on())
+        text.set_clip_box(self.get_clip_box())
+        text.set_clip_path(self.get_clip_path())
+        text.set_alpha(self.get_alpha())
+        for i, label in enumerate(self._texts):
+            text.set_position((self._x[i], self._y[i]))
+            text.set_text(label)
+            if self._colors is not None:
+                text.set_color(self._colors[i])
+            yield text
+
+    @mpartist.allow_rasterization
+    def draw(self: 'TextCollection', renderer) -> None:
+        """Draw all labels."""
+        if not self.get_visible():
+            return
+        renderer.open_group('textcollection', gid=self.get_gid())
+        for text in self._iter_texts():
+            text.draw(renderer)
+        renderer.close_group('textcollection')
+        self.stale = False
+
+    def get_window_extent(
+        self: 'TextCollection',
+        renderer=None,
+    ) -> mptransforms.Bbox:
+        """Union of window extents of all labels."""
+        bboxes = [
+            text.get_window_extent(renderer)
+            for text in self._iter_texts()
+        ]
+        if not bboxes:
+            return mptransforms.Bbox.null()
+        return mptransforms.Bbox.union(bboxes)
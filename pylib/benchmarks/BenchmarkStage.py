@@ -0,0 +1,13 @@
+import typing
+
+
+class BenchmarkStage(typing.NamedTuple):
+    """A unit of work to time and memory-profile across tree sizes."""
+
+    name: str
+    # largest number of tips to benchmark, e.g., for quadratic stages
+    max_num_tips: int
+    # given number of tips, imbalance, and seed, prepares arguments for run
+    setup: typing.Callable[[int, float, int], typing.Tuple]
+    # the work measured
+    run: typing.Callable[..., typing.Any]
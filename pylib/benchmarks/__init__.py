@@ -0,0 +1,15 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'BenchmarkStage',
+    'compare_benchmarks',
+    'default_benchmark_stages',
+    'make_synthetic_pairwise_mrca_table',
+    'make_synthetic_tree',
+    'run_benchmarks',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
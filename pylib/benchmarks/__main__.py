@@ -0,0 +1,82 @@
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from .compare_benchmarks import compare_benchmarks
+from .default_benchmark_stages import default_benchmark_stages
+from .run_benchmarks import run_benchmarks
+
+parser = argparse.ArgumentParser(
+    prog='python3 -m pylib.benchmarks',
+    description='Time and memory-profile pylib stages over synthetic trees, '
+    'optionally flagging regressions against a baseline run.',
+)
+parser.add_argument(
+    '--sizes', type=int, nargs='+',
+    default=[10**2, 10**3, 10**4, 10**5, 10**6],
+    help='numbers of tips to benchmark (default: 10^2 to 10^6)',
+)
+parser.add_argument(
+    '--imbalances', type=float, nargs='+', default=[0.0, 1.0],
+    help='tree shapes, from 0 (balanced) to 1 (caterpillar)',
+)
+parser.add_argument(
+    '--stages', nargs='+', default=None,
+    help='names of stages to benchmark (default: all)',
+)
+parser.add_argument(
+    '--max-tips', type=int, default=None,
+    help='skip sizes above this, for all stages',
+)
+parser.add_argument('--repeats', type=int, default=3)
+parser.add_argument(
+    '--output', default='benchmarks.csv', help='results CSV path',
+)
+parser.add_argument(
+    '--baseline', default=None,
+    help='baseline results CSV to compare against; '
+    'written from this run if it does not exist',
+)
+parser.add_argument(
+    '--tolerance', type=float, default=0.25,
+    help='fractional slowdown or memory growth flagged as a regression',
+)
+args = parser.parse_args()
+
+stages = [
+    stage for stage in default_benchmark_stages
+    if args.stages is None or stage.name in args.stages
+]
+
+results = run_benchmarks(
+    sizes=args.sizes,
+    imbalances=args.imbalances,
+    stages=stages,
+    max_num_tips=args.max_tips,
+    repeats=args.repeats,
+    progress_callback=lambda row: print(*row.values(), flush=True),
+)
+results.to_csv(args.output, index=False)
+
+if args.baseline is None:
+    sys.exit(0)
+if not os.path.exists(args.baseline):
+    results.to_csv(args.baseline, index=False)
+    print(f'saved baseline {args.baseline}')
+    sys.exit(0)
+
+comparison = compare_benchmarks(
+    results, pd.read_csv(args.baseline), tolerance=args.tolerance,
+)
+print(comparison.to_string())
+regressions = comparison[comparison['Regression']]
+for __, row in regressions.iterrows():
+    print(
+        f'regression {row["Stage"]} {row["Num Tips"]} tips '
+        f'imbalance {row["Imbalance"]}: '
+        f'{row["Seconds Ratio"]:.2f}x time, '
+        f'{row["Peak Bytes Ratio"]:.2f}x peak memory',
+    )
+sys.exit(1 if len(regressions) else 0)
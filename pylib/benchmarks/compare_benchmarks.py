@@ -0,0 +1,43 @@
+import pandas as pd
+
+
+def compare_benchmarks(
+    results: pd.DataFrame,
+    baseline: pd.DataFrame,
+    *,
+    tolerance: float=0.25,
+    min_seconds: float=0.01,
+    min_bytes: int=2**20,
+) -> pd.DataFrame:
+    """Compare `run_benchmarks` results against a saved baseline run.
+
+    A measurement regresses if it exceeds the baseline by more than
+    `tolerance`, as a fraction of the baseline, and by more than an absolute
+    noise floor, `min_seconds` for time or `min_bytes` for memory.
+
+    Returns
+    -------
+    pd.DataFrame
+        `results`, with columns 'Baseline Seconds' and 'Baseline Peak Bytes'
+        (NaN where the baseline has no matching stage, size, and shape),
+        'Seconds Ratio', 'Peak Bytes Ratio', and 'Regression'.
+    """
+    keys = ['Stage', 'Num Tips', 'Imbalance']
+    res = results.merge(
+        baseline[[*keys, 'Seconds', 'Peak Bytes']].rename(columns={
+            'Seconds': 'Baseline Seconds',
+            'Peak Bytes': 'Baseline Peak Bytes',
+        }),
+        on=keys,
+        how='left',
+    )
+    res['Seconds Ratio'] = res['Seconds'] / res['Baseline Seconds']
+    res['Peak Bytes Ratio'] = res['Peak Bytes'] / res['Baseline Peak Bytes']
+    res['Regression'] = (
+        (res['Seconds Ratio'] > 1 + tolerance)
+        & (res['Seconds'] - res['Baseline Seconds'] > min_seconds)
+    ) | (
+        (res['Peak Bytes Ratio'] > 1 + tolerance)
+        & (res['Peak Bytes'] - res['Baseline Peak Bytes'] > min_bytes)
+    )
+    return res
@@ -0,0 +1,88 @@
+from ..draw_biopython_tree_with_origin_time_bounds \
+    import draw_biopython_tree_with_origin_time_bounds
+from .BenchmarkStage import BenchmarkStage
+from ..reconstruction import calc_pairwise_mrca_matrices_from_dataframe
+from ..reconstruction import construct_upgma_tree
+from ..treecompare import BipartitionIndex
+from ..tree_layout import calc_tree_layout
+from .make_synthetic_pairwise_mrca_table \
+    import make_synthetic_pairwise_mrca_table
+from .make_synthetic_tree import make_synthetic_tree
+
+
+def _setup_tree(num_tips, imbalance, seed):
+    return (make_synthetic_tree(num_tips, imbalance, seed),)
+
+
+def _draw_tree(tree):
+    # only needed to draw
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 8), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    draw_biopython_tree_with_origin_time_bounds(
+        tree,
+        axes=fig.add_subplot(1, 1, 1),
+        do_show=False,
+        batch_artists=True,
+        level_of_detail=True,
+        layout_cache=None,
+    )
+    canvas.draw()
+
+
+def _setup_table(num_tips, imbalance, seed):
+    return (make_synthetic_pairwise_mrca_table(num_tips, imbalance, seed),)
+
+
+def _setup_distance_matrix(num_tips, imbalance, seed):
+    matrices, labels = calc_pairwise_mrca_matrices_from_dataframe(
+        make_synthetic_pairwise_mrca_table(num_tips, imbalance, seed),
+    )
+    return matrices.distance_matrix, labels
+
+
+def _get_tree_arrays(tree):
+    layout = calc_tree_layout(tree)
+    return (
+        layout.parent_ids,
+        [clade.branch_length for clade in layout.clades],
+        [clade.name for clade in layout.clades],
+    )
+
+
+def _setup_tree_comparison(num_tips, imbalance, seed):
+    # same taxa, independently shuffled over the same shape
+    return (
+        _get_tree_arrays(make_synthetic_tree(num_tips, imbalance, seed)),
+        _get_tree_arrays(make_synthetic_tree(num_tips, imbalance, seed + 1)),
+    )
+
+
+def _compare_trees(reference, candidate):
+    return BipartitionIndex(*reference).score(*candidate)
+
+
+# stages of the tree rendering and reconstruction pipeline
+default_benchmark_stages = [
+    BenchmarkStage(
+        'calc_tree_layout', 10**6, _setup_tree, calc_tree_layout,
+    ),
+    BenchmarkStage('draw_tree', 10**5, _setup_tree, _draw_tree),
+    BenchmarkStage(
+        'calc_pairwise_mrca_matrices',
+        10**3,
+        _setup_table,
+        calc_pairwise_mrca_matrices_from_dataframe,
+    ),
+    BenchmarkStage(
+        'construct_upgma_tree',
+        10**3,
+        _setup_distance_matrix,
+        construct_upgma_tree,
+    ),
+    BenchmarkStage(
+        'compare_trees', 10**4, _setup_tree_comparison, _compare_trees,
+    ),
+]
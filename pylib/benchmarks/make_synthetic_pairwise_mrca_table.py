@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from .make_synthetic_tree import make_synthetic_tree
+from ..reconstruction import LcaIndex
+
+
+def make_synthetic_pairwise_mrca_table(
+    num_tips: int,
+    imbalance: float=0.0,
+    seed: int=1,
+    missing_fraction: float=0.05,
+) -> pd.DataFrame:
+    """Generate a pairwise MRCA estimates table, with one row per unordered
+    pair of tips of `make_synthetic_tree(num_tips, imbalance, seed)`, for
+    benchmarking.
+
+    MRCA generation bounds enclose the true MRCA origin time, widened by up
+    to 2 generations either side. For a random `missing_fraction` of pairs,
+    bounds are missing (NaN), as if the MRCA preceded the earliest
+    detectable rank. Columns are those read by
+    `calc_pairwise_mrca_matrices_from_dataframe`.
+    """
+    rng = np.random.default_rng(seed)
+    index = LcaIndex(make_synthetic_tree(num_tips, imbalance, seed))
+    origin_times = np.array([clade.origin_time for clade in index.clades])
+    tip_ids = np.array([
+        node_id for node_id, clade in enumerate(index.clades)
+        if not clade.clades
+    ])
+    tip_names = np.array([index.clades[tip_id].name for tip_id in tip_ids])
+
+    from_tips, to_tips = np.triu_indices(len(tip_ids), 1)
+    mrca_times = origin_times[
+        index.calc_lca(tip_ids[from_tips], tip_ids[to_tips])
+    ]
+    num_pairs = len(mrca_times)
+    is_missing = rng.random(num_pairs) < missing_fraction
+    mrca_lbs = np.maximum(mrca_times - rng.integers(0, 3, num_pairs), 0)
+    mrca_ubs = mrca_times + 1 + rng.integers(0, 3, num_pairs)
+
+    return pd.DataFrame({
+        'Taxon Compared From': tip_names[from_tips],
+        'Taxon Compared To': tip_names[to_tips],
+        'Generation Of MRCA Lower Bound (inclusive)':
+            np.where(is_missing, np.nan, mrca_lbs),
+        'Generation Of MRCA Upper Bound (exclusive)':
+            np.where(is_missing, np.nan, mrca_ubs),
+        'Rank of Earliest Detectable Mrca With':
+            mrca_times + rng.integers(1, 10, num_pairs),
+        'Generation of Taxon Compared From':
+            origin_times[tip_ids[from_tips]],
+        'Generation of Taxon Compared To': origin_times[tip_ids[to_tips]],
+    })
@@ -0,0 +1,66 @@
+import collections
+
+from Bio.Phylo import BaseTree
+import numpy as np
+
+
+def make_synthetic_tree(
+    num_tips: int,
+    imbalance: float=0.0,
+    seed: int=1,
+) -> BaseTree.Tree:
+    """Generate a random bifurcating Biopython tree, with origin time bounds
+    on every clade, for benchmarking.
+
+    The tree is built by merging pending subtrees. Each merge joins the two
+    oldest pending subtrees with probability 1 - `imbalance`, which gives a
+    balanced tree when `imbalance` is 0, and otherwise joins the newest
+    subtree with the oldest, which gives a caterpillar when `imbalance` is 1.
+    No step recurses, so caterpillars of any size can be generated.
+
+    Branch lengths are whole generations between 1 and 10. Each clade
+    carries its true `origin_time`, its depth below the root, and bounds
+    `origin_time_lb` and `origin_time_ub` up to 2 generations either side of
+    it. Tips are named '0' to `num_tips` - 1, in random order.
+    """
+    assert num_tips >= 1
+    rng = np.random.default_rng(seed)
+    num_nodes = 2 * num_tips - 1
+
+    # tips are nodes 0 to num_tips - 1, and merge k creates node num_tips + k
+    parents = [-1] * num_nodes
+    pending = collections.deque(range(num_tips))
+    for node, coin in enumerate(rng.random(num_tips - 1), start=num_tips):
+        if coin < imbalance:
+            children = pending.pop(), pending.popleft()
+        else:
+            children = pending.popleft(), pending.popleft()
+        for child in children:
+            parents[child] = node
+        pending.append(node)
+
+    branch_lengths = rng.integers(1, 11, num_nodes).tolist()
+    branch_lengths[-1] = 0
+    # parents are created after their children, so visit in reverse
+    origin_times = [0] * num_nodes
+    for node in reversed(range(num_nodes - 1)):
+        origin_times[node] = origin_times[parents[node]] \
+            + branch_lengths[node]
+
+    names = rng.permutation(num_tips).astype(str).tolist()
+    lb_offsets = (2 * rng.random(num_nodes)).tolist()
+    ub_offsets = (2 * rng.random(num_nodes)).tolist()
+    clades = []
+    for node in range(num_nodes):
+        clade = BaseTree.Clade(
+            branch_length=branch_lengths[node],
+            name=names[node] if node < num_tips else None,
+        )
+        clade.origin_time = origin_times[node]
+        clade.origin_time_lb = origin_times[node] - lb_offsets[node]
+        clade.origin_time_ub = origin_times[node] + ub_offsets[node]
+        clades.append(clade)
+    for node in range(num_nodes - 1):
+        clades[parents[node]].clades.append(clades[node])
+
+    return BaseTree.Tree(root=clades[-1], rooted=True)
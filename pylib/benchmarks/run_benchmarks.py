@@ -0,0 +1,99 @@
+import gc
+import time
+import typing
+
+import pandas as pd
+
+from .BenchmarkStage import BenchmarkStage
+from .default_benchmark_stages import default_benchmark_stages
+from ..helpers import ProfilingRegistry
+
+
+def run_benchmarks(
+    *,
+    sizes: typing.Sequence[int]=(10**2, 10**3, 10**4, 10**5, 10**6),
+    imbalances: typing.Sequence[float]=(0.0, 1.0),
+    stages: typing.Optional[typing.Sequence[BenchmarkStage]]=None,
+    max_num_tips: typing.Optional[int]=None,
+    repeats: int=3,
+    seed: int=1,
+    progress_callback: typing.Optional[
+        typing.Callable[[typing.Dict[str, typing.Any]], None]
+    ]=None,
+) -> pd.DataFrame:
+    """Time and memory-profile each stage over a ladder of synthetic tree
+    sizes and shapes.
+
+    Each stage is run `repeats` times untraced to measure wall time, then
+    once more with tracemalloc to measure peak memory, so tracing overhead
+    does not inflate timings. Inputs are generated by each stage's setup
+    outside of measurement. Sizes above a stage's `max_num_tips` are
+    skipped.
+
+    Parameters
+    ----------
+    sizes : sequence of int
+        Numbers of tips to benchmark.
+    imbalances : sequence of float
+        Tree shapes to benchmark, from 0 (balanced) to 1 (caterpillar). See
+        `make_synthetic_tree`.
+    stages : sequence of BenchmarkStage, optional
+        Stages to benchmark. Defaults to `default_benchmark_stages`.
+    max_num_tips : int, optional
+        Skip sizes above this, for all stages.
+    repeats : int, default 3
+        Number of timed runs of each stage, at each size and shape.
+    seed : int, default 1
+        Seed for synthetic inputs.
+    progress_callback : callable, optional
+        Called with each result row as it is measured.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per stage, size, and shape, with columns 'Stage', 'Num
+        Tips', 'Imbalance', 'Seconds' (minimum over repeats), and 'Peak
+        Bytes' (allocated above memory in use at the start of the run).
+    """
+    if stages is None:
+        stages = default_benchmark_stages
+    rows = []
+    for stage in stages:
+        for num_tips in sizes:
+            if num_tips > stage.max_num_tips or (
+                max_num_tips is not None and num_tips > max_num_tips
+            ):
+                continue
+            for imbalance in imbalances:
+                args = stage.setup(num_tips, imbalance, seed)
+                gc.collect()
+
+                seconds = []
+                for __ in range(repeats):
+                    begin = time.perf_counter()
+                    stage.run(*args)
+                    seconds.append(time.perf_counter() - begin)
+
+                registry = ProfilingRegistry()
+                registry.enable(trace_memory=True)
+                try:
+                    with registry.phase(stage.name):
+                        stage.run(*args)
+                finally:
+                    registry.disable()
+
+                rows.append({
+                    'Stage': stage.name,
+                    'Num Tips': num_tips,
+                    'Imbalance': imbalance,
+                    'Seconds': min(seconds),
+                    'Peak Bytes': registry.get_stats(stage.name).peak_bytes,
+                })
+                if progress_callback is not None:
+                    progress_callback(rows[-1])
+                del args
+
+    return pd.DataFrame.from_records(
+        rows,
+        columns=['Stage', 'Num Tips', 'Imbalance', 'Seconds', 'Peak Bytes'],
+    )
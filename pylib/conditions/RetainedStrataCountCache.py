@@ -0,0 +1,122 @@
+import sqlite3
+import time
+import typing
+
+
+class RetainedStrataCountCache:
+    """Memoized `CalcNumStrataRetainedExact` results, keyed by retention
+    policy, policy parameter, and number of generations.
+
+    Results are held in memory and, if a path is given, persisted to a SQLite
+    database shared across processes and runs. Persistent entries record when
+    they were last used; on `save`, the least recently used entries beyond
+    `max_entries` are evicted.
+    """
+
+    _memory: typing.Dict[typing.Tuple[str, int, int], int]
+    # keys used since last save, to be written or refreshed
+    _used: typing.Set[typing.Tuple[str, int, int]]
+    _connection: typing.Optional[sqlite3.Connection]
+    _max_entries: int
+
+    def __init__(
+        self: 'RetainedStrataCountCache',
+        path: typing.Optional[str]=None,
+        *,
+        max_entries: int=2**20,
+    ) -> None:
+        """Open (or create) the cache.
+
+        Parameters
+        ----------
+        path : str, optional
+            SQLite database file. If None, results are only memoized in
+            memory.
+        max_entries : int, default 2**20
+            Number of entries kept on disk.
+        """
+        self._memory = {}
+        self._used = set()
+        self._max_entries = max_entries
+        if path is None:
+            self._connection = None
+        else:
+            self._connection = sqlite3.connect(path, timeout=60)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS retained_strata_counts ('
+                'policy TEXT, parameter INTEGER, num_generations INTEGER, '
+                'num_strata_retained INTEGER, last_used REAL, '
+                'PRIMARY KEY (policy, parameter, num_generations))'
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def get_policy_name(condemner_factory: typing.Callable) -> str:
+        return f'{condemner_factory.__module__}.' \
+            f'{condemner_factory.__qualname__}'
+
+    def get(
+        self: 'RetainedStrataCountCache',
+        condemner_factory: typing.Callable,
+        parameter: int,
+        num_generations: int,
+    ) -> int:
+        """How many strata does `condemner_factory(parameter)` retain after
+        `num_generations` depositions?"""
+        key = (
+            self.get_policy_name(condemner_factory),
+            int(parameter),
+            int(num_generations),
+        )
+        self._used.add(key)
+        if key in self._memory:
+            return self._memory[key]
+
+        row = None if self._connection is None else self._connection.execute(
+            'SELECT num_strata_retained FROM retained_strata_counts '
+            'WHERE policy = ? AND parameter = ? AND num_generations = ?',
+            key,
+        ).fetchone()
+        if row is None:
+            res = condemner_factory(parameter).CalcNumStrataRetainedExact(
+                num_generations,
+            )
+        else:
+            res, = row
+        self._memory[key] = res
+        return res
+
+    def save(self: 'RetainedStrataCountCache') -> None:
+        """Write results used since the last save to disk and evict least
+        recently used entries. Does nothing for in-memory caches."""
+        if self._connection is None:
+            return
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO retained_strata_counts '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(*key, self._memory[key], now) for key in self._used],
+            )
+            self._connection.execute(
+                'DELETE FROM retained_strata_counts WHERE rowid IN ('
+                'SELECT rowid FROM retained_strata_counts '
+                'ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self._max_entries,),
+            )
+        self._used.clear()
+
+    def close(self: 'RetainedStrataCountCache') -> None:
+        """Save and release the database."""
+        self.save()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(
+        self: 'RetainedStrataCountCache',
+    ) -> 'RetainedStrataCountCache':
+        return self
+
+    def __exit__(self: 'RetainedStrataCountCache', *args) -> None:
+        self.close()
@@ -0,0 +1,98 @@
+import itertools as it
+import typing
+
+from interval_search import doubling_search
+import pandas as pd
+
+from .RetainedStrataCountCache import RetainedStrataCountCache
+
+
+def plan_conditions(
+    num_generations: typing.Union[int, typing.Iterable[int]],
+    condemner_factories: typing.Mapping[typing.Callable, int],
+    target_retained_bits: typing.Iterable[int],
+    differentia_bit_widths: typing.Iterable[int],
+    *,
+    cache: typing.Optional[RetainedStrataCountCache]=None,
+) -> pd.DataFrame:
+    """Choose, for each retention policy, target retained bit count, and
+    differentia bit width, the finest policy resolution parameter whose
+    columns stay within the target bit count after `num_generations`.
+
+    Reproduces the notebooks' `make_conditions`, but draws every
+    `CalcNumStrataRetainedExact` evaluation from `cache`. Counts computed
+    while searching for a parameter are reused for the final row's actual
+    retained strata and by every other row that probes the same parameter,
+    and, with an on-disk cache, by later calls and other processes.
+
+    Parameters
+    ----------
+    num_generations : int or iterable of int
+        Number of generations columns will be evolved for. If several are
+        given, conditions are planned for each and a 'Num Generations' column
+        is added.
+    condemner_factories : mapping from callable to int
+        Stratum retention condemner class (e.g.,
+        `hstrat.StratumRetentionCondemnerTaperedDepthProportionalResolution`)
+        mapped to the lowest resolution parameter to consider.
+    target_retained_bits : iterable of int
+        Column sizes to target, in bits.
+    differentia_bit_widths : iterable of int
+        Differentia bit widths to plan for.
+    cache : RetainedStrataCountCache, optional
+        Memoized retained strata counts. Defaults to a fresh in-memory cache.
+        Saved on return.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per condition, with the notebooks' `make_conditions`
+        columns.
+    """
+    is_batched = not isinstance(num_generations, int)
+    all_num_generations = [*num_generations] if is_batched \
+        else [num_generations]
+    target_retained_bits = [*target_retained_bits]
+    differentia_bit_widths = [*differentia_bit_widths]
+    if cache is None:
+        cache = RetainedStrataCountCache()
+
+    # condemner instances, shared between rows with the same parameter
+    condemners = {}
+
+    rows = []
+    for generations in all_num_generations:
+        for (factory, initial_guess), target, bit_width in it.product(
+            condemner_factories.items(),
+            target_retained_bits,
+            differentia_bit_widths,
+        ):
+            # finest parameter whose successor would overshoot the target
+            policy_param = doubling_search(
+                lambda x: cache.get(factory, x + 1, generations) * bit_width
+                > target,
+                initial_guess,
+                # parameters this large already retain every stratum
+                satisfaction_bound=generations,
+            )
+            num_strata = cache.get(factory, policy_param, generations)
+            key = (factory, policy_param)
+            if key not in condemners:
+                condemners[key] = factory(policy_param)
+
+            row = {
+                'Retention Policy': factory.__name__[25:],
+                'Differentia Bit Width': bit_width,
+                'Retention Policy Resolution Parameter': policy_param,
+                'Target Retained Bits': target,
+                'Actual Retained Bits': num_strata * bit_width,
+                'Retained Bits Error': num_strata * bit_width - target,
+                'Actual Retained Strata': num_strata,
+                'condemner': condemners[key],
+            }
+            if is_batched:
+                row = {'Num Generations': generations, **row}
+            rows.append(row)
+
+    cache.save()
+    return pd.DataFrame(rows)
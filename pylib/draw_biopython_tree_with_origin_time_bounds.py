@@ -64,15 +64,27 @@
 Third-party libraries are loaded when the corresponding function is called.
 """
 
+import collections
 import itertools as it
 import math
 from matplotlib import cm
 import matplotlib.patches as patches
+import numpy as np
 import sys
 
 from Bio import MissingPythonDependencyError
 
+from .artists import TextCollection
+from .helpers import default_profiling_registry
+from .tree_layout import calc_level_of_detail
+from .tree_layout import calc_tree_layout
+from .tree_layout import TreeLayoutCache
 
+# shared across calls, so repeated renders of one topology lay it out once
+_default_layout_cache = TreeLayoutCache()
+
+
+@default_profiling_registry.profile()
 def draw_biopython_tree_with_origin_time_bounds(
     tree,
     label_func=str,
@@ -82,6 +94,12 @@ def draw_biopython_tree_with_origin_time_bounds(
     axes=None,
     branch_labels=None,
     label_colors=None,
+    batch_artists=False,
+    level_of_detail=False,
+    figsize=None,
+    dpi=None,
+    layout=None,
+    layout_cache=_default_layout_cache,
     *args,
     **kwargs,
 ):
@@ -91,7 +109,10 @@ def draw_biopython_tree_with_origin_time_bounds(
     draw_ascii.
 
     Additional keyword arguments passed into this function are used as pyplot
-    options. The input format should be in the form of:
+    options, applied through the axes' method of the same name, or its
+    set_ method (e.g., set_title for title), where there is one. Other pyplot
+    functions are applied only to axes in a pyplot figure, and otherwise
+    raise ValueError. The input format should be in the form of:
     pyplot_option_name=(tuple), pyplot_option_name=(tuple, dict), or
     pyplot_option_name=(dict).
 
@@ -137,20 +158,67 @@ def draw_biopython_tree_with_origin_time_bounds(
             A function or a dictionary specifying the color of the tip label.
             If the tip label can't be found in the dict or label_colors is
             None, the label will be shown in black.
+        batch_artists : bool
+            Whether to draw each kind of element (horizontal branches,
+            vertical connectors, bound bars, bound caps, and labels) as a single
+            collection artist built from coordinate arrays, instead of adding
+            separate artists for every clade. Produces the same picture (up to
+            antialiasing at a few merged edges), but draws much faster on
+            large trees.
+        level_of_detail : bool
+            Whether to summarize detail finer than a pixel row of the output
+            with wedge glyphs, annotated with the merged origin time bound
+            envelope of the nodes they stand for, and to drop node labels
+            that would overlap earlier ones. Glyphs replace subtrees whose
+            tips span less than one pixel row, small siblings sharing a pixel
+            row, and runs of a lineage (e.g., a caterpillar's spine and the
+            tips hanging off it) within one pixel row, as chosen by
+            ``pylib.tree_layout.calc_level_of_detail``. The number of
+            artists and drawing time then depend on output resolution, not
+            tree size.
+        figsize : (float, float)
+            Output figure size in inches. Used for a new figure, and to compute
+            output resolution for ``level_of_detail``. Defaults to the size of
+            the figure drawn in.
+        dpi : float
+            Output resolution in dots per inch, as for ``figsize``. Pass the
+            dpi that will be given to ``savefig``, if different.
+        layout : pylib.tree_layout.TreeLayout
+            Precomputed layout of ``tree`` (e.g., from ``calc_tree_layout``).
+            By default, the layout is computed or taken from
+            ``layout_cache``.
+        layout_cache : pylib.tree_layout.TreeLayoutCache
+            Cache to look up and store the layout in. By default, a cache
+            shared by all calls, so trees with the same topology, tip order,
+            and branch lengths are laid out once. If None, the layout is
+            always computed.
 
     """
     try:
-        import matplotlib.pyplot as plt
+        import matplotlib
+        import matplotlib.axes
     except ImportError:
-        try:
-            import pylab as plt
-        except ImportError:
-            raise MissingPythonDependencyError(
-                "Install matplotlib or pylab if you want to use draw."
-            ) from None
+        raise MissingPythonDependencyError(
+            "Install matplotlib if you want to use draw."
+        ) from None
 
     import matplotlib.collections as mpcollections
 
+    def get_pyplot():
+        """Import pyplot only if its state machine is needed, so drawing
+        into a given axes works without a pyplot backend (e.g., in worker
+        processes)."""
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            try:
+                import pylab as plt
+            except ImportError:
+                raise MissingPythonDependencyError(
+                    "Install matplotlib or pylab if you want to use draw."
+                ) from None
+        return plt
+
     # Arrays that store lines for the plot of clades
     horizontal_linecollections = []
     vertical_linecollections = []
@@ -213,52 +281,109 @@ def draw_biopython_tree_with_origin_time_bounds(
 
     # Layout
 
-    def get_x_positions(tree):
-        """Create a mapping of each clade to its horizontal position.
-
-        Dict of {clade: x-coord}
-        """
-        depths = tree.depths()
-        # If there are no branch lengths, assume unit branch lengths
-        if not max(depths.values()):
-            depths = tree.depths(unit_branch_lengths=True)
-        return depths
-
-    def get_y_positions(tree):
-        """Create a mapping of each clade to its vertical position.
-
-        Dict of {clade: y-coord}.
-        Coordinates are negative, and integers for tips.
-        """
-        maxheight = tree.count_terminals()
-        # Rows are defined by the tips
-        heights = {
-            tip: maxheight - i for i, tip in enumerate(reversed(tree.get_terminals()))
-        }
-
-        # Internal nodes: place at midpoint of children
-        def calc_row(clade):
-            for subclade in clade:
-                if subclade not in heights:
-                    calc_row(subclade)
-            # Closure over heights
-            heights[clade] = (
-                heights[clade.clades[0]] + heights[clade.clades[-1]]
-            ) / 2.0
-
-        if tree.root.clades:
-            calc_row(tree.root)
-        return heights
-
-    x_posns = get_x_positions(tree)
-    y_posns = get_y_positions(tree)
-    # The function draw_clade closes over the axes object
+    profiling = default_profiling_registry
+    if layout is None:
+        with profiling.phase('draw_tree.layout'):
+            layout = calc_tree_layout(tree) if layout_cache is None \
+                else layout_cache.get(tree)
+    elif layout.clades[0] is not tree.root:
+        raise ValueError("layout must be computed for tree")
+    x_posns = layout.x_positions
+    y_posns = layout.y_positions
+    # The function draw_clades closes over the axes object
     if axes is None:
-        fig = plt.figure()
+        fig = get_pyplot().figure(figsize=figsize, dpi=dpi)
         axes = fig.add_subplot(1, 1, 1)
-    elif not isinstance(axes, plt.matplotlib.axes.Axes):
+    elif not isinstance(axes, matplotlib.axes.Axes):
         raise ValueError(f"Invalid argument for axes: {axes}")
 
+    if level_of_detail:
+        figure = axes.get_figure()
+        if figsize is None:
+            figsize = figure.get_size_inches()
+        if dpi is None:
+            dpi = figure.dpi
+        axes_height = axes.get_position().height * figsize[1] * dpi
+        # y limits, set below, span tip rows plus 0.6 rows of margin
+        with profiling.phase('draw_tree.level_of_detail'):
+            lod = calc_level_of_detail(
+                layout, axes_height / (y_posns.max() + 0.6),
+            )
+
+            # extent and origin time bound envelope of each glyph, over its
+            # collapsed node and the nodes it hides
+            hidden_ids = np.flatnonzero(~lod.visible_mask)
+            hidden_glyph_ids = lod.glyph_ids[hidden_ids]
+            glyph_far_xs = x_posns.copy()
+            np.maximum.at(glyph_far_xs, hidden_glyph_ids, x_posns[hidden_ids])
+            glyph_min_ys = y_posns.copy()
+            np.minimum.at(glyph_min_ys, hidden_glyph_ids, y_posns[hidden_ids])
+            glyph_max_ys = y_posns.copy()
+            np.maximum.at(glyph_max_ys, hidden_glyph_ids, y_posns[hidden_ids])
+            glyph_lbs = np.full(layout.num_nodes, np.inf)
+            np.minimum.at(glyph_lbs, hidden_glyph_ids, np.fromiter(
+                (layout.clades[i].origin_time_lb for i in hidden_ids),
+                dtype=float,
+                count=len(hidden_ids),
+            ))
+            glyph_ubs = np.full(layout.num_nodes, -np.inf)
+            np.maximum.at(glyph_ubs, hidden_glyph_ids, np.fromiter(
+                (layout.clades[i].origin_time_ub for i in hidden_ids),
+                dtype=float,
+                count=len(hidden_ids),
+            ))
+
+            # visible nodes with hidden parents continue out of glyphs
+            parent_glyph_ids = np.full(layout.num_nodes, -1)
+            parent_glyph_ids[1:] = lod.glyph_ids[layout.parent_ids[1:]]
+            glyph_exit_ids = collections.defaultdict(list)
+            for node_id in np.flatnonzero(
+                lod.visible_mask & (parent_glyph_ids >= 0),
+            ).tolist():
+                glyph_exit_ids[parent_glyph_ids[node_id]].append(node_id)
+
+        # greedily keep labels, top to bottom, at least one line apart
+        label_spacing = matplotlib.rcParams["font.size"] * dpi / 72 \
+            / lod.pixels_per_row
+        candidate_labels = {}
+        for node_id in np.flatnonzero(lod.visible_mask).tolist():
+            clade = layout.clades[node_id]
+            label = label_func(clade)
+            if label not in (None, clade.__class__.__name__):
+                candidate_labels[node_id] = label
+        lod_labels = {}
+        last_y = -np.inf
+        for node_id in sorted(candidate_labels, key=y_posns.__getitem__):
+            if y_posns[node_id] - last_y >= label_spacing:
+                lod_labels[node_id] = candidate_labels[node_id]
+                last_y = y_posns[node_id]
+    else:
+        lod = None
+
+    def get_label(node_id, clade):
+        if lod is None:
+            return label_func(clade)
+        return lod_labels.get(node_id)
+
+    def get_bounds(node_id, clade):
+        """Origin time bounds of clade, or merged bound envelope of the
+        nodes its glyph summarizes if collapsed."""
+        if lod is None or not lod.collapsed_mask[node_id]:
+            return clade.origin_time_lb, clade.origin_time_ub
+        return (
+            min(clade.origin_time_lb, glyph_lbs[node_id]),
+            max(clade.origin_time_ub, glyph_ubs[node_id]),
+        )
+
+    def get_wedge(node_id):
+        """Triangle summarizing the nodes hidden by a collapsed node, from
+        the collapsed node to the farthest of them."""
+        return [
+            (x_posns[node_id], y_posns[node_id]),
+            (glyph_far_xs[node_id], glyph_min_ys[node_id]),
+            (glyph_far_xs[node_id], glyph_max_ys[node_id]),
+        ]
+
     def draw_clade_lines(
         use_linecollection=False,
         orientation="horizontal",
@@ -294,119 +419,311 @@ def draw_biopython_tree_with_origin_time_bounds(
 
     cycle = it.cycle(cm.turbo([0.2, 0.4, 0.8]))
 
-    def draw_clade(clade, x_start, color, lw):
-        """Recursively draw a tree, down from the given clade."""
-        x_here = x_posns[clade]
-        y_here = y_posns[clade]
-        # phyloXML-only graphics annotations
-        if hasattr(clade, "color") and clade.color is not None:
-            color = clade.color.to_hex()
-        if hasattr(clade, "width") and clade.width is not None:
-            lw = clade.width * plt.rcParams["lines.linewidth"]
-        # Draw a horizontal line from start to here
-        draw_clade_lines(
-            use_linecollection=True,
-            orientation="horizontal",
-            y_here=y_here,
-            x_start=x_start,
-            x_here=x_here,
-            color=color,
-            lw=lw,
-        )
+    def draw_clades(x_start, color, lw):
+        """Draw a tree, down from the root, one clade at a time."""
+        # explicit stack visits clades in preorder, without recursion
+        stack = [(0, x_start, color, lw)]
+        while stack:
+            node_id, x_start, color, lw = stack.pop()
+            clade = layout.clades[node_id]
+            x_here = x_posns[node_id]
+            y_here = y_posns[node_id]
+            # phyloXML-only graphics annotations
+            if hasattr(clade, "color") and clade.color is not None:
+                color = clade.color.to_hex()
+            if hasattr(clade, "width") and clade.width is not None:
+                lw = clade.width * matplotlib.rcParams["lines.linewidth"]
+            # Draw a horizontal line from start to here
+            draw_clade_lines(
+                use_linecollection=True,
+                orientation="horizontal",
+                y_here=y_here,
+                x_start=x_start,
+                x_here=x_here,
+                color=color,
+                lw=lw,
+            )
+
+            # Annotate origin time bounds with error bars
+            # lower bound cap      upper bound cap
+            # |--------------------|
+            #         bar
+            assert hasattr(clade, 'origin_time_ub'), \
+                "Origin time upper bound must be provided as 'origin_time_ub' " \
+                "attr on all clades."
+            assert hasattr(clade, 'origin_time_lb'), \
+                "Origin time lower bound must be provided as 'origin_time_lb' " \
+                "attr on all clades."
+            origin_time_lb, origin_time_ub = get_bounds(node_id, clade)
+            bound_width = origin_time_ub - origin_time_lb
+
+            bar_color = next(cycle)
+            bar = patches.Rectangle(
+                (origin_time_lb, y_here-0.25), # lower left position
+                bound_width, # width
+                0.5, # height
+                linewidth=0,
+                edgecolor=bar_color,
+                facecolor=bar_color,
+                zorder=99,
+                alpha=0.3,
+            )
+            axes.add_patch(bar)
+            lower_bound_cap = patches.Rectangle(
+                (origin_time_lb, y_here-0.75), # lower left position
+                0, # width
+                1.5, # height
+                linewidth=1,
+                edgecolor=bar_color,
+                facecolor=bar_color,
+                zorder=99,
+                alpha=0.7,
+            )
+            axes.add_patch(lower_bound_cap)
+            upper_bound_cap = patches.Rectangle(
+                (origin_time_ub, y_here-0.75), # lower left position
+                0, # width
+                1.5, # height
+                linewidth=1,
+                edgecolor=bar_color,
+                facecolor=bar_color,
+                zorder=99,
+                alpha=0.7,
+            )
+            axes.add_patch(upper_bound_cap)
+
+            # Add node/taxon labels
+            label = get_label(node_id, clade)
+            if label not in (None, clade.__class__.__name__):
+                axes.text(
+                    x_here,
+                    y_here,
+                    f" {label}",
+                    verticalalignment="center",
+                    color=get_label_color(label),
+                )
+            # Add label above the branch (optional)
+            conf_label = format_branch_label(clade)
+            if conf_label:
+                axes.text(
+                    0.5 * (x_start + x_here),
+                    y_here,
+                    conf_label,
+                    fontsize="small",
+                    horizontalalignment="center",
+                )
+            if lod is not None and lod.collapsed_mask[node_id]:
+                # Draw one glyph in place of descendants
+                axes.add_patch(patches.Polygon(
+                    get_wedge(node_id),
+                    closed=True,
+                    facecolor=color,
+                    edgecolor=color,
+                    linewidth=lw,
+                ))
+                # Draw lineages continuing out of the glyph
+                stack.extend(
+                    (exit_id, x_posns[layout.parent_ids[exit_id]], color, lw)
+                    for exit_id in reversed(glyph_exit_ids[node_id])
+                )
+            elif clade.clades:
+                child_ids = layout.get_child_ids(node_id)
+                # Draw a vertical line connecting all children
+                y_top = y_posns[child_ids[0]]
+                y_bot = y_posns[child_ids[-1]]
+                # Only apply widths to horizontal lines, like Archaeopteryx
+                draw_clade_lines(
+                    use_linecollection=True,
+                    orientation="vertical",
+                    x_here=x_here,
+                    y_bot=y_bot,
+                    y_top=y_top,
+                    color=color,
+                    lw=lw,
+                )
+                # Draw descendents
+                stack.extend(
+                    (child_id, x_here, color, lw)
+                    for child_id in reversed(child_ids.tolist())
+                    if lod is None or lod.visible_mask[child_id]
+                )
+
+    def draw_clades_batched(x_start, color, lw):
+        """Draw a tree using one collection artist per kind of element."""
+        num_nodes = layout.num_nodes
+        parent_ids = layout.parent_ids
+        if lod is None:
+            drawn_mask = np.ones(num_nodes, dtype=bool)
+            collapsed_ids = np.empty(0, dtype=int)
+        else:
+            drawn_mask = lod.visible_mask
+            collapsed_ids = np.flatnonzero(lod.collapsed_mask)
+        drawn_ids = np.flatnonzero(drawn_mask)
+        # nodes below hidden parents take overrides from the parent's glyph
+        source_ids = parent_ids.copy()
+        if lod is not None:
+            source_ids[1:] = np.where(
+                lod.visible_mask[parent_ids[1:]],
+                parent_ids[1:],
+                lod.glyph_ids[parent_ids[1:]],
+            )
+
+        # propagate color and width overrides down from parents;
+        # parents precede children in node id order
+        colors = [None] * num_nodes
+        lws = np.empty(num_nodes, dtype=float)
+        bound_lbs = np.empty(num_nodes, dtype=float)
+        bound_ubs = np.empty(num_nodes, dtype=float)
+        label_ids, label_texts, label_colors = [], [], []
+        conf_ids, conf_texts = [], []
+        for node_id in drawn_ids.tolist():
+            clade = layout.clades[node_id]
+            if node_id:
+                color = colors[source_ids[node_id]]
+                lw = lws[source_ids[node_id]]
+            # phyloXML-only graphics annotations
+            if hasattr(clade, "color") and clade.color is not None:
+                color = clade.color.to_hex()
+            if hasattr(clade, "width") and clade.width is not None:
+                lw = clade.width * matplotlib.rcParams["lines.linewidth"]
+            colors[node_id] = color
+            lws[node_id] = lw
+
+            assert hasattr(clade, 'origin_time_ub'), \
+                "Origin time upper bound must be provided as 'origin_time_ub' " \
+                "attr on all clades."
+            assert hasattr(clade, 'origin_time_lb'), \
+                "Origin time lower bound must be provided as 'origin_time_lb' " \
+                "attr on all clades."
+            bound_lbs[node_id], bound_ubs[node_id] \
+                = get_bounds(node_id, clade)
+
+            label = get_label(node_id, clade)
+            if label not in (None, clade.__class__.__name__):
+                label_ids.append(node_id)
+                label_texts.append(f" {label}")
+                label_colors.append(get_label_color(label))
+            conf_label = format_branch_label(clade)
+            if conf_label:
+                conf_ids.append(node_id)
+                conf_texts.append(conf_label)
+
+        h_x_starts = np.empty(num_nodes, dtype=float)
+        h_x_starts[0] = x_start
+        h_x_starts[1:] = x_posns[parent_ids[1:]]
+        h_ys = y_posns[drawn_ids]
+
+        inner_ids = np.flatnonzero(drawn_mask & ~layout.tip_mask)
+        if lod is not None:
+            inner_ids = inner_ids[~lod.collapsed_mask[inner_ids]]
+        v_xs = x_posns[inner_ids]
+        v_y_bots = y_posns[layout.last_child_ids[inner_ids]]
+        v_y_tops = y_posns[layout.first_child_ids[inner_ids]]
+        v_colors = [colors[node_id] for node_id in inner_ids.tolist()]
+        v_lws = lws[inner_ids]
+
+        conf_ids = np.asarray(conf_ids, dtype=int)
+        conf_xs = 0.5 * (h_x_starts[conf_ids] + x_posns[conf_ids])
+        conf_ys = y_posns[conf_ids]
+        label_xs = x_posns[label_ids]
+        label_ys = y_posns[label_ids]
+
+        # segment arrays have shape (num segments, 2 endpoints, 2 coords)
+        horizontal_linecollections.append(mpcollections.LineCollection(
+            np.stack([
+                np.column_stack([h_x_starts[drawn_ids], h_ys]),
+                np.column_stack([x_posns[drawn_ids], h_ys]),
+            ], axis=1),
+            colors=[colors[node_id] for node_id in drawn_ids.tolist()],
+            linewidths=lws[drawn_ids],
+        ))
+        if len(v_xs):
+            vertical_linecollections.append(mpcollections.LineCollection(
+                np.stack([
+                    np.column_stack([v_xs, v_y_bots]),
+                    np.column_stack([v_xs, v_y_tops]),
+                ], axis=1),
+                colors=v_colors,
+                linewidths=v_lws,
+            ))
+        # Draw one glyph in place of descendants of each collapsed clade
+        if len(collapsed_ids):
+            axes.add_collection(mpcollections.PolyCollection(
+                [*map(get_wedge, collapsed_ids.tolist())],
+                facecolors=[colors[node_id] for node_id in collapsed_ids],
+                edgecolors=[colors[node_id] for node_id in collapsed_ids],
+                linewidths=lws[collapsed_ids],
+            ))
+
+        # bar colors cycle through palette in traversal order, like draw_clades
+        palette = cm.turbo([0.2, 0.4, 0.8])
+        bar_colors = palette[np.arange(len(drawn_ids)) % len(palette)]
+        bound_lbs = bound_lbs[drawn_ids]
+        bound_ubs = bound_ubs[drawn_ids]
 
         # Annotate origin time bounds with error bars
         # lower bound cap      upper bound cap
         # |--------------------|
         #         bar
-        assert hasattr(clade, 'origin_time_ub'), \
-            "Origin time upper bound must be provided as 'origin_time_ub' " \
-            "attr on all clades."
-        assert hasattr(clade, 'origin_time_lb'), \
-            "Origin time lower bound must be provided as 'origin_time_lb' " \
-            "attr on all clades."
-        bound_width = clade.origin_time_ub - clade.origin_time_lb
-
-        bar_color = next(cycle)
-        bar = patches.Rectangle(
-            (clade.origin_time_lb, y_here-0.25), # lower left position
-            bound_width, # width
-            0.5, # height
-            linewidth=0,
-            edgecolor=bar_color,
-            facecolor=bar_color,
+        axes.add_collection(mpcollections.PolyCollection(
+            np.stack([
+                np.column_stack([bound_lbs, h_ys - 0.25]),
+                np.column_stack([bound_ubs, h_ys - 0.25]),
+                np.column_stack([bound_ubs, h_ys + 0.25]),
+                np.column_stack([bound_lbs, h_ys + 0.25]),
+            ], axis=1),
+            linewidths=0,
+            edgecolors=bar_colors,
+            facecolors=bar_colors,
             zorder=99,
             alpha=0.3,
-        )
-        axes.add_patch(bar)
-        lower_bound_cap = patches.Rectangle(
-            (clade.origin_time_lb, y_here-0.75), # lower left position
-            0, # width
-            1.5, # height
-            linewidth=1,
-            edgecolor=bar_color,
-            facecolor=bar_color,
-            zorder=99,
-            alpha=0.7,
-        )
-        axes.add_patch(lower_bound_cap)
-        upper_bound_cap = patches.Rectangle(
-            (clade.origin_time_ub, y_here-0.75), # lower left position
-            0, # width
-            1.5, # height
-            linewidth=1,
-            edgecolor=bar_color,
-            facecolor=bar_color,
-            zorder=99,
-            alpha=0.7,
-        )
-        axes.add_patch(upper_bound_cap)
+        ))
+        for cap_xs in bound_lbs, bound_ubs:
+            axes.add_collection(mpcollections.LineCollection(
+                np.stack([
+                    np.column_stack([cap_xs, h_ys - 0.75]),
+                    np.column_stack([cap_xs, h_ys + 0.75]),
+                ], axis=1),
+                linewidths=1,
+                colors=bar_colors,
+                zorder=99,
+                alpha=0.7,
+            ))
 
         # Add node/taxon labels
-        label = label_func(clade)
-        if label not in (None, clade.__class__.__name__):
-            axes.text(
-                x_here,
-                y_here,
-                f" {label}",
+        if label_texts:
+            axes.add_artist(TextCollection(
+                label_xs,
+                label_ys,
+                label_texts,
+                colors=label_colors,
                 verticalalignment="center",
-                color=get_label_color(label),
-            )
+            ))
         # Add label above the branch (optional)
-        conf_label = format_branch_label(clade)
-        if conf_label:
-            axes.text(
-                0.5 * (x_start + x_here),
-                y_here,
-                conf_label,
+        if conf_texts:
+            axes.add_artist(TextCollection(
+                conf_xs,
+                conf_ys,
+                conf_texts,
                 fontsize="small",
                 horizontalalignment="center",
-            )
-        if clade.clades:
-            # Draw a vertical line connecting all children
-            y_top = y_posns[clade.clades[0]]
-            y_bot = y_posns[clade.clades[-1]]
-            # Only apply widths to horizontal lines, like Archaeopteryx
-            draw_clade_lines(
-                use_linecollection=True,
-                orientation="vertical",
-                x_here=x_here,
-                y_bot=y_bot,
-                y_top=y_top,
-                color=color,
-                lw=lw,
-            )
-            # Draw descendents
-            for child in clade:
-                draw_clade(child, x_here, color, lw)
+            ))
 
-    draw_clade(tree.root, 0, "k", plt.rcParams["lines.linewidth"])
+    with profiling.phase('draw_tree.artists'):
+        if batch_artists:
+            draw_clades_batched(
+                0, "k", matplotlib.rcParams["lines.linewidth"],
+            )
+        else:
+            draw_clades(0, "k", matplotlib.rcParams["lines.linewidth"])
 
     # If line collections were used to create clade lines, here they are added
     # to the pyplot plot.
-    for i in horizontal_linecollections:
-        axes.add_collection(i)
-    for i in vertical_linecollections:
-        axes.add_collection(i)
+    with profiling.phase('draw_tree.collections'):
+        for i in horizontal_linecollections:
+            axes.add_collection(i)
+        for i in vertical_linecollections:
+            axes.add_collection(i)
 
     # Aesthetics
 
@@ -420,11 +737,11 @@ def draw_biopython_tree_with_origin_time_bounds(
     axes.set_xlabel("branch length")
     axes.set_ylabel("taxa")
     # Add margins around the tree to prevent overlapping the axes
-    xmax = max(x_posns.values())
+    xmax = x_posns.max()
     axes.set_xlim(-0.05 * xmax, 1.25 * xmax)
     # Also invert the y-axis (origin at the top)
     # Add a small vertical margin, but avoid including 0 and N+1 on the y axis
-    axes.set_ylim(max(y_posns.values()) + 0.8, 0.2)
+    axes.set_ylim(y_posns.max() + 0.8, 0.2)
 
     # Parse and process key word arguments as pyplot options
     for key, value in kwargs.items():
@@ -437,12 +754,27 @@ def draw_biopython_tree_with_origin_time_bounds(
                 "pyplot_option_name=(tuple), pyplot_option_name=(tuple, dict),"
                 " or pyplot_option_name=(dict) " % (key, value)
             ) from None
+        # prefer axes methods, e.g., Axes.set_title for title, so options
+        # apply to the axes drawn in rather than pyplot's current axes
+        option = getattr(axes, str(key), None)
+        if not callable(option):
+            option = getattr(axes, "set_%s" % key, None)
+        if not callable(option):
+            # only figures made through pyplot have a manager
+            if axes.get_figure().canvas.manager is None:
+                raise ValueError(
+                    'Keyword argument "%s" is not an axes option, and '
+                    "pyplot options need axes in a pyplot figure" % key
+                )
+            get_pyplot().sca(axes)
+            option = getattr(get_pyplot(), str(key))
         if isinstance(value, dict):
-            getattr(plt, str(key))(**dict(value))
+            option(**dict(value))
         elif not (isinstance(value[0], tuple)):
-            getattr(plt, str(key))(*value)
+            option(*value)
         elif isinstance(value[0], tuple):
-            getattr(plt, str(key))(*value[0], **dict(value[1]))
+            option(*value[0], **dict(value[1]))
 
     if do_show:
-        plt.show()
+        with profiling.phase('draw_tree.show'):
+            get_pyplot().show()
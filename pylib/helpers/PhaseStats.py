@@ -0,0 +1,30 @@
+import typing
+
+
+class PhaseStats:
+    """Running totals for one profiled phase, updated in place as the phase
+    is timed."""
+
+    __slots__ = ('calls', 'seconds', 'peak_bytes')
+
+    calls: int
+    # total wall time, including time in nested phases
+    seconds: float
+    # largest allocation high-water mark over a single call, above memory in
+    # use at its start, or None if memory was not traced
+    peak_bytes: typing.Optional[int]
+
+    def __init__(self: 'PhaseStats') -> None:
+        self.reset()
+
+    def reset(self: 'PhaseStats') -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.peak_bytes = None
+
+    def to_dict(self: 'PhaseStats') -> typing.Dict[str, typing.Any]:
+        return {
+            'calls': self.calls,
+            'seconds': self.seconds,
+            'peak_bytes': self.peak_bytes,
+        }
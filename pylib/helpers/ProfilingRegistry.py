@@ -0,0 +1,204 @@
+import contextlib
+import csv
+import functools
+import json
+import time
+import typing
+
+from .attach_attrs import attach_attrs
+from .PhaseStats import PhaseStats
+
+# shared by all disabled phases, so entering one allocates nothing
+_null_phase = contextlib.nullcontext()
+
+
+class _PhaseTimer:
+
+    __slots__ = ('_registry', '_stats', '_begin')
+
+    def __init__(
+        self: '_PhaseTimer',
+        registry: 'ProfilingRegistry',
+        stats: PhaseStats,
+    ) -> None:
+        self._registry = registry
+        self._stats = stats
+
+    def __enter__(self: '_PhaseTimer') -> None:
+        if self._registry._trace_memory:
+            self._registry._push_memory_frame()
+        self._begin = time.perf_counter()
+
+    def __exit__(self: '_PhaseTimer', *exc_info) -> None:
+        self._stats.seconds += time.perf_counter() - self._begin
+        self._stats.calls += 1
+        if self._registry._trace_memory:
+            peak_bytes = self._registry._pop_memory_frame()
+            if self._stats.peak_bytes is None \
+                    or peak_bytes > self._stats.peak_bytes:
+                self._stats.peak_bytes = peak_bytes
+
+
+class ProfilingRegistry:
+    """Named wall time, call count, and (opt-in) peak memory statistics for
+    phases of work, timed with `phase` blocks or `profile`d functions.
+
+    While disabled, `phase` returns a shared no-op context manager and
+    `profile`d functions call straight through, so instrumentation can be
+    left in place at near-zero cost.
+    """
+
+    _enabled: bool
+    _trace_memory: bool
+    # whether tracemalloc was started by this registry, to stop on disable
+    _started_tracemalloc: bool
+    _stats: typing.Dict[str, PhaseStats]
+    # for each open phase, memory in use at its start and highest peak seen
+    # before nested phases reset the tracemalloc peak (or, before Python
+    # 3.9, the tracemalloc peak at its start)
+    _memory_frames: typing.List[typing.List[int]]
+
+    def __init__(self: 'ProfilingRegistry') -> None:
+        self._enabled = False
+        self._trace_memory = False
+        self._started_tracemalloc = False
+        self._stats = {}
+        self._memory_frames = []
+
+    @property
+    def enabled(self: 'ProfilingRegistry') -> bool:
+        return self._enabled
+
+    def enable(self: 'ProfilingRegistry', trace_memory: bool=False) -> None:
+        """Start recording, and tracing allocations with tracemalloc if
+        `trace_memory`, which slows allocation-heavy code down."""
+        # deferred, as tracemalloc imports pickle and tokenize
+        import tracemalloc
+
+        self._enabled = True
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._trace_memory = trace_memory
+
+    def disable(self: 'ProfilingRegistry') -> None:
+        """Stop recording, keeping statistics recorded so far."""
+        self._enabled = False
+        self._trace_memory = False
+        self._memory_frames.clear()
+        if self._started_tracemalloc:
+            import tracemalloc
+
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self: 'ProfilingRegistry') -> None:
+        """Zero all statistics, in place, so stats attached to profiled
+        functions stay live."""
+        for stats in self._stats.values():
+            stats.reset()
+
+    def get_stats(self: 'ProfilingRegistry', name: str) -> PhaseStats:
+        if name not in self._stats:
+            self._stats[name] = PhaseStats()
+        return self._stats[name]
+
+    def _push_memory_frame(self: 'ProfilingRegistry') -> None:
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        if not hasattr(tracemalloc, 'reset_peak'):
+            # before Python 3.9, the peak cannot be reset, so keep the peak
+            # so far to tell whether the phase raises it
+            self._memory_frames.append([current, peak])
+            return
+        if self._memory_frames:
+            frame = self._memory_frames[-1]
+            frame[1] = max(frame[1], peak)
+        self._memory_frames.append([current, current])
+        tracemalloc.reset_peak()
+
+    def _pop_memory_frame(self: 'ProfilingRegistry') -> int:
+        import tracemalloc
+
+        begin, peak = self._memory_frames.pop()
+        current, traced_peak = tracemalloc.get_traced_memory()
+        if not hasattr(tracemalloc, 'reset_peak'):
+            # unless the phase set a new overall peak, its own peak is
+            # unknown, so fall back to the most memory in use at either end
+            if traced_peak > peak:
+                return traced_peak - begin
+            return max(current, begin) - begin
+        peak = max(peak, traced_peak)
+        if self._memory_frames:
+            frame = self._memory_frames[-1]
+            frame[1] = max(frame[1], peak)
+        return peak - begin
+
+    def phase(self: 'ProfilingRegistry', name: str) -> typing.ContextManager:
+        """Context manager that times its block as phase `name`."""
+        if not self._enabled:
+            return _null_phase
+        return _PhaseTimer(self, self.get_stats(name))
+
+    def profile(
+        self: 'ProfilingRegistry',
+        name: typing.Optional[str]=None,
+    ) -> typing.Callable[[typing.Callable], typing.Callable]:
+        """Generates decorator that times each call of a function as phase
+        `name`, defaulting to the function's qualified name.
+
+        The phase's live `PhaseStats` is attached to the decorated function
+        as `profile_stats`.
+        """
+
+        def profile_decorator(f: typing.Callable) -> typing.Callable:
+            stats = self.get_stats(f.__qualname__ if name is None else name)
+
+            @functools.wraps(f)
+            def profiled(*args, **kwargs):
+                if not self._enabled:
+                    return f(*args, **kwargs)
+                with _PhaseTimer(self, stats):
+                    return f(*args, **kwargs)
+
+            return attach_attrs({'profile_stats': stats})(profiled)
+
+        return profile_decorator
+
+    def get_report(
+        self: 'ProfilingRegistry',
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Statistics of each phase called at least once, in order of first
+        registration."""
+        return [
+            {'phase': name, **stats.to_dict()}
+            for name, stats in self._stats.items()
+            if stats.calls
+        ]
+
+    def write_report(
+        self: 'ProfilingRegistry',
+        path: str,
+        metadata: typing.Optional[typing.Dict[str, typing.Any]]=None,
+    ) -> None:
+        """Write `get_report` to a JSON file, along with `metadata`, or to a
+        CSV file, with one row per phase, according to the extension of
+        `path`."""
+        report = self.get_report()
+        if path.endswith('.json'):
+            with open(path, 'w') as file:
+                json.dump(
+                    {'metadata': metadata or {}, 'phases': report},
+                    file,
+                    indent=1,
+                )
+        elif path.endswith('.csv'):
+            with open(path, 'w', newline='') as file:
+                writer = csv.DictWriter(
+                    file, fieldnames=['phase', *PhaseStats.__slots__],
+                )
+                writer.writeheader()
+                writer.writerows(report)
+        else:
+            raise ValueError(f'unsupported report format for {path}')
@@ -1,6 +1,14 @@
 from .attach_attrs import attach_attrs
+from .default_profiling_registry import default_profiling_registry
+from .install_lazy_attrs import install_lazy_attrs
+from .PhaseStats import PhaseStats
+from .ProfilingRegistry import ProfilingRegistry
 
 # adapted from https://stackoverflow.com/a/31079085
 __all__ = [
     'attach_attrs',
+    'default_profiling_registry',
+    'install_lazy_attrs',
+    'PhaseStats',
+    'ProfilingRegistry',
 ]
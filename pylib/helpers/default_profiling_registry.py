@@ -0,0 +1,22 @@
+import atexit
+import os
+
+from .ProfilingRegistry import ProfilingRegistry
+
+# registry used by pylib's own instrumentation
+default_profiling_registry = ProfilingRegistry()
+
+# set for each notebook run by `python3 -m pylib.notebooks --profile-dir`
+_report_path = os.environ.get('PYLIB_PROFILE_REPORT')
+if _report_path:
+    default_profiling_registry.enable(
+        trace_memory=bool(os.environ.get('PYLIB_PROFILE_MEMORY')),
+    )
+    atexit.register(
+        default_profiling_registry.write_report,
+        _report_path,
+        {
+            'notebook_name': os.environ.get('NOTEBOOK_NAME'),
+            'notebook_path': os.environ.get('NOTEBOOK_PATH'),
+        },
+    )
@@ -0,0 +1,65 @@
+import sys
+import types
+import typing
+
+
+class _LazyPackage(types.ModuleType):
+    """Package module whose exported names, once their submodule is
+    imported, stay bound to the exported object rather than the submodule."""
+
+    def __setattr__(
+        self: '_LazyPackage',
+        name: str,
+        value: typing.Any,
+    ) -> None:
+        # importing a submodule binds it on its package, which would shadow
+        # the same-named function or class the package exports
+        submodules = self.__dict__.get('_lazy_submodules', {})
+        if (
+            isinstance(value, types.ModuleType)
+            and submodules.get(name) == name
+            and value.__name__ == f'{self.__name__}.{name}'
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def install_lazy_attrs(
+    package_name: str,
+    names: typing.Iterable[str],
+    submodules: typing.Optional[typing.Dict[str, str]]=None,
+) -> None:
+    """Give package `package_name` a module-level `__getattr__` that imports
+    each of `names` from its submodule on first access, instead of at
+    package import.
+
+    Each name is taken from the submodule of the same name, unless mapped to
+    another submodule in `submodules`. Call from the package's `__init__`.
+    """
+    package = sys.modules[package_name]
+    submodules = {
+        **{name: name for name in names},
+        **(submodules or {}),
+    }
+
+    def __getattr__(name: str) -> typing.Any:
+        if name not in submodules:
+            raise AttributeError(
+                f'module {package_name!r} has no attribute {name!r}',
+            )
+        submodule_name = f'{package_name}.{submodules[name]}'
+        # unlike importlib.import_module, __import__ is timed by python -X
+        # importtime
+        __import__(submodule_name)
+        value = getattr(sys.modules[submodule_name], name)
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> typing.List[str]:
+        return sorted({*package.__dict__, *submodules})
+
+    package.__class__ = _LazyPackage
+    package._lazy_submodules = submodules
+    package.__getattr__ = __getattr__
+    package.__dir__ = __dir__
@@ -0,0 +1,10 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'measure_import_times',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
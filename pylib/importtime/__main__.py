@@ -0,0 +1,40 @@
+import argparse
+import os
+import pkgutil
+
+from .measure_import_times import measure_import_times
+
+pylib_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+parser = argparse.ArgumentParser(
+    prog='python3 -m pylib.importtime',
+    description='Measure cold-start import time of pylib, per module loaded.',
+)
+parser.add_argument(
+    'targets', nargs='*',
+    help="modules, or 'module:name' to import a name from a module "
+    "(default: pylib, and every name exported by each pylib subpackage)",
+)
+parser.add_argument('--repeats', type=int, default=3)
+parser.add_argument(
+    '--top', type=int, default=5,
+    help='number of slowest modules to list per target',
+)
+parser.add_argument('--output', default=None, help='full report CSV path')
+args = parser.parse_args()
+
+targets = args.targets or ['pylib', *(
+    f'pylib.{module_info.name}:*'
+    for module_info in pkgutil.iter_modules([pylib_dir])
+    if module_info.ispkg and module_info.name != 'test'
+)]
+report = measure_import_times(targets, repeats=args.repeats)
+if args.output is not None:
+    report.to_csv(args.output, index=False)
+
+for target, rows in report.groupby('Target', sort=False):
+    total_ms = rows.loc[rows['Depth'] == 0, 'Cumulative Microseconds'] \
+        .sum() / 1000
+    print(f'{target}: {total_ms:.1f} ms')
+    for __, row in rows.nlargest(args.top, 'Self Microseconds').iterrows():
+        print(f'  {row["Self Microseconds"] / 1000:8.1f} ms  {row["Module"]}')
@@ -0,0 +1,106 @@
+import os
+import re
+import subprocess
+import sys
+import typing
+
+import pandas as pd
+
+# e.g., 'import time:       430 |      17260 |   pylib.helpers'
+_importtime_line = re.compile(
+    r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)',
+)
+
+
+def _run_importtime(
+    python: str,
+    statement: str,
+    env: typing.Dict[str, str],
+) -> pd.DataFrame:
+    stderr = subprocess.run(
+        [python, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stderr
+    return pd.DataFrame.from_records(
+        [
+            (name, len(indent) // 2, int(self_us), int(cum_us))
+            for self_us, cum_us, indent, name
+            in _importtime_line.findall(stderr)
+        ],
+        columns=[
+            'Module',
+            'Depth',
+            'Self Microseconds',
+            'Cumulative Microseconds',
+        ],
+    )
+
+
+def _get_import_statement(target: str) -> str:
+    module, __, name = target.partition(':')
+    return f'from {module} import {name}' if name else f'import {module}'
+
+
+def measure_import_times(
+    targets: typing.Iterable[str],
+    *,
+    repeats: int=3,
+    python: str=sys.executable,
+) -> pd.DataFrame:
+    """Measure the cold-start cost of each import target, broken down by
+    every module the import loads.
+
+    Targets are module names (e.g., 'pylib.tree_layout'), or module and
+    name separated by a colon (e.g., 'pylib.tree_layout:calc_tree_layout'
+    or 'pylib.tree_layout:*'), to include the cost of names a package loads
+    lazily. Each target is imported in a fresh interpreter with `python -X
+    importtime`, `repeats` times, keeping the fastest time for each loaded
+    module. Modules already loaded at interpreter startup are left out. The
+    directory containing `pylib` is put on the path, so it can be run from
+    anywhere.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per module loaded by each target, in load order, with
+        columns 'Target', 'Module', 'Depth' (nesting of the import, 0 for
+        modules imported directly by the target), 'Self Microseconds', and
+        'Cumulative Microseconds' (including modules it imported).
+    """
+    repo_dir = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    env = {
+        **os.environ,
+        'PYTHONPATH': os.pathsep.join(
+            [repo_dir, *filter(None, [os.environ.get('PYTHONPATH')])],
+        ),
+    }
+
+    # modules loaded at interpreter startup (e.g., by site) are not loaded
+    # by targets
+    startup_modules = {*_run_importtime(python, 'pass', env)['Module']}
+
+    frames = []
+    for target in targets:
+        runs = [
+            _run_importtime(python, _get_import_statement(target), env)
+            for __ in range(repeats)
+        ]
+        # modules load in the same order every run
+        fastest = pd.concat(runs).groupby(
+            ['Module', 'Depth'], sort=False,
+        ).min().reset_index()
+        fastest = fastest[~fastest['Module'].isin(startup_modules)]
+        frames.append(fastest.assign(Target=target))
+
+    return pd.concat(frames, ignore_index=True)[[
+        'Target',
+        'Module',
+        'Depth',
+        'Self Microseconds',
+        'Cumulative Microseconds',
+    ]]
@@ -0,0 +1,302 @@
+import hashlib
+import json
+import os
+import pathlib
+import sqlite3
+import tempfile
+import time
+import typing
+from urllib import parse
+from urllib import request
+
+import pandas as pd
+import pyarrow as pa
+
+
+class InputCache:
+    """Content-addressed on-disk cache of remote input files, such as the
+    phylogeny and pairwise estimate tables the mills read from osf.io and
+    GitHub.
+
+    Fetched files are stored by SHA-256 digest, with an index from URL to
+    digest, so identical content fetched from different URLs is stored once.
+    `read_csv` also stores each parsed table as an uncompressed Arrow file,
+    keyed by content digest and parsing options, which later reads memory-map
+    instead of downloading, decompressing, and parsing again.
+
+    Files beyond `max_bytes` are evicted least recently used first. In
+    offline mode, nothing is downloaded and uncached inputs raise
+    FileNotFoundError. Sources may be http(s) or file URLs, or local paths.
+    """
+
+    _cache_dir: str
+    _max_bytes: typing.Optional[int]
+    _offline: bool
+    _pins: typing.Dict[str, str]
+    _connection: sqlite3.Connection
+
+    def __init__(
+        self: 'InputCache',
+        cache_dir: typing.Optional[str]=None,
+        *,
+        max_bytes: typing.Optional[int]=None,
+        offline: typing.Optional[bool]=None,
+        pins: typing.Optional[typing.Mapping[str, str]]=None,
+    ) -> None:
+        """Open (or create) the cache.
+
+        Parameters
+        ----------
+        cache_dir : str, optional
+            Cache directory. Defaults to the PYLIB_INPUT_CACHE_DIR environment
+            variable, or else `~/.cache/pylib/inputs`.
+        max_bytes : int, optional
+            Total size of cached files to keep. Unbounded if None.
+        offline : bool, optional
+            Never download. Defaults to whether the PYLIB_INPUT_CACHE_OFFLINE
+            environment variable is set to a nonempty value.
+        pins : mapping from str to str, optional
+            Expected SHA-256 hex digest of content, keyed by URL.
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get(
+                'PYLIB_INPUT_CACHE_DIR',
+                os.path.join(
+                    os.path.expanduser('~'), '.cache', 'pylib', 'inputs',
+                ),
+            )
+        if offline is None:
+            offline = bool(os.environ.get('PYLIB_INPUT_CACHE_OFFLINE'))
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._offline = offline
+        self._pins = dict(pins or {})
+
+        os.makedirs(os.path.join(cache_dir, 'blobs'), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, 'parsed'), exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(cache_dir, 'index.sqlite'), timeout=60,
+        )
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS urls '
+                '(url TEXT PRIMARY KEY, digest TEXT)'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS files '
+                '(path TEXT PRIMARY KEY, size INTEGER, last_used REAL)'
+            )
+
+    @property
+    def cache_dir(self: 'InputCache') -> str:
+        return self._cache_dir
+
+    @property
+    def offline(self: 'InputCache') -> bool:
+        return self._offline
+
+    def _get_blob_path(self: 'InputCache', digest: str) -> str:
+        return os.path.join('blobs', digest[:2], digest)
+
+    def _touch(self: 'InputCache', path: str) -> None:
+        with self._connection:
+            self._connection.execute(
+                'UPDATE files SET last_used = ? WHERE path = ?',
+                (time.time(), path),
+            )
+
+    def _add_file(self: 'InputCache', path: str) -> None:
+        size = os.path.getsize(os.path.join(self._cache_dir, path))
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO files VALUES (?, ?, ?)',
+                (path, size, time.time()),
+            )
+        self._evict(keep=path)
+
+    def _evict(self: 'InputCache', keep: str) -> None:
+        if self._max_bytes is None:
+            return
+        with self._connection:
+            rows = self._connection.execute(
+                'SELECT path, size FROM files ORDER BY last_used DESC',
+            ).fetchall()
+            total = 0
+            for path, size in rows:
+                total += size
+                if total > self._max_bytes and path != keep:
+                    try:
+                        os.remove(os.path.join(self._cache_dir, path))
+                    except FileNotFoundError:
+                        pass
+                    self._connection.execute(
+                        'DELETE FROM files WHERE path = ?', (path,),
+                    )
+
+    def _is_cached(self: 'InputCache', path: str) -> bool:
+        return os.path.exists(os.path.join(self._cache_dir, path))
+
+    def _download(self: 'InputCache', url: str) -> str:
+        """Stream `url` into the cache and return its digest."""
+        if not parse.urlparse(url).scheme:
+            url = pathlib.Path(url).resolve().as_uri()
+
+        digest = hashlib.sha256()
+        with request.urlopen(url) as response, tempfile.NamedTemporaryFile(
+            dir=self._cache_dir, delete=False,
+        ) as temp_file:
+            try:
+                for block in iter(lambda: response.read(2**20), b''):
+                    digest.update(block)
+                    temp_file.write(block)
+            except BaseException:
+                os.remove(temp_file.name)
+                raise
+        res = digest.hexdigest()
+        path = self._get_blob_path(res)
+        os.makedirs(
+            os.path.dirname(os.path.join(self._cache_dir, path)),
+            exist_ok=True,
+        )
+        os.replace(temp_file.name, os.path.join(self._cache_dir, path))
+        self._add_file(path)
+        return res
+
+    def _lookup_digest(
+        self: 'InputCache',
+        url: str,
+        pinned: typing.Optional[str],
+    ) -> typing.Optional[str]:
+        """Digest of `url`'s content, if pinned or previously fetched."""
+        if pinned is not None:
+            return pinned
+        row = self._connection.execute(
+            'SELECT digest FROM urls WHERE url = ?', (url,),
+        ).fetchone()
+        return row and row[0]
+
+    def _get_parsed_path(
+        self: 'InputCache',
+        digest: str,
+        read_csv_kwargs: typing.Dict,
+    ) -> str:
+        key = hashlib.sha256(json.dumps(
+            [digest, read_csv_kwargs], sort_keys=True, default=str,
+        ).encode()).hexdigest()
+        return os.path.join('parsed', f'{key}.arrow')
+
+    def fetch(
+        self: 'InputCache',
+        url: str,
+        *,
+        digest: typing.Optional[str]=None,
+    ) -> str:
+        """Get a local path to the content of `url`, downloading it if not
+        cached.
+
+        Parameters
+        ----------
+        url : str
+            http(s) or file URL, or local path.
+        digest : str, optional
+            Expected SHA-256 hex digest of the content. If given (or pinned
+            for `url` at construction), cached content with this digest is
+            used even if fetched from another URL, and mismatched content
+            raises ValueError.
+
+        Returns
+        -------
+        str
+            Path of the cached content. Do not modify.
+        """
+        return os.path.join(
+            self._cache_dir,
+            self._get_blob_path(self.fetch_digest(url, digest=digest)),
+        )
+
+    def fetch_digest(
+        self: 'InputCache',
+        url: str,
+        *,
+        digest: typing.Optional[str]=None,
+    ) -> str:
+        """As `fetch`, but return the content's digest."""
+        pinned = digest or self._pins.get(url)
+        candidate = self._lookup_digest(url, pinned)
+        if candidate and self._is_cached(self._get_blob_path(candidate)):
+            self._touch(self._get_blob_path(candidate))
+            return candidate
+
+        if self._offline:
+            raise FileNotFoundError(
+                f'{url} is not cached and the input cache is offline',
+            )
+        res = self._download(url)
+        if pinned is not None and res != pinned:
+            raise ValueError(
+                f'{url} has digest {res}, but {pinned} was pinned',
+            )
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO urls VALUES (?, ?)', (url, res),
+            )
+        return res
+
+    def read_csv(
+        self: 'InputCache',
+        url: str,
+        *,
+        digest: typing.Optional[str]=None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Read a CSV input through the cache, like `pd.read_csv(url,
+        **kwargs)`.
+
+        The first read of given content with given `kwargs` parses the CSV and
+        stores the result as an Arrow file. Later reads memory-map that file.
+        Tables Arrow cannot represent are parsed every time.
+        """
+        # the parsed copy may outlive the raw content it was parsed from
+        content_digest = self._lookup_digest(
+            url, digest or self._pins.get(url),
+        )
+        if content_digest is None or not self._is_cached(
+            self._get_parsed_path(content_digest, kwargs),
+        ):
+            content_digest = self.fetch_digest(url, digest=digest)
+        parsed_path = self._get_parsed_path(content_digest, kwargs)
+
+        if self._is_cached(parsed_path):
+            self._touch(parsed_path)
+            # the table's buffers keep the mapping open while referenced
+            source = pa.memory_map(os.path.join(self._cache_dir, parsed_path))
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+        res = pd.read_csv(
+            os.path.join(self._cache_dir, self._get_blob_path(content_digest)),
+            **kwargs,
+        )
+        try:
+            table = pa.Table.from_pandas(res)
+        except (pa.ArrowException, ValueError, TypeError):
+            return res
+
+        with tempfile.NamedTemporaryFile(
+            dir=self._cache_dir, delete=False,
+        ) as temp_file:
+            pass
+        with pa.OSFile(temp_file.name, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temp_file.name, os.path.join(self._cache_dir, parsed_path))
+        self._add_file(parsed_path)
+        return res
+
+    def close(self: 'InputCache') -> None:
+        self._connection.close()
+
+    def __enter__(self: 'InputCache') -> 'InputCache':
+        return self
+
+    def __exit__(self: 'InputCache', *args) -> None:
+        self.close()
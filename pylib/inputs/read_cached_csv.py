@@ -0,0 +1,27 @@
+import typing
+
+import pandas as pd
+
+from .InputCache import InputCache
+
+# created on first use, configured through environment variables
+_default_cache = None
+
+
+def read_cached_csv(
+    url: str,
+    *,
+    digest: typing.Optional[str]=None,
+    **kwargs,
+) -> pd.DataFrame:
+    """Drop-in replacement for `pd.read_csv(url, **kwargs)` that reads
+    through a default `InputCache`.
+
+    Configure the default cache with the PYLIB_INPUT_CACHE_DIR and
+    PYLIB_INPUT_CACHE_OFFLINE environment variables. Pass `digest` to pin
+    the expected SHA-256 hex digest of the downloaded content.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = InputCache()
+    return _default_cache.read_csv(url, digest=digest, **kwargs)
@@ -0,0 +1,22 @@
+import json
+import os
+import typing
+
+
+class NotebookInstance(typing.NamedTuple):
+    """One execution of a notebook: the notebook itself, or one endomill
+    instance of it."""
+
+    notebook_path: str
+    # endomill parameter pack, or None to execute the notebook in place
+    parameter_pack: typing.Optional[typing.Dict[str, typing.Any]]=None
+
+    def get_key(self: 'NotebookInstance', root: str) -> str:
+        """Identify the instance by notebook path, relative to `root`, and
+        parameter pack."""
+        res = os.path.relpath(self.notebook_path, root)
+        if self.parameter_pack is not None:
+            res += ' ' + json.dumps(
+                self.parameter_pack, sort_keys=True, default=str,
+            )
+        return res
@@ -0,0 +1,48 @@
+import argparse
+import sys
+
+from .execute_notebooks import execute_notebooks
+
+parser = argparse.ArgumentParser(
+    prog='python3 -m pylib.notebooks',
+    description='Execute notebooks and endomill instances concurrently, '
+    'skipping any unchanged since their last successful run.',
+)
+parser.add_argument('root', help='directory to search for notebooks')
+parser.add_argument(
+    '-j', '--jobs', type=int, default=None,
+    help='maximum number of concurrent instances (default: CPU count)',
+)
+parser.add_argument(
+    '--input', action='append', default=[], dest='input_paths',
+    help='glob, relative to notebook directories, of input data files; '
+    'may be repeated',
+)
+parser.add_argument('--report', default=None, help='timing report CSV path')
+parser.add_argument(
+    '--force', action='store_true', help='execute unchanged instances too',
+)
+parser.add_argument(
+    '--profile-dir', default=None,
+    help='directory to write a profiling report JSON to for each instance',
+)
+parser.add_argument(
+    '--profile-memory', action='store_true',
+    help='also trace peak memory in profiling reports',
+)
+args = parser.parse_args()
+
+report = execute_notebooks(
+    args.root,
+    num_processes=args.jobs,
+    input_paths=args.input_paths,
+    report_path=args.report,
+    force=args.force,
+    profile_dir=args.profile_dir,
+    profile_memory=args.profile_memory,
+)
+print(report.drop('Error', axis=1).to_string())
+failed = report[report['Status'] == 'failed']
+for __, row in failed.iterrows():
+    print(f'failed {row["Notebook"]} {row["Parameters"]}: {row["Error"]}')
+sys.exit(1 if len(failed) else 0)
@@ -0,0 +1,63 @@
+import glob
+import hashlib
+import json
+import os
+import typing
+
+import nbformat
+
+from .NotebookInstance import NotebookInstance
+
+
+def _update_with_file(digest: 'hashlib._Hash', path: str) -> None:
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(2**20), b''):
+            digest.update(block)
+
+
+def calc_notebook_instance_digest(
+    instance: NotebookInstance,
+    input_paths: typing.Iterable[str]=(),
+) -> str:
+    """Hash everything an instance's results depend on.
+
+    Covers the notebook's cell sources (not outputs, which executing in place
+    rewrites), its parameter pack, pylib's sources, any parameter value naming
+    an existing file, and files matching `input_paths` glob patterns. Paths
+    are relative to the notebook's directory.
+    """
+    notebook_dir = os.path.dirname(os.path.abspath(instance.notebook_path))
+    notebook = nbformat.read(instance.notebook_path, as_version=4)
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([
+        (cell.cell_type, cell.source) for cell in notebook.cells
+    ]).encode())
+    digest.update(json.dumps(
+        instance.parameter_pack, sort_keys=True, default=str,
+    ).encode())
+
+    pylib_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    dependency_paths = {
+        path
+        for path in glob.glob(
+            os.path.join(pylib_dir, '**', '*.py'), recursive=True,
+        )
+        if not path.startswith(os.path.join(pylib_dir, 'test', ''))
+    }
+    for value in (instance.parameter_pack or {}).values():
+        if isinstance(value, str) \
+                and os.path.isfile(os.path.join(notebook_dir, value)):
+            dependency_paths.add(os.path.join(notebook_dir, value))
+    for pattern in input_paths:
+        dependency_paths.update(
+            path for path in glob.glob(
+                os.path.join(notebook_dir, pattern), recursive=True,
+            )
+            if os.path.isfile(path)
+        )
+
+    for path in sorted(dependency_paths):
+        digest.update(os.path.relpath(path, notebook_dir).encode())
+        _update_with_file(digest, path)
+    return digest.hexdigest()
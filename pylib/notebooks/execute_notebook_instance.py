@@ -0,0 +1,109 @@
+import itertools as it
+import os
+import shutil
+import tempfile
+
+from keyname import keyname as kn
+import nbclient
+import nbformat
+import papermill
+from slugify import slugify
+
+from .NotebookInstance import NotebookInstance
+
+
+def _move_into(source: str, destination_dir: str) -> None:
+    destination = os.path.join(destination_dir, os.path.basename(source))
+    if os.path.isdir(source) and os.path.isdir(destination):
+        for entry in os.listdir(source):
+            _move_into(os.path.join(source, entry), destination)
+        os.rmdir(source)
+    else:
+        os.replace(source, destination)
+
+
+def _execute_in_place(notebook_path: str) -> None:
+    notebook = nbformat.read(notebook_path, as_version=4)
+    nbclient.NotebookClient(
+        notebook,
+        timeout=None,
+        resources={'metadata': {'path': os.path.dirname(notebook_path)}},
+    ).execute()
+    nbformat.write(notebook, notebook_path)
+
+
+def _execute_endomill_instance(instance: NotebookInstance) -> None:
+    notebook_dir = os.path.dirname(instance.notebook_path)
+    # endomill instances write executing.endomill.ipynb (and copy it out
+    # at kernel exit) in their working directory, so give each instance its
+    # own, mirroring the notebook's directory through symlinks
+    scratch_dir = tempfile.mkdtemp(prefix='.endomill-', dir=notebook_dir)
+    for entry in os.listdir(notebook_dir):
+        if entry != os.path.basename(scratch_dir):
+            os.symlink(
+                os.path.join('..', entry),
+                os.path.join(scratch_dir, entry),
+            )
+    before = {*os.listdir(scratch_dir)}
+
+    executing_path = os.path.join(scratch_dir, 'executing.endomill.ipynb')
+    os.environ['NOTEBOOK_PATH'] = executing_path
+    papermill.execute_notebook(
+        instance.notebook_path,
+        executing_path,
+        parameters=instance.parameter_pack,
+        cwd=scratch_dir,
+        progress_bar=False,
+    )
+
+    created = {*os.listdir(scratch_dir)} - before - {
+        'executing.endomill.ipynb',
+    }
+    if not any(entry.endswith('.ipynb') for entry in created):
+        # name the instance the way endomill does
+        outpath = kn.pack({
+            **{
+                slugify(str(k)): slugify(str(v))
+                for k, v in instance.parameter_pack.items()
+            },
+            'ext': '.endomill.ipynb',
+        })
+        if len(outpath.encode()) > 255:
+            outpath = next(
+                fallback for fallback in (
+                    f'fallback{i}.endomill.ipynb' for i in it.count()
+                )
+                if not os.path.exists(os.path.join(notebook_dir, fallback))
+            )
+        shutil.copy(executing_path, os.path.join(scratch_dir, outpath))
+        created.add(outpath)
+
+    for entry in sorted(created):
+        _move_into(os.path.join(scratch_dir, entry), notebook_dir)
+    shutil.rmtree(scratch_dir)
+
+
+def execute_notebook_instance(instance: NotebookInstance) -> None:
+    """Execute a notebook in place, or execute one endomill instance of it.
+
+    Endomill instances are executed directly with papermill, as
+    `endomill.instantiate_one` would from within the notebook, and the milled
+    notebook and any other files the instance creates are moved into the
+    notebook's directory. Instances of the same notebook may be executed
+    concurrently, in separate processes. If an instance fails, its scratch
+    directory (`.endomill-*`) is left in place for inspection.
+
+    Sets the NOTEBOOK_NAME and NOTEBOOK_PATH environment variables, as
+    `execute_notebooks.sh` does.
+    """
+    notebook_path = os.path.abspath(instance.notebook_path)
+    os.environ['NOTEBOOK_NAME'] = os.path.splitext(
+        os.path.basename(notebook_path),
+    )[0]
+    os.environ['NOTEBOOK_PATH'] = notebook_path
+    if instance.parameter_pack is None:
+        _execute_in_place(notebook_path)
+    else:
+        _execute_endomill_instance(instance._replace(
+            notebook_path=notebook_path,
+        ))
@@ -0,0 +1,177 @@
+from concurrent import futures
+import hashlib
+import json
+import os
+import time
+import traceback
+import typing
+
+import pandas as pd
+from slugify import slugify
+
+from .calc_notebook_instance_digest import calc_notebook_instance_digest
+from .execute_notebook_instance import execute_notebook_instance
+from .find_notebook_instances import find_notebook_instances
+from .NotebookInstance import NotebookInstance
+
+
+def _timed_execute(
+    instance: NotebookInstance,
+    profile_environ: typing.Dict[str, str],
+) -> float:
+    # inherited by the kernel, enabling pylib's profiling registry there
+    for key in 'PYLIB_PROFILE_REPORT', 'PYLIB_PROFILE_MEMORY':
+        os.environ.pop(key, None)
+    os.environ.update(profile_environ)
+    begin = time.perf_counter()
+    execute_notebook_instance(instance)
+    return time.perf_counter() - begin
+
+
+def _get_profile_environ(
+    key: str,
+    profile_dir: typing.Optional[str],
+    profile_memory: bool,
+) -> typing.Dict[str, str]:
+    if profile_dir is None:
+        return {}
+    # readable, and unique even if slugs collide or are truncated
+    filename = slugify(key)[:200] \
+        + '-' + hashlib.sha1(key.encode()).hexdigest()[:8] + '.json'
+    res = {'PYLIB_PROFILE_REPORT': os.path.join(profile_dir, filename)}
+    if profile_memory:
+        res['PYLIB_PROFILE_MEMORY'] = '1'
+    return res
+
+
+def _write_json_atomic(path: str, data: typing.Any) -> None:
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(data, file, indent=1, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def execute_notebooks(
+    root: str,
+    *,
+    num_processes: typing.Optional[int]=None,
+    input_paths: typing.Iterable[str]=(),
+    record_path: typing.Optional[str]=None,
+    report_path: typing.Optional[str]=None,
+    force: bool=False,
+    profile_dir: typing.Optional[str]=None,
+    profile_memory: bool=False,
+) -> pd.DataFrame:
+    """Execute every notebook and endomill instance under `root`, skipping
+    any unchanged since its last successful run.
+
+    Instances are treated as independent and executed concurrently across a
+    bounded process pool. Each successful run is recorded, with the digest
+    from `calc_notebook_instance_digest`, as soon as it completes, so an
+    interrupted rebuild resumes where it left off. Failed instances are
+    reported and retried next time; other instances still run.
+
+    Parameters
+    ----------
+    root : str
+        Directory to search for notebooks, recursively.
+    num_processes : int, optional
+        Maximum number of instances executing at once. Defaults to the CPU
+        count.
+    input_paths : iterable of str
+        Glob patterns, relative to each notebook's directory, of input data
+        files whose contents a run depends on.
+    record_path : str, optional
+        JSON file of successful runs. Defaults to
+        `{root}/.execute_notebooks.json`.
+    report_path : str, optional
+        CSV file to write the timing report to. Defaults to
+        `{root}/execute_notebooks_report.csv`.
+    force : bool, default False
+        Execute every instance, even if unchanged.
+    profile_dir : str, optional
+        Directory to write a JSON report from `default_profiling_registry`
+        to for each executed instance, named after the instance. Created if
+        it does not exist. Only phases instrumented in pylib and run in the
+        instance's kernel are reported.
+    profile_memory : bool, default False
+        Also trace peak memory of each phase, with tracemalloc. Ignored
+        without `profile_dir`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Timing report, with one row per instance and columns 'Notebook',
+        'Parameters', 'Status' ('executed', 'skipped', or 'failed'),
+        'Seconds' (for skipped instances, from their recorded run), and
+        'Error'.
+    """
+    if record_path is None:
+        record_path = os.path.join(root, '.execute_notebooks.json')
+    if report_path is None:
+        report_path = os.path.join(root, 'execute_notebooks_report.csv')
+    input_paths = [*input_paths]
+    if profile_dir is not None:
+        profile_dir = os.path.abspath(profile_dir)
+        os.makedirs(profile_dir, exist_ok=True)
+
+    records = {}
+    if os.path.exists(record_path):
+        with open(record_path) as file:
+            records = json.load(file)
+
+    instances = find_notebook_instances(root, num_processes=num_processes)
+    digests = {
+        instance.get_key(root): calc_notebook_instance_digest(
+            instance, input_paths,
+        )
+        for instance in instances
+    }
+
+    rows = {}
+    pending = []
+    for instance in instances:
+        key = instance.get_key(root)
+        rows[key] = {
+            'Notebook': os.path.relpath(instance.notebook_path, root),
+            'Parameters': json.dumps(instance.parameter_pack, default=str)
+                if instance.parameter_pack is not None else '',
+            'Status': 'skipped',
+            'Seconds': records.get(key, {}).get('seconds', float('nan')),
+            'Error': '',
+        }
+        if force or records.get(key, {}).get('digest') != digests[key]:
+            pending.append(instance)
+
+    with futures.ProcessPoolExecutor(max_workers=num_processes) as executor:
+        submitted = {
+            executor.submit(
+                _timed_execute,
+                instance,
+                _get_profile_environ(
+                    instance.get_key(root), profile_dir, profile_memory,
+                ),
+            ): instance
+            for instance in pending
+        }
+        for future in futures.as_completed(submitted):
+            key = submitted[future].get_key(root)
+            try:
+                seconds = future.result()
+            except Exception as e:
+                rows[key].update({
+                    'Status': 'failed',
+                    'Seconds': float('nan'),
+                    'Error': ''.join(
+                        traceback.format_exception_only(type(e), e),
+                    ).strip(),
+                })
+                records.pop(key, None)
+            else:
+                rows[key].update({'Status': 'executed', 'Seconds': seconds})
+                records[key] = {'digest': digests[key], 'seconds': seconds}
+            _write_json_atomic(record_path, records)
+
+    res = pd.DataFrame.from_records([*rows.values()])
+    res.to_csv(report_path, index=False)
+    return res
@@ -0,0 +1,101 @@
+import contextlib
+import io
+import os
+import sys
+import types
+import typing
+
+import nbformat
+
+
+class _ParameterPacksFound(Exception):
+
+    def __init__(
+        self: '_ParameterPacksFound',
+        parameter_packs: typing.List[typing.Dict],
+    ) -> None:
+        super().__init__()
+        self.parameter_packs = parameter_packs
+
+
+def _make_endomill_stub() -> types.ModuleType:
+    """Stand-in for endomill that captures parameter packs instead of
+    executing instances."""
+    res = types.ModuleType('endomill')
+
+    def instantiate_over(parameter_packs, should_halt=True):
+        raise _ParameterPacksFound([*parameter_packs])
+
+    def instantiate_one(parameter_pack, should_halt=True):
+        raise _ParameterPacksFound([parameter_pack])
+
+    res.instantiate_over = instantiate_over
+    res.instantiate_one = instantiate_one
+    res.add_instance_outpath = lambda outpath: None
+    res.in_interactive_notebook = lambda: False
+    return res
+
+
+def _strip_magics(source: str) -> str:
+    return '\n'.join(
+        '' if line.lstrip().startswith(('%', '!')) else line
+        for line in source.splitlines()
+    )
+
+
+def extract_parameter_packs(
+    notebook_path: str,
+) -> typing.Optional[typing.List[typing.Dict[str, typing.Any]]]:
+    """Find the parameter packs an endomill notebook instantiates over.
+
+    Runs the notebook's code cells, in the notebook's directory, up through
+    the first cell that calls `endomill.instantiate_over` (or
+    `instantiate_one`), with endomill stubbed out to capture its arguments.
+    Run this in a throwaway process; cells' imports and other side effects
+    persist.
+
+    Returns
+    -------
+    list of dict, optional
+        Parameter packs, or None if the notebook does not use endomill.
+    """
+    notebook_path = os.path.abspath(notebook_path)
+    notebook = nbformat.read(notebook_path, as_version=4)
+    sources = [
+        cell.source for cell in notebook.cells if cell.cell_type == 'code'
+    ]
+    num_cells = next(
+        (
+            index + 1 for index, source in enumerate(sources)
+            if 'instantiate_over' in source or 'instantiate_one' in source
+        ),
+        None,
+    )
+    if num_cells is None:
+        return None
+
+    notebook_dir = os.path.dirname(notebook_path)
+    prev_cwd = os.getcwd()
+    prev_endomill = sys.modules.get('endomill')
+    sys.modules['endomill'] = _make_endomill_stub()
+    sys.path.insert(0, notebook_dir)
+    os.chdir(notebook_dir)
+    namespace = {'__name__': '__main__'}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for source in sources[:num_cells]:
+                exec(
+                    compile(_strip_magics(source), notebook_path, 'exec'),
+                    namespace,
+                )
+    except _ParameterPacksFound as found:
+        return found.parameter_packs
+    finally:
+        os.chdir(prev_cwd)
+        sys.path.remove(notebook_dir)
+        if prev_endomill is None:
+            del sys.modules['endomill']
+        else:
+            sys.modules['endomill'] = prev_endomill
+
+    raise ValueError(f'{notebook_path} never instantiated endomill instances')
@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+import typing
+
+from .extract_parameter_packs import extract_parameter_packs
+from .NotebookInstance import NotebookInstance
+
+
+def find_notebook_instances(
+    root: str,
+    *,
+    num_processes: typing.Optional[int]=None,
+) -> typing.List[NotebookInstance]:
+    """Find notebooks under `root` and the endomill instances of each.
+
+    Notebooks that instantiate endomill parameter packs yield one instance
+    per pack; other notebooks yield a single in-place instance. Milled
+    `.endomill.ipynb` outputs, hidden directories, and symlinked
+    directories (e.g., `pylib`) are skipped. Parameter packs are extracted in
+    a fresh process per notebook, since doing so runs the notebooks' setup
+    cells.
+    """
+    notebook_paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            dirname for dirname in dirnames
+            if not dirname.startswith('.')
+            and not os.path.islink(os.path.join(dirpath, dirname))
+        )
+        notebook_paths.extend(
+            os.path.join(dirpath, filename)
+            for filename in sorted(filenames)
+            if filename.endswith('.ipynb')
+            and not filename.endswith('.endomill.ipynb')
+        )
+
+    # one notebook per worker process, so no notebook's imports or global
+    # state leak into another's extraction
+    with multiprocessing.Pool(num_processes, maxtasksperchild=1) as pool:
+        all_parameter_packs = pool.map(
+            extract_parameter_packs, notebook_paths, chunksize=1,
+        )
+
+    return [
+        NotebookInstance(notebook_path, parameter_pack)
+        for notebook_path, parameter_packs
+        in zip(notebook_paths, all_parameter_packs)
+        for parameter_pack in (
+            [None] if parameter_packs is None else parameter_packs
+        )
+    ]
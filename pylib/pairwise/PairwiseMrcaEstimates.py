@@ -0,0 +1,103 @@
+import typing
+
+from keyname import keyname as kn
+import numpy as np
+import pandas as pd
+
+# configuration fields keyname-packed into bundle keys by the simulation
+# notebooks, and the pairwise MRCA estimates table columns they fill
+CONFIGURATION_KEYNAME_COLUMNS = {
+    'differentia': 'Differentia Bit Width',
+    'policy': 'Stratum Retention Policy',
+    'resolution': 'Stratum Retention Policy Resolution Parameter',
+    'actual_bits': 'Stratigraphic Column Expected Retained Bits',
+    'target_bits': 'Stratigraphic Column Target Retained Bits',
+    'bits_error': 'Stratigraphic Column Expected Retained Bits Error',
+    'actual_strata': 'Stratigraphic Column Actual Num Retained Strata',
+}
+
+
+class PairwiseMrcaEstimates(typing.NamedTuple):
+    """Pairwise MRCA estimates between taxa, stored as typed columns.
+
+    Each pair of taxa appears once, with taxon compared from preceding taxon
+    compared to. Estimate arrays have one row per column configuration and one
+    column per pair, with missing estimates as NaN.
+    """
+
+    # column configuration names (e.g., keyname-packed bundle keys)
+    configurations: typing.List[str]
+    # confidence level actually provided by MRCA bounds, per configuration
+    confidence_levels: np.ndarray
+    # number of strata deposited, per taxon
+    taxon_generations: np.ndarray
+    # taxon index, per pair
+    taxon_from_indices: np.ndarray
+    taxon_to_indices: np.ndarray
+    # shape (num configurations, num pairs)
+    mrca_lbs: np.ndarray
+    mrca_ubs: np.ndarray
+    earliest_detectable_mrca_ranks: np.ndarray
+
+    @property
+    def num_pairs(self: 'PairwiseMrcaEstimates') -> int:
+        return len(self.taxon_from_indices)
+
+    def to_dataframe(
+        self: 'PairwiseMrcaEstimates',
+        taxon_labels: typing.Optional[typing.Sequence[typing.Any]]=None,
+    ) -> pd.DataFrame:
+        """Expand into a long-form pairwise MRCA estimates table, with one row
+        per pair per configuration.
+
+        Column names match those of the `pairwise_mrca_estimates` tables
+        written by the simulation notebooks. Fields keyname-packed into
+        configuration names (e.g., `policy`, `differentia`, and
+        `target_bits`) are unpacked into their own columns, as the notebooks
+        do, so the table can be passed to `export_pairwise_mrca_index` with
+        its default configuration columns. Configurations missing a field
+        have None in its column.
+
+        Parameters
+        ----------
+        taxon_labels : sequence, optional
+            Label for each taxon. Defaults to taxon index.
+        """
+        num_configurations = len(self.configurations)
+        from_indices = np.repeat(self.taxon_from_indices, num_configurations)
+        to_indices = np.repeat(self.taxon_to_indices, num_configurations)
+        if taxon_labels is None:
+            taxon_labels = np.arange(len(self.taxon_generations))
+        taxon_labels = np.asarray(taxon_labels)
+
+        unpacked = [*map(kn.unpack, self.configurations)]
+        configuration_fields = {
+            column: np.tile(
+                np.array([attrs.get(key) for attrs in unpacked], dtype=object),
+                self.num_pairs,
+            )
+            for key, column in CONFIGURATION_KEYNAME_COLUMNS.items()
+            if any(key in attrs for attrs in unpacked)
+        }
+
+        return pd.DataFrame({
+            'Column Configuration': np.tile(
+                np.asarray(self.configurations, dtype=object),
+                self.num_pairs,
+            ),
+            **configuration_fields,
+            'Taxon Compared From': taxon_labels[from_indices],
+            'Taxon Compared To': taxon_labels[to_indices],
+            'Generation of Taxon Compared From':
+                self.taxon_generations[from_indices],
+            'Generation of Taxon Compared To':
+                self.taxon_generations[to_indices],
+            'Generation Of MRCA Lower Bound (inclusive)':
+                self.mrca_lbs.T.ravel(),
+            'Generation Of MRCA Upper Bound (exclusive)':
+                self.mrca_ubs.T.ravel(),
+            'MRCA Bound Confidence':
+                np.tile(self.confidence_levels, self.num_pairs),
+            'Rank of Earliest Detectable Mrca With':
+                self.earliest_detectable_mrca_ranks.T.ravel(),
+        })
@@ -0,0 +1,176 @@
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+from . import _pairwise_mrca_table_format as fmt
+
+
+class PairwiseMrcaTableReader:
+    """Read a columnar pairwise MRCA estimates table written by
+    `PairwiseMrcaTableWriter`.
+
+    Binary columns are memory-mapped, so only fields and rows actually
+    requested are paged in from disk. Loading may be restricted to selected
+    fields and to selected column configurations.
+    """
+
+    _path: str
+    _meta: typing.Dict[str, typing.Any]
+    # map from field name to index into meta columns
+    _column_indices: typing.Dict[str, int]
+
+    def __init__(self: 'PairwiseMrcaTableReader', path: str) -> None:
+        self._path = path
+        self._meta = fmt.read_meta(path)
+        self._column_indices = {
+            column['name']: index
+            for index, column in enumerate(self._meta['columns'] or ())
+        }
+
+    def __len__(self: 'PairwiseMrcaTableReader') -> int:
+        return self._meta['num_rows']
+
+    @property
+    def configuration_columns(
+        self: 'PairwiseMrcaTableReader',
+    ) -> typing.List[str]:
+        """Dictionary-encoded fields, configuration key first."""
+        return [*(self._meta['configuration_columns'] or ())]
+
+    @property
+    def columns(self: 'PairwiseMrcaTableReader') -> typing.List[str]:
+        """All fields, configuration fields first."""
+        return self.configuration_columns + [*self._column_indices]
+
+    @property
+    def configurations(self: 'PairwiseMrcaTableReader') -> pd.DataFrame:
+        """Dictionary of configuration fields, indexed by configuration
+        code."""
+        return pd.DataFrame.from_records(
+            self._meta['configurations'],
+            columns=self.configuration_columns,
+        )
+
+    def _memmap(
+        self: 'PairwiseMrcaTableReader',
+        filename: str,
+        dtype: str,
+    ) -> np.ndarray:
+        if not len(self):
+            return np.empty(0, dtype=dtype)
+        return np.memmap(
+            os.path.join(self._path, filename),
+            dtype=dtype,
+            mode='r',
+            shape=(len(self),),
+        )
+
+    def get_configuration_codes(
+        self: 'PairwiseMrcaTableReader',
+    ) -> np.ndarray:
+        """Memory-mapped configuration code of each row."""
+        return self._memmap(
+            fmt.CONFIGURATION_CODES_FILENAME,
+            fmt.CONFIGURATION_CODE_DTYPE,
+        )
+
+    def select_rows(
+        self: 'PairwiseMrcaTableReader',
+        configurations: typing.Sequence[typing.Any],
+    ) -> np.ndarray:
+        """Indices of rows belonging to any of `configurations`, identified by
+        configuration key."""
+        codes_by_key = {
+            values[0]: code
+            for code, values in enumerate(self._meta['configurations'])
+        }
+        try:
+            selected_codes = [codes_by_key[key] for key in configurations]
+        except KeyError as e:
+            raise KeyError(f'unknown configuration {e.args[0]!r}') from None
+        return np.flatnonzero(
+            np.isin(self.get_configuration_codes(), selected_codes),
+        )
+
+    def get_values(
+        self: 'PairwiseMrcaTableReader',
+        column: str,
+        rows: typing.Optional[np.ndarray]=None,
+    ) -> np.ndarray:
+        """Stored values of a non-configuration field, memory-mapped if `rows`
+        is None. Nulls in integer fields hold zero; see `get_nulls`."""
+        index = self._column_indices[column]
+        dtype = '<i8' if self._meta['columns'][index]['dtype'] == 'int' \
+            else '<f8'
+        res = self._memmap(fmt.get_values_filename(index), dtype)
+        return res if rows is None else res[rows]
+
+    def get_nulls(
+        self: 'PairwiseMrcaTableReader',
+        column: str,
+        rows: typing.Optional[np.ndarray]=None,
+    ) -> np.ndarray:
+        """Null mask of a non-configuration field."""
+        index = self._column_indices[column]
+        if self._meta['columns'][index]['dtype'] == 'float':
+            return np.isnan(self.get_values(column, rows))
+        res = self._memmap(
+            fmt.get_nulls_filename(index),
+            fmt.NULLS_DTYPE,
+        ).view(bool)
+        return res if rows is None else res[rows]
+
+    def to_dataframe(
+        self: 'PairwiseMrcaTableReader',
+        columns: typing.Optional[typing.Sequence[str]]=None,
+        configurations: typing.Optional[typing.Sequence[typing.Any]]=None,
+    ) -> pd.DataFrame:
+        """Load selected fields and configurations into a DataFrame.
+
+        Integer fields load as nullable "Int64" and the configuration key as
+        categorical. Other configuration fields are expanded from the
+        dictionary.
+
+        Parameters
+        ----------
+        columns : sequence of str, optional
+            Fields to load. Defaults to all fields.
+        configurations : sequence, optional
+            Configuration keys of rows to load. Defaults to all rows.
+        """
+        if columns is None:
+            columns = self.columns
+        rows = None if configurations is None \
+            else self.select_rows(configurations)
+
+        needs_codes = any(
+            column in self.configuration_columns for column in columns
+        )
+        if needs_codes:
+            codes = self.get_configuration_codes()
+            codes = np.asarray(codes if rows is None else codes[rows])
+        dictionary = self.configurations
+
+        res = {}
+        for column in columns:
+            if column == self.configuration_columns[0]:
+                res[column] = pd.Categorical.from_codes(
+                    codes,
+                    categories=dictionary[column],
+                )
+            elif column in self.configuration_columns:
+                res[column] = dictionary[column].to_numpy()[codes]
+            elif column not in self._column_indices:
+                raise KeyError(f'unknown field {column!r}')
+            else:
+                values = np.asarray(self.get_values(column, rows))
+                if values.dtype.kind == 'i':
+                    values = pd.arrays.IntegerArray(
+                        values,
+                        np.asarray(self.get_nulls(column, rows)),
+                    )
+                res[column] = values
+
+        return pd.DataFrame(res)
@@ -0,0 +1,239 @@
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+from . import _pairwise_mrca_table_format as fmt
+
+
+class PairwiseMrcaTableWriter:
+    """Append pairwise MRCA estimate tables to a compact columnar directory.
+
+    Fields that are constant for each column configuration (retention policy,
+    resolution, target bits, etc.) are dictionary-encoded once per
+    configuration, leaving a single int32 configuration code per row.
+    Remaining fields are stored as fixed-width binary arrays: integer-valued
+    fields (taxon ids, generations, MRCA bounds, ...) as int64 with a
+    separate null mask and other numeric fields as float64. Read tables back
+    with `PairwiseMrcaTableReader`.
+
+    Each call to `append` writes one chunk, so tables too large for memory
+    can be written piece by piece (e.g., from
+    `PairwiseMrcaEstimates.to_dataframe` on chunks of pairs). Opening an
+    existing table continues appending to it. Metadata is updated only after
+    a chunk's data is fully written, so an interrupted append is discarded
+    when the table is next opened.
+    """
+
+    _path: str
+    _meta: typing.Dict[str, typing.Any]
+    # map from configuration key to configuration code
+    _configuration_codes: typing.Dict[typing.Any, int]
+    _configuration_columns: typing.Sequence[str]
+    _column_dtypes: typing.Dict[str, str]
+
+    def __init__(
+        self: 'PairwiseMrcaTableWriter',
+        path: str,
+        *,
+        configuration_columns: typing.Sequence[str]
+            =fmt.DEFAULT_CONFIGURATION_COLUMNS,
+        configuration_key: str=fmt.DEFAULT_CONFIGURATION_KEY,
+        column_dtypes: typing.Optional[typing.Dict[str, str]]=None,
+    ) -> None:
+        """Open table directory `path` for appending, creating it if needed.
+
+        Parameters
+        ----------
+        path : str
+            Table directory.
+        configuration_columns : sequence of str, optional
+            Fields to dictionary-encode per configuration, if present.
+            Ignored when appending to an existing table.
+        configuration_key : str, default "Column Configuration"
+            Field that uniquely identifies each configuration. Ignored when
+            appending to an existing table.
+        column_dtypes : dict, optional
+            Override inferred storage of fields, as "int" or "float". By
+            default, fields whose values are all integers (or null) are
+            stored as int.
+        """
+        self._path = path
+        self._configuration_columns = configuration_columns
+        self._column_dtypes = dict(column_dtypes or {})
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(os.path.join(path, fmt.META_FILENAME)):
+            self._meta = fmt.read_meta(path)
+            self._discard_partial_chunk()
+        else:
+            self._meta = {
+                'format': fmt.FORMAT_NAME,
+                'version': fmt.FORMAT_VERSION,
+                'configuration_key': configuration_key,
+                'configuration_columns': None,
+                'configurations': [],
+                'columns': None,
+                'num_rows': 0,
+            }
+            self._discard_uncommitted_files()
+        # configuration key is always the first field
+        self._configuration_codes = {
+            values[0]: code
+            for code, values in enumerate(self._meta['configurations'])
+        }
+
+    def _iter_files(
+        self: 'PairwiseMrcaTableWriter',
+    ) -> typing.Iterator[typing.Tuple[str, int]]:
+        """Yield filename and item size of each binary file."""
+        yield (
+            fmt.CONFIGURATION_CODES_FILENAME,
+            np.dtype(fmt.CONFIGURATION_CODE_DTYPE).itemsize,
+        )
+        for index, column in enumerate(self._meta['columns'] or ()):
+            yield fmt.get_values_filename(index), 8
+            if column['dtype'] == 'int':
+                yield fmt.get_nulls_filename(index), 1
+
+    def _discard_partial_chunk(self: 'PairwiseMrcaTableWriter') -> None:
+        num_rows = self._meta['num_rows']
+        for filename, itemsize in self._iter_files():
+            file_path = os.path.join(self._path, filename)
+            if os.path.exists(file_path):
+                os.truncate(file_path, num_rows * itemsize)
+
+    def _discard_uncommitted_files(
+        self: 'PairwiseMrcaTableWriter',
+    ) -> None:
+        """Remove binary files left by a first append that was interrupted
+        before metadata was ever written."""
+        for filename in os.listdir(self._path):
+            if filename == fmt.CONFIGURATION_CODES_FILENAME or (
+                filename.startswith('column') and filename.endswith('.bin')
+            ):
+                os.remove(os.path.join(self._path, filename))
+
+    def _init_schema(
+        self: 'PairwiseMrcaTableWriter',
+        df: pd.DataFrame,
+    ) -> None:
+        key = self._meta['configuration_key']
+        self._meta['configuration_columns'] = [key] + [
+            column for column in self._configuration_columns
+            if column in df.columns and column != key
+        ]
+        columns = []
+        for column in df.columns:
+            if column in self._meta['configuration_columns']:
+                continue
+            values = df[column]
+            if not pd.api.types.is_numeric_dtype(values):
+                raise ValueError(
+                    f'field {column!r} is not numeric; '
+                    'list it in configuration_columns if it is constant per '
+                    'configuration',
+                )
+            if column in self._column_dtypes:
+                dtype = self._column_dtypes[column]
+            elif pd.api.types.is_float_dtype(values):
+                finite = values.to_numpy()[np.isfinite(values.to_numpy())]
+                is_int = (finite == np.round(finite)).all()
+                dtype = 'int' if is_int else 'float'
+            else:
+                dtype = 'int'
+            assert dtype in ('int', 'float')
+            columns.append({'name': column, 'dtype': dtype})
+        self._meta['columns'] = columns
+
+    def _encode_configurations(
+        self: 'PairwiseMrcaTableWriter',
+        df: pd.DataFrame,
+    ) -> np.ndarray:
+        configuration_columns = self._meta['configuration_columns']
+        key = configuration_columns[0]
+        codes, uniques = pd.factorize(df[key])
+        if (codes < 0).any():
+            raise ValueError(f'field {key!r} has null values')
+
+        __, first_rows = np.unique(codes, return_index=True)
+        translation = np.empty(len(uniques), dtype=np.int32)
+        for unique_index, unique in enumerate(uniques):
+            unique = unique.item() if hasattr(unique, 'item') else unique
+            if unique not in self._configuration_codes:
+                row = df.iloc[first_rows[unique_index]]
+                self._configuration_codes[unique] = len(
+                    self._meta['configurations'],
+                )
+                self._meta['configurations'].append([
+                    unique,
+                    *(
+                        value.item() if hasattr(value, 'item') else value
+                        for value in row[configuration_columns[1:]]
+                    ),
+                ])
+            translation[unique_index] = self._configuration_codes[unique]
+
+        return translation[codes]
+
+    def _append_file(
+        self: 'PairwiseMrcaTableWriter',
+        filename: str,
+        values: np.ndarray,
+    ) -> None:
+        with open(os.path.join(self._path, filename), 'ab') as file:
+            file.write(np.ascontiguousarray(values).tobytes())
+
+    def append(self: 'PairwiseMrcaTableWriter', df: pd.DataFrame) -> None:
+        """Append rows of a pairwise MRCA estimates table.
+
+        The first chunk appended to a new table fixes its fields; later
+        chunks must have the same fields. Row index is not stored.
+        """
+        if self._meta['columns'] is None:
+            self._init_schema(df)
+
+        expected_columns = {
+            *self._meta['configuration_columns'],
+            *(column['name'] for column in self._meta['columns']),
+        }
+        if set(df.columns) != expected_columns:
+            raise ValueError(
+                f'fields {sorted(df.columns)} do not match table fields '
+                f'{sorted(expected_columns)}',
+            )
+
+        encoded = []
+        for index, column in enumerate(self._meta['columns']):
+            values = df[column['name']].to_numpy(dtype=float, na_value=np.nan)
+            if column['dtype'] == 'float':
+                encoded.append((index, values.astype('<f8'), None))
+                continue
+            nulls = np.isnan(values)
+            filled = np.where(nulls, 0, values)
+            if (filled != np.round(filled)).any():
+                raise ValueError(
+                    f'field {column["name"]!r} has non-integer values; '
+                    'store it as float with column_dtypes',
+                )
+            encoded.append((index, filled.astype('<i8'), nulls))
+
+        codes = self._encode_configurations(df)
+        self._append_file(
+            fmt.CONFIGURATION_CODES_FILENAME,
+            codes.astype(fmt.CONFIGURATION_CODE_DTYPE),
+        )
+        for index, values, nulls in encoded:
+            self._append_file(fmt.get_values_filename(index), values)
+            if nulls is not None:
+                self._append_file(
+                    fmt.get_nulls_filename(index),
+                    nulls.astype(fmt.NULLS_DTYPE),
+                )
+
+        self._meta['num_rows'] += len(df)
+        fmt.write_meta(self._path, self._meta)
+
+    @property
+    def num_rows(self: 'PairwiseMrcaTableWriter') -> int:
+        return self._meta['num_rows']
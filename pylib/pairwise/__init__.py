@@ -0,0 +1,17 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'calc_upper_triangle_pair_offsets',
+    'calc_upper_triangle_row_chunks',
+    'estimate_pairwise_mrca',
+    'export_pairwise_mrca_index',
+    'load_pairwise_mrca_estimates',
+    'PairwiseMrcaEstimates',
+    'PairwiseMrcaTableReader',
+    'PairwiseMrcaTableWriter',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
@@ -0,0 +1,24 @@
+import argparse
+
+import pandas as pd
+
+from .export_pairwise_mrca_index import export_pairwise_mrca_index
+
+parser = argparse.ArgumentParser(
+    prog='python3 -m pylib.pairwise',
+    description='Export a pairwise MRCA estimates table as the binary index '
+    'read by phylogeny_visualizations/phylogeny.js.',
+)
+parser.add_argument(
+    'source', help='pairwise_mrca_estimates CSV path or URL, maybe gzipped',
+)
+parser.add_argument('out_dir', help='index directory to create')
+parser.add_argument(
+    '--shard-size', type=int, default=2**16,
+    help='approximate number of taxon pairs per shard',
+)
+args = parser.parse_args()
+
+export_pairwise_mrca_index(
+    pd.read_csv(args.source), args.out_dir, shard_size=args.shard_size,
+)
@@ -0,0 +1,63 @@
+import json
+import os
+import typing
+
+# On-disk layout of a pairwise MRCA table directory:
+#
+#   meta.json              schema, configuration dictionary, and row count
+#   configuration.bin      int32 configuration code per row
+#   column{k}.bin          fixed-width little-endian values per row
+#   column{k}.nulls.bin    uint8 null flag per row (integer columns only)
+#
+# Binary files are appended to chunk by chunk and read back by memory map.
+
+FORMAT_NAME = 'pairwise_mrca_table'
+FORMAT_VERSION = 1
+
+META_FILENAME = 'meta.json'
+CONFIGURATION_CODES_FILENAME = 'configuration.bin'
+CONFIGURATION_CODE_DTYPE = '<i4'
+NULLS_DTYPE = 'u1'
+
+# fields written by the simulation notebooks that are constant for each
+# column configuration
+DEFAULT_CONFIGURATION_COLUMNS = (
+    'Differentia Bit Width',
+    'MRCA Bound Confidence',
+    'Stratigraphic Column Actual Num Retained Strata',
+    'Stratigraphic Column Expected Retained Bits',
+    'Stratigraphic Column Expected Retained Bits Error',
+    'Stratigraphic Column Mean Actual Retained Bits',
+    'Stratigraphic Column Target Retained Bits',
+    'Stratum Retention Policy',
+    'Stratum Retention Policy Resolution Parameter',
+)
+DEFAULT_CONFIGURATION_KEY = 'Column Configuration'
+
+
+def get_values_filename(column_index: int) -> str:
+    return f'column{column_index}.bin'
+
+
+def get_nulls_filename(column_index: int) -> str:
+    return f'column{column_index}.nulls.bin'
+
+
+def read_meta(path: str) -> typing.Dict[str, typing.Any]:
+    with open(os.path.join(path, META_FILENAME)) as file:
+        meta = json.load(file)
+    if meta.get('format') != FORMAT_NAME:
+        raise ValueError(f'{path} is not a pairwise MRCA table')
+    if meta['version'] > FORMAT_VERSION:
+        raise ValueError(
+            f'{path} has unsupported format version {meta["version"]}',
+        )
+    return meta
+
+
+def write_meta(path: str, meta: typing.Dict[str, typing.Any]) -> None:
+    # write then rename, so readers never observe a partial file
+    temp_path = os.path.join(path, META_FILENAME + '.tmp')
+    with open(temp_path, 'w') as file:
+        json.dump(meta, file, indent=1)
+    os.replace(temp_path, os.path.join(path, META_FILENAME))
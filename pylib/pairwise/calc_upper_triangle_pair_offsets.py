@@ -0,0 +1,10 @@
+import numpy as np
+
+
+def calc_upper_triangle_pair_offsets(
+    rows: np.ndarray,
+    num_taxa: int,
+) -> np.ndarray:
+    """How many strict upper triangle pairs precede each row?"""
+    rows = np.asarray(rows, dtype=np.int64)
+    return rows * (num_taxa - 1) - rows * (rows - 1) // 2
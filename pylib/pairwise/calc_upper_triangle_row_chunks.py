@@ -0,0 +1,33 @@
+import numpy as np
+
+from .calc_upper_triangle_pair_offsets \
+    import calc_upper_triangle_pair_offsets
+
+
+def calc_upper_triangle_row_chunks(
+    num_taxa: int,
+    chunk_size: int,
+) -> np.ndarray:
+    """Split rows of a strict upper triangle into contiguous chunks of about
+    `chunk_size` pairs each.
+
+    Row i of the strict upper triangle holds pairs (i, i + 1) through
+    (i, num_taxa - 1). Chunks never split a row, so a chunk may exceed
+    `chunk_size` if a single row does.
+
+    Returns
+    -------
+    array of int
+        Row boundaries; chunk k spans rows [res[k], res[k + 1]).
+    """
+    assert chunk_size > 0
+    pairs_before_row = calc_upper_triangle_pair_offsets(
+        np.arange(num_taxa + 1),
+        num_taxa,
+    )
+    num_pairs = pairs_before_row[-1]
+    targets = np.arange(0, num_pairs, chunk_size)
+    boundaries = np.searchsorted(pairs_before_row, targets, side='left')
+    return np.unique(
+        np.concatenate([[0], boundaries, [num_taxa]]),
+    ).astype(np.int64)
@@ -0,0 +1,215 @@
+from concurrent import futures
+import os
+import typing
+
+import numpy as np
+
+from .calc_upper_triangle_pair_offsets \
+    import calc_upper_triangle_pair_offsets
+from .calc_upper_triangle_row_chunks import calc_upper_triangle_row_chunks
+from .PairwiseMrcaEstimates import PairwiseMrcaEstimates
+
+# columns and settings shared by all chunks evaluated in this process
+_worker_state = {}
+
+
+def _init_worker(
+    columns: typing.Sequence[typing.Any],
+    configurations: typing.Sequence[str],
+    confidence_level: float,
+) -> None:
+    _worker_state['columns'] = columns
+    _worker_state['configurations'] = configurations
+    _worker_state['confidence_level'] = confidence_level
+
+
+def _calc_chunk_pairs(
+    row_begin: int,
+    row_end: int,
+    num_taxa: int,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    rows = np.arange(row_begin, row_end)
+    row_lengths = num_taxa - 1 - rows
+    from_indices = np.repeat(rows, row_lengths)
+    # position within row, counting from the diagonal
+    offsets = np.arange(len(from_indices)) - np.repeat(
+        np.cumsum(row_lengths) - row_lengths,
+        row_lengths,
+    )
+    to_indices = from_indices + 1 + offsets
+    return from_indices.astype(np.int32), to_indices.astype(np.int32)
+
+
+def _estimate_chunk(
+    row_begin: int,
+    row_end: int,
+) -> typing.Tuple[int, int, np.ndarray, np.ndarray, np.ndarray]:
+    columns = _worker_state['columns']
+    configurations = _worker_state['configurations']
+    confidence_level = _worker_state['confidence_level']
+
+    from_indices, to_indices = _calc_chunk_pairs(
+        row_begin, row_end, len(columns),
+    )
+    shape = (len(configurations), len(from_indices))
+    mrca_lbs = np.full(shape, np.nan)
+    mrca_ubs = np.full(shape, np.nan)
+    earliest_ranks = np.full(shape, np.nan)
+
+    for pair, (i, j) in enumerate(zip(from_indices, to_indices)):
+        first, second = columns[i], columns[j]
+        for config, impl in enumerate(configurations):
+            bounds = first[impl].CalcRankOfMrcaBoundsWith(
+                second[impl],
+                confidence_level=confidence_level,
+            )
+            if bounds is not None:
+                mrca_lbs[config, pair], mrca_ubs[config, pair] = bounds
+            earliest = first[impl].CalcRankOfEarliestDetectableMrcaWith(
+                second[impl],
+                confidence_level=confidence_level,
+            )
+            if earliest is not None:
+                earliest_ranks[config, pair] = earliest
+
+    return row_begin, row_end, mrca_lbs, mrca_ubs, earliest_ranks
+
+
+def estimate_pairwise_mrca(
+    columns: typing.Sequence[typing.Any],
+    *,
+    num_processes: typing.Optional[int]=None,
+    chunk_size: int=4096,
+    confidence_level: float=0.95,
+    out_dir: typing.Optional[str]=None,
+    progress_callback: typing.Optional[typing.Callable[[int], None]]=None,
+) -> typing.Optional[PairwiseMrcaEstimates]:
+    """Estimate MRCA bounds between every pair of extant columns.
+
+    Only one comparison per unordered pair is made, because MRCA bounds and
+    earliest detectable MRCA rank are symmetric. Pairs are split into chunks
+    of whole upper triangle rows and evaluated across a process pool. Columns
+    are sent to each worker process once, at startup, rather than with every
+    chunk.
+
+    Results are written into preallocated typed arrays as chunks complete. If
+    `out_dir` is given, each chunk is instead flushed to its own `.npz` file
+    there as it completes and nothing is held in memory; read the chunks back
+    with `load_pairwise_mrca_estimates`.
+
+    Parameters
+    ----------
+    columns : sequence of hstrat.HereditaryStratigraphicColumnBundle
+        Extant columns, all with the same configurations.
+    num_processes : int, optional
+        Number of worker processes. Defaults to the CPU count. If 1, chunks
+        are evaluated serially in this process.
+    chunk_size : int, default 4096
+        Approximate number of pairs evaluated per task.
+    confidence_level : float, default 0.95
+        Confidence level requested for MRCA bounds.
+    out_dir : str, optional
+        Directory to flush chunks to. Created if it does not exist. Must not
+        already hold flushed estimates, so stale chunks from an earlier run
+        can never be mixed in.
+    progress_callback : callable, optional
+        Called with the number of pairs in each chunk as it completes (e.g.,
+        `tqdm.update`).
+
+    Returns
+    -------
+    PairwiseMrcaEstimates, optional
+        Estimates, or None if `out_dir` was given.
+    """
+    num_taxa = len(columns)
+    assert num_taxa
+    configurations = [*columns[0]]
+    confidence_levels = np.array([
+        columns[0][impl].CalcRankOfMrcaBoundsWithProvidedConfidenceLevel(
+            confidence_level,
+        )
+        for impl in configurations
+    ])
+    taxon_generations = np.array([
+        column.GetNumStrataDeposited() for column in columns
+    ])
+    row_boundaries = calc_upper_triangle_row_chunks(num_taxa, chunk_size)
+    num_pairs = int(calc_upper_triangle_pair_offsets(num_taxa, num_taxa))
+
+    if out_dir is None:
+        shape = (len(configurations), num_pairs)
+        res = PairwiseMrcaEstimates(
+            configurations=configurations,
+            confidence_levels=confidence_levels,
+            taxon_generations=taxon_generations,
+            taxon_from_indices=np.empty(num_pairs, dtype=np.int32),
+            taxon_to_indices=np.empty(num_pairs, dtype=np.int32),
+            mrca_lbs=np.empty(shape),
+            mrca_ubs=np.empty(shape),
+            earliest_detectable_mrca_ranks=np.empty(shape),
+        )
+    else:
+        os.makedirs(out_dir, exist_ok=True)
+        if any(
+            filename == 'meta.npz' or filename.startswith('chunk')
+            for filename in os.listdir(out_dir)
+        ):
+            raise FileExistsError(
+                f'{out_dir} already holds pairwise MRCA estimates',
+            )
+        np.savez(
+            os.path.join(out_dir, 'meta.npz'),
+            configurations=np.asarray(configurations, dtype=str),
+            confidence_levels=confidence_levels,
+            taxon_generations=taxon_generations,
+            row_boundaries=row_boundaries,
+        )
+
+    def collect(chunk_result) -> None:
+        row_begin, row_end, mrca_lbs, mrca_ubs, earliest_ranks = chunk_result
+        from_indices, to_indices = _calc_chunk_pairs(
+            row_begin, row_end, num_taxa,
+        )
+        if out_dir is None:
+            begin = calc_upper_triangle_pair_offsets(row_begin, num_taxa)
+            end = begin + len(from_indices)
+            res.taxon_from_indices[begin:end] = from_indices
+            res.taxon_to_indices[begin:end] = to_indices
+            res.mrca_lbs[:, begin:end] = mrca_lbs
+            res.mrca_ubs[:, begin:end] = mrca_ubs
+            res.earliest_detectable_mrca_ranks[:, begin:end] = earliest_ranks
+        else:
+            np.savez(
+                os.path.join(out_dir, f'chunk{row_begin:09d}.npz'),
+                taxon_from_indices=from_indices,
+                taxon_to_indices=to_indices,
+                mrca_lbs=mrca_lbs,
+                mrca_ubs=mrca_ubs,
+                earliest_detectable_mrca_ranks=earliest_ranks,
+            )
+        if progress_callback is not None:
+            progress_callback(len(from_indices))
+
+    worker_args = (columns, configurations, confidence_level)
+    chunks = [*zip(row_boundaries[:-1], row_boundaries[1:])]
+    if num_processes == 1:
+        _init_worker(*worker_args)
+        try:
+            for row_begin, row_end in chunks:
+                collect(_estimate_chunk(row_begin, row_end))
+        finally:
+            _worker_state.clear()
+    else:
+        with futures.ProcessPoolExecutor(
+            max_workers=num_processes,
+            initializer=_init_worker,
+            initargs=worker_args,
+        ) as executor:
+            pending = [
+                executor.submit(_estimate_chunk, row_begin, row_end)
+                for row_begin, row_end in chunks
+            ]
+            for future in futures.as_completed(pending):
+                collect(future.result())
+
+    return res if out_dir is None else None
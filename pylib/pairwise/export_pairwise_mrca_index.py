@@ -0,0 +1,141 @@
+import json
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .calc_upper_triangle_pair_offsets \
+    import calc_upper_triangle_pair_offsets
+from .calc_upper_triangle_row_chunks import calc_upper_triangle_row_chunks
+
+# On-disk layout of a pairwise MRCA index directory, read by
+# phylogeny_visualizations/phylogeny.js:
+#
+#   index.json         taxon labels, configuration keys, value dtype, and row
+#                      boundaries and filename of each shard
+#   shard{k}.bin       MRCA bounds for pairs (i, j), i < j, with i in
+#                      [row_boundaries[k], row_boundaries[k + 1])
+#
+# Each shard holds an array of shape (num configurations, 2, num pairs in
+# shard): lower bounds (inclusive) then upper bounds (exclusive) for each
+# configuration, over the shard's pairs in upper triangle row-major order,
+# with missing estimates as NaN. Pair (i, j) is at position
+# calc_upper_triangle_pair_offsets(i) + j - i - 1 of the whole triangle.
+
+FORMAT_NAME = 'pairwise_mrca_index'
+FORMAT_VERSION = 1
+INDEX_FILENAME = 'index.json'
+
+# fields the viewer concatenates into its configuration key
+DEFAULT_CONFIGURATION_COLUMNS = (
+    'Stratum Retention Policy',
+    'Differentia Bit Width',
+    'Stratigraphic Column Target Retained Bits',
+)
+
+
+def export_pairwise_mrca_index(
+    df: pd.DataFrame,
+    out_dir: str,
+    *,
+    shard_size: int=2**16,
+    configuration_columns: typing.Sequence[str]
+        =DEFAULT_CONFIGURATION_COLUMNS,
+) -> None:
+    """Write a pairwise MRCA estimates table as a compact binary index that
+    the phylogeny viewer can look pairs up in without loading it all.
+
+    Bounds are stored as typed arrays per configuration over the upper
+    triangle of taxon pairs, sharded by ranges of taxon rows, so a lookup
+    fetches one shard. Values are stored as float32, or float64 if any
+    exceeds 2**24 and would lose precision. Pairs missing from the table are
+    stored as NaN. Each pair may be listed in either direction.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Pairwise MRCA estimates table, e.g., read from a
+        `pairwise_mrca_estimates` CSV, or from
+        `PairwiseMrcaEstimates.to_dataframe`.
+    out_dir : str
+        Directory to write to. Created if it does not exist. Must not
+        already hold an index.
+    shard_size : int, default 65536
+        Approximate number of taxon pairs per shard. Shards never split a
+        taxon's row of pairs.
+    configuration_columns : sequence of str
+        Fields whose values, converted to str and concatenated, identify
+        each configuration. Defaults to the retention policy, differentia
+        bit width, and target retained bits, as keyed by the viewer.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if os.path.exists(os.path.join(out_dir, INDEX_FILENAME)):
+        raise FileExistsError(f'{out_dir} already holds a pairwise index')
+
+    taxon_codes, taxa = pd.factorize(np.concatenate([
+        df['Taxon Compared From'].to_numpy(),
+        df['Taxon Compared To'].to_numpy(),
+    ]))
+    num_taxa = len(taxa)
+    from_codes, to_codes = np.split(taxon_codes.astype(np.int64), 2)
+    rows = np.minimum(from_codes, to_codes)
+    cols = np.maximum(from_codes, to_codes)
+    assert (rows != cols).all()
+    positions = calc_upper_triangle_pair_offsets(rows, num_taxa) \
+        + cols - rows - 1
+
+    configuration_keys = df[configuration_columns[0]].astype(str)
+    for column in configuration_columns[1:]:
+        configuration_keys = configuration_keys + df[column].astype(str)
+    configuration_codes, configurations = pd.factorize(configuration_keys)
+
+    bounds = np.stack([
+        df['Generation Of MRCA Lower Bound (inclusive)'].to_numpy(float),
+        df['Generation Of MRCA Upper Bound (exclusive)'].to_numpy(float),
+    ])
+    dtype = '<f4' if not (np.abs(bounds) > 2**24).any() else '<f8'
+
+    # group table rows by shard with one sort, rather than a scan per shard
+    order = np.argsort(positions, kind='stable')
+    sorted_positions = positions[order]
+    row_boundaries = calc_upper_triangle_row_chunks(num_taxa, shard_size)
+    pair_boundaries = calc_upper_triangle_pair_offsets(
+        row_boundaries, num_taxa,
+    )
+    shard_filenames = []
+    for shard, (begin, end) in enumerate(
+        zip(pair_boundaries[:-1], pair_boundaries[1:]),
+    ):
+        selected = order[
+            np.searchsorted(sorted_positions, begin):
+            np.searchsorted(sorted_positions, end)
+        ]
+        values = np.full(
+            (len(configurations), 2, end - begin), np.nan, dtype=dtype,
+        )
+        for bound in range(2):
+            values[
+                configuration_codes[selected],
+                bound,
+                positions[selected] - begin,
+            ] = bounds[bound, selected]
+        shard_filenames.append(f'shard{shard:06d}.bin')
+        values.tofile(os.path.join(out_dir, shard_filenames[-1]))
+
+    # write index last, then rename, so a partial export is never read
+    temp_path = os.path.join(out_dir, INDEX_FILENAME + '.tmp')
+    with open(temp_path, 'w') as file:
+        json.dump(
+            {
+                'format': FORMAT_NAME,
+                'version': FORMAT_VERSION,
+                'dtype': dtype,
+                'taxa': [*map(str, taxa)],
+                'configurations': [*configurations],
+                'row_boundaries': row_boundaries.tolist(),
+                'shards': shard_filenames,
+            },
+            file,
+        )
+    os.replace(temp_path, os.path.join(out_dir, INDEX_FILENAME))
@@ -0,0 +1,35 @@
+import os
+
+import numpy as np
+
+from .PairwiseMrcaEstimates import PairwiseMrcaEstimates
+
+
+def load_pairwise_mrca_estimates(out_dir: str) -> PairwiseMrcaEstimates:
+    """Assemble estimates flushed to disk by `estimate_pairwise_mrca`.
+
+    Only chunks recorded in the directory's metadata are read, in row order.
+    Raises FileNotFoundError if any are missing (e.g., from an interrupted
+    run).
+    """
+    meta = np.load(os.path.join(out_dir, 'meta.npz'))
+    chunks = [
+        np.load(os.path.join(out_dir, f'chunk{row_begin:09d}.npz'))
+        for row_begin in meta['row_boundaries'][:-1]
+    ]
+
+    def concatenate(field: str, axis: int) -> np.ndarray:
+        return np.concatenate([chunk[field] for chunk in chunks], axis=axis)
+
+    return PairwiseMrcaEstimates(
+        configurations=meta['configurations'].tolist(),
+        confidence_levels=meta['confidence_levels'],
+        taxon_generations=meta['taxon_generations'],
+        taxon_from_indices=concatenate('taxon_from_indices', 0),
+        taxon_to_indices=concatenate('taxon_to_indices', 0),
+        mrca_lbs=concatenate('mrca_lbs', 1),
+        mrca_ubs=concatenate('mrca_ubs', 1),
+        earliest_detectable_mrca_ranks=concatenate(
+            'earliest_detectable_mrca_ranks', 1,
+        ),
+    )
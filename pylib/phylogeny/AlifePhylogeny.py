@@ -0,0 +1,272 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .parse_ancestor_lists import parse_ancestor_lists
+
+
+class AlifePhylogeny:
+    """Asexual phylogeny in the alife community data standard, held as flat
+    arrays.
+
+    Nodes are numbered by row. Each node's parent is stored as a row index
+    (-1 for roots), and children are stored in compressed sparse row (CSR)
+    form, ordered by row within each parent. Traversal orders are computed
+    level by level with vectorized NumPy operations, so there is no recursion
+    and no per-node Python object.
+    """
+
+    # original alife id of each node
+    _ids: np.ndarray
+    # row index of each node's parent, or -1 for roots
+    _parents: np.ndarray
+    # children of node i are _children[_child_offsets[i]:_child_offsets[i+1]]
+    _child_offsets: np.ndarray
+    _children: np.ndarray
+    # origin time of each node, NaN if not provided
+    _origin_times: np.ndarray
+    # node indices at each depth, children grouped by parent in CSR order
+    _levels: typing.Optional[typing.List[np.ndarray]]
+
+    def __init__(
+        self: 'AlifePhylogeny',
+        ids: np.ndarray,
+        ancestor_ids: np.ndarray,
+        origin_times: typing.Optional[np.ndarray]=None,
+    ) -> None:
+        """Index a phylogeny given each node's id and its ancestor's id (-1
+        for roots).
+
+        Raises ValueError if any ancestor id is not among `ids`.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        ancestor_ids = np.asarray(ancestor_ids, dtype=np.int64)
+        num_nodes = len(ids)
+        dtype = np.int32 if num_nodes < 2**31 else np.int64
+
+        is_root = ancestor_ids < 0
+        sorter = np.argsort(ids, kind='stable')
+        positions = np.searchsorted(
+            ids, ancestor_ids, sorter=sorter,
+        ).clip(max=max(num_nodes - 1, 0))
+        parents = np.where(is_root, -1, sorter[positions])
+        if (ids[parents[~is_root]] != ancestor_ids[~is_root]).any():
+            raise ValueError('ancestor ids must be ids of nodes')
+
+        self._ids = ids
+        self._parents = parents.astype(dtype)
+        num_children = np.bincount(
+            self._parents[~is_root], minlength=num_nodes,
+        )
+        self._child_offsets = np.zeros(num_nodes + 1, dtype=dtype)
+        np.cumsum(num_children, out=self._child_offsets[1:])
+        self._children = np.flatnonzero(~is_root)[
+            np.argsort(self._parents[~is_root], kind='stable')
+        ].astype(dtype)
+        self._origin_times = np.full(num_nodes, np.nan) \
+            if origin_times is None \
+            else np.asarray(origin_times, dtype=float)
+        self._levels = None
+
+    @classmethod
+    def from_dataframe(
+        cls: typing.Type['AlifePhylogeny'],
+        df: pd.DataFrame,
+    ) -> 'AlifePhylogeny':
+        """Index an alife standard phylogeny dataframe.
+
+        Uses the `ancestor_id` column if present, else parses
+        `ancestor_list`. Uses the `origin_time` column if present.
+        """
+        if 'ancestor_id' in df:
+            ancestor_ids = df['ancestor_id'].to_numpy(dtype=np.int64)
+            # by convention, roots are their own ancestors
+            ancestor_ids = np.where(
+                ancestor_ids == df['id'].to_numpy(), -1, ancestor_ids,
+            )
+        else:
+            ancestor_ids = parse_ancestor_lists(df['ancestor_list'])
+        return cls(
+            df['id'].to_numpy(),
+            ancestor_ids,
+            df['origin_time'].to_numpy() if 'origin_time' in df else None,
+        )
+
+    def __len__(self: 'AlifePhylogeny') -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self: 'AlifePhylogeny') -> np.ndarray:
+        return self._ids
+
+    @property
+    def parents(self: 'AlifePhylogeny') -> np.ndarray:
+        return self._parents
+
+    @property
+    def child_offsets(self: 'AlifePhylogeny') -> np.ndarray:
+        return self._child_offsets
+
+    @property
+    def children(self: 'AlifePhylogeny') -> np.ndarray:
+        return self._children
+
+    @property
+    def origin_times(self: 'AlifePhylogeny') -> np.ndarray:
+        return self._origin_times
+
+    def get_roots(self: 'AlifePhylogeny') -> np.ndarray:
+        return np.flatnonzero(self._parents < 0)
+
+    def get_leaves(self: 'AlifePhylogeny') -> np.ndarray:
+        return np.flatnonzero(np.diff(self._child_offsets) == 0)
+
+    def get_children(self: 'AlifePhylogeny', node: int) -> np.ndarray:
+        return self._children[
+            self._child_offsets[node]:self._child_offsets[node + 1]
+        ]
+
+    def get_edge_lengths(self: 'AlifePhylogeny') -> np.ndarray:
+        """Origin time elapsed since each node's parent, or since time zero
+        for roots."""
+        parent_origin_times = np.where(
+            self._parents < 0,
+            0.0,
+            self._origin_times[np.maximum(self._parents, 0)],
+        )
+        return self._origin_times - parent_origin_times
+
+    def _get_levels(self: 'AlifePhylogeny') -> typing.List[np.ndarray]:
+        if self._levels is None:
+            self._levels = []
+            frontier = self.get_roots().astype(self._children.dtype)
+            while len(frontier):
+                self._levels.append(frontier)
+                begins = self._child_offsets[frontier]
+                counts = self._child_offsets[frontier + 1] - begins
+                # CSR positions of all children of the frontier, in order
+                positions = np.arange(counts.sum()) + np.repeat(
+                    begins - (np.cumsum(counts) - counts), counts,
+                )
+                frontier = self._children[positions]
+            if sum(map(len, self._levels)) != len(self):
+                raise ValueError('phylogeny contains a cycle')
+        return self._levels
+
+    def get_depths(self: 'AlifePhylogeny') -> np.ndarray:
+        """Number of edges between each node and its root."""
+        res = np.empty(len(self), dtype=np.int64)
+        for depth, level in enumerate(self._get_levels()):
+            res[level] = depth
+        return res
+
+    def get_level_order(self: 'AlifePhylogeny') -> np.ndarray:
+        """Node indices in breadth-first order, roots first."""
+        levels = self._get_levels()
+        return np.concatenate(levels) if levels \
+            else np.empty(0, dtype=self._children.dtype)
+
+    def get_postorder(self: 'AlifePhylogeny') -> np.ndarray:
+        """Node indices in depth-first postorder, children in row order."""
+        levels = self._get_levels()
+        subtree_sizes = np.ones(len(self), dtype=np.int64)
+        for level in reversed(levels[1:]):
+            np.add.at(
+                subtree_sizes, self._parents[level], subtree_sizes[level],
+            )
+
+        # total size of earlier siblings' subtrees, over CSR positions
+        sibling_sums = np.cumsum(subtree_sizes[self._children]) \
+            - subtree_sizes[self._children]
+        first_sibling_sums = np.append(sibling_sums, 0)[
+            self._child_offsets[:-1]
+        ]
+        preceding = np.zeros(len(self), dtype=np.int64)
+        preceding[self._children] = sibling_sums - np.repeat(
+            first_sibling_sums, np.diff(self._child_offsets),
+        )
+
+        preorder_positions = np.empty(len(self), dtype=np.int64)
+        if levels:
+            roots = levels[0]
+            preorder_positions[roots] = np.cumsum(subtree_sizes[roots]) \
+                - subtree_sizes[roots]
+        for level in levels[1:]:
+            preorder_positions[level] = preorder_positions[
+                self._parents[level]
+            ] + 1 + preceding[level]
+
+        # a node follows its descendants and everything preceding it in
+        # preorder except its ancestors
+        postorder_positions = preorder_positions - self.get_depths() \
+            + subtree_sizes - 1
+        res = np.empty(len(self), dtype=self._children.dtype)
+        res[postorder_positions] = np.arange(len(self))
+        return res
+
+    def iter_level_order(self: 'AlifePhylogeny') -> typing.Iterator[int]:
+        yield from self.get_level_order().tolist()
+
+    def iter_postorder(self: 'AlifePhylogeny') -> typing.Iterator[int]:
+        yield from self.get_postorder().tolist()
+
+    def _get_root(self: 'AlifePhylogeny') -> int:
+        roots = self.get_roots()
+        if len(roots) != 1:
+            raise ValueError(
+                f'phylogeny has {len(roots)} roots, but a tree needs one',
+            )
+        return int(roots[0])
+
+    def to_biopython_tree(self: 'AlifePhylogeny'):
+        """Build a Biopython tree, with clades named by id, branch lengths
+        from origin times, and `origin_time` attributes on clades."""
+        # only needed to convert
+        from Bio.Phylo import BaseTree
+
+        root = self._get_root()
+        clades = [None] * len(self)
+        edge_lengths = self.get_edge_lengths()
+        for node in self.iter_level_order():
+            clade = BaseTree.Clade(
+                name=str(self._ids[node]),
+                branch_length=None if np.isnan(edge_lengths[node])
+                else float(edge_lengths[node]),
+            )
+            clade.origin_time = float(self._origin_times[node])
+            clades[node] = clade
+            parent = self._parents[node]
+            if parent >= 0:
+                clades[parent].clades.append(clade)
+        return BaseTree.Tree(root=clades[root], rooted=True)
+
+    def to_dendropy_tree(self: 'AlifePhylogeny', taxon_namespace=None):
+        """Build a rooted dendropy tree, with edge lengths from origin times,
+        `id` and `origin_time` attributes on nodes, and leaf taxa labeled by
+        id."""
+        # only needed to convert
+        import dendropy
+
+        root = self._get_root()
+        tree = dendropy.Tree(taxon_namespace=taxon_namespace, is_rooted=True)
+        # require_taxon searches the namespace linearly
+        taxa = {taxon.label: taxon for taxon in tree.taxon_namespace}
+        nodes = [None] * len(self)
+        nodes[root] = tree.seed_node
+        edge_lengths = self.get_edge_lengths()
+        is_leaf = np.diff(self._child_offsets) == 0
+        for node in self.iter_level_order():
+            if node != root:
+                nodes[node] = nodes[self._parents[node]].new_child()
+            dendropy_node = nodes[node]
+            dendropy_node.id = int(self._ids[node])
+            dendropy_node.origin_time = float(self._origin_times[node])
+            if not np.isnan(edge_lengths[node]):
+                dendropy_node.edge.length = float(edge_lengths[node])
+            if is_leaf[node]:
+                label = str(self._ids[node])
+                if label not in taxa:
+                    taxa[label] = tree.taxon_namespace.new_taxon(label=label)
+                dendropy_node.taxon = taxa[label]
+        return tree
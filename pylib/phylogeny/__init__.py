@@ -0,0 +1,14 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'AlifePhylogeny',
+    'calc_lane_offsets',
+    'export_phylogeny_layout',
+    'load_alife_phylogeny',
+    'parse_ancestor_lists',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
@@ -0,0 +1,30 @@
+import argparse
+
+import pandas as pd
+
+from .export_phylogeny_layout import export_phylogeny_layout
+
+parser = argparse.ArgumentParser(
+    prog='python3 -m pylib.phylogeny',
+    description='Export an alife standard phylogeny CSV as the precomputed '
+    'layout read by phylogeny_visualizations/phylogeny.js.',
+)
+parser.add_argument('source', help='phylogeny CSV path or URL, maybe gzipped')
+parser.add_argument('out_dir', help='layout directory to create')
+parser.add_argument(
+    '--extant-time', type=float, default=None,
+    help='destruction time of nodes never destroyed '
+    '(default: latest origin or destruction time)',
+)
+parser.add_argument(
+    '--max-lanes', type=int, default=21,
+    help='number of lane offsets available',
+)
+args = parser.parse_args()
+
+export_phylogeny_layout(
+    pd.read_csv(args.source),
+    args.out_dir,
+    extant_time=args.extant_time,
+    max_lanes=args.max_lanes,
+)
@@ -0,0 +1,96 @@
+import heapq
+
+import numpy as np
+
+from .AlifePhylogeny import AlifePhylogeny
+
+
+def _get_lane(rank: int) -> int:
+    # lanes are preferred in order 0, 1, -1, 2, -2, ...
+    return (rank + 1) // 2 if rank % 2 else -(rank // 2)
+
+
+def calc_lane_offsets(
+    phylogeny: AlifePhylogeny,
+    destruction_times: np.ndarray,
+    *,
+    max_lanes: int=21,
+) -> np.ndarray:
+    """Assign each node a lane, offset from the line it is drawn on, so that
+    the lifespans of an unbranched lineage's nodes do not overlap.
+
+    Follows the rules of the phylogeny viewer's former `CalcOffsets`. Nodes
+    are grouped into runs, each starting at a root or at a child of a node
+    with several children and continuing through nodes with one child. Down
+    each run, a node takes the first lane, in order 0, 1, -1, 2, -2, ...,
+    not held by an earlier node of its run destroyed after its origin time,
+    and holds that lane until its own destruction time. If all `max_lanes`
+    lanes are held, the last one is shared.
+
+    Runs are walked iteratively, keeping held lanes in a heap ordered by
+    destruction time and released lanes in a heap ordered by preference, so
+    each node costs O(log max_lanes) and long lineages do not recurse.
+
+    Parameters
+    ----------
+    phylogeny : AlifePhylogeny
+        Phylogeny with origin times.
+    destruction_times : np.ndarray
+        Destruction time of each node, by row. NaN for nodes never
+        destroyed.
+    max_lanes : int, default 21
+        Number of lanes available, i.e., offsets -10 through 10 by default.
+
+    Returns
+    -------
+    np.ndarray
+        Lane offset of each node, by row.
+    """
+    origin_times = phylogeny.origin_times.tolist()
+    destruction_times = np.asarray(destruction_times, dtype=float)
+    release_times = np.where(
+        np.isnan(destruction_times), np.inf, destruction_times,
+    ).tolist()
+    num_children = np.diff(phylogeny.child_offsets)
+    single_child = np.full(len(phylogeny), -1)
+    single_child[num_children == 1] = phylogeny.children[
+        phylogeny.child_offsets[:-1][num_children == 1]
+    ]
+    single_child = single_child.tolist()
+
+    # children are grouped by parent, in parent order
+    run_starts = np.concatenate([
+        phylogeny.get_roots(),
+        phylogeny.children[np.repeat(num_children > 1, num_children)],
+    ]).tolist()
+
+    res = [0] * len(phylogeny)
+    for node in run_starts:
+        # (destruction time, rank) of lanes held, possibly stale if shared
+        held = []
+        holder_release_times = {}
+        # ranks released below num_ranks; ranks from num_ranks on never held
+        released = []
+        num_ranks = 0
+        while node >= 0:
+            origin_time = origin_times[node]
+            while held and held[0][0] <= origin_time:
+                release_time, rank = heapq.heappop(held)
+                if holder_release_times.get(rank) == release_time:
+                    del holder_release_times[rank]
+                    heapq.heappush(released, rank)
+
+            if released:
+                rank = heapq.heappop(released)
+            elif num_ranks < max_lanes:
+                rank = num_ranks
+                num_ranks += 1
+            else:
+                rank = max_lanes - 1
+
+            holder_release_times[rank] = release_times[node]
+            heapq.heappush(held, (release_times[node], rank))
+            res[node] = _get_lane(rank)
+            node = single_child[node]
+
+    return np.array(res, dtype=np.int64)
@@ -0,0 +1,144 @@
+import json
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .AlifePhylogeny import AlifePhylogeny
+from .calc_lane_offsets import calc_lane_offsets
+
+# On-disk layout of a phylogeny layout directory, read by
+# phylogeny_visualizations/phylogeny.js:
+#
+#   layout.json        number of nodes and tips, extant time, and the dtype
+#                      and byte offset of each column within layout.bin
+#   layout.bin         columns of per-node values, in row order, each
+#                      starting at a multiple of 8 bytes so the viewer can
+#                      view them as typed arrays without copying
+#
+# Columns are the alife id, parent row (-1 for roots), vertical position
+# (tips on rows 1 through number of tips, in depth-first order, and inner
+# nodes midway between their first and last child), origin time,
+# destruction time (extant time for nodes never destroyed), and lane offset.
+
+FORMAT_NAME = 'phylogeny_layout'
+FORMAT_VERSION = 1
+INDEX_FILENAME = 'layout.json'
+DATA_FILENAME = 'layout.bin'
+
+
+def _calc_rows(phylogeny: AlifePhylogeny) -> np.ndarray:
+    is_tip = np.diff(phylogeny.child_offsets) == 0
+    postorder = phylogeny.get_postorder()
+    res = np.empty(len(phylogeny), dtype=float)
+    res[postorder[is_tip[postorder]]] = np.arange(1, is_tip.sum() + 1)
+
+    # inner nodes grouped by depth, deepest last
+    level_order = phylogeny.get_level_order()
+    inner = level_order[~is_tip[level_order]]
+    inner_depths = phylogeny.get_depths()[inner]
+    level_boundaries = np.flatnonzero(np.diff(inner_depths)) + 1
+    for level in reversed(np.split(inner, level_boundaries)):
+        res[level] = (
+            res[phylogeny.children[phylogeny.child_offsets[level]]]
+            + res[phylogeny.children[phylogeny.child_offsets[level + 1] - 1]]
+        ) / 2.0
+    return res
+
+
+def _get_time_dtype(times: np.ndarray) -> str:
+    # generation counts are usually exact in float32
+    is_exact = times.astype('<f4') == times
+    return '<f4' if (is_exact | np.isnan(times)).all() else '<f8'
+
+
+def export_phylogeny_layout(
+    df: pd.DataFrame,
+    out_dir: str,
+    *,
+    extant_time: typing.Optional[float]=None,
+    max_lanes: int=21,
+) -> None:
+    """Write node positions, lane offsets, and destruction times of an alife
+    standard phylogeny as a compact columnar payload that the phylogeny
+    viewer draws directly.
+
+    Vertical positions follow `pylib.tree_layout.calc_tree_layout`, and lane
+    offsets follow `calc_lane_offsets`, so the viewer does no layout of its
+    own. Horizontal positions are origin times, which the viewer scales.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Alife standard phylogeny, with `id`, `ancestor_list` or
+        `ancestor_id`, and `origin_time` columns, and optionally a
+        `destruction_time` column.
+    out_dir : str
+        Directory to write to. Created if it does not exist. Must not
+        already hold a layout.
+    extant_time : float, optional
+        Destruction time recorded for nodes never destroyed, i.e., with
+        missing destruction time. Defaults to the latest origin or
+        destruction time.
+    max_lanes : int, default 21
+        Number of lane offsets available to `calc_lane_offsets`.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if os.path.exists(os.path.join(out_dir, INDEX_FILENAME)):
+        raise FileExistsError(f'{out_dir} already holds a phylogeny layout')
+
+    phylogeny = AlifePhylogeny.from_dataframe(df)
+    origin_times = phylogeny.origin_times
+    destruction_times = df['destruction_time'].to_numpy(dtype=float) \
+        if 'destruction_time' in df \
+        else np.full(len(phylogeny), np.nan)
+    if extant_time is None:
+        extant_time = float(np.nanmax(
+            np.concatenate([origin_times, destruction_times, [-np.inf]]),
+        ))
+    destruction_times = np.where(
+        np.isnan(destruction_times), extant_time, destruction_times,
+    )
+
+    ids = phylogeny.ids
+    columns = {
+        'id': ids.astype(
+            '<i4' if ids.size == 0 or np.abs(ids).max() < 2**31 else '<f8',
+        ),
+        'parent': phylogeny.parents.astype('<i4'),
+        'row': _calc_rows(phylogeny).astype('<f4'),
+        'origin_time': origin_times.astype(_get_time_dtype(origin_times)),
+        'destruction_time': destruction_times.astype(
+            _get_time_dtype(destruction_times),
+        ),
+        'offset': calc_lane_offsets(
+            phylogeny, destruction_times, max_lanes=max_lanes,
+        ).astype('<i1' if max_lanes <= 255 else '<i4'),
+    }
+
+    column_infos = {}
+    with open(os.path.join(out_dir, DATA_FILENAME), 'wb') as file:
+        for name, values in columns.items():
+            file.write(bytes(-file.tell() % 8))
+            column_infos[name] = {
+                'dtype': values.dtype.str,
+                'offset': file.tell(),
+            }
+            file.write(values.tobytes())
+
+    # write index last, then rename, so a partial export is never read
+    temp_path = os.path.join(out_dir, INDEX_FILENAME + '.tmp')
+    with open(temp_path, 'w') as file:
+        json.dump(
+            {
+                'format': FORMAT_NAME,
+                'version': FORMAT_VERSION,
+                'num_nodes': len(phylogeny),
+                'num_tips': int((np.diff(phylogeny.child_offsets) == 0).sum()),
+                'extant_time': extant_time,
+                'columns': column_infos,
+            },
+            file,
+        )
+    os.replace(temp_path, os.path.join(out_dir, INDEX_FILENAME))
@@ -0,0 +1,19 @@
+import pandas as pd
+
+from .AlifePhylogeny import AlifePhylogeny
+
+_columns = {'id', 'ancestor_id', 'ancestor_list', 'origin_time'}
+
+
+def load_alife_phylogeny(source, **kwargs) -> AlifePhylogeny:
+    """Load an alife standard phylogeny CSV into flat arrays.
+
+    Only the `id`, `ancestor_id`, `ancestor_list`, and `origin_time` columns
+    are read. Remaining keyword arguments are forwarded to `pd.read_csv`.
+    Use `AlifePhylogeny.from_dataframe` to index a dataframe already loaded
+    (e.g., through `pylib.inputs.read_cached_csv`).
+    """
+    df = pd.read_csv(
+        source, usecols=lambda column: column in _columns, **kwargs,
+    )
+    return AlifePhylogeny.from_dataframe(df)
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+
+def parse_ancestor_lists(ancestor_lists: pd.Series) -> np.ndarray:
+    """Parse alife standard `ancestor_list` strings of an asexual phylogeny
+    into ancestor ids, with vectorized string operations rather than `eval`.
+
+    Entries like '[12]' give ancestor id 12. Entries like '[none]', '[NONE]',
+    or '[]' mark roots, with ancestor id -1. Raises ValueError for entries
+    listing more than one ancestor.
+    """
+    stripped = ancestor_lists.astype(str).str.strip().str.strip('[]')
+    if stripped.str.contains(',', regex=False).any():
+        raise ValueError('only asexual phylogenies are supported')
+    stripped = stripped.str.strip()
+    is_root = stripped.str.lower().isin(('none', ''))
+    return pd.to_numeric(stripped.mask(is_root, '-1')).to_numpy(
+        dtype=np.int64,
+    )
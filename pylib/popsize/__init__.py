@@ -0,0 +1,18 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'calc_median_unbiased_mle_popsize',
+    'calc_mildest_extrema_popsize',
+    'calc_mildest_extrema_popsize_ci',
+    'calc_mle_popsize',
+    'calc_mle_popsize_ci',
+    'calc_upper_gamma_popsize',
+    'evaluate_popsize_estimators',
+    'sample_population_maxima',
+    'solve_upper_gamma_popsize_sympy',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def _calc_neg_log_extrema_product(
+    observations: np.ndarray,
+    neg_log: bool,
+) -> np.ndarray:
+    """Negated log of the product of each observation set, summed in log
+    space so large sets do not underflow."""
+    observations = np.asarray(observations, dtype=float)
+    if neg_log:
+        return observations.sum(axis=-1)
+    with np.errstate(divide='ignore'):
+        return -np.log(observations).sum(axis=-1)
@@ -0,0 +1,13 @@
+import numpy as np
+
+
+def _calc_neg_log_mildest_extreme(
+    observations: np.ndarray,
+    neg_log: bool,
+) -> np.ndarray:
+    """Negated log of the smallest observation of each observation set."""
+    observations = np.asarray(observations, dtype=float)
+    if neg_log:
+        return observations.max(axis=-1)
+    with np.errstate(divide='ignore'):
+        return -np.log(observations.min(axis=-1))
@@ -0,0 +1,26 @@
+import numpy as np
+
+from .calc_upper_gamma_popsize import calc_upper_gamma_popsize
+
+
+def calc_median_unbiased_mle_popsize(
+    observations: np.ndarray,
+    *,
+    neg_log: bool=False,
+) -> np.ndarray:
+    """Median-unbiased population size estimate for each set of observed
+    population maxima.
+
+    Parameters
+    ----------
+    observations : array of float
+        Observation sets along the last axis.
+    neg_log : bool, default False
+        If True, observations are given as -log(x) rather than x.
+
+    Returns
+    -------
+    array of float
+        One estimate per observation set.
+    """
+    return calc_upper_gamma_popsize(observations, 0.5, neg_log=neg_log)
@@ -0,0 +1,30 @@
+import numpy as np
+
+from ._calc_neg_log_mildest_extreme import _calc_neg_log_mildest_extreme
+
+
+def calc_mildest_extrema_popsize(
+    observations: np.ndarray,
+    *,
+    neg_log: bool=False,
+) -> np.ndarray:
+    """Median-unbiased population size estimate from the smallest of each set
+    of k observed population maxima, log(1 - 0.5^(1/k)) / log(min(x)).
+
+    Parameters
+    ----------
+    observations : array of float
+        Observation sets along the last axis.
+    neg_log : bool, default False
+        If True, observations are given as -log(x) rather than x.
+
+    Returns
+    -------
+    array of float
+        One estimate per observation set.
+    """
+    observations = np.asarray(observations, dtype=float)
+    k = observations.shape[-1]
+    return -np.log1p(-0.5 ** (1 / k)) / _calc_neg_log_mildest_extreme(
+        observations, neg_log,
+    )
@@ -0,0 +1,42 @@
+import typing
+
+import numpy as np
+
+from ._calc_neg_log_mildest_extreme import _calc_neg_log_mildest_extreme
+
+
+def calc_mildest_extrema_popsize_ci(
+    observations: np.ndarray,
+    *,
+    confidence: float,
+    neg_log: bool=False,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Confidence interval for population size from the smallest of each set
+    of k observed population maxima.
+
+    Bounds are log(1 - q^(1/k)) / log(min(x)), with q = (1 - c) / 2 for the
+    lower bound and q = (1 + c) / 2 for the upper bound, as `expected_lb` and
+    `expected_ub` in the mildest extrema confidence interval notebook.
+
+    Parameters
+    ----------
+    observations : array of float
+        Observation sets along the last axis.
+    confidence : float or array of float
+        Confidence level, in (0, 1).
+    neg_log : bool, default False
+        If True, observations are given as -log(x) rather than x.
+
+    Returns
+    -------
+    tuple of array of float
+        Lower and upper bounds, one per observation set.
+    """
+    observations = np.asarray(observations, dtype=float)
+    k = observations.shape[-1]
+    confidence = np.asarray(confidence)
+    neg_log_mildest = _calc_neg_log_mildest_extreme(observations, neg_log)
+    return (
+        -np.log1p(-((1 - confidence) / 2) ** (1 / k)) / neg_log_mildest,
+        -np.log1p(-((1 + confidence) / 2) ** (1 / k)) / neg_log_mildest,
+    )
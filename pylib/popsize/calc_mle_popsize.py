@@ -0,0 +1,30 @@
+import numpy as np
+
+from ._calc_neg_log_extrema_product import _calc_neg_log_extrema_product
+
+
+def calc_mle_popsize(
+    observations: np.ndarray,
+    *,
+    neg_log: bool=False,
+) -> np.ndarray:
+    """Maximum likelihood population size estimate, -k / log(prod(x)), for
+    each set of k observed population maxima of uniform [0, 1) values.
+
+    Parameters
+    ----------
+    observations : array of float
+        Observation sets along the last axis.
+    neg_log : bool, default False
+        If True, observations are given as -log(x) rather than x. Keeps
+        precision for very large populations, whose maxima round to 1.
+
+    Returns
+    -------
+    array of float
+        One estimate per observation set.
+    """
+    observations = np.asarray(observations, dtype=float)
+    return observations.shape[-1] / _calc_neg_log_extrema_product(
+        observations, neg_log,
+    )
@@ -0,0 +1,39 @@
+import typing
+
+import numpy as np
+
+from .calc_upper_gamma_popsize import calc_upper_gamma_popsize
+
+
+def calc_mle_popsize_ci(
+    observations: np.ndarray,
+    *,
+    confidence: float,
+    neg_log: bool=False,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Confidence interval for population size around the maximum likelihood
+    estimate, for each set of observed population maxima.
+
+    Parameters
+    ----------
+    observations : array of float
+        Observation sets along the last axis.
+    confidence : float or array of float
+        Confidence level, in (0, 1).
+    neg_log : bool, default False
+        If True, observations are given as -log(x) rather than x.
+
+    Returns
+    -------
+    tuple of array of float
+        Lower and upper bounds, one per observation set.
+    """
+    confidence = np.asarray(confidence)
+    return (
+        calc_upper_gamma_popsize(
+            observations, (1 + confidence) / 2, neg_log=neg_log,
+        ),
+        calc_upper_gamma_popsize(
+            observations, (1 - confidence) / 2, neg_log=neg_log,
+        ),
+    )
@@ -0,0 +1,41 @@
+import numpy as np
+from scipy import special
+
+from ._calc_neg_log_extrema_product import _calc_neg_log_extrema_product
+
+
+def calc_upper_gamma_popsize(
+    observations: np.ndarray,
+    level: np.ndarray,
+    *,
+    neg_log: bool=False,
+) -> np.ndarray:
+    """Solve Γ(k, -n log(prod(x))) = level Γ(k) for population size n, for
+    each set of k observed population maxima x.
+
+    The product of k maxima of n uniform values has -n log(prod(x)) gamma
+    distributed with shape k, so confidence bounds and the median-unbiased
+    estimate are this solution at different levels. Uses the inverse
+    regularized upper incomplete gamma function directly, instead of numeric
+    root finding.
+
+    Parameters
+    ----------
+    observations : array of float
+        Observation sets along the last axis.
+    level : float or array of float
+        Regularized upper incomplete gamma value to solve for, in (0, 1).
+        Broadcast against observation sets.
+    neg_log : bool, default False
+        If True, observations are given as -log(x) rather than x.
+
+    Returns
+    -------
+    array of float
+        One population size per observation set.
+    """
+    observations = np.asarray(observations, dtype=float)
+    k = observations.shape[-1]
+    return special.gammainccinv(k, level) / _calc_neg_log_extrema_product(
+        observations, neg_log,
+    )
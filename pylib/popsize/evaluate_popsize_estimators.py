@@ -0,0 +1,194 @@
+from concurrent import futures
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .calc_median_unbiased_mle_popsize import calc_median_unbiased_mle_popsize
+from .calc_mildest_extrema_popsize import calc_mildest_extrema_popsize
+from .calc_mildest_extrema_popsize_ci import calc_mildest_extrema_popsize_ci
+from .calc_mle_popsize import calc_mle_popsize
+from .calc_mle_popsize_ci import calc_mle_popsize_ci
+from .sample_population_maxima import sample_population_maxima
+
+default_estimators = {
+    'maximum_likelihood_estimator': calc_mle_popsize,
+    'median_unbiased_maximum_likelihood_estimator':
+        calc_median_unbiased_mle_popsize,
+    'mildest_extrema_estimator': calc_mildest_extrema_popsize,
+}
+
+default_interval_estimators = {
+    'maximum_likelihood_estimator': calc_mle_popsize_ci,
+    'mildest_extrema_estimator': calc_mildest_extrema_popsize_ci,
+}
+
+
+def _evaluate_chunk(
+    popsizes: np.ndarray,
+    num_trials: int,
+    num_observations: int,
+    seed_sequence: np.random.SeedSequence,
+    estimators: typing.Mapping[str, typing.Callable],
+    interval_estimators: typing.Mapping[str, typing.Callable],
+    confidence: float,
+) -> typing.Dict[str, np.ndarray]:
+    """Sums of per-trial statistics, one per population size, keyed by
+    '{estimator} {statistic}'."""
+    observations = sample_population_maxima(
+        popsizes,
+        num_trials,
+        num_observations,
+        rng=np.random.default_rng(seed_sequence),
+        neg_log=True,
+    )
+    true_popsizes = popsizes[:, np.newaxis]
+
+    res = {}
+    for name, estimator in estimators.items():
+        estimates = estimator(observations, neg_log=True)
+        res[f'{name} estimate'] = estimates.sum(axis=-1)
+        res[f'{name} squared error'] = (
+            (estimates - true_popsizes) ** 2
+        ).sum(axis=-1)
+    for name, interval_estimator in interval_estimators.items():
+        lbs, ubs = interval_estimator(
+            observations, confidence=confidence, neg_log=True,
+        )
+        res[f'{name} coverage'] = (
+            (lbs <= true_popsizes) & (true_popsizes <= ubs)
+        ).sum(axis=-1)
+        res[f'{name} width'] = (ubs - lbs).sum(axis=-1)
+    return res
+
+
+def evaluate_popsize_estimators(
+    popsizes: typing.Sequence[int],
+    nums_observations: typing.Sequence[int],
+    num_trials: int,
+    *,
+    confidence: float=0.95,
+    estimators: typing.Optional[typing.Mapping[str, typing.Callable]]=None,
+    interval_estimators: typing.Optional[
+        typing.Mapping[str, typing.Callable]
+    ]=None,
+    seed: int=1,
+    chunk_size: int=4096,
+    num_processes: typing.Optional[int]=None,
+) -> pd.DataFrame:
+    """Estimate bias, mean square error, and confidence interval coverage of
+    population size estimators by Monte Carlo simulation.
+
+    Observations are drawn with `sample_population_maxima`, so population
+    size does not affect cost. Trials are split into chunks of `chunk_size`
+    and evaluated across a process pool. Each chunk draws from its own seed,
+    derived from `seed` and the chunk's position, and chunk sums are combined
+    in a fixed order, so results do not depend on `num_processes`.
+
+    Parameters
+    ----------
+    popsizes : sequence of int
+        True population sizes to simulate.
+    nums_observations : sequence of int
+        Numbers of observed maxima per observation set (k) to simulate.
+    num_trials : int
+        Number of observation sets simulated per population size and k.
+    confidence : float, default 0.95
+        Confidence level of intervals.
+    estimators : mapping from str to callable, optional
+        Point estimators, called as `estimator(observations, neg_log=True)`.
+        Defaults to the maximum likelihood, median-unbiased maximum
+        likelihood, and mildest extrema estimators. Must be picklable.
+    interval_estimators : mapping from str to callable, optional
+        Interval estimators, called as `estimator(observations,
+        confidence=confidence, neg_log=True)` and returning lower and upper
+        bounds. Defaults to the maximum likelihood and mildest extrema
+        intervals. Must be picklable.
+    seed : int, default 1
+        Root seed.
+    chunk_size : int, default 4096
+        Number of trials per task.
+    num_processes : int, optional
+        Number of worker processes. Defaults to the CPU count. If 1, chunks
+        are evaluated serially in this process.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per estimator, k, and population size. Point estimators
+        report 'Mean Estimate', 'Bias', 'Mean Square Error', and their
+        population size normalized counterparts. Interval estimators report
+        'Fraction Estimates within Confidence Interval' and 'Mean Normalized
+        Confidence Interval width'.
+    """
+    if estimators is None:
+        estimators = default_estimators
+    if interval_estimators is None:
+        interval_estimators = default_interval_estimators
+    popsizes = np.asarray(popsizes, dtype=float)
+
+    tasks = []
+    for k_index, k in enumerate(nums_observations):
+        for chunk_index, chunk_begin in enumerate(
+            range(0, num_trials, chunk_size),
+        ):
+            tasks.append((
+                popsizes,
+                min(chunk_size, num_trials - chunk_begin),
+                k,
+                np.random.SeedSequence(seed, spawn_key=(k_index, chunk_index)),
+                estimators,
+                interval_estimators,
+                confidence,
+            ))
+
+    if num_processes == 1:
+        chunk_results = [_evaluate_chunk(*task) for task in tasks]
+    else:
+        with futures.ProcessPoolExecutor(
+            max_workers=num_processes,
+        ) as executor:
+            chunk_results = [*executor.map(_evaluate_chunk, *zip(*tasks))]
+
+    sums = {}
+    for (__, __, k, *__), chunk_result in zip(tasks, chunk_results):
+        for statistic, values in chunk_result.items():
+            key = (k, statistic)
+            sums[key] = sums[key] + values if key in sums else values
+
+    records = []
+    for k in nums_observations:
+        for popsize_index, popsize in enumerate(popsizes):
+            def get_mean(statistic: str) -> float:
+                return sums[(k, statistic)][popsize_index] / num_trials
+
+            base = {
+                'Num Observations': k,
+                'True Population Size': popsize,
+                'Num Trials': num_trials,
+            }
+            for name in estimators:
+                mean_estimate = get_mean(f'{name} estimate')
+                mean_square_error = get_mean(f'{name} squared error')
+                records.append({
+                    'Estimator': name,
+                    **base,
+                    'Mean Estimate': mean_estimate,
+                    'Bias': mean_estimate - popsize,
+                    'Normalized Bias': (mean_estimate - popsize) / popsize,
+                    'Mean Square Error': mean_square_error,
+                    'Normalized Mean Square Error':
+                        mean_square_error / popsize ** 2,
+                })
+            for name in interval_estimators:
+                records.append({
+                    'Estimator': f'{name} interval',
+                    **base,
+                    'Confidence': confidence,
+                    'Fraction Estimates within Confidence Interval':
+                        get_mean(f'{name} coverage'),
+                    'Mean Normalized Confidence Interval width':
+                        get_mean(f'{name} width') / popsize,
+                })
+
+    return pd.DataFrame.from_records(records)
@@ -0,0 +1,31 @@
+import math
+import typing
+
+
+def solve_upper_gamma_popsize_sympy(
+    observations: typing.Sequence[float],
+    level: float,
+) -> float:
+    """Solve Γ(k, -n log(prod(x))) = level Γ(k) for population size n by
+    symbolic root finding, for a single set of k observed population maxima.
+
+    Reference implementation of `calc_upper_gamma_popsize`, as used by the
+    popsize notebooks. Much slower.
+    """
+    # slow to import, and only needed for reference
+    import sympy
+
+    k = len(observations)
+    hat_x = math.prod(observations)
+
+    # use mle estimate as starting guess
+    hat_n_mle = -k / math.log(hat_x)
+
+    n = sympy.Symbol('n', positive=True, real=True)
+
+    return float(sympy.nsolve(
+        2 * sympy.uppergamma(k, -n * sympy.log(hat_x))
+        - 2 * level * sympy.gamma(k),
+        hat_n_mle,
+        verify=False,
+    ))
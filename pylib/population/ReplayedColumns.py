@@ -0,0 +1,16 @@
+import typing
+
+import numpy as np
+
+
+class ReplayedColumns(typing.NamedTuple):
+    """Columns of one replayed phylogeny leaf, one per configuration."""
+
+    # index of the leaf among the replayed phylogeny's nodes
+    node_index: int
+    # number of strata deposited on each of the leaf's columns
+    num_strata_deposited: int
+    # ascending retained ranks (read-only, shared), per configuration
+    retained_ranks: typing.Dict[str, np.ndarray]
+    # retained differentia, aligned with retained_ranks, per configuration
+    differentia: typing.Dict[str, np.ndarray]
@@ -0,0 +1,89 @@
+import bisect
+import typing
+
+import numpy as np
+
+
+class RetainedRanksCache:
+    """Memoized sets of ranks a stratum retention policy retains after a given
+    number of strata have been deposited.
+
+    A column's retained ranks depend only on how many strata it has deposited,
+    so they can be computed once and shared by every column with that
+    deposition count. If the condemner provides `CalcNumStrataRetainedExact`
+    and `CalcRankAtColumnIndex` (as hstrat's depth- and recency-proportional
+    resolution policies do), the final rank set is computed directly.
+    Otherwise, condemnation is stepped forward from the nearest smaller cached
+    deposition count, with no differentia involved.
+    """
+
+    _condemner: typing.Callable
+    # cached rank arrays, keyed by number of strata deposited
+    _ranks: typing.Dict[int, np.ndarray]
+    # sorted keys of _ranks
+    _num_deposited_keys: typing.List[int]
+
+    def __init__(
+        self: 'RetainedRanksCache',
+        condemner: typing.Callable,
+    ) -> None:
+        self._condemner = condemner
+        self._ranks = {}
+        self._num_deposited_keys = []
+        self._store(0, [])
+
+    def _store(
+        self: 'RetainedRanksCache',
+        num_strata_deposited: int,
+        ranks: typing.Iterable[int],
+    ) -> np.ndarray:
+        res = np.fromiter(ranks, dtype=np.int64)
+        # shared between columns, so must not be modified
+        res.setflags(write=False)
+        self._ranks[num_strata_deposited] = res
+        bisect.insort(self._num_deposited_keys, num_strata_deposited)
+        return res
+
+    @property
+    def has_closed_form(self: 'RetainedRanksCache') -> bool:
+        return hasattr(self._condemner, 'CalcRankAtColumnIndex') \
+            and hasattr(self._condemner, 'CalcNumStrataRetainedExact')
+
+    def get(
+        self: 'RetainedRanksCache',
+        num_strata_deposited: int,
+    ) -> np.ndarray:
+        """Ranks retained, in ascending order, after `num_strata_deposited`
+        strata have been deposited. The returned array is read-only."""
+        if num_strata_deposited in self._ranks:
+            return self._ranks[num_strata_deposited]
+
+        if self.has_closed_form:
+            num_retained = self._condemner.CalcNumStrataRetainedExact(
+                num_strata_deposited,
+            )
+            return self._store(
+                num_strata_deposited,
+                sorted(
+                    self._condemner.CalcRankAtColumnIndex(
+                        index,
+                        num_strata_deposited,
+                    )
+                    for index in range(num_retained)
+                ),
+            )
+
+        start = self._num_deposited_keys[
+            bisect.bisect_right(self._num_deposited_keys, num_strata_deposited)
+            - 1
+        ]
+        ranks = self._ranks[start].tolist()
+        for num_completed in range(start, num_strata_deposited):
+            ranks.append(num_completed)
+            condemned = {*self._condemner(
+                num_stratum_depositions_completed=num_completed,
+                retained_ranks=iter(ranks),
+            )}
+            if condemned:
+                ranks = [rank for rank in ranks if rank not in condemned]
+        return self._store(num_strata_deposited, ranks)
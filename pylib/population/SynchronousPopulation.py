@@ -0,0 +1,208 @@
+import typing
+
+import numpy as np
+
+from ._get_differentia_dtype import _get_differentia_dtype
+from .select_tournament import select_tournament
+
+
+class SynchronousPopulation:
+    """Population of hereditary stratigraphic columns evolving in
+    synchronous, non-overlapping generations, stored as struct-of-arrays.
+
+    Stands in for a list of organisms that each carry a
+    `HereditaryStratigraphicColumnBundle`. Because generations are
+    synchronous, every column of a configuration has deposited the same number
+    of strata and so retains the same ranks. Ranks are therefore tracked once
+    per configuration and retained differentia are held in one
+    (population size, num retained) array per configuration. The retention
+    policy is consulted once per configuration per generation, instead of once
+    per organism.
+
+    Reproduction gathers rows of every array by parent index and then deposits
+    a stratum of fresh random differentia across the whole population, which
+    together have the same effect as `CloneDescendant` on each parent.
+    """
+
+    # unique id of each individual
+    uids: np.ndarray
+    # unique id of each individual's parent, -1 for founders
+    parent_uids: np.ndarray
+    # phenotype (or genotype) of each individual
+    phenotypes: np.ndarray
+
+    _condemners: typing.Dict[str, typing.Callable]
+    _differentia_bit_widths: typing.Dict[str, int]
+    # shape (population size, num retained), per configuration
+    _differentia: typing.Dict[str, np.ndarray]
+    # ranks of retained strata, shared by all columns of a configuration
+    _retained_ranks: typing.Dict[str, np.ndarray]
+    _num_strata_deposited: int
+    _next_uid: int
+    _rng: np.random.Generator
+
+    def __init__(
+        self: 'SynchronousPopulation',
+        phenotypes: np.ndarray,
+        condemners: typing.Mapping[str, typing.Callable],
+        differentia_bit_widths: typing.Mapping[str, int],
+        *,
+        rng: typing.Optional[np.random.Generator]=None,
+    ) -> None:
+        """Create founders, each with freshly initialized columns.
+
+        Parameters
+        ----------
+        phenotypes : 1d array
+            Phenotype of each founder; sets population size.
+        condemners : mapping from str to callable
+            Stratum retention condemner of each column configuration (e.g.,
+            `hstrat.StratumRetentionCondemnerRecencyProportionalResolution`
+            instances), keyed by configuration name.
+        differentia_bit_widths : mapping from str to int
+            Differentia bit width of each column configuration, at most 64.
+        rng : numpy.random.Generator, optional
+            Source of randomness for differentia and selection.
+        """
+        assert condemners.keys() == differentia_bit_widths.keys()
+        self.phenotypes = np.array(phenotypes)
+        population_size = len(self.phenotypes)
+        self.uids = np.arange(population_size, dtype=np.int64)
+        self.parent_uids = np.full(population_size, -1, dtype=np.int64)
+        self._next_uid = population_size
+        self._rng = np.random.default_rng() if rng is None else rng
+
+        self._condemners = dict(condemners)
+        self._differentia_bit_widths = dict(differentia_bit_widths)
+        self._differentia = {
+            configuration: np.empty(
+                (population_size, 0),
+                dtype=_get_differentia_dtype(bit_width),
+            )
+            for configuration, bit_width in differentia_bit_widths.items()
+        }
+        self._retained_ranks = {
+            configuration: np.empty(0, dtype=np.int64)
+            for configuration in condemners
+        }
+        self._num_strata_deposited = 0
+        # columns deposit their first stratum on construction
+        self._deposit_stratum(np.arange(population_size))
+
+    def __len__(self: 'SynchronousPopulation') -> int:
+        return len(self.uids)
+
+    @property
+    def configurations(self: 'SynchronousPopulation') -> typing.List[str]:
+        return [*self._condemners]
+
+    @property
+    def num_strata_deposited(self: 'SynchronousPopulation') -> int:
+        """Number of strata deposited on every column, counting the stratum
+        deposited at construction."""
+        return self._num_strata_deposited
+
+    @property
+    def rng(self: 'SynchronousPopulation') -> np.random.Generator:
+        return self._rng
+
+    def get_retained_ranks(
+        self: 'SynchronousPopulation',
+        configuration: str,
+    ) -> np.ndarray:
+        """Ranks of retained strata, in ascending order, shared by every
+        column of `configuration`."""
+        return self._retained_ranks[configuration]
+
+    def get_differentia(
+        self: 'SynchronousPopulation',
+        configuration: str,
+    ) -> np.ndarray:
+        """Retained differentia of `configuration`, with one row per
+        individual and one column per retained rank."""
+        return self._differentia[configuration]
+
+    def _deposit_stratum(
+        self: 'SynchronousPopulation',
+        parent_indices: np.ndarray,
+    ) -> None:
+        """Gather columns of parents and deposit a stratum on each."""
+        num_offspring = len(parent_indices)
+        new_rank = self._num_strata_deposited
+        for configuration, condemner in self._condemners.items():
+            candidate_ranks = np.append(
+                self._retained_ranks[configuration],
+                new_rank,
+            )
+            condemned_ranks = {*condemner(
+                num_stratum_depositions_completed=new_rank,
+                retained_ranks=iter(candidate_ranks.tolist()),
+            )}
+            keep = np.fromiter(
+                (rank not in condemned_ranks for rank in candidate_ranks),
+                dtype=bool,
+                count=len(candidate_ranks),
+            )
+
+            differentia = self._differentia[configuration]
+            bit_width = self._differentia_bit_widths[configuration]
+            new_differentia = self._rng.integers(
+                2 ** bit_width,
+                size=(num_offspring, 1),
+                dtype=differentia.dtype,
+            )
+            if keep[:-1].all():
+                gathered = differentia[parent_indices]
+            else:
+                gathered = differentia[
+                    np.ix_(parent_indices, np.flatnonzero(keep[:-1]))
+                ]
+            if keep[-1]:
+                gathered = np.concatenate([gathered, new_differentia], axis=1)
+
+            self._differentia[configuration] = gathered
+            self._retained_ranks[configuration] = candidate_ranks[keep]
+
+        self._num_strata_deposited += 1
+
+    def reproduce(
+        self: 'SynchronousPopulation',
+        parent_indices: np.ndarray,
+    ) -> None:
+        """Replace the population with one offspring of each listed parent.
+
+        Offspring inherit their parent's phenotype; apply any mutation to
+        `phenotypes` afterwards.
+        """
+        parent_indices = np.asarray(parent_indices, dtype=np.intp)
+        num_offspring = len(parent_indices)
+        self._deposit_stratum(parent_indices)
+        self.phenotypes = self.phenotypes[parent_indices]
+        self.parent_uids = self.uids[parent_indices]
+        self.uids = np.arange(
+            self._next_uid,
+            self._next_uid + num_offspring,
+            dtype=np.int64,
+        )
+        self._next_uid += num_offspring
+
+    def do_tournament_generation(
+        self: 'SynchronousPopulation',
+        fitnesses: np.ndarray,
+        tournament_size: int=7,
+    ) -> np.ndarray:
+        """Replace the population with offspring of tournament winners, one
+        tournament per individual.
+
+        Returns
+        -------
+        array of int
+            Index of each offspring's parent in the previous generation.
+        """
+        parent_indices = select_tournament(
+            fitnesses,
+            tournament_size,
+            self._rng,
+        )
+        self.reproduce(parent_indices)
+        return parent_indices
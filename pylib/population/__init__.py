@@ -0,0 +1,15 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'calc_phenotype_frequency_fitnesses',
+    'replay_phylogeny',
+    'ReplayedColumns',
+    'RetainedRanksCache',
+    'select_tournament',
+    'SynchronousPopulation',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
@@ -0,0 +1,10 @@
+import numpy as np
+
+
+def _get_differentia_dtype(differentia_bit_width: int) -> np.dtype:
+    for dtype in np.uint8, np.uint16, np.uint32, np.uint64:
+        if differentia_bit_width <= np.iinfo(dtype).bits:
+            return np.dtype(dtype)
+    raise ValueError(
+        f'differentia bit width {differentia_bit_width} exceeds 64',
+    )
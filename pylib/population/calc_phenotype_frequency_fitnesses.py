@@ -0,0 +1,10 @@
+import numpy as np
+
+
+def calc_phenotype_frequency_fitnesses(phenotypes: np.ndarray) -> np.ndarray:
+    """Fitness of each individual as the reciprocal of the number of
+    individuals sharing its phenotype, as in the ecology simulation."""
+    __, inverse, counts = np.unique(
+        phenotypes, return_inverse=True, return_counts=True,
+    )
+    return 1.0 / counts[inverse.ravel()]
@@ -0,0 +1,152 @@
+import typing
+
+import numpy as np
+
+from ._get_differentia_dtype import _get_differentia_dtype
+from .ReplayedColumns import ReplayedColumns
+from .RetainedRanksCache import RetainedRanksCache
+
+
+def replay_phylogeny(
+    parent_indices: np.ndarray,
+    origin_times: np.ndarray,
+    condemners: typing.Mapping[str, typing.Callable],
+    differentia_bit_widths: typing.Mapping[str, int],
+    *,
+    rng: typing.Optional[np.random.Generator]=None,
+) -> typing.Iterator[ReplayedColumns]:
+    """Replay hereditary stratigraphic columns down a known phylogeny and
+    yield the columns of each leaf.
+
+    Stands in for walking the phylogeny, cloning each parent's column bundle,
+    and calling `DepositStratum` once per elapsed generation. Roots get fresh
+    columns with one stratum deposited; every other node deposits one stratum
+    per unit of origin time elapsed since its parent.
+
+    Elapsed generations are deposited in one step: the node's retained ranks
+    are the retention policy's final rank set for its deposition count
+    (memoized per count, see `RetainedRanksCache`). Differentia at retained
+    ranks the parent already had are copied from the parent and the rest are
+    drawn fresh. Chains of single-child nodes are skipped outright, since
+    nothing deposited along them is shared with any other lineage.
+
+    Nodes are visited depth first and a node's columns are dropped as soon as
+    all of its children have been derived, so only columns of branch points
+    along the current path are held at once, not columns of every node.
+
+    Parameters
+    ----------
+    parent_indices : 1d array of int
+        Index of each node's parent, or -1 for roots.
+    origin_times : 1d array of int
+        Generation at which each node originated. Must not decrease from
+        parent to child.
+    condemners : mapping from str to callable
+        Stratum retention condemner of each column configuration, keyed by
+        configuration name.
+    differentia_bit_widths : mapping from str to int
+        Differentia bit width of each column configuration, at most 64.
+    rng : numpy.random.Generator, optional
+        Source of randomness for differentia.
+
+    Yields
+    ------
+    ReplayedColumns
+        Columns of each leaf.
+    """
+    assert condemners.keys() == differentia_bit_widths.keys()
+    parent_indices = np.asarray(parent_indices, dtype=np.int64)
+    origin_times = np.asarray(origin_times, dtype=np.int64)
+    num_nodes = len(parent_indices)
+    assert origin_times.shape == (num_nodes,)
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # children of each node in CSR form
+    is_root = parent_indices < 0
+    child_ids = np.flatnonzero(~is_root)
+    child_ids = child_ids[
+        np.argsort(parent_indices[child_ids], kind='stable')
+    ]
+    num_children = np.bincount(
+        parent_indices[~is_root], minlength=num_nodes,
+    )
+    child_offsets = np.concatenate([[0], np.cumsum(num_children)])
+    assert (
+        origin_times[~is_root] >= origin_times[parent_indices[~is_root]]
+    ).all()
+
+    ranks_caches = {
+        configuration: RetainedRanksCache(condemner)
+        for configuration, condemner in condemners.items()
+    }
+    dtypes = {
+        configuration: _get_differentia_dtype(bit_width)
+        for configuration, bit_width in differentia_bit_widths.items()
+    }
+
+    def derive(
+        parent_num_deposited: int,
+        parent_differentia: typing.Dict[str, np.ndarray],
+        num_deposited: int,
+    ) -> typing.Dict[str, np.ndarray]:
+        res = {}
+        for configuration, ranks_cache in ranks_caches.items():
+            ranks = ranks_cache.get(num_deposited)
+            differentia = rng.integers(
+                2 ** differentia_bit_widths[configuration],
+                size=len(ranks),
+                dtype=dtypes[configuration],
+            )
+            num_inherited = np.searchsorted(ranks, parent_num_deposited)
+            if num_inherited:
+                parent_ranks = ranks_cache.get(parent_num_deposited)
+                differentia[:num_inherited] = parent_differentia[
+                    configuration
+                ][np.searchsorted(parent_ranks, ranks[:num_inherited])]
+            res[configuration] = differentia
+        return res
+
+    def make_replayed(
+        node: int,
+        num_deposited: int,
+        differentia: typing.Dict[str, np.ndarray],
+    ) -> ReplayedColumns:
+        return ReplayedColumns(
+            node_index=int(node),
+            num_strata_deposited=int(num_deposited),
+            retained_ranks={
+                configuration: ranks_cache.get(num_deposited)
+                for configuration, ranks_cache in ranks_caches.items()
+            },
+            differentia=differentia,
+        )
+
+    # entries are (node, num strata deposited, differentia per configuration)
+    stack = []
+    for root in np.flatnonzero(is_root)[::-1]:
+        differentia = derive(0, {}, 1)
+        if num_children[root]:
+            stack.append((root, 1, differentia))
+        else:
+            yield make_replayed(root, 1, differentia)
+
+    while stack:
+        # once popped, only derived children reference a node's columns
+        node, num_deposited, differentia = stack.pop()
+        children = child_ids[child_offsets[node]:child_offsets[node + 1]]
+        for child in children:
+            # skip over chains of single-child nodes
+            while num_children[child] == 1:
+                child = child_ids[child_offsets[child]]
+            child_num_deposited = num_deposited \
+                + origin_times[child] - origin_times[node]
+            child_differentia = derive(
+                num_deposited, differentia, child_num_deposited,
+            )
+            if num_children[child]:
+                stack.append((child, child_num_deposited, child_differentia))
+            else:
+                yield make_replayed(
+                    child, child_num_deposited, child_differentia,
+                )
@@ -0,0 +1,65 @@
+import typing
+
+import numpy as np
+
+
+def select_tournament(
+    fitnesses: np.ndarray,
+    tournament_size: int,
+    rng: np.random.Generator,
+    num_tournaments: typing.Optional[int]=None,
+) -> np.ndarray:
+    """Run tournaments all at once and return the index of each winner.
+
+    Like `max(random.sample(population, tournament_size), key=get_fitness)`
+    repeated once per tournament: contestants are drawn without replacement
+    within each tournament and ties go to the first contestant drawn.
+
+    If tournament_size ** 2 <= population size, contestants are drawn with
+    replacement and only tournaments that drew a duplicate are redrawn, which
+    needs a small expected number of redraws and costs about
+    O(num_tournaments * tournament_size). Otherwise, duplicates would be drawn
+    too often, so each tournament instead takes a prefix of a random
+    permutation of the population, costing
+    O(num_tournaments * population size).
+
+    Parameters
+    ----------
+    fitnesses : 1d array of float
+        Fitness of each individual.
+    tournament_size : int
+        Number of contestants per tournament.
+    rng : numpy.random.Generator
+        Source of randomness.
+    num_tournaments : int, optional
+        Defaults to population size.
+    """
+    population_size = len(fitnesses)
+    if num_tournaments is None:
+        num_tournaments = population_size
+    assert 0 < tournament_size <= population_size
+
+    if tournament_size ** 2 > population_size:
+        # duplicates would be drawn too often for redrawing to pay off
+        contestants = rng.permuted(
+            np.broadcast_to(
+                np.arange(population_size),
+                (num_tournaments, population_size),
+            ),
+            axis=1,
+        )[:, :tournament_size]
+    else:
+        contestants = rng.integers(
+            population_size, size=(num_tournaments, tournament_size),
+        )
+        redraw = np.arange(num_tournaments)
+        while len(redraw):
+            ordered = np.sort(contestants[redraw], axis=1)
+            has_duplicate = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+            redraw = redraw[has_duplicate]
+            contestants[redraw] = rng.integers(
+                population_size, size=(len(redraw), tournament_size),
+            )
+
+    winning_positions = np.argmax(fitnesses[contestants], axis=1)
+    return contestants[np.arange(num_tournaments), winning_positions]
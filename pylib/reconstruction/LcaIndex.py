@@ -0,0 +1,123 @@
+import typing
+
+import numpy as np
+
+
+class LcaIndex:
+    """Constant-time lowest common ancestor (LCA) queries over a Biopython
+    tree.
+
+    Builds an Euler tour of the tree and a sparse table of range minima over
+    it. Nodes are numbered in preorder, so every node's id is smaller than its
+    descendants' and the LCA of two nodes is simply the smallest node id
+    visited by the Euler tour between their first occurrences.
+
+    Construction takes O(n log n) time and memory for n nodes. Queries accept
+    arrays of node ids and are answered with a constant number of vectorized
+    NumPy operations, regardless of tree shape.
+    """
+
+    # clade objects, indexed by node id
+    _clades: typing.List[typing.Any]
+    # map from clade object identity to node id
+    _node_ids_by_clade: typing.Dict[int, int]
+    # position of each node's first occurrence in the Euler tour
+    _first_occurrences: np.ndarray
+    # row k holds minimum node id over Euler tour windows of length 2 ** k
+    _sparse_table: np.ndarray
+    # floor(log2(i)) for window lengths i
+    _floor_log2: np.ndarray
+
+    def __init__(self: 'LcaIndex', tree) -> None:
+        """Index all clades of `tree`, which may be a Biopython Tree or
+        Clade."""
+
+        root = getattr(tree, 'root', tree)
+        self._clades = []
+        euler_tour = []
+        first_occurrences = []
+        # None entries mark returns to a parent between its children
+        stack = [(root, -1)]
+        while stack:
+            clade, parent_id = stack.pop()
+            if clade is None:
+                euler_tour.append(parent_id)
+                continue
+            node_id = len(self._clades)
+            self._clades.append(clade)
+            first_occurrences.append(len(euler_tour))
+            euler_tour.append(node_id)
+            for child in reversed(clade.clades):
+                stack.append((None, node_id))
+                stack.append((child, node_id))
+
+        self._node_ids_by_clade = {
+            id(clade): node_id for node_id, clade in enumerate(self._clades)
+        }
+
+        dtype = np.int32 if len(self._clades) < 2**31 else np.int64
+        self._first_occurrences = np.array(first_occurrences, dtype=dtype)
+        tour_length = len(euler_tour)
+        num_levels = tour_length.bit_length()
+        self._sparse_table = np.empty((num_levels, tour_length), dtype=dtype)
+        self._sparse_table[0] = euler_tour
+        for level in range(1, num_levels):
+            half = 1 << (level - 1)
+            prev = self._sparse_table[level - 1]
+            row = self._sparse_table[level]
+            row[:tour_length - 2 * half + 1] = np.minimum(
+                prev[:tour_length - 2 * half + 1],
+                prev[half:tour_length - half + 1],
+            )
+            # entries past the end of the tour are never queried
+            row[tour_length - 2 * half + 1:] = 0
+
+        # frexp is exact for integers below 2 ** 53
+        self._floor_log2 = (
+            np.frexp(np.arange(tour_length + 1))[1] - 1
+        ).astype(dtype)
+
+    def __len__(self: 'LcaIndex') -> int:
+        return len(self._clades)
+
+    @property
+    def clades(self: 'LcaIndex') -> typing.List[typing.Any]:
+        """Clade objects, indexed by node id (preorder)."""
+        return self._clades
+
+    def get_clade(self: 'LcaIndex', node_id: int) -> typing.Any:
+        return self._clades[node_id]
+
+    def get_node_id(self: 'LcaIndex', clade: typing.Any) -> int:
+        return self._node_ids_by_clade[id(clade)]
+
+    def get_node_ids(
+        self: 'LcaIndex',
+        clades: typing.Iterable[typing.Any],
+    ) -> np.ndarray:
+        return np.fromiter(
+            (self._node_ids_by_clade[id(clade)] for clade in clades),
+            dtype=self._first_occurrences.dtype,
+        )
+
+    def calc_lca(
+        self: 'LcaIndex',
+        first_node_ids: typing.Union[int, np.ndarray],
+        second_node_ids: typing.Union[int, np.ndarray],
+    ) -> typing.Union[int, np.ndarray]:
+        """Find LCA node ids of node id pairs, elementwise.
+
+        Accepts scalars or broadcastable arrays of node ids. Returns a scalar
+        node id if both arguments are scalars, otherwise an array.
+        """
+
+        first = self._first_occurrences[first_node_ids]
+        second = self._first_occurrences[second_node_ids]
+        lo = np.minimum(first, second)
+        hi = np.maximum(first, second)
+        level = self._floor_log2[hi - lo + 1]
+        res = np.minimum(
+            self._sparse_table[level, lo],
+            self._sparse_table[level, hi - (1 << level) + 1],
+        )
+        return res.item() if np.ndim(res) == 0 else res
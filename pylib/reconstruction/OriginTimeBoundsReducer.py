@@ -0,0 +1,93 @@
+import typing
+
+import numpy as np
+
+
+class OriginTimeBoundsReducer:
+    """Streaming consolidation of per-node origin time bounds.
+
+    Each pairwise comparison between taxa contributes an origin time lower
+    bound (inclusive) and upper bound (exclusive) to the node at which their
+    lineages join. This reducer folds arrays of such contributions into one
+    consolidated bound per node without materializing per-node lists.
+
+    Consolidation follows the rule used for distance-reconstructed trees.
+    Upper bounds are hard bounds, so the consolidated upper bound is the
+    lowest contributed upper bound. The consolidated lower bound is the
+    strictest (largest) lower bound among contributions whose upper bound has
+    not been undercut, i.e., equals the consolidated upper bound.
+    """
+
+    _origin_time_lbs: np.ndarray
+    _origin_time_ubs: np.ndarray
+    _num_contributions: np.ndarray
+
+    def __init__(self: 'OriginTimeBoundsReducer', num_nodes: int) -> None:
+        self._origin_time_lbs = np.full(num_nodes, -np.inf)
+        self._origin_time_ubs = np.full(num_nodes, np.inf)
+        self._num_contributions = np.zeros(num_nodes, dtype=np.int64)
+
+    def fold(
+        self: 'OriginTimeBoundsReducer',
+        node_ids: np.ndarray,
+        origin_time_lbs: np.ndarray,
+        origin_time_ubs: np.ndarray,
+    ) -> None:
+        """Incorporate a chunk of bound contributions.
+
+        Parameters
+        ----------
+        node_ids : array of int
+            Node receiving each contribution.
+        origin_time_lbs : array of float
+            Contributed lower bounds (inclusive).
+        origin_time_ubs : array of float
+            Contributed upper bounds (exclusive).
+        """
+        node_ids = np.asarray(node_ids).ravel()
+        lbs = np.asarray(origin_time_lbs, dtype=float).ravel()
+        ubs = np.asarray(origin_time_ubs, dtype=float).ravel()
+        assert len(node_ids) == len(lbs) == len(ubs)
+        assert not np.isnan(lbs).any() and not np.isnan(ubs).any()
+
+        prev_ubs = self._origin_time_ubs[node_ids]
+        np.minimum.at(self._origin_time_ubs, node_ids, ubs)
+        # lower bounds paired with undercut upper bounds no longer count
+        undercut = self._origin_time_ubs[node_ids] < prev_ubs
+        self._origin_time_lbs[node_ids[undercut]] = -np.inf
+
+        not_undercut = ubs == self._origin_time_ubs[node_ids]
+        np.maximum.at(
+            self._origin_time_lbs,
+            node_ids[not_undercut],
+            lbs[not_undercut],
+        )
+        self._num_contributions += np.bincount(
+            node_ids,
+            minlength=len(self._num_contributions),
+        )
+
+    @property
+    def origin_time_lbs(self: 'OriginTimeBoundsReducer') -> np.ndarray:
+        """Consolidated lower bound of each node, -inf if none folded."""
+        return self._origin_time_lbs
+
+    @property
+    def origin_time_ubs(self: 'OriginTimeBoundsReducer') -> np.ndarray:
+        """Consolidated upper bound of each node, inf if none folded."""
+        return self._origin_time_ubs
+
+    @property
+    def num_contributions(self: 'OriginTimeBoundsReducer') -> np.ndarray:
+        """Number of bound contributions folded into each node."""
+        return self._num_contributions
+
+    def get_bounds(
+        self: 'OriginTimeBoundsReducer',
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Return consolidated (lower bound, upper bound) arrays.
+
+        Asserts every node received at least one contribution.
+        """
+        assert self._num_contributions.all()
+        return self._origin_time_lbs, self._origin_time_ubs
@@ -0,0 +1,15 @@
+import typing
+
+import numpy as np
+
+
+class PairwiseMrcaMatrices(typing.NamedTuple):
+    """Square matrices derived from pairwise MRCA estimates, indexed by
+    integer taxon code."""
+
+    # symmetric estimated phylogenetic distance between taxa, zero diagonal
+    distance_matrix: np.ndarray
+    # MRCA generation lower bound (inclusive), taxon generation on diagonal
+    origin_time_lb_matrix: np.ndarray
+    # MRCA generation upper bound (exclusive), taxon generation + 1 on diagonal
+    origin_time_ub_matrix: np.ndarray
@@ -0,0 +1,18 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'calc_pairwise_mrca_matrices',
+    'calc_pairwise_mrca_matrices_from_dataframe',
+    'consolidate_origin_time_bounds',
+    'construct_distance_tree',
+    'construct_nj_tree',
+    'construct_upgma_tree',
+    'LcaIndex',
+    'OriginTimeBoundsReducer',
+    'PairwiseMrcaMatrices',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
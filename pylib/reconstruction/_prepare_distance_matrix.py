@@ -0,0 +1,44 @@
+import typing
+
+import numpy as np
+
+
+def _prepare_distance_matrix(
+    distance_matrix: np.ndarray,
+    names: typing.Sequence[typing.Any],
+    overwrite: bool,
+) -> np.ndarray:
+    """Validate a square distance matrix and return a contiguous floating
+    point working copy, or `distance_matrix` itself if `overwrite` is set and
+    its layout allows in-place use."""
+    if overwrite and isinstance(distance_matrix, np.ndarray) \
+            and distance_matrix.dtype in (np.float32, np.float64) \
+            and distance_matrix.flags.c_contiguous \
+            and distance_matrix.flags.writeable:
+        res = distance_matrix
+    else:
+        distance_matrix = np.asarray(distance_matrix)
+        res = np.array(
+            distance_matrix,
+            dtype=np.float32
+            if distance_matrix.dtype == np.float32
+            else np.float64,
+            order='C',
+        )
+
+    if res.ndim != 2 or res.shape[0] != res.shape[1]:
+        raise ValueError(f"distance matrix must be square, got {res.shape}")
+    if res.shape[0] != len(names):
+        raise ValueError(
+            f"got {len(names)} names for {res.shape[0]} x {res.shape[0]} "
+            "distance matrix"
+        )
+    # check in row blocks to avoid a full-size temporary mask
+    rows_per_block = max(1, 2**22 // max(len(res), 1))
+    if any(
+        np.isnan(res[begin:begin + rows_per_block]).any()
+        for begin in range(0, len(res), rows_per_block)
+    ):
+        raise ValueError("distance matrix must not contain NaN")
+
+    return res
@@ -0,0 +1,23 @@
+import numpy as np
+
+
+def _symmetrize_from_lower_triangle(
+    matrix: np.ndarray,
+    chunk_size: int=2**22,
+) -> None:
+    """Copy entries below the diagonal of a square matrix into the
+    corresponding entries above it, in place.
+
+    Works in row blocks of about `chunk_size` entries, so temporaries stay
+    small regardless of matrix size.
+    """
+    num_rows = len(matrix)
+    rows_per_block = max(1, chunk_size // max(num_rows, 1))
+    for begin in range(0, num_rows, rows_per_block):
+        end = min(begin + rows_per_block, num_rows)
+        # strictly upper part right of the diagonal block
+        matrix[begin:end, end:] = matrix[end:, begin:end].T
+        # strictly upper part within the diagonal block
+        block = matrix[begin:end, begin:end]
+        upper = np.triu_indices(end - begin, 1)
+        block[upper] = block.T[upper]
@@ -0,0 +1,128 @@
+import typing
+
+import numpy as np
+
+from .PairwiseMrcaMatrices import PairwiseMrcaMatrices
+
+
+def calc_pairwise_mrca_matrices(
+    taxon_from_codes: np.ndarray,
+    taxon_to_codes: np.ndarray,
+    mrca_lbs: np.ndarray,
+    mrca_ubs: np.ndarray,
+    earliest_detectable_mrca_ranks: np.ndarray,
+    taxon_from_generations: np.ndarray,
+    taxon_to_generations: np.ndarray,
+    *,
+    num_taxa: typing.Optional[int]=None,
+    dtype: typing.Type=np.float64,
+) -> PairwiseMrcaMatrices:
+    """Build distance and MRCA bound matrices from pairwise MRCA estimates.
+
+    All arguments are parallel arrays with one entry per row of a pairwise MRCA
+    estimates table, with missing estimates as NaN. The same rules previously
+    applied row by row are applied here as whole-column NumPy operations.
+
+    MRCA generation is estimated as the midpoint of its bounds. If bounds are
+    unavailable, the midpoint below the earliest detectable MRCA rank is used.
+    If that is unavailable too, the midpoint below the earlier of the two taxa
+    is used. The MRCA estimate is zero if no common ancestry is detected.
+
+    Distance between taxa i and j sums the estimated elapsed generations from
+    their MRCA to each, over both comparison directions. Pairs listed in only
+    one direction (e.g., upper-triangle tables) are mirrored.
+
+    Parameters
+    ----------
+    taxon_from_codes, taxon_to_codes : array of int
+        Integer codes, in range [0, num_taxa), of taxa compared from and to.
+    mrca_lbs : array of float
+        "Generation Of MRCA Lower Bound (inclusive)" column.
+    mrca_ubs : array of float
+        "Generation Of MRCA Upper Bound (exclusive)" column.
+    earliest_detectable_mrca_ranks : array of float
+        "Rank of Earliest Detectable Mrca With" column.
+    taxon_from_generations, taxon_to_generations : array of float
+        "Generation of Taxon Compared From/To" columns.
+    num_taxa : int, optional
+        Matrix size. Defaults to largest taxon code plus one.
+    dtype : numpy dtype, default np.float64
+        Dtype of returned matrices. Use np.float32 to halve memory use for
+        large populations.
+    """
+    i = np.asarray(taxon_from_codes, dtype=np.intp)
+    j = np.asarray(taxon_to_codes, dtype=np.intp)
+    lb = np.asarray(mrca_lbs, dtype=float)
+    ub = np.asarray(mrca_ubs, dtype=float)
+    earliest = np.asarray(earliest_detectable_mrca_ranks, dtype=float)
+    gen_from = np.asarray(taxon_from_generations, dtype=float)
+    gen_to = np.asarray(taxon_to_generations, dtype=float)
+    assert not (i == j).any()
+    if num_taxa is None:
+        num_taxa = int(max(i.max(initial=-1), j.max(initial=-1))) + 1
+
+    has_lb = ~np.isnan(lb)
+    has_ub = ~np.isnan(ub)
+    has_earliest = ~np.isnan(earliest)
+    # upper bound is never available without lower bound
+    assert not (has_ub & ~has_lb).any()
+    # lower bound is never available without upper bound
+    assert not (has_lb & ~has_ub).any()
+
+    min_gen = np.minimum(gen_from, gen_to)
+    mrca_time_mids = np.select(
+        [
+            has_lb & has_ub,
+            earliest == 0,
+            has_earliest,
+        ],
+        [
+            (lb + ub - 1) / 2,  # ub is exclusive
+            # we are confident that no mrca exists, but return 0
+            0,
+            (earliest - 1) / 2,  # exclusive
+        ],
+        min_gen / 2,
+    )
+    distances = gen_from + gen_to - 2 * mrca_time_mids
+    assert not np.isnan(distances).any()
+
+    mrca_time_lbs = np.where(has_lb, lb, 0)
+    mrca_time_ubs = np.select(
+        [has_ub, has_earliest],
+        [ub, earliest],
+        min_gen + 1,  # exclusive
+    )
+
+    # fill directed entries, then symmetrize
+    present = np.zeros((num_taxa, num_taxa), dtype=bool)
+    present[i, j] = True
+    present_transpose = present.T
+    mirror = ~present & present_transpose
+    assert (present | mirror | np.eye(num_taxa, dtype=bool)).all(), \
+        "pairwise estimates missing for some taxon pairs"
+
+    def fill_directed(values: np.ndarray) -> np.ndarray:
+        res = np.zeros((num_taxa, num_taxa), dtype=dtype)
+        res[i, j] = values
+        res[mirror] = res.T[mirror]
+        return res
+
+    distance_matrix = fill_directed(distances)
+    distance_matrix += distance_matrix.T
+    np.fill_diagonal(distance_matrix, 0)
+
+    taxon_generations = np.zeros(num_taxa, dtype=float)
+    taxon_generations[j] = gen_to
+    taxon_generations[i] = gen_from
+
+    origin_time_lb_matrix = fill_directed(mrca_time_lbs)
+    np.fill_diagonal(origin_time_lb_matrix, taxon_generations)  # inclusive
+    origin_time_ub_matrix = fill_directed(mrca_time_ubs)
+    np.fill_diagonal(origin_time_ub_matrix, taxon_generations + 1) # exclusive
+
+    return PairwiseMrcaMatrices(
+        distance_matrix=distance_matrix,
+        origin_time_lb_matrix=origin_time_lb_matrix,
+        origin_time_ub_matrix=origin_time_ub_matrix,
+    )
@@ -0,0 +1,39 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .calc_pairwise_mrca_matrices import calc_pairwise_mrca_matrices
+from .PairwiseMrcaMatrices import PairwiseMrcaMatrices
+
+
+def calc_pairwise_mrca_matrices_from_dataframe(
+    df: pd.DataFrame,
+    **kwargs,
+) -> typing.Tuple[PairwiseMrcaMatrices, np.ndarray]:
+    """Build distance and MRCA bound matrices from a pairwise MRCA estimates
+    table for a single treatment.
+
+    Taxa are coded in order of first appearance in the "Taxon Compared From"
+    column, followed by any taxa appearing only in the "Taxon Compared To"
+    column. Returns the matrices and the taxon label for each code. Keyword
+    arguments are forwarded to `calc_pairwise_mrca_matrices`.
+    """
+    taxon_codes, labels = pd.factorize(np.concatenate([
+        df['Taxon Compared From'].to_numpy(),
+        df['Taxon Compared To'].to_numpy(),
+    ]))
+    taxon_from_codes, taxon_to_codes = np.split(taxon_codes, 2)
+
+    matrices = calc_pairwise_mrca_matrices(
+        taxon_from_codes,
+        taxon_to_codes,
+        df['Generation Of MRCA Lower Bound (inclusive)'].to_numpy(),
+        df['Generation Of MRCA Upper Bound (exclusive)'].to_numpy(),
+        df['Rank of Earliest Detectable Mrca With'].to_numpy(),
+        df['Generation of Taxon Compared From'].to_numpy(),
+        df['Generation of Taxon Compared To'].to_numpy(),
+        num_taxa=len(labels),
+        **kwargs,
+    )
+    return matrices, np.asarray(labels)
@@ -0,0 +1,72 @@
+import typing
+
+import numpy as np
+
+from .LcaIndex import LcaIndex
+from .OriginTimeBoundsReducer import OriginTimeBoundsReducer
+
+
+def consolidate_origin_time_bounds(
+    tree,
+    terminal_clades: typing.Sequence[typing.Any],
+    origin_time_lb_matrix: np.ndarray,
+    origin_time_ub_matrix: np.ndarray,
+    *,
+    lca_index: typing.Optional[LcaIndex]=None,
+    chunk_size: int=2**20,
+) -> None:
+    """Set consolidated `origin_time_lb` and `origin_time_ub` attributes on
+    all clades of a reconstructed tree.
+
+    Every entry (i, j) of the bound matrices, including the diagonal,
+    contributes a bound to the LCA of `terminal_clades[i]` and
+    `terminal_clades[j]`. Contributions are consolidated per node by
+    `OriginTimeBoundsReducer`. Matrices are processed in row blocks of about
+    `chunk_size` entries, so memory-mapped matrices need not fit in memory.
+
+    Parameters
+    ----------
+    tree : Bio.Phylo.BaseTree.Tree
+        Tree to annotate.
+    terminal_clades : sequence of Bio.Phylo.BaseTree.Clade
+        Clade corresponding to each row/column of the bound matrices.
+    origin_time_lb_matrix : 2d array of float
+        Pairwise MRCA origin time lower bounds (inclusive).
+    origin_time_ub_matrix : 2d array of float
+        Pairwise MRCA origin time upper bounds (exclusive).
+    lca_index : LcaIndex, optional
+        Prebuilt index over `tree`. Built if not provided.
+    chunk_size : int, default 2**20
+        Approximate number of matrix entries folded per step.
+    """
+    num_taxa = len(terminal_clades)
+    assert origin_time_lb_matrix.shape == (num_taxa, num_taxa)
+    assert origin_time_ub_matrix.shape == (num_taxa, num_taxa)
+
+    if lca_index is None:
+        lca_index = LcaIndex(tree)
+    terminal_ids = lca_index.get_node_ids(terminal_clades)
+
+    reducer = OriginTimeBoundsReducer(len(lca_index))
+    rows_per_chunk = max(1, chunk_size // max(num_taxa, 1))
+    for begin in range(0, num_taxa, rows_per_chunk):
+        end = min(begin + rows_per_chunk, num_taxa)
+        mrca_ids = lca_index.calc_lca(
+            terminal_ids[begin:end, None],
+            terminal_ids[None, :],
+        )
+        reducer.fold(
+            mrca_ids,
+            origin_time_lb_matrix[begin:end],
+            origin_time_ub_matrix[begin:end],
+        )
+
+    origin_time_lbs, origin_time_ubs = reducer.get_bounds()
+    assert (origin_time_ubs > origin_time_lbs).all()
+    for clade, lb, ub in zip(
+        lca_index.clades,
+        origin_time_lbs.tolist(),
+        origin_time_ubs.tolist(),
+    ):
+        clade.origin_time_lb = lb
+        clade.origin_time_ub = ub
@@ -0,0 +1,42 @@
+import typing
+
+from Bio.Phylo import BaseTree
+import numpy as np
+
+from .construct_nj_tree import construct_nj_tree
+from .construct_upgma_tree import construct_upgma_tree
+
+
+def construct_distance_tree(
+    distance_matrix: np.ndarray,
+    names: typing.Sequence[typing.Any],
+    algorithm: str,
+    **kwargs,
+) -> BaseTree.Tree:
+    """Construct a tree from a distance matrix with the named algorithm.
+
+    Drop-in replacement for
+    `getattr(DistanceTreeConstructor(), algorithm)(dm)` that takes a NumPy
+    matrix directly, instead of a lower-triangular `DistanceMatrix`.
+
+    Parameters
+    ----------
+    distance_matrix : 2d array of float
+        Symmetric matrix of distances between taxa.
+    names : sequence
+        Name of each taxon, used as terminal clade names.
+    algorithm : {'upgma', 'nj'}
+        Tree construction algorithm.
+    **kwargs
+        Forwarded to `construct_upgma_tree` or `construct_nj_tree`.
+    """
+    try:
+        constructor = {
+            'nj': construct_nj_tree,
+            'upgma': construct_upgma_tree,
+        }[algorithm]
+    except KeyError:
+        raise ValueError(
+            f"Invalid algorithm '{algorithm}'; must be one of: 'nj', 'upgma'"
+        ) from None
+    return constructor(distance_matrix, names, **kwargs)
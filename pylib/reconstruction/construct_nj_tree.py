@@ -0,0 +1,224 @@
+import typing
+
+from Bio.Phylo import BaseTree
+import numpy as np
+
+from ._prepare_distance_matrix import _prepare_distance_matrix
+from ._symmetrize_from_lower_triangle \
+    import _symmetrize_from_lower_triangle
+
+
+def construct_nj_tree(
+    distance_matrix: np.ndarray,
+    names: typing.Sequence[typing.Any],
+    *,
+    prune_search: bool=True,
+    overwrite: bool=False,
+) -> BaseTree.Tree:
+    """Construct a neighbor joining tree.
+
+    Follows Biopython's `DistanceTreeConstructor().nj`, including its
+    tie-breaking, clade naming ("Inner1", "Inner2", ...), branch lengths, and
+    unrooted result, but works on a NumPy matrix in place and maintains row
+    sums incrementally instead of recomputing them every step.
+
+    Incremental row sums can round differently from Biopython's in the last
+    few bits, so exact ties in the joining criterion may resolve differently.
+    Such ties always occur among the final four nodes, where they change how
+    the unrooted result is anchored but not its topology.
+
+    Parameters
+    ----------
+    distance_matrix : 2d array of float
+        Symmetric matrix of distances between taxa. Only entries below the
+        diagonal are read.
+    names : sequence
+        Name of each taxon, used as terminal clade names.
+    prune_search : bool, default True
+        If True, search for the pair to join in the spirit of RapidNJ. Rows
+        are visited in order of a lower bound on their best criterion value,
+        computed from cached row minima, and the search stops once no
+        unvisited row can beat the best pair found. Usually only a handful of
+        rows are scanned per step. If False, every pair is scanned every step.
+        Both choose the same pairs.
+    overwrite : bool, default False
+        If True and `distance_matrix` is a C-contiguous float32 or float64
+        array, use it as working memory instead of copying it. Its contents
+        are then destroyed.
+    """
+    dm = _prepare_distance_matrix(distance_matrix, names, overwrite)
+    num_taxa = len(names)
+    clades = [BaseTree.Clade(None, str(name)) for name in names]
+
+    # special cases for Minimum Alignment Matrices
+    if num_taxa == 1:
+        return BaseTree.Tree(clades[0], rooted=False)
+    elif num_taxa == 2:
+        # minimum distance will always be [1,0]
+        clade1, clade2 = clades[1], clades[0]
+        clade1.branch_length = float(dm[1, 0]) / 2.0
+        clade2.branch_length = float(dm[1, 0]) - clade1.branch_length
+        inner_clade = BaseTree.Clade(None, "Inner")
+        inner_clade.clades.append(clade1)
+        inner_clade.clades.append(clade2)
+        return BaseTree.Tree(inner_clade, rooted=False)
+
+    # slots keep their relative order, so slot order matches the index
+    # order of Biopython's shrinking matrix
+    _symmetrize_from_lower_triangle(dm)
+    row_sums = dm.sum(axis=1, dtype=np.float64)
+    # inactive slots and the diagonal hold inf, so they never minimize
+    np.fill_diagonal(dm, np.inf)
+    is_active = np.ones(num_taxa, dtype=bool)
+    num_active = num_taxa
+
+    # per row, minimum distance to any other active slot and its column
+    row_mins = np.full(num_taxa, np.inf)
+    row_argmins = np.full(num_taxa, -1, dtype=np.intp)
+
+    def update_row(row: int) -> None:
+        row_argmins[row] = np.argmin(dm[row])
+        row_mins[row] = dm[row, row_argmins[row]]
+
+    if prune_search:
+        for row in range(num_taxa):
+            update_row(row)
+
+    def calc_criteria(
+        rows: np.ndarray,
+        node_dists: np.ndarray,
+        active: np.ndarray,
+    ) -> np.ndarray:
+        """Joining criterion between each of `rows` and each active slot."""
+        # evaluate as Biopython does, dm[i, j] - node_dist[i] - node_dist[j]
+        # for i > j, to reproduce its rounding
+        below = active[None, :] < rows[:, None]
+        row_dists = node_dists[rows][:, None]
+        col_dists = node_dists[active][None, :]
+        return (
+            dm[np.ix_(rows, active)]
+            - np.where(below, row_dists, col_dists)
+            - np.where(below, col_dists, row_dists)
+        )
+
+    def find_pair_exhaustive(
+        node_dists: np.ndarray,
+        active: np.ndarray,
+    ) -> typing.Tuple[int, int]:
+        # first minimum in Biopython's scan order, rows i ascending then
+        # columns j < i ascending, with strict <
+        best = (np.inf, -1, -1)
+        block_size = max(1, 2**20 // len(active))
+        for begin in range(1, len(active), block_size):
+            rows = active[begin:begin + block_size]
+            criteria = calc_criteria(rows, node_dists, active)
+            criteria[active[None, :] >= rows[:, None]] = np.inf
+            flat_argmin = np.argmin(criteria)
+            row_pos, col_pos = np.unravel_index(flat_argmin, criteria.shape)
+            if criteria[row_pos, col_pos] < best[0]:
+                best = (
+                    criteria[row_pos, col_pos],
+                    rows[row_pos],
+                    active[col_pos],
+                )
+        return best[1], best[2]
+
+    def find_pair_pruned(
+        node_dists: np.ndarray,
+        active: np.ndarray,
+    ) -> typing.Tuple[int, int]:
+        lower_bounds = (
+            row_mins[active] - node_dists[active] - node_dists[active].max()
+        )
+        order = np.argsort(lower_bounds, kind='stable')
+        best = (np.inf, -1, -1)
+        begin, block_size = 0, 8
+        while begin < len(order) and lower_bounds[order[begin]] <= best[0]:
+            positions = order[begin:begin + block_size]
+            positions = positions[lower_bounds[positions] <= best[0]]
+            rows = active[positions]
+            criteria = calc_criteria(rows, node_dists, active)
+            value = criteria.min()
+            if value <= best[0]:
+                # among ties, prefer Biopython's scan order
+                row_pos, col_pos = np.nonzero(criteria == value)
+                pairs = np.stack([
+                    np.maximum(rows[row_pos], active[col_pos]),
+                    np.minimum(rows[row_pos], active[col_pos]),
+                ])
+                first = np.lexsort(pairs[::-1])[0]
+                best = min(best, (value, *pairs[:, first].tolist()))
+            begin += block_size
+            block_size = min(2 * block_size, max(8, 2**20 // len(active)))
+        return best[1], best[2]
+
+    inner_count = 0
+    inner_clade = None
+    while num_active > 2:
+        active = np.flatnonzero(is_active)
+        node_dists = row_sums / (num_active - 2)
+        if prune_search:
+            min_i, min_j = find_pair_pruned(node_dists, active)
+        else:
+            min_i, min_j = find_pair_exhaustive(node_dists, active)
+        min_i, min_j = int(min_i), int(min_j)
+        if (min_i, min_j) == (active[1], active[0]):
+            # Biopython initializes its search with i, j swapped
+            min_i, min_j = min_j, min_i
+
+        # create clade
+        clade1 = clades[min_i]
+        clade2 = clades[min_j]
+        inner_count += 1
+        inner_clade = BaseTree.Clade(None, "Inner" + str(inner_count))
+        inner_clade.clades.append(clade1)
+        inner_clade.clades.append(clade2)
+        # assign branch length
+        pair_dist = float(dm[min_i, min_j])
+        clade1.branch_length = (
+            pair_dist + node_dists[min_i] - node_dists[min_j]
+        ) / 2.0
+        clade2.branch_length = pair_dist - clade1.branch_length
+        clades[min_j] = inner_clade
+        clades[min_i] = None
+
+        # set the distances of new node at the index of min_j
+        others = active[(active != min_i) & (active != min_j)]
+        merged = (dm[min_i, others] + dm[min_j, others] - pair_dist) / 2.0
+        row_sums[others] += merged - dm[min_i, others] - dm[min_j, others]
+        row_sums[min_j] = merged.sum(dtype=np.float64)
+        row_sums[min_i] = 0
+        dm[min_j, others] = merged
+        dm[others, min_j] = merged
+        dm[min_i, :] = np.inf
+        dm[:, min_i] = np.inf
+        is_active[min_i] = False
+        num_active -= 1
+
+        if prune_search:
+            # refresh cached row minima affected by the merge
+            row_mins[min_i] = np.inf
+            update_row(min_j)
+            stale = (row_argmins[others] == min_i) \
+                | (row_argmins[others] == min_j)
+            improved = ~stale & (merged < row_mins[others])
+            row_mins[others[improved]] = merged[improved]
+            row_argmins[others[improved]] = min_j
+            for row in others[stale].tolist():
+                update_row(row)
+
+    # set the last clade as one of the child of the inner_clade
+    first, second = np.flatnonzero(is_active).tolist()
+    last_dist = float(dm[second, first])
+    if clades[first] is inner_clade:
+        clades[first].branch_length = 0
+        clades[second].branch_length = last_dist
+        clades[first].clades.append(clades[second])
+        root = clades[first]
+    else:
+        clades[first].branch_length = last_dist
+        clades[second].branch_length = 0
+        clades[second].clades.append(clades[first])
+        root = clades[second]
+
+    return BaseTree.Tree(root, rooted=False)
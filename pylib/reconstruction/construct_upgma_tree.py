@@ -0,0 +1,137 @@
+import typing
+
+from Bio.Phylo import BaseTree
+import numpy as np
+
+from ._prepare_distance_matrix import _prepare_distance_matrix
+from ._symmetrize_from_lower_triangle \
+    import _symmetrize_from_lower_triangle
+
+
+def construct_upgma_tree(
+    distance_matrix: np.ndarray,
+    names: typing.Sequence[typing.Any],
+    *,
+    size_weighted: bool=False,
+    overwrite: bool=False,
+) -> BaseTree.Tree:
+    """Construct an average-linkage hierarchical clustering tree.
+
+    Produces the same tree as Biopython's
+    `DistanceTreeConstructor().upgma`, including its tie-breaking, clade
+    naming ("Inner1", "Inner2", ...), and branch lengths, but works on a
+    NumPy matrix in place and caches each row's minimum so that finding the
+    closest pair does not rescan the whole matrix every step.
+
+    Parameters
+    ----------
+    distance_matrix : 2d array of float
+        Symmetric matrix of distances between taxa. Only entries below the
+        diagonal are read.
+    names : sequence
+        Name of each taxon, used as terminal clade names.
+    size_weighted : bool, default False
+        If False, merged distances are the plain mean of the two merged
+        clusters' distances, as in Biopython (strictly, WPGMA). If True,
+        distances are weighted by cluster size (textbook UPGMA).
+    overwrite : bool, default False
+        If True and `distance_matrix` is a C-contiguous float32 or float64
+        array, use it as working memory instead of copying it. Its contents
+        are then destroyed.
+    """
+    dm = _prepare_distance_matrix(distance_matrix, names, overwrite)
+    num_taxa = len(names)
+    clades = [BaseTree.Clade(None, str(name)) for name in names]
+    if num_taxa == 1:
+        clades[0].branch_length = 0
+        return BaseTree.Tree(clades[0])
+
+    # inactive slots and the diagonal hold inf, so they never minimize
+    # slots keep their relative order, so slot order matches the index
+    # order of Biopython's shrinking matrix
+    np.fill_diagonal(dm, np.inf)
+    _symmetrize_from_lower_triangle(dm)
+    is_active = np.ones(num_taxa, dtype=bool)
+    heights = [0.0] * num_taxa
+    sizes = np.ones(num_taxa, dtype=dm.dtype)
+
+    # per row i, minimum over columns j < i and
+    # the last column achieving it (Biopython scans with >=)
+    row_mins = np.full(num_taxa, np.inf, dtype=dm.dtype)
+    row_argmins = np.full(num_taxa, -1, dtype=np.intp)
+
+    def update_row(row: int) -> None:
+        values = dm[row, :row]
+        if len(values):
+            rev_argmin = np.argmin(values[::-1])
+            row_argmins[row] = row - 1 - rev_argmin
+            row_mins[row] = values[row_argmins[row]]
+        else:
+            row_mins[row] = np.inf
+            row_argmins[row] = -1
+
+    for row in range(num_taxa):
+        update_row(row)
+
+    inner_count = 0
+    for __ in range(num_taxa - 1):
+        # Biopython scans rows in increasing order with >=,
+        # so the last row achieving the minimum wins
+        min_dist = row_mins.min()
+        min_i = int(np.flatnonzero(row_mins == min_dist)[-1])
+        min_j = int(row_argmins[min_i])
+        min_dist = float(min_dist)
+
+        # create clade
+        clade1 = clades[min_i]
+        clade2 = clades[min_j]
+        inner_count += 1
+        inner_clade = BaseTree.Clade(None, "Inner" + str(inner_count))
+        inner_clade.clades.append(clade1)
+        inner_clade.clades.append(clade2)
+        # assign branch length
+        clade1.branch_length = min_dist * 1.0 / 2 - heights[min_i]
+        clade2.branch_length = min_dist * 1.0 / 2 - heights[min_j]
+        heights[min_j] = max(
+            heights[min_i] + clade1.branch_length,
+            heights[min_j] + clade2.branch_length,
+        )
+        clades[min_j] = inner_clade
+        clades[min_i] = None
+
+        # retire slot min_i
+        is_active[min_i] = False
+        others = np.flatnonzero(is_active)
+        others = others[others != min_j]
+        # set the distances of new node at the index of min_j
+        if size_weighted:
+            merged = (
+                dm[min_i, others] * sizes[min_i]
+                + dm[min_j, others] * sizes[min_j]
+            ) / (sizes[min_i] + sizes[min_j])
+            sizes[min_j] += sizes[min_i]
+        else:
+            merged = (dm[min_i, others] + dm[min_j, others]) / 2
+        dm[min_j, others] = merged
+        dm[others, min_j] = merged
+        dm[min_i, :] = np.inf
+        dm[:, min_i] = np.inf
+        row_mins[min_i] = np.inf
+        row_argmins[min_i] = -1
+
+        # refresh cached row minima affected by the merge
+        update_row(min_j)
+        later = others[others > min_j]
+        later_values = dm[later, min_j]
+        stale = (row_argmins[later] == min_i) | (row_argmins[later] == min_j)
+        improved = ~stale & (
+            (later_values < row_mins[later])
+            | ((later_values == row_mins[later]) & (min_j > row_argmins[later]))
+        )
+        row_mins[later[improved]] = later_values[improved]
+        row_argmins[later[improved]] = min_j
+        for row in later[stale].tolist():
+            update_row(row)
+
+    inner_clade.branch_length = 0
+    return BaseTree.Tree(inner_clade)
@@ -0,0 +1,13 @@
+import typing
+
+
+class RenderJob(typing.NamedTuple):
+    """A tree figure to render with `render_tree_figures`."""
+
+    # Biopython tree, with origin time bounds on every clade
+    tree: typing.Any
+    # keyword arguments for draw_biopython_tree_with_origin_time_bounds;
+    # `figsize` and `dpi` also size the figure
+    options: typing.Dict[str, typing.Any]
+    # file to save the figure to, format inferred from extension
+    output_path: str
@@ -0,0 +1,11 @@
+import typing
+
+
+class RenderResult(typing.NamedTuple):
+    """Outcome of rendering one `RenderJob`."""
+
+    output_path: str
+    # wall time spent drawing and saving the figure
+    seconds: float
+    # formatted traceback if rendering failed, else None
+    error: typing.Optional[str]
@@ -0,0 +1,91 @@
+from concurrent import futures
+import time
+import traceback
+import typing
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from ..draw_biopython_tree_with_origin_time_bounds \
+    import draw_biopython_tree_with_origin_time_bounds
+from ..helpers import default_profiling_registry
+from .RenderJob import RenderJob
+from .RenderResult import RenderResult
+
+# settings shared by all jobs rendered in this process
+_worker_state = {}
+
+
+def _init_worker(savefig_kwargs: typing.Dict[str, typing.Any]) -> None:
+    _worker_state['savefig_kwargs'] = savefig_kwargs
+
+
+def _render_job(job: typing.Tuple) -> RenderResult:
+    tree, options, output_path = job
+    begin = time.perf_counter()
+    try:
+        # explicit figure and canvas, so no pyplot state is touched
+        fig = Figure(figsize=options.get('figsize'), dpi=options.get('dpi'))
+        FigureCanvasAgg(fig)
+        draw_biopython_tree_with_origin_time_bounds(
+            tree,
+            axes=fig.add_subplot(1, 1, 1),
+            do_show=False,
+            **options,
+        )
+        with default_profiling_registry.phase('render_tree_figures.savefig'):
+            fig.savefig(output_path, **_worker_state['savefig_kwargs'])
+    except Exception:
+        error = traceback.format_exc()
+    else:
+        error = None
+    return RenderResult(output_path, time.perf_counter() - begin, error)
+
+
+def render_tree_figures(
+    jobs: typing.Iterable[typing.Tuple],
+    *,
+    num_processes: typing.Optional[int]=None,
+    savefig_kwargs: typing.Optional[typing.Dict[str, typing.Any]]=None,
+) -> typing.List[RenderResult]:
+    """Render many tree figures to file, across a process pool.
+
+    Each figure is drawn with `draw_biopython_tree_with_origin_time_bounds`
+    onto its own `Figure` with an Agg canvas, without the pyplot state
+    machine, then saved. A job that raises is recorded as failed, and does
+    not stop the others.
+
+    Parameters
+    ----------
+    jobs : iterable of RenderJob or tuple
+        Tree, drawing options, and output path of each figure. Trees and
+        options are pickled to worker processes, so callables among the
+        options (e.g., `label_func`) must be module-level functions.
+    num_processes : int, optional
+        Number of worker processes. Defaults to the CPU count. If 1, jobs are
+        rendered serially in this process.
+    savefig_kwargs : dict, optional
+        Keyword arguments for `Figure.savefig`, shared by all jobs (e.g.,
+        `bbox_inches`).
+
+    Returns
+    -------
+    list of RenderResult
+        Output path, render time, and error, if any, of each job, in order.
+    """
+    jobs = [*map(tuple, jobs)]
+    worker_args = ({} if savefig_kwargs is None else savefig_kwargs,)
+
+    if num_processes == 1:
+        _init_worker(*worker_args)
+        try:
+            return [*map(_render_job, jobs)]
+        finally:
+            _worker_state.clear()
+    else:
+        with futures.ProcessPoolExecutor(
+            max_workers=num_processes,
+            initializer=_init_worker,
+            initargs=worker_args,
+        ) as executor:
+            return [*executor.map(_render_job, jobs)]
@@ -0,0 +1,57 @@
+import unittest
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from pylib.artists import TextCollection
+
+
+class TestTextCollection(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_draw(self):
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        axes = fig.add_subplot(1, 1, 1)
+        collection = TextCollection(
+            [0.1, 0.5, 0.9],
+            [0.2, 0.4, 0.6],
+            ['foo', 'bar', 'qux'],
+            colors=['red', 'green', 'blue'],
+            verticalalignment='center',
+        )
+        axes.add_artist(collection)
+        fig.canvas.draw()
+
+        assert len(collection) == 3
+        assert collection.axes is axes
+        assert len(axes.texts) == 0
+
+    def test_window_extent(self):
+        fig = Figure()
+        axes = fig.add_subplot(1, 1, 1)
+        one = axes.add_artist(TextCollection([0.5], [0.5], ['foo']))
+        two = axes.add_artist(TextCollection(
+            [0.5, 0.9], [0.5, 0.1], ['foo', 'bar'],
+        ))
+        renderer = FigureCanvasAgg(fig).get_renderer()
+
+        one_extent = one.get_window_extent(renderer)
+        two_extent = two.get_window_extent(renderer)
+        assert one_extent.width > 0
+        assert two_extent.width > one_extent.width
+
+    def test_empty(self):
+        fig = Figure()
+        axes = fig.add_subplot(1, 1, 1)
+        FigureCanvasAgg(fig)
+        collection = axes.add_artist(TextCollection([], [], []))
+        fig.canvas.draw()
+
+        assert len(collection) == 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+
+from pylib.benchmarks import make_synthetic_pairwise_mrca_table
+from pylib.benchmarks import make_synthetic_tree
+from pylib.reconstruction import calc_pairwise_mrca_matrices_from_dataframe
+
+
+class TestMakeSyntheticPairwiseMrcaTable(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_table(self):
+        df = make_synthetic_pairwise_mrca_table(40, 0.5, seed=3)
+        assert len(df) == 40 * 39 // 2
+
+        tree = make_synthetic_tree(40, 0.5, seed=3)
+        tips = {tip.name: tip for tip in tree.get_terminals()}
+        for row in df.sample(50, random_state=1).itertuples(index=False):
+            from_name, to_name, lb, ub, earliest, from_gen, to_gen = row
+            assert from_gen == tips[from_name].origin_time
+            assert to_gen == tips[to_name].origin_time
+            mrca = tree.common_ancestor(tips[from_name], tips[to_name])
+            assert earliest > mrca.origin_time
+            if not np.isnan(lb):
+                assert lb <= mrca.origin_time < ub
+
+        matrices, labels = calc_pairwise_mrca_matrices_from_dataframe(df)
+        assert matrices.distance_matrix.shape == (40, 40)
+        assert sorted(labels, key=int) == [*map(str, range(40))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from pylib.benchmarks import make_synthetic_tree
+
+
+class TestMakeSyntheticTree(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def _test_tree(self, num_tips, imbalance):
+        tree = make_synthetic_tree(num_tips, imbalance, seed=2)
+        # Biopython traversals recurse, so walk caterpillars explicitly
+        stack = [(tree.root, 0)]
+        max_depth = 0
+        tip_names = []
+        while stack:
+            clade, depth = stack.pop()
+            max_depth = max(max_depth, depth)
+            if not clade.clades:
+                tip_names.append(int(clade.name))
+            assert len(clade.clades) in (0, 2)
+            assert clade.origin_time_lb <= clade.origin_time \
+                <= clade.origin_time_ub
+            for child in clade.clades:
+                assert child.origin_time \
+                    == clade.origin_time + child.branch_length
+                assert 1 <= child.branch_length <= 10
+                stack.append((child, depth + 1))
+        assert sorted(tip_names) == [*range(num_tips)]
+        return max_depth
+
+    def test_shapes(self):
+        assert self._test_tree(1, 0.0) == 0
+        assert self._test_tree(64, 0.0) == 6
+        assert self._test_tree(64, 1.0) == 63
+        assert 6 < self._test_tree(64, 0.5) < 63
+        # deeper than the recursion limit
+        assert self._test_tree(5000, 1.0) == 4999
+
+    def test_seed(self):
+        first, second, third = (
+            make_synthetic_tree(50, 0.5, seed) for seed in (1, 1, 2)
+        )
+        assert first.format('newick') == second.format('newick')
+        assert first.format('newick') != third.format('newick')
+
+
+if __name__ == '__main__':
+    unittest.main()
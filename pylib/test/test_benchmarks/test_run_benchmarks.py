@@ -0,0 +1,59 @@
+import unittest
+
+from pylib.benchmarks import compare_benchmarks
+from pylib.benchmarks import default_benchmark_stages
+from pylib.benchmarks import run_benchmarks
+
+
+class TestRunBenchmarks(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_run_benchmarks(self):
+        rows = []
+        results = run_benchmarks(
+            sizes=(10, 30, 2000),
+            imbalances=(0.0, 1.0),
+            max_num_tips=1000,
+            repeats=1,
+            progress_callback=rows.append,
+        )
+        assert len(results) == len(rows) \
+            == 2 * 2 * len(default_benchmark_stages)
+        assert {*results['Stage']} == {
+            stage.name for stage in default_benchmark_stages
+        }
+        assert (results['Seconds'] > 0).all()
+        assert (results['Peak Bytes'] > 0).all()
+
+        comparison = compare_benchmarks(results, results)
+        assert not comparison['Regression'].any()
+        assert (comparison['Seconds Ratio'] == 1).all()
+
+        slower = results.assign(Seconds=results['Seconds'] * 2)
+        assert compare_benchmarks(
+            slower, results, min_seconds=0,
+        )['Regression'].all()
+        assert not compare_benchmarks(
+            slower, results, tolerance=1.5, min_seconds=0,
+        )['Regression'].any()
+        assert (
+            compare_benchmarks(slower, results)['Regression']
+            == (results['Seconds'] > 0.01)
+        ).all()
+        bigger = results.assign(
+            **{'Peak Bytes': results['Peak Bytes'] + 2**21},
+        )
+        assert (
+            compare_benchmarks(bigger, results)['Regression']
+            == (results['Peak Bytes'] < 2**23)
+        ).all()
+
+        comparison = compare_benchmarks(results, results.iloc[1:])
+        assert comparison['Baseline Seconds'].isna().sum() == 1
+        assert not comparison['Regression'].any()
+
+
+if __name__ == '__main__':
+    unittest.main()
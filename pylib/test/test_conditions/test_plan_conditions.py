@@ -0,0 +1,173 @@
+import os
+import tempfile
+import unittest
+
+from interval_search import doubling_search
+
+from pylib.conditions import plan_conditions
+from pylib.conditions import RetainedStrataCountCache
+
+
+class StratumRetentionCondemnerMockTapered:
+    """Retains about `resolution` strata per doubling of column depth."""
+
+    num_calls = 0
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+
+    def CalcNumStrataRetainedExact(self, num_strata_deposited):
+        type(self).num_calls += 1
+        return min(
+            num_strata_deposited,
+            self.resolution * num_strata_deposited.bit_length() + 1,
+        )
+
+
+class StratumRetentionCondemnerMockRecency(
+    StratumRetentionCondemnerMockTapered,
+):
+
+    num_calls = 0
+
+    def CalcNumStrataRetainedExact(self, num_strata_deposited):
+        type(self).num_calls += 1
+        return min(
+            num_strata_deposited,
+            (self.resolution + 1) * num_strata_deposited.bit_length(),
+        )
+
+
+factories = {
+    StratumRetentionCondemnerMockTapered: 1,
+    StratumRetentionCondemnerMockRecency: 0,
+}
+
+
+def make_conditions_reference(num_generations, targets, bit_widths):
+    res = []
+    for factory, initial_guess in factories.items():
+        for target in targets:
+            for bit_width in bit_widths:
+                policy_param = doubling_search(
+                    lambda x: factory(x + 1).CalcNumStrataRetainedExact(
+                        num_generations,
+                    ) * bit_width > target or x >= num_generations,
+                    initial_guess,
+                )
+                res.append((
+                    factory.__name__[25:],
+                    bit_width,
+                    policy_param,
+                    target,
+                    factory(policy_param).CalcNumStrataRetainedExact(
+                        num_generations,
+                    ),
+                ))
+    return res
+
+
+class TestPlanConditions(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def reset_call_counts(self):
+        for factory in factories:
+            factory.num_calls = 0
+
+    def get_call_count(self):
+        return sum(factory.num_calls for factory in factories)
+
+    def check_against_reference(self, df, num_generations):
+        reference = make_conditions_reference(
+            num_generations, [64, 512, 4096], [1, 8, 64],
+        )
+        assert len(df) == len(reference)
+        for (_, row), expected in zip(df.iterrows(), reference):
+            policy, bit_width, param, target, num_strata = expected
+            assert row['Retention Policy'] == policy
+            assert row['Differentia Bit Width'] == bit_width
+            assert row['Retention Policy Resolution Parameter'] == param
+            assert row['Target Retained Bits'] == target
+            assert row['Actual Retained Strata'] == num_strata
+            assert row['Actual Retained Bits'] == num_strata * bit_width
+            assert row['Retained Bits Error'] \
+                == num_strata * bit_width - target
+            assert row['condemner'].resolution == param
+
+    def test_matches_make_conditions(self):
+        for num_generations in 1, 100, 36864:
+            df = plan_conditions(
+                num_generations, factories, [64, 512, 4096], [1, 8, 64],
+            )
+            assert 'Num Generations' not in df
+            self.check_against_reference(df, num_generations)
+
+    def test_batched(self):
+        df = plan_conditions(
+            [100, 36864], factories, [64, 512, 4096], [1, 8, 64],
+        )
+        assert [*df['Num Generations'].unique()] == [100, 36864]
+        for num_generations, group in df.groupby('Num Generations'):
+            self.check_against_reference(
+                group.drop('Num Generations', axis=1), num_generations,
+            )
+
+    def test_memoized(self):
+        self.reset_call_counts()
+        make_conditions_reference(36864, [64, 512, 4096], [1, 8, 64])
+        num_reference_calls = self.get_call_count()
+
+        self.reset_call_counts()
+        cache = RetainedStrataCountCache()
+        plan_conditions(36864, factories, [64, 512, 4096], [1, 8, 64],
+                        cache=cache)
+        num_calls = self.get_call_count()
+        assert 0 < num_calls < num_reference_calls
+
+        plan_conditions(36864, factories, [64, 512, 4096], [1, 8, 64],
+                        cache=cache)
+        assert self.get_call_count() == num_calls
+
+    def test_persistent(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'cache.sqlite')
+            with RetainedStrataCountCache(path) as cache:
+                first = plan_conditions(
+                    36864, factories, [64, 512], [1, 8], cache=cache,
+                )
+
+            self.reset_call_counts()
+            with RetainedStrataCountCache(path) as cache:
+                second = plan_conditions(
+                    36864, factories, [64, 512], [1, 8], cache=cache,
+                )
+            assert self.get_call_count() == 0
+            assert first.drop('condemner', axis=1).equals(
+                second.drop('condemner', axis=1),
+            )
+
+    def test_eviction(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'cache.sqlite')
+            factory = StratumRetentionCondemnerMockTapered
+            with RetainedStrataCountCache(path, max_entries=4) as cache:
+                for param in range(4):
+                    cache.get(factory, param, 100)
+                cache.save()
+                # refresh all but 1, then add 4
+                for param in 0, 2, 3, 4:
+                    cache.get(factory, param, 100)
+
+            self.reset_call_counts()
+            with RetainedStrataCountCache(path, max_entries=4) as cache:
+                for param in 0, 2, 3, 4:
+                    cache.get(factory, param, 100)
+                assert self.get_call_count() == 0
+                cache.get(factory, 1, 100)
+                assert self.get_call_count() == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
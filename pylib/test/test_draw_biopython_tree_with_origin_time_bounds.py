@@ -0,0 +1,176 @@
+from io import StringIO
+import random
+import unittest
+
+from Bio import Phylo
+from Bio.Phylo.BaseTree import Clade
+from Bio.Phylo.BaseTree import Tree
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import matplotlib.pyplot as plt
+import numpy as np
+
+from pylib import draw_biopython_tree_with_origin_time_bounds
+from pylib.tree_layout import calc_tree_layout
+from pylib.tree_layout import TreeLayoutCache
+
+
+def make_tree():
+    tree = Phylo.read(
+        StringIO(
+            '((A:1,B:2)0.9:1,(C:1,(D:1,a_particularly_long_tip_name:3):1):2);',
+        ),
+        'newick',
+    )
+    depths = tree.depths()
+    for clade in tree.find_clades():
+        clade.origin_time_lb = depths[clade] - 0.5
+        clade.origin_time_ub = depths[clade] + 0.25
+    return tree
+
+
+def make_random_tree(num_tips):
+    rng = random.Random(1)
+    clades = [
+        Clade(branch_length=rng.random(), name=str(tip))
+        for tip in range(num_tips)
+    ]
+    while len(clades) > 1:
+        children = [clades.pop(rng.randrange(len(clades))) for __ in range(2)]
+        clades.append(Clade(branch_length=rng.random(), clades=children))
+    tree = Tree(root=clades[0])
+    depths = tree.depths()
+    for clade in tree.find_clades():
+        clade.origin_time_lb = depths[clade] - rng.random()
+        clade.origin_time_ub = depths[clade] + rng.random()
+    return tree
+
+
+def render(batch_artists, tree=None, figsize=(4, 3), dpi=80, **kwargs):
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    axes = fig.add_subplot(1, 1, 1)
+    draw_biopython_tree_with_origin_time_bounds(
+        make_tree() if tree is None else tree,
+        axes=axes,
+        do_show=False,
+        batch_artists=batch_artists,
+        **kwargs,
+    )
+    canvas.draw()
+    return axes, np.asarray(canvas.buffer_rgba())
+
+
+class TestDrawBiopythonTreeWithOriginTimeBounds(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_batched_matches_per_clade(self):
+        per_clade_axes, per_clade_pixels = render(batch_artists=False)
+        batched_axes, batched_pixels = render(batch_artists=True)
+
+        assert len(per_clade_axes.texts) > 1
+        assert len(batched_axes.texts) == 0
+        assert len(batched_axes.get_children()) \
+            < len(per_clade_axes.get_children())
+
+        assert per_clade_pixels.shape == batched_pixels.shape
+        differs = (per_clade_pixels != batched_pixels).any(axis=-1)
+        # antialiasing of merged collections may shift a few edge pixels
+        assert differs.mean() < 0.01
+
+        # long tip label extends past the right edge of the axes
+        right_edge = int(per_clade_axes.bbox.x1) + 2
+        outside = slice(right_edge, None)
+        per_clade_outside = (per_clade_pixels[:, outside, :3] < 128).sum()
+        batched_outside = (batched_pixels[:, outside, :3] < 128).sum()
+        assert per_clade_outside > 0
+        assert batched_outside == per_clade_outside
+
+    def test_level_of_detail_small_tree_unchanged(self):
+        for batch_artists in False, True:
+            __, pixels = render(batch_artists=batch_artists)
+            __, lod_pixels = render(
+                batch_artists=batch_artists, level_of_detail=True,
+            )
+            assert (pixels == lod_pixels).all()
+
+    def test_level_of_detail(self):
+        tree = make_random_tree(600)
+        num_clades = len([*tree.find_clades()])
+        kwargs = dict(tree=tree, figsize=(2, 2), dpi=50, level_of_detail=True)
+        per_clade_axes, per_clade_pixels = render(False, **kwargs)
+        batched_axes, batched_pixels = render(True, **kwargs)
+
+        # rows are about 0.13 pixels tall, so most clades are collapsed
+        assert len(per_clade_axes.patches) < num_clades
+        ys = sorted(text.get_position()[1] for text in per_clade_axes.texts)
+        assert 0 < len(ys) <= 12
+        pixels_per_row = per_clade_axes.bbox.height / 600.6
+        assert (np.diff(ys) * pixels_per_row >= 10 * 50 / 72).all()
+
+        differs = (per_clade_pixels != batched_pixels).any(axis=-1)
+        assert differs.mean() < 0.05
+
+        # output resolution can differ from the figure drawn in
+        fine_axes = Figure(figsize=(2, 2), dpi=50).add_subplot(1, 1, 1)
+        draw_biopython_tree_with_origin_time_bounds(
+            tree, axes=fine_axes, do_show=False, level_of_detail=True, dpi=500,
+        )
+        assert len(fine_axes.patches) > len(per_clade_axes.patches)
+        assert len(fine_axes.texts) > len(per_clade_axes.texts)
+
+    def test_layout_cache(self):
+        __, pixels = render(batch_artists=True, layout_cache=None)
+        cache = TreeLayoutCache()
+        for __ in range(2):
+            __, cached_pixels = render(batch_artists=True, layout_cache=cache)
+            assert (pixels == cached_pixels).all()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        tree = make_tree()
+        __, explicit_pixels = render(
+            batch_artists=True, tree=tree, layout=calc_tree_layout(tree),
+        )
+        assert (pixels == explicit_pixels).all()
+        with self.assertRaises(ValueError):
+            render(
+                batch_artists=True, layout=calc_tree_layout(make_tree()),
+            )
+
+    def test_options(self):
+        num_figures = len(plt.get_fignums())
+        axes, __ = render(
+            batch_artists=True,
+            title=('a title',),
+            xlabel=(('time',), {'fontsize': 7}),
+            axvline={'x': 1},
+        )
+        assert axes.get_title() == 'a title'
+        assert axes.get_xlabel() == 'time'
+        assert axes.xaxis.label.get_fontsize() == 7
+        assert len(axes.lines) == 1
+        # pyplot functions apply only to axes in pyplot figures
+        with self.assertRaises(ValueError):
+            render(batch_artists=True, sci=((None,),))
+        assert len(plt.get_fignums()) == num_figures
+
+        fig = plt.figure()
+        try:
+            pyplot_axes = fig.add_subplot(1, 1, 1)
+            other_axes = fig.add_subplot(2, 1, 2)
+            assert plt.gca() is other_axes
+            draw_biopython_tree_with_origin_time_bounds(
+                make_tree(), axes=pyplot_axes, do_show=False,
+                title=('a title',), figtext=(0.5, 0.5, 'text'),
+            )
+            assert pyplot_axes.get_title() == 'a title'
+            assert other_axes.get_title() == ''
+            assert len(fig.texts) == 1
+        finally:
+            plt.close(fig)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from pylib.helpers import ProfilingRegistry
+
+
+class TestProfilingRegistry(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_disabled(self):
+        registry = ProfilingRegistry()
+
+        @registry.profile()
+        def routine(x):
+            return x + 1
+
+        with registry.phase('block'):
+            assert routine(1) == 2
+        assert routine.profile_stats.calls == 0
+        assert registry.get_report() == []
+        assert registry.phase('block') is registry.phase('other')
+
+    def test_timing(self):
+        registry = ProfilingRegistry()
+        registry.enable()
+
+        @registry.profile('named')
+        def routine():
+            with registry.phase('inner'):
+                time.sleep(0.01)
+
+        for __ in range(3):
+            routine()
+        with self.assertRaises(ZeroDivisionError):
+            with registry.phase('failing'):
+                1 / 0
+
+        report = {row['phase']: row for row in registry.get_report()}
+        assert [*report] == ['named', 'inner', 'failing']
+        assert report['named']['calls'] == report['inner']['calls'] == 3
+        assert report['failing']['calls'] == 1
+        assert report['named']['seconds'] >= report['inner']['seconds'] \
+            >= 0.03
+        assert report['named']['peak_bytes'] is None
+        assert routine.profile_stats is registry.get_stats('named')
+        assert routine.__name__ == 'routine'
+
+        registry.disable()
+        routine()
+        assert routine.profile_stats.calls == 3
+        registry.reset()
+        assert routine.profile_stats.calls == 0
+        assert registry.get_report() == []
+
+    def test_memory(self):
+        registry = ProfilingRegistry()
+        registry.enable(trace_memory=True)
+        with registry.phase('outer'):
+            with registry.phase('inner'):
+                data = np.ones(1_000_000)
+                del data
+            data = np.ones(100_000)
+            del data
+        registry.disable()
+
+        stats = registry.get_stats('inner')
+        assert 8_000_000 <= stats.peak_bytes < 9_000_000
+        assert registry.get_stats('outer').peak_bytes >= stats.peak_bytes
+
+    def test_memory_without_reset_peak(self):
+        # tracemalloc.reset_peak was added in Python 3.9
+        import tracemalloc
+
+        reset_peak = getattr(tracemalloc, 'reset_peak', None)
+        if reset_peak is not None:
+            del tracemalloc.reset_peak
+        try:
+            registry = ProfilingRegistry()
+            registry.enable(trace_memory=True)
+            with registry.phase('outer'):
+                with registry.phase('inner'):
+                    data = np.ones(1_000_000)
+                    del data
+                data = np.ones(100_000)
+                del data
+            registry.disable()
+        finally:
+            if reset_peak is not None:
+                tracemalloc.reset_peak = reset_peak
+
+        stats = registry.get_stats('inner')
+        assert 8_000_000 <= stats.peak_bytes < 9_000_000
+        assert registry.get_stats('outer').peak_bytes >= stats.peak_bytes
+
+    def test_write_report(self):
+        registry = ProfilingRegistry()
+        registry.enable()
+        with registry.phase('block'):
+            pass
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = os.path.join(tmp_dir, 'report.json')
+            registry.write_report(json_path, {'run': 1})
+            with open(json_path) as file:
+                report = json.load(file)
+            assert report['metadata'] == {'run': 1}
+            assert report['phases'] == registry.get_report()
+
+            csv_path = os.path.join(tmp_dir, 'report.csv')
+            registry.write_report(csv_path)
+            with open(csv_path) as file:
+                rows = [*csv.DictReader(file)]
+            assert [row['phase'] for row in rows] == ['block']
+            assert rows[0]['calls'] == '1'
+
+            with self.assertRaises(ValueError):
+                registry.write_report(os.path.join(tmp_dir, 'report.txt'))
+
+    def test_environ(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'report.json')
+            subprocess.run(
+                [
+                    sys.executable,
+                    '-c',
+                    'from pylib.helpers import default_profiling_registry\n'
+                    'with default_profiling_registry.phase("block"):\n'
+                    '    pass\n',
+                ],
+                check=True,
+                cwd=os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+                env={
+                    **os.environ,
+                    'NOTEBOOK_NAME': 'notebook',
+                    'PYLIB_PROFILE_MEMORY': '1',
+                    'PYLIB_PROFILE_REPORT': path,
+                },
+            )
+            with open(path) as file:
+                report = json.load(file)
+        assert report['metadata']['notebook_name'] == 'notebook'
+        assert [row['phase'] for row in report['phases']] == ['block']
+        assert report['phases'][0]['peak_bytes'] is not None
+
+
+if __name__ == '__main__':
+    unittest.main()
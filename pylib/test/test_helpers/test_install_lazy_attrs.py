@@ -0,0 +1,82 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+
+
+def write_package(root, name):
+    os.makedirs(os.path.join(root, name))
+    files = {
+        '__init__.py':
+            'from pylib.helpers import install_lazy_attrs\n'
+            '__all__ = ["make_value", "Thing", "other_value"]\n'
+            'install_lazy_attrs(__name__, __all__, {\n'
+            '    "other_value": "make_value",\n'
+            '})\n',
+        'make_value.py':
+            'def make_value():\n'
+            '    return 42\n'
+            'other_value = 7\n',
+        'Thing.py':
+            'from .make_value import make_value\n'
+            'class Thing:\n'
+            '    value = make_value()\n',
+    }
+    for filename, source in files.items():
+        with open(os.path.join(root, name, filename), 'w') as file:
+            file.write(source)
+
+
+class TestInstallLazyAttrs(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        sys.path.insert(0, self._tmp_dir.name)
+
+    def tearDown(self):
+        sys.path.remove(self._tmp_dir.name)
+        for name in [*sys.modules]:
+            if name.startswith('lazy_package_'):
+                del sys.modules[name]
+        self._tmp_dir.cleanup()
+
+    def _import_package(self, name):
+        write_package(self._tmp_dir.name, name)
+        return importlib.import_module(name)
+
+    def test_lazy(self):
+        package = self._import_package('lazy_package_a')
+        assert 'lazy_package_a.make_value' not in sys.modules
+        assert {'make_value', 'Thing', 'other_value'} <= {*dir(package)}
+
+        assert package.make_value() == 42
+        assert 'lazy_package_a.make_value' in sys.modules
+        assert 'lazy_package_a.Thing' not in sys.modules
+        assert package.other_value == 7
+
+        with self.assertRaises(AttributeError):
+            package.missing
+        with self.assertRaises(ImportError):
+            exec('from lazy_package_a import missing')
+
+    def test_submodule_imported_first(self):
+        package = self._import_package('lazy_package_b')
+        # loading Thing imports make_value as a submodule, which the
+        # import system binds on the package
+        from lazy_package_b import Thing
+        assert Thing.value == 42
+        assert callable(package.make_value)
+        assert package.make_value() == 42
+
+        namespace = {}
+        exec('from lazy_package_b import *', namespace)
+        assert namespace['Thing'] is Thing
+        assert namespace['other_value'] == 7
+
+
+if __name__ == '__main__':
+    unittest.main()
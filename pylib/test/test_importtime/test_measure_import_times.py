@@ -0,0 +1,40 @@
+import unittest
+
+from pylib.importtime import measure_import_times
+
+
+class TestMeasureImportTimes(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_measure_import_times(self):
+        report = measure_import_times(
+            ['pylib', 'pylib:draw_biopython_tree_with_origin_time_bounds'],
+            repeats=2,
+        )
+        assert [*report.columns] == [
+            'Target',
+            'Module',
+            'Depth',
+            'Self Microseconds',
+            'Cumulative Microseconds',
+        ]
+        assert (
+            report['Cumulative Microseconds'] >= report['Self Microseconds']
+        ).all()
+
+        lazy = report[report['Target'] == 'pylib']
+        eager = report[report['Target'] != 'pylib']
+        assert 'pylib' in {*lazy.loc[lazy['Depth'] == 0, 'Module']}
+        # heavy plotting dependencies load only when needed
+        assert not lazy['Module'].str.startswith('matplotlib').any()
+        assert eager['Module'].str.startswith('matplotlib').any()
+        assert 'pylib.draw_biopython_tree_with_origin_time_bounds' \
+            in {*eager['Module']}
+        # already loaded at interpreter startup
+        assert 'sys' not in {*report['Module']}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import functools
+import gzip
+import hashlib
+from http import server
+import os
+import tempfile
+import threading
+import unittest
+
+import pandas as pd
+
+from pylib.inputs import InputCache
+
+
+class CountingHandler(server.SimpleHTTPRequestHandler):
+
+    num_requests = 0
+
+    def do_GET(self):
+        type(self).num_requests += 1
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestInputCache(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.serve_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.df = pd.DataFrame({
+            'id': [0, 1, 2],
+            'ancestor_list': ['[none]', '[0]', '[0]'],
+            'origin_time': [0.0, 1.5, 2.5],
+        })
+        self.csv_path = os.path.join(self.serve_dir.name, 'phylogeny.csv')
+        self.df.to_csv(self.csv_path, index=False)
+        with open(self.csv_path, 'rb') as file:
+            self.csv_digest = hashlib.sha256(file.read()).hexdigest()
+        with gzip.open(
+            os.path.join(self.serve_dir.name, 'phylogeny.csv.gz'), 'wb',
+        ) as file, open(self.csv_path, 'rb') as source:
+            file.write(source.read())
+
+        CountingHandler.num_requests = 0
+        self.server = server.ThreadingHTTPServer(
+            ('127.0.0.1', 0),
+            functools.partial(CountingHandler, directory=self.serve_dir.name),
+        )
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.serve_dir.cleanup()
+        self.cache_dir.cleanup()
+
+    def test_read_csv_http(self):
+        with InputCache(self.cache_dir.name) as cache:
+            for __ in range(3):
+                df = cache.read_csv(
+                    f'{self.url}/phylogeny.csv.gz?raw=true',
+                    compression='gzip',
+                )
+                pd.testing.assert_frame_equal(df, self.df)
+            assert CountingHandler.num_requests == 1
+
+            # different parsing options reuse the download
+            df = cache.read_csv(
+                f'{self.url}/phylogeny.csv.gz?raw=true',
+                compression='gzip',
+                usecols=['id'],
+            )
+            pd.testing.assert_frame_equal(df, self.df[['id']])
+            assert CountingHandler.num_requests == 1
+
+    def test_local_path(self):
+        with InputCache(self.cache_dir.name) as cache:
+            pd.testing.assert_frame_equal(
+                cache.read_csv(self.csv_path), self.df,
+            )
+            with open(cache.fetch(self.csv_path), 'rb') as file:
+                assert hashlib.sha256(file.read()).hexdigest() \
+                    == self.csv_digest
+
+    def test_offline(self):
+        with InputCache(self.cache_dir.name) as cache:
+            cache.read_csv(f'{self.url}/phylogeny.csv')
+        with InputCache(self.cache_dir.name, offline=True) as cache:
+            pd.testing.assert_frame_equal(
+                cache.read_csv(f'{self.url}/phylogeny.csv'), self.df,
+            )
+            # pinned content is found even under another url
+            pd.testing.assert_frame_equal(
+                cache.read_csv(
+                    'https://osf.io/5d3be/download', digest=self.csv_digest,
+                ),
+                self.df,
+            )
+            with self.assertRaises(FileNotFoundError):
+                cache.fetch(f'{self.url}/phylogeny.csv.gz')
+        assert CountingHandler.num_requests == 1
+
+    def test_parsed_copy(self):
+        url = f'{self.url}/phylogeny.csv.gz'
+        with InputCache(self.cache_dir.name) as cache:
+            os.remove(cache.fetch(url))
+        with InputCache(self.cache_dir.name, offline=True) as cache:
+            with self.assertRaises(FileNotFoundError):
+                cache.read_csv(url, compression='gzip')
+        with InputCache(self.cache_dir.name) as cache:
+            cache.read_csv(url, compression='gzip')
+            os.remove(cache.fetch(url))
+        with InputCache(self.cache_dir.name, offline=True) as cache:
+            pd.testing.assert_frame_equal(
+                cache.read_csv(url, compression='gzip'), self.df,
+            )
+
+    def test_pinned_mismatch(self):
+        with InputCache(
+            self.cache_dir.name,
+            pins={f'{self.url}/phylogeny.csv.gz': self.csv_digest},
+        ) as cache:
+            with self.assertRaises(ValueError):
+                cache.fetch(f'{self.url}/phylogeny.csv.gz')
+            cache.fetch(f'{self.url}/phylogeny.csv', digest=self.csv_digest)
+
+    def test_eviction(self):
+        size = os.path.getsize(self.csv_path)
+        with InputCache(self.cache_dir.name, max_bytes=size) as cache:
+            first = cache.fetch(f'{self.url}/phylogeny.csv')
+            second = cache.fetch(f'{self.url}/phylogeny.csv.gz')
+            assert not os.path.exists(first)
+            assert os.path.exists(second)
+            cache.fetch(f'{self.url}/phylogeny.csv')
+            assert CountingHandler.num_requests == 3
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import os
+import tempfile
+import unittest
+
+import nbformat
+
+from pylib.notebooks import calc_notebook_instance_digest
+from pylib.notebooks import execute_notebooks
+from pylib.notebooks import find_notebook_instances
+from pylib.notebooks import NotebookInstance
+
+
+def write_notebook(path, *sources, parameters_cell=None):
+    notebook = nbformat.v4.new_notebook()
+    notebook.metadata['kernelspec'] = {
+        'display_name': 'Python 3',
+        'language': 'python',
+        'name': 'python3',
+    }
+    notebook.cells = [nbformat.v4.new_code_cell(source) for source in sources]
+    if parameters_cell is not None:
+        notebook.cells[parameters_cell].metadata['tags'] = ['parameters']
+    nbformat.write(notebook, path)
+
+
+def write_mill(path):
+    write_notebook(
+        path,
+        'import endomill',
+        'prefix = "x"\n'
+        'endomill.instantiate_over(\n'
+        '    parameter_packs=[{"value": prefix + str(i)} for i in (1, 2)],\n'
+        ')',
+        'value: str',
+        'with open(f"out_{value}.txt", "w") as file:\n'
+        '    file.write(value)',
+        parameters_cell=2,
+    )
+
+
+class TestExecuteNotebooks(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_find_notebook_instances(self):
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, 'sub'))
+            write_notebook(os.path.join(root, 'plain.ipynb'), 'print(1)')
+            write_mill(os.path.join(root, 'sub', 'mill.ipynb'))
+            write_notebook(
+                os.path.join(root, 'sub', 'value=x1+ext=.endomill.ipynb'),
+                'print(1)',
+            )
+            os.symlink('sub', os.path.join(root, 'link'))
+
+            instances = find_notebook_instances(root, num_processes=1)
+            assert [
+                instance.get_key(root) for instance in instances
+            ] == [
+                'plain.ipynb',
+                'sub/mill.ipynb {"value": "x1"}',
+                'sub/mill.ipynb {"value": "x2"}',
+            ]
+
+    def test_find_notebook_instances_isolated(self):
+        with tempfile.TemporaryDirectory() as root:
+            for name in 'a', 'b':
+                write_notebook(
+                    os.path.join(root, f'{name}.ipynb'),
+                    'import sys\n'
+                    'import endomill\n'
+                    'leaked = hasattr(sys, "leak")\n'
+                    'sys.leak = True\n'
+                    'endomill.instantiate_one({"leaked": leaked})',
+                )
+
+            # one worker extracts both notebooks, in turn
+            instances = find_notebook_instances(root, num_processes=1)
+            assert [
+                instance.parameter_pack for instance in instances
+            ] == [{'leaked': False}] * 2
+
+    def test_digest(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, 'mill.ipynb')
+            write_mill(path)
+            with open(os.path.join(root, 'data.csv'), 'w') as file:
+                file.write('a')
+
+            first = NotebookInstance(path, {'value': 'x1'})
+            second = NotebookInstance(path, {'value': 'x2'})
+            digest = calc_notebook_instance_digest(first, ['*.csv'])
+            assert digest == calc_notebook_instance_digest(first, ['*.csv'])
+            assert digest != calc_notebook_instance_digest(second, ['*.csv'])
+            assert digest != calc_notebook_instance_digest(first)
+
+            with open(os.path.join(root, 'data.csv'), 'w') as file:
+                file.write('b')
+            assert digest != calc_notebook_instance_digest(first, ['*.csv'])
+            digest = calc_notebook_instance_digest(first, ['*.csv'])
+
+            # outputs do not matter
+            notebook = nbformat.read(path, as_version=4)
+            notebook.cells[0].outputs = [
+                nbformat.v4.new_output('stream', text='hi'),
+            ]
+            nbformat.write(notebook, path)
+            assert digest == calc_notebook_instance_digest(
+                NotebookInstance(path, {'value': 'x1'}), ['*.csv'],
+            )
+
+    def test_execute_notebooks(self):
+        with tempfile.TemporaryDirectory() as root:
+            write_notebook(
+                os.path.join(root, 'plain.ipynb'),
+                'import os\nprint(os.environ["NOTEBOOK_NAME"])',
+            )
+            write_notebook(os.path.join(root, 'broken.ipynb'), '1 / 0')
+            write_mill(os.path.join(root, 'mill.ipynb'))
+
+            report = execute_notebooks(root, num_processes=4)
+            statuses = dict(zip(
+                report['Notebook'] + report['Parameters'], report['Status'],
+            ))
+            assert statuses == {
+                'broken.ipynb': 'failed',
+                'mill.ipynb{"value": "x1"}': 'executed',
+                'mill.ipynb{"value": "x2"}': 'executed',
+                'plain.ipynb': 'executed',
+            }
+            assert 'ZeroDivisionError' in report['Error'].str.cat()
+            assert os.path.exists(
+                os.path.join(root, 'execute_notebooks_report.csv'),
+            )
+
+            plain = nbformat.read(
+                os.path.join(root, 'plain.ipynb'), as_version=4,
+            )
+            assert plain.cells[0].outputs[0]['text'] == 'plain\n'
+            for value in 'x1', 'x2':
+                with open(os.path.join(root, f'out_{value}.txt')) as file:
+                    assert file.read() == value
+                assert os.path.exists(
+                    os.path.join(root, f'value={value}+ext=.endomill.ipynb'),
+                )
+            assert not any(
+                entry.startswith('.endomill-') for entry in os.listdir(root)
+            )
+
+            report = execute_notebooks(root, num_processes=4)
+            assert (report['Status'] == 'skipped').sum() == 3
+            assert (report['Status'] == 'failed').sum() == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
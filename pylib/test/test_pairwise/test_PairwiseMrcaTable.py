@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pylib.pairwise import PairwiseMrcaTableReader, PairwiseMrcaTableWriter
+
+
+def make_table(num_rows, seed):
+    rng = np.random.default_rng(seed)
+    configurations = rng.integers(0, 3, size=num_rows)
+    lbs = rng.integers(0, 100, size=num_rows).astype(float)
+    lbs[rng.random(num_rows) < 0.3] = np.nan
+    return pd.DataFrame({
+        'Column Configuration': [
+            f'differentia={c}+policy=p{c}' for c in configurations
+        ],
+        'Differentia Bit Width': 2 ** configurations,
+        'Stratum Retention Policy': [f'p{c}' for c in configurations],
+        'Taxon Compared From': rng.integers(0, 50, size=num_rows),
+        'Taxon Compared To': rng.integers(0, 50, size=num_rows),
+        'Generation Of MRCA Lower Bound (inclusive)': lbs,
+        'Generation Of MRCA Upper Bound (exclusive)': lbs + 3,
+        'Phenotype': rng.random(num_rows),
+    })
+
+
+class TestPairwiseMrcaTable(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_roundtrip(self):
+        chunks = [make_table(num_rows, seed) for seed, num_rows in enumerate(
+            (20, 0, 1, 35),
+        )]
+        expected = pd.concat(chunks, ignore_index=True)
+        with tempfile.TemporaryDirectory() as path:
+            writer = PairwiseMrcaTableWriter(path)
+            for chunk in chunks[:2]:
+                writer.append(chunk)
+            # reopening continues appending
+            writer = PairwiseMrcaTableWriter(path)
+            for chunk in chunks[2:]:
+                writer.append(chunk)
+
+            reader = PairwiseMrcaTableReader(path)
+            assert len(reader) == len(expected)
+            assert len(reader.configurations) == 3
+            assert reader.configuration_columns == [
+                'Column Configuration',
+                'Differentia Bit Width',
+                'Stratum Retention Policy',
+            ]
+            actual = reader.to_dataframe()
+            assert [*actual.columns] == [*expected.columns]
+            assert str(actual['Taxon Compared From'].dtype) == 'Int64'
+            assert actual['Phenotype'].dtype == float
+            pd.testing.assert_frame_equal(
+                actual.astype(object).where(actual.notna(), None),
+                expected.astype(object).where(expected.notna(), None),
+            )
+
+    def test_selective_load(self):
+        expected = make_table(100, 1)
+        key = 'differentia=1+policy=p1'
+        with tempfile.TemporaryDirectory() as path:
+            PairwiseMrcaTableWriter(path).append(expected)
+            reader = PairwiseMrcaTableReader(path)
+            actual = reader.to_dataframe(
+                columns=['Generation Of MRCA Lower Bound (inclusive)'],
+                configurations=[key],
+            )
+            with self.assertRaises(KeyError):
+                reader.to_dataframe(configurations=['nonexistent'])
+
+        selected = expected[expected['Column Configuration'] == key]
+        assert [*actual.columns] == [
+            'Generation Of MRCA Lower Bound (inclusive)',
+        ]
+        np.testing.assert_array_equal(
+            actual.iloc[:, 0].to_numpy(dtype=float, na_value=np.nan),
+            selected['Generation Of MRCA Lower Bound (inclusive)'],
+        )
+
+    def test_interrupted_append(self):
+        expected = make_table(10, 2)
+        with tempfile.TemporaryDirectory() as path:
+            PairwiseMrcaTableWriter(path).append(expected)
+            # simulate partial write of a subsequent chunk
+            with open(os.path.join(path, 'configuration.bin'), 'ab') as file:
+                file.write(b'\0' * 12)
+            writer = PairwiseMrcaTableWriter(path)
+            writer.append(expected)
+            actual = PairwiseMrcaTableReader(path).to_dataframe()
+        assert len(actual) == 20
+        assert (
+            actual['Column Configuration'].astype(str).to_numpy()
+            == np.tile(expected['Column Configuration'], 2)
+        ).all()
+
+    def test_interrupted_first_append(self):
+        first, second = make_table(3, 4), make_table(3, 5)
+        with tempfile.TemporaryDirectory() as path:
+            PairwiseMrcaTableWriter(path).append(first)
+            # simulate a crash before metadata was first committed
+            os.remove(os.path.join(path, 'meta.json'))
+            PairwiseMrcaTableWriter(path).append(second)
+            actual = PairwiseMrcaTableReader(path).to_dataframe()
+        np.testing.assert_array_equal(
+            actual['Taxon Compared From'].to_numpy(dtype=int),
+            second['Taxon Compared From'],
+        )
+
+    def test_mismatched_fields(self):
+        with tempfile.TemporaryDirectory() as path:
+            writer = PairwiseMrcaTableWriter(path)
+            writer.append(make_table(5, 3))
+            with self.assertRaises(ValueError):
+                writer.append(make_table(5, 3).drop(columns='Phenotype'))
+
+
+if __name__ == '__main__':
+    unittest.main()
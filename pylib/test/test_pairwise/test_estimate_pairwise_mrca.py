@@ -0,0 +1,184 @@
+import itertools as it
+import json
+import os
+import tempfile
+import unittest
+
+from keyname import keyname as kn
+import numpy as np
+
+from pylib.pairwise import (
+    estimate_pairwise_mrca,
+    export_pairwise_mrca_index,
+    load_pairwise_mrca_estimates,
+)
+
+
+class MockColumn:
+    """Stands in for hstrat.HereditaryStratigraphicColumn."""
+
+    def __init__(self, lineage, resolution):
+        self.lineage = lineage
+        self.resolution = resolution
+
+    def CalcRankOfMrcaBoundsWith(self, other, confidence_level=0.95):
+        common = 0
+        for a, b in zip(self.lineage, other.lineage):
+            if a != b:
+                break
+            common += 1
+        if not common:
+            return None
+        lb = (common - 1) // self.resolution * self.resolution
+        return (lb, common)
+
+    def CalcRankOfEarliestDetectableMrcaWith(
+        self, other, confidence_level=0.95,
+    ):
+        return None if self.resolution > 2 else self.resolution
+
+    def CalcRankOfMrcaBoundsWithProvidedConfidenceLevel(
+        self, requested_confidence_level=0.95,
+    ):
+        return 1 - (1 - requested_confidence_level) / self.resolution
+
+
+class MockBundle(dict):
+    """Stands in for hstrat.HereditaryStratigraphicColumnBundle."""
+
+    def GetNumStrataDeposited(self):
+        return len(next(iter(self.values())).lineage)
+
+
+def make_bundles(num_taxa, seed):
+    rng = np.random.default_rng(seed)
+    res = []
+    for __ in range(num_taxa):
+        lineage = tuple(rng.integers(0, 2, size=rng.integers(1, 6)))
+        res.append(MockBundle({
+            f'resolution={resolution}': MockColumn(lineage, resolution)
+            for resolution in (1, 2, 3)
+        }))
+    return res
+
+
+class TestEstimatePairwiseMrca(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def check(self, bundles, res):
+        num_taxa = len(bundles)
+        assert res.configurations == [*bundles[0]]
+        pairs = [*it.combinations(range(num_taxa), 2)]
+        assert [
+            *zip(res.taxon_from_indices, res.taxon_to_indices)
+        ] == pairs
+        for pair, (i, j) in enumerate(pairs):
+            for config, impl in enumerate(res.configurations):
+                expected = bundles[i][impl].CalcRankOfMrcaBoundsWith(
+                    bundles[j][impl],
+                )
+                actual = (
+                    res.mrca_lbs[config, pair],
+                    res.mrca_ubs[config, pair],
+                )
+                if expected is None:
+                    assert np.isnan(actual).all()
+                else:
+                    assert actual == expected
+
+    def test_serial(self):
+        for num_taxa, chunk_size in it.product((1, 2, 9, 20), (1, 7, 1000)):
+            bundles = make_bundles(num_taxa, num_taxa)
+            res = estimate_pairwise_mrca(
+                bundles, num_processes=1, chunk_size=chunk_size,
+            )
+            self.check(bundles, res)
+
+    def test_process_pool(self):
+        bundles = make_bundles(30, 1)
+        progress = []
+        res = estimate_pairwise_mrca(
+            bundles,
+            num_processes=2,
+            chunk_size=50,
+            progress_callback=progress.append,
+        )
+        self.check(bundles, res)
+        assert sum(progress) == res.num_pairs
+
+    def test_out_dir(self):
+        bundles = make_bundles(25, 2)
+        expected = estimate_pairwise_mrca(bundles, num_processes=1)
+        with tempfile.TemporaryDirectory() as out_dir:
+            assert estimate_pairwise_mrca(
+                bundles, num_processes=2, chunk_size=40, out_dir=out_dir,
+            ) is None
+            actual = load_pairwise_mrca_estimates(out_dir)
+        assert actual.configurations == expected.configurations
+        for field in expected._fields[1:]:
+            np.testing.assert_array_equal(
+                getattr(actual, field), getattr(expected, field),
+            )
+
+    def test_out_dir_reuse(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            estimate_pairwise_mrca(
+                make_bundles(12, 4), num_processes=1, out_dir=out_dir,
+            )
+            with self.assertRaises(FileExistsError):
+                estimate_pairwise_mrca(
+                    make_bundles(8, 5),
+                    num_processes=1,
+                    chunk_size=3,
+                    out_dir=out_dir,
+                )
+            assert load_pairwise_mrca_estimates(out_dir).num_pairs == 66
+
+    def test_to_dataframe(self):
+        bundles = make_bundles(6, 3)
+        res = estimate_pairwise_mrca(bundles, num_processes=1)
+        df = res.to_dataframe(taxon_labels=[*'abcdef'])
+        assert len(df) == 15 * 3
+        row = df.iloc[4]
+        assert row['Column Configuration'] == 'resolution=2'
+        assert row['Stratum Retention Policy Resolution Parameter'] == '2'
+        assert 'Stratum Retention Policy' not in df
+        assert row['Taxon Compared From'] == 'a'
+        assert row['Taxon Compared To'] == 'c'
+        assert row['Rank of Earliest Detectable Mrca With'] == 2
+        assert row['MRCA Bound Confidence'] == 0.975
+        assert (
+            row['Generation of Taxon Compared To']
+            == bundles[2].GetNumStrataDeposited()
+        )
+
+
+    def test_to_dataframe_export(self):
+        res = estimate_pairwise_mrca(make_bundles(6, 3), num_processes=1)
+        configurations = [
+            kn.pack({
+                'differentia': 8,
+                'policy': policy,
+                'resolution': resolution,
+                'target_bits': 64,
+            })
+            for policy, resolution in [
+                ('Recency', 1), ('Tapered', 2), ('Tapered', 3),
+            ]
+        ]
+        df = res._replace(configurations=configurations).to_dataframe()
+        assert (df['Differentia Bit Width'] == '8').all()
+        assert [*df['Stratum Retention Policy'][:3]] \
+            == ['Recency', 'Tapered', 'Tapered']
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            export_pairwise_mrca_index(df, out_dir)
+            with open(os.path.join(out_dir, 'index.json')) as file:
+                index = json.load(file)
+        assert index['configurations'] == ['Recency864', 'Tapered864']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pylib.pairwise import calc_upper_triangle_pair_offsets
+from pylib.pairwise import export_pairwise_mrca_index
+
+
+def make_table(num_taxa, seed):
+    rng = np.random.default_rng(seed)
+    labels = rng.permutation(1000)[:num_taxa]
+    records = []
+    for i in range(num_taxa):
+        for j in range(i + 1, num_taxa):
+            for policy, bits in ('Recency', 64), ('Tapered', 512):
+                if rng.random() < 0.1:
+                    continue  # missing pair
+                lb = rng.integers(0, 100)
+                ub = lb + rng.integers(1, 9)
+                if lb % 7 == 0:
+                    lb = ub = np.nan  # no bounds estimated
+                from_, to = (i, j) if rng.random() < 0.5 else (j, i)
+                records.append({
+                    'Taxon Compared From': labels[from_],
+                    'Taxon Compared To': labels[to],
+                    'Generation Of MRCA Lower Bound (inclusive)': lb,
+                    'Generation Of MRCA Upper Bound (exclusive)': ub,
+                    'Stratum Retention Policy': policy,
+                    'Differentia Bit Width': 8,
+                    'Stratigraphic Column Target Retained Bits': bits,
+                })
+    return pd.DataFrame.from_records(records).sample(frac=1, random_state=1)
+
+
+def lookup(index_dir, index, first, second, configuration):
+    """Look up bounds as phylogeny.js does."""
+    taxa = {taxon: code for code, taxon in enumerate(index['taxa'])}
+    i, j = sorted((taxa[first], taxa[second]))
+    shard = np.searchsorted(index['row_boundaries'], i, side='right') - 1
+    values = np.fromfile(
+        os.path.join(index_dir, index['shards'][shard]),
+        dtype=index['dtype'],
+    )
+    num_taxa = len(index['taxa'])
+    offsets = calc_upper_triangle_pair_offsets(
+        [index['row_boundaries'][shard], i], num_taxa,
+    )
+    num_pairs = calc_upper_triangle_pair_offsets(
+        index['row_boundaries'][shard + 1], num_taxa,
+    ) - offsets[0]
+    position = offsets[1] - offsets[0] + j - i - 1
+    values = values.reshape(len(index['configurations']), 2, num_pairs)
+    return tuple(
+        values[index['configurations'].index(configuration), :, position],
+    )
+
+
+class TestExportPairwiseMrcaIndex(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_export(self):
+        df = make_table(40, 1)
+        with tempfile.TemporaryDirectory() as index_dir:
+            export_pairwise_mrca_index(df, index_dir, shard_size=100)
+            with open(os.path.join(index_dir, 'index.json')) as file:
+                index = json.load(file)
+            assert index['dtype'] == '<f4'
+            assert sorted(index['configurations']) \
+                == ['Recency864', 'Tapered8512']
+            assert len(index['shards']) > 5
+            assert index['row_boundaries'][0] == 0
+            assert index['row_boundaries'][-1] == 40
+
+            expected = {
+                (
+                    frozenset([row[0], row[1]]),
+                    f'{row[4]}{row[5]}{row[6]}',
+                ): (row[2], row[3])
+                for row in df.itertuples(index=False)
+            }
+            taxa = [*map(str, pd.unique(df['Taxon Compared From']))]
+            for first in taxa[:10]:
+                for second in taxa:
+                    if first == second:
+                        continue
+                    for configuration in index['configurations']:
+                        actual = lookup(
+                            index_dir, index, first, second, configuration,
+                        )
+                        key = (
+                            frozenset([int(first), int(second)]),
+                            configuration,
+                        )
+                        np.testing.assert_array_equal(
+                            actual, expected.get(key, (np.nan, np.nan)),
+                        )
+
+            with self.assertRaises(FileExistsError):
+                export_pairwise_mrca_index(df, index_dir)
+
+    def test_large_values(self):
+        df = make_table(5, 2)
+        df['Generation Of MRCA Upper Bound (exclusive)'] += 2**25
+        with tempfile.TemporaryDirectory() as index_dir:
+            export_pairwise_mrca_index(df, index_dir)
+            with open(os.path.join(index_dir, 'index.json')) as file:
+                index = json.load(file)
+            assert index['dtype'] == '<f8'
+            assert len(index['shards']) == 1
+            row = df.iloc[0]
+            assert lookup(
+                index_dir,
+                index,
+                str(row['Taxon Compared From']),
+                str(row['Taxon Compared To']),
+                f'{row["Stratum Retention Policy"]}8'
+                f'{row["Stratigraphic Column Target Retained Bits"]}',
+            )[1] == row['Generation Of MRCA Upper Bound (exclusive)']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import collections
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pylib.phylogeny import AlifePhylogeny
+from pylib.phylogeny import load_alife_phylogeny
+from pylib.phylogeny import parse_ancestor_lists
+from pylib.treecompare import BipartitionIndex
+from pylib.treecompare import dendropy_tree_to_arrays
+
+
+def make_random_phylogeny_df(rng, num_nodes):
+    ids = rng.sample(range(10 * num_nodes), num_nodes)
+    origin_times = [0]
+    ancestor_lists = ['[none]']
+    for i in range(1, num_nodes):
+        parent = rng.randrange(i)
+        origin_times.append(origin_times[parent] + rng.randrange(1, 5))
+        ancestor_lists.append(f'[{ids[parent]}]')
+    return pd.DataFrame({
+        'id': ids,
+        'ancestor_list': ancestor_lists,
+        'origin_time': origin_times,
+    }).sample(frac=1, random_state=1)
+
+
+class TestAlifePhylogeny(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_parse_ancestor_lists(self):
+        assert parse_ancestor_lists(pd.Series(
+            ['[none]', '[NONE]', '[]', '[12]', ' [ 3 ] '],
+        )).tolist() == [-1, -1, -1, 12, 3]
+        with self.assertRaises(ValueError):
+            parse_ancestor_lists(pd.Series(['[1, 2]']))
+
+    def test_structure(self):
+        df = make_random_phylogeny_df(random.Random(1), 500)
+        phylogeny = AlifePhylogeny.from_dataframe(df)
+        assert len(phylogeny) == 500
+
+        rows = {id_: row for row, id_ in enumerate(df['id'])}
+        children = collections.defaultdict(list)
+        for row, ancestor_list in enumerate(df['ancestor_list']):
+            if ancestor_list == '[none]':
+                assert phylogeny.parents[row] == -1
+            else:
+                parent = rows[int(ancestor_list.strip('[]'))]
+                assert phylogeny.parents[row] == parent
+                children[parent].append(row)
+        for node in range(len(phylogeny)):
+            assert phylogeny.get_children(node).tolist() == children[node]
+        assert phylogeny.get_leaves().tolist() == [
+            node for node in range(len(phylogeny)) if not children[node]
+        ]
+
+        root = phylogeny.get_roots().item()
+        level_order, queue = [], collections.deque([root])
+        while queue:
+            level_order.append(queue.popleft())
+            queue.extend(children[level_order[-1]])
+        assert phylogeny.get_level_order().tolist() == level_order
+        assert [*phylogeny.iter_level_order()] == level_order
+
+        postorder, stack = [], [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                postorder.append(node)
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in children[node][::-1])
+        assert phylogeny.get_postorder().tolist() == postorder
+        assert [*phylogeny.iter_postorder()] == postorder
+
+        edge_lengths = phylogeny.get_edge_lengths()
+        assert edge_lengths[root] == 0
+        assert (edge_lengths[phylogeny.parents >= 0] > 0).all()
+
+    def test_forest(self):
+        phylogeny = AlifePhylogeny(
+            [5, 6, 7, 8, 9], [-1, 5, -1, 7, 7], [0, 1, 0, 1, 2],
+        )
+        assert phylogeny.get_level_order().tolist() == [0, 2, 1, 3, 4]
+        assert phylogeny.get_postorder().tolist() == [1, 0, 3, 4, 2]
+        with self.assertRaises(ValueError):
+            phylogeny.to_biopython_tree()
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            AlifePhylogeny([0, 1], [-1, 2])
+        with self.assertRaises(ValueError):
+            AlifePhylogeny([0, 1, 2], [-1, 2, 1]).get_level_order()
+
+    def test_converters(self):
+        df = make_random_phylogeny_df(random.Random(2), 100)
+        phylogeny = AlifePhylogeny.from_dataframe(df)
+        origin_times = dict(zip(df['id'], df['origin_time']))
+
+        biopython_tree = phylogeny.to_biopython_tree()
+        clades = [*biopython_tree.find_clades()]
+        assert len(clades) == 100
+        for clade in clades:
+            assert clade.origin_time == origin_times[int(clade.name)]
+            assert biopython_tree.distance(clade) \
+                == clade.origin_time - biopython_tree.root.origin_time
+
+        dendropy_tree = phylogeny.to_dendropy_tree()
+        nodes = [*dendropy_tree.preorder_node_iter()]
+        assert len(nodes) == 100
+        for node in nodes:
+            assert node.origin_time == origin_times[node.id]
+            if node.parent_node is not None:
+                assert node.edge.length \
+                    == node.origin_time - node.parent_node.origin_time
+        assert len(dendropy_tree.taxon_namespace) \
+            == len(phylogeny.get_leaves())
+
+        # same splits and edge lengths as the arrays themselves
+        index = BipartitionIndex(
+            phylogeny.parents,
+            phylogeny.get_edge_lengths(),
+            [*map(str, phylogeny.ids)],
+        )
+        assert tuple(
+            index.score(*dendropy_tree_to_arrays(dendropy_tree)),
+        ) == (0, 0.0, 0.0)
+
+    def test_load_alife_phylogeny(self):
+        df = make_random_phylogeny_df(random.Random(3), 50)
+        expected = AlifePhylogeny.from_dataframe(df)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'phylogeny.csv')
+            df.assign(extra='x').to_csv(path, index=False)
+            phylogeny = load_alife_phylogeny(path)
+        for attr in 'ids', 'parents', 'child_offsets', 'children':
+            assert np.array_equal(
+                getattr(phylogeny, attr), getattr(expected, attr),
+            )
+
+        ancestor_ids = parse_ancestor_lists(df['ancestor_list'])
+        phylogeny = AlifePhylogeny.from_dataframe(df.assign(
+            ancestor_id=np.where(ancestor_ids < 0, df['id'], ancestor_ids),
+        ).drop(columns='ancestor_list'))
+        assert np.array_equal(phylogeny.parents, expected.parents)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import random
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pylib.phylogeny import AlifePhylogeny
+from pylib.phylogeny import calc_lane_offsets
+
+
+def make_random_phylogeny(rng, num_nodes):
+    """Random phylogeny with long unbranched runs and overlapping
+    lifespans."""
+    origin_times = [0]
+    ancestor_ids = [-1]
+    destruction_times = [rng.choice([np.nan, 30])]
+    for i in range(1, num_nodes):
+        parent = max(i - rng.choice([1, 1, 1, 2, 5]), 0)
+        origin_times.append(origin_times[parent] + rng.randrange(0, 3))
+        ancestor_ids.append(parent)
+        destruction_times.append(
+            np.nan if rng.random() < 0.1
+            else origin_times[-1] + rng.randrange(0, 12),
+        )
+    phylogeny = AlifePhylogeny(range(num_nodes), ancestor_ids, origin_times)
+    return phylogeny, np.array(destruction_times)
+
+
+def calc_lane_offsets_reference(phylogeny, destruction_times, max_lanes):
+    """Recursive lane assignment, as the viewer's former CalcOffsets."""
+    lanes = [(rank + 1) // 2 if rank % 2 else -(rank // 2)
+             for rank in range(max_lanes)]
+    release_times = np.where(
+        np.isnan(destruction_times), np.inf, destruction_times,
+    )
+    res = {}
+
+    def visit(node, in_use):
+        in_use = {
+            lane: release_time for lane, release_time in in_use.items()
+            if release_time > phylogeny.origin_times[node]
+        }
+        lane = next((lane for lane in lanes if lane not in in_use), lanes[-1])
+        res[node] = lane
+        in_use[lane] = release_times[node]
+        children = phylogeny.get_children(node)
+        for child in children:
+            visit(child, dict(in_use) if len(children) == 1 else {})
+
+    for root in phylogeny.get_roots():
+        visit(root, {})
+    return [res[node] for node in range(len(phylogeny))]
+
+
+class TestCalcLaneOffsets(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_matches_reference(self):
+        rng = random.Random(1)
+        for num_nodes in 1, 10, 300:
+            phylogeny, destruction_times = make_random_phylogeny(
+                rng, num_nodes,
+            )
+            for max_lanes in 21, 3:
+                assert calc_lane_offsets(
+                    phylogeny, destruction_times, max_lanes=max_lanes,
+                ).tolist() == calc_lane_offsets_reference(
+                    phylogeny, destruction_times, max_lanes,
+                )
+
+    def test_lanes(self):
+        # run 0 -> 1 -> 2 branches into runs 3 -> 5 and 4
+        phylogeny = AlifePhylogeny(
+            [0, 1, 2, 3, 4, 5], [-1, 0, 1, 2, 2, 3], [0, 1, 2, 3, 3, 5],
+        )
+        destruction_times = np.array([4, 2, np.nan, 6, 4, 7])
+        assert calc_lane_offsets(
+            phylogeny, destruction_times,
+        ).tolist() == [0, 1, 1, 0, 0, 1]
+        # only one lane available, so shared
+        assert calc_lane_offsets(
+            phylogeny, destruction_times, max_lanes=1,
+        ).tolist() == [0] * 6
+
+    def test_long_lineage(self):
+        num_nodes = 100000
+        phylogeny = AlifePhylogeny.from_dataframe(pd.DataFrame({
+            'id': range(num_nodes),
+            'ancestor_id': range(-1, num_nodes - 1),
+            'origin_time': range(num_nodes),
+        }))
+        # each node outlives the next two
+        offsets = calc_lane_offsets(
+            phylogeny, np.arange(num_nodes) + 3.0,
+        )
+        assert offsets[:6].tolist() == [0, 1, -1, 0, 1, -1]
+        assert np.array_equal(offsets[3:], offsets[:-3])
+
+
+if __name__ == '__main__':
+    unittest.main()
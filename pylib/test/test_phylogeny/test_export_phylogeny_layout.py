@@ -0,0 +1,109 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pylib.phylogeny import AlifePhylogeny
+from pylib.phylogeny import calc_lane_offsets
+from pylib.phylogeny import export_phylogeny_layout
+from pylib.tree_layout import calc_tree_layout
+
+
+def make_random_phylogeny_df(rng, num_nodes):
+    ids = rng.sample(range(10 * num_nodes), num_nodes)
+    origin_times = [0]
+    ancestor_lists = ['[NONE]']
+    for i in range(1, num_nodes):
+        parent = max(i - rng.choice([1, 1, 2, 7]), 0)
+        origin_times.append(origin_times[parent] + rng.randrange(1, 5))
+        ancestor_lists.append(f'[{ids[parent]}]')
+    return pd.DataFrame({
+        'id': ids,
+        'ancestor_list': ancestor_lists,
+        'origin_time': origin_times,
+        'destruction_time': [
+            np.nan if rng.random() < 0.2
+            else origin_time + rng.randrange(1, 20)
+            for origin_time in origin_times
+        ],
+    }).sample(frac=1, random_state=1)
+
+
+def read_layout(layout_dir):
+    """Read columns as phylogeny.js does."""
+    with open(os.path.join(layout_dir, 'layout.json')) as file:
+        layout = json.load(file)
+    with open(os.path.join(layout_dir, 'layout.bin'), 'rb') as file:
+        data = file.read()
+    columns = {
+        name: np.frombuffer(
+            data,
+            dtype=info['dtype'],
+            count=layout['num_nodes'],
+            offset=info['offset'],
+        )
+        for name, info in layout['columns'].items()
+    }
+    return layout, columns
+
+
+class TestExportPhylogenyLayout(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_export(self):
+        df = make_random_phylogeny_df(random.Random(1), 500)
+        phylogeny = AlifePhylogeny.from_dataframe(df)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            export_phylogeny_layout(df, tmp_dir)
+            layout, columns = read_layout(tmp_dir)
+            with self.assertRaises(FileExistsError):
+                export_phylogeny_layout(df, tmp_dir)
+
+        assert layout['num_nodes'] == 500
+        assert layout['num_tips'] == len(phylogeny.get_leaves())
+        extant_time = np.nanmax(df[['origin_time', 'destruction_time']])
+        assert layout['extant_time'] == extant_time
+        for info in layout['columns'].values():
+            assert info['offset'] % 8 == 0
+
+        assert columns['id'].tolist() == df['id'].tolist()
+        assert columns['parent'].tolist() == phylogeny.parents.tolist()
+        assert columns['origin_time'].tolist() == df['origin_time'].tolist()
+        destruction_times = df['destruction_time'].fillna(extant_time)
+        assert columns['destruction_time'].tolist() \
+            == destruction_times.tolist()
+        assert columns['offset'].tolist() == calc_lane_offsets(
+            phylogeny, destruction_times.to_numpy(),
+        ).tolist()
+
+        # same vertical positions as the Biopython tree layout
+        tree_layout = calc_tree_layout(phylogeny.to_biopython_tree())
+        rows = dict(zip(columns['id'].tolist(), columns['row'].tolist()))
+        for clade, y_position in zip(
+            tree_layout.clades, tree_layout.y_positions,
+        ):
+            self.assertAlmostEqual(rows[int(clade.name)], y_position, 4)
+
+    def test_large_times(self):
+        df = pd.DataFrame({
+            'id': [2**40, 7],
+            'ancestor_id': [2**40, 2**40],
+            'origin_time': [0, 2**24 + 1],
+        })
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            export_phylogeny_layout(df, tmp_dir, extant_time=2**25)
+            layout, columns = read_layout(tmp_dir)
+        assert columns['id'].tolist() == [2**40, 7]
+        assert columns['origin_time'].tolist() == [0, 2**24 + 1]
+        assert columns['destruction_time'].tolist() == [2**25] * 2
+        assert columns['row'].tolist() == [1, 1]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from pylib.popsize import calc_median_unbiased_mle_popsize
+from pylib.popsize import calc_mle_popsize
+from pylib.popsize import calc_mle_popsize_ci
+from pylib.popsize import calc_upper_gamma_popsize
+from pylib.popsize import solve_upper_gamma_popsize_sympy
+
+
+def sample_observations(rng, true_popsize, num_sets, k):
+    return rng.random((num_sets, k, true_popsize)).max(axis=-1)
+
+
+class TestCalcUpperGammaPopsize(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_matches_sympy(self):
+        rng = np.random.default_rng(1)
+        for true_popsize in 10, 100:
+            for k in 1, 10:
+                observations = sample_observations(rng, true_popsize, 4, k)
+                for level in 0.005, 0.025, 0.5, 0.975, 0.995:
+                    actual = calc_upper_gamma_popsize(observations, level)
+                    expected = [
+                        solve_upper_gamma_popsize_sympy(
+                            observation_set, level,
+                        )
+                        for observation_set in observations
+                    ]
+                    assert actual.shape == (4,)
+                    assert np.allclose(actual, expected, rtol=1e-6)
+
+    def test_single_set(self):
+        observations = [0.9, 0.95, 0.99]
+        actual = calc_upper_gamma_popsize(observations, 0.5)
+        assert actual.shape == ()
+        assert np.isclose(
+            actual,
+            solve_upper_gamma_popsize_sympy(observations, 0.5),
+        )
+
+    def test_mle(self):
+        observations = np.array([[0.5, 0.25], [0.9, 0.9]])
+        assert np.allclose(
+            calc_mle_popsize(observations),
+            [-2 / np.log(0.125), -2 / np.log(0.81)],
+        )
+
+    def test_ci(self):
+        rng = np.random.default_rng(1)
+        observations = sample_observations(rng, 100, 1000, 10)
+        for confidence in 0.95, 0.99:
+            lb, ub = calc_mle_popsize_ci(observations, confidence=confidence)
+            mle = calc_mle_popsize(observations)
+            median_unbiased = calc_median_unbiased_mle_popsize(observations)
+            assert (lb < median_unbiased).all()
+            assert (median_unbiased < ub).all()
+            assert (lb < mle).all()
+            assert (mle < ub).all()
+            coverage = np.mean((lb <= 100) & (100 <= ub))
+            assert abs(coverage - confidence) < 0.03
+
+    def test_median_unbiased(self):
+        rng = np.random.default_rng(1)
+        observations = sample_observations(rng, 100, 2000, 3)
+        estimates = calc_median_unbiased_mle_popsize(observations)
+        assert abs(np.mean(estimates > 100) - 0.5) < 0.05
+
+
+if __name__ == '__main__':
+    unittest.main()
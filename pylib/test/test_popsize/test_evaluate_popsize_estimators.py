@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+from pylib.popsize import calc_mildest_extrema_popsize
+from pylib.popsize import calc_mildest_extrema_popsize_ci
+from pylib.popsize import evaluate_popsize_estimators
+
+
+class TestEvaluatePopsizeEstimators(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_reproducible(self):
+        kwargs = dict(chunk_size=1000, seed=2)
+        serial = evaluate_popsize_estimators(
+            [10, 100], [1, 3], 2500, num_processes=1, **kwargs,
+        )
+        parallel = evaluate_popsize_estimators(
+            [10, 100], [1, 3], 2500, num_processes=2, **kwargs,
+        )
+        assert serial.equals(parallel)
+        assert len(serial) == 2 * 2 * 5
+
+    def test_statistics(self):
+        df = evaluate_popsize_estimators(
+            [100, 10**9], [10], 20000, num_processes=1,
+        ).set_index(['Estimator', 'True Population Size'])
+
+        for popsize in 100, 10**9:
+            # E[mle] = n k / (k - 1); MSE from the notebooks' closed form
+            k = 10
+            mle = df.loc[('maximum_likelihood_estimator', popsize)]
+            assert np.isclose(mle['Normalized Bias'], 1 / (k - 1), atol=0.01)
+            assert np.isclose(
+                mle['Normalized Mean Square Error'],
+                (k ** 2 + k - 2) / ((k - 1) ** 2 * (k - 2)),
+                rtol=0.1,
+            )
+            for estimator in (
+                'maximum_likelihood_estimator interval',
+                'mildest_extrema_estimator interval',
+            ):
+                coverage = df.loc[(estimator, popsize)][
+                    'Fraction Estimates within Confidence Interval'
+                ]
+                assert abs(coverage - 0.95) < 0.01
+
+    def test_mildest_extrema_matches_notebook(self):
+        observations = np.array([[0.9, 0.99, 0.5], [0.3, 0.4, 0.7]])
+        k = 3
+        expected = np.log(1 - 0.5 ** (1 / k)) / np.log([0.5, 0.3])
+        assert np.allclose(
+            calc_mildest_extrema_popsize(observations), expected,
+        )
+        lb, ub = calc_mildest_extrema_popsize_ci(observations, confidence=0.9)
+        assert np.allclose(
+            lb, np.log(1 - 0.05 ** (1 / k)) / np.log([0.5, 0.3]),
+        )
+        assert np.allclose(
+            ub, np.log(1 - 0.95 ** (1 / k)) / np.log([0.5, 0.3]),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+from scipy import stats
+
+from pylib.popsize import sample_population_maxima
+
+
+class TestSamplePopulationMaxima(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_shape(self):
+        res = sample_population_maxima([10, 100, 1000], 7, 3)
+        assert res.shape == (3, 7, 3)
+        assert ((0 <= res) & (res < 1)).all()
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        for popsize in 1, 10, 50:
+            direct = sample_population_maxima(popsize, 2000, 1, rng=rng)
+            brute_force = rng.random((2000, popsize)).max(axis=-1)
+            assert stats.ks_2samp(direct.ravel(), brute_force).pvalue > 0.001
+
+    def test_neg_log(self):
+        res = sample_population_maxima(
+            [10, 10**9],
+            5,
+            2,
+            rng=np.random.default_rng(1),
+            neg_log=True,
+        )
+        assert np.allclose(
+            np.exp(-res),
+            sample_population_maxima(
+                [10, 10**9], 5, 2, rng=np.random.default_rng(1),
+            ),
+        )
+        assert (res[1] > 0).all()
+        assert (res[1] < 1e-6).all()
+
+
+if __name__ == '__main__':
+    unittest.main()
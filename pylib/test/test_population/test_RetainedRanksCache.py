@@ -0,0 +1,63 @@
+import unittest
+
+from pylib.population import RetainedRanksCache
+
+
+class MockFixedResolutionCondemner:
+    """Retains every `resolution`th rank and the most recent rank, like
+    hstrat's fixed resolution policy."""
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+
+    def __call__(self, num_stratum_depositions_completed, retained_ranks=None):
+        previous_rank = num_stratum_depositions_completed - 1
+        if previous_rank > 0 and previous_rank % self.resolution:
+            yield previous_rank
+
+
+class MockClosedFormCondemner(MockFixedResolutionCondemner):
+
+    def CalcNumStrataRetainedExact(self, num_strata_deposited):
+        return len(self._calc_ranks(num_strata_deposited))
+
+    def CalcRankAtColumnIndex(self, index, num_strata_deposited):
+        return self._calc_ranks(num_strata_deposited)[index]
+
+    def _calc_ranks(self, num_strata_deposited):
+        if not num_strata_deposited:
+            return []
+        last = num_strata_deposited - 1
+        return sorted({*range(0, last, self.resolution), last})
+
+
+class TestRetainedRanksCache(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_stepped_matches_closed_form(self):
+        for resolution in 1, 3, 10:
+            stepped = RetainedRanksCache(
+                MockFixedResolutionCondemner(resolution),
+            )
+            closed_form = RetainedRanksCache(
+                MockClosedFormCondemner(resolution),
+            )
+            assert not stepped.has_closed_form
+            assert closed_form.has_closed_form
+            # out of order, to exercise stepping from cached counts
+            for num_deposited in 50, 7, 0, 1, 2, 100, 49, 51:
+                assert stepped.get(num_deposited).tolist() \
+                    == closed_form.get(num_deposited).tolist()
+
+    def test_memoized(self):
+        cache = RetainedRanksCache(MockFixedResolutionCondemner(4))
+        ranks = cache.get(20)
+        assert ranks.tolist() == [0, 4, 8, 12, 16, 19]
+        assert cache.get(20) is ranks
+        assert not ranks.flags.writeable
+
+
+if __name__ == '__main__':
+    unittest.main()
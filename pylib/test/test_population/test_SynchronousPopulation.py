@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+
+from pylib.population import SynchronousPopulation
+
+
+class MockFixedResolutionCondemner:
+    """Retains every `resolution`th rank and the most recent rank, like
+    hstrat's fixed resolution policy."""
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+
+    def __call__(self, num_stratum_depositions_completed, retained_ranks=None):
+        previous_rank = num_stratum_depositions_completed - 1
+        if previous_rank > 0 and previous_rank % self.resolution:
+            yield previous_rank
+
+
+class TestSynchronousPopulation(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def make_population(self, seed=1):
+        return SynchronousPopulation(
+            np.arange(20),
+            condemners={
+                'perfect': MockFixedResolutionCondemner(1),
+                'coarse': MockFixedResolutionCondemner(4),
+            },
+            differentia_bit_widths={'perfect': 64, 'coarse': 1},
+            rng=np.random.default_rng(seed),
+        )
+
+    def test_founders(self):
+        population = self.make_population()
+        assert len(population) == 20
+        assert population.num_strata_deposited == 1
+        assert (population.parent_uids == -1).all()
+        assert population.get_differentia('perfect').dtype == np.uint64
+        assert population.get_differentia('coarse').dtype == np.uint8
+        for configuration in population.configurations:
+            assert population.get_retained_ranks(configuration).tolist() \
+                == [0]
+            assert population.get_differentia(configuration).shape \
+                == (20, 1)
+
+    def test_retention(self):
+        population = self.make_population()
+        for __ in range(10):
+            population.reproduce(np.arange(len(population)))
+        assert population.num_strata_deposited == 11
+        assert population.get_retained_ranks('perfect').tolist() \
+            == [*range(11)]
+        assert population.get_retained_ranks('coarse').tolist() \
+            == [0, 4, 8, 10]
+        assert population.get_differentia('coarse').shape == (20, 4)
+        assert population.get_differentia('coarse').max() <= 1
+
+    def test_inheritance(self):
+        population = self.make_population()
+        for __ in range(25):
+            fitnesses = population.phenotypes.astype(float)
+            before = {
+                configuration: population.get_differentia(configuration)
+                for configuration in population.configurations
+            }
+            before_ranks = {
+                configuration: population.get_retained_ranks(configuration)
+                for configuration in population.configurations
+            }
+            before_uids = population.uids
+            parents = population.do_tournament_generation(fitnesses)
+            assert (population.parent_uids == before_uids[parents]).all()
+            assert population.uids.min() > before_uids.max()
+            for configuration in population.configurations:
+                ranks = population.get_retained_ranks(configuration)
+                inherited = np.isin(before_ranks[configuration], ranks)
+                np.testing.assert_array_equal(
+                    population.get_differentia(configuration)[:, :-1],
+                    before[configuration][parents][:, inherited],
+                )
+
+        # selection favors high phenotypes
+        assert population.phenotypes.mean() > 15
+
+    def test_reproducible(self):
+        first, second = self.make_population(7), self.make_population(7)
+        for __ in range(5):
+            first.do_tournament_generation(first.phenotypes)
+            second.do_tournament_generation(second.phenotypes)
+        np.testing.assert_array_equal(first.phenotypes, second.phenotypes)
+        np.testing.assert_array_equal(
+            first.get_differentia('perfect'),
+            second.get_differentia('perfect'),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
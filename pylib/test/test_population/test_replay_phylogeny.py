@@ -0,0 +1,127 @@
+import unittest
+
+import numpy as np
+
+from pylib.population import replay_phylogeny, RetainedRanksCache
+
+
+class MockFixedResolutionCondemner:
+    """Retains every `resolution`th rank and the most recent rank, like
+    hstrat's fixed resolution policy."""
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+
+    def __call__(self, num_stratum_depositions_completed, retained_ranks=None):
+        previous_rank = num_stratum_depositions_completed - 1
+        if previous_rank > 0 and previous_rank % self.resolution:
+            yield previous_rank
+
+
+def make_phylogeny(num_nodes, seed):
+    rng = np.random.default_rng(seed)
+    parent_indices = np.array([-1] + [
+        rng.integers(max(0, i - 5), i) for i in range(1, num_nodes)
+    ])
+    origin_times = np.zeros(num_nodes, dtype=int)
+    for i in range(1, num_nodes):
+        origin_times[i] = origin_times[parent_indices[i]] \
+            + rng.integers(0, 20)
+    return parent_indices, origin_times
+
+
+def calc_ancestors(parent_indices, node):
+    res = []
+    while node >= 0:
+        res.append(node)
+        node = parent_indices[node]
+    return res
+
+
+class TestReplayPhylogeny(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    condemners = {
+        'fine': MockFixedResolutionCondemner(1),
+        'coarse': MockFixedResolutionCondemner(7),
+    }
+    differentia_bit_widths = {'fine': 64, 'coarse': 64}
+
+    def test_leaves(self):
+        parent_indices, origin_times = make_phylogeny(300, 1)
+        leaves = [*replay_phylogeny(
+            parent_indices,
+            origin_times,
+            self.condemners,
+            self.differentia_bit_widths,
+            rng=np.random.default_rng(1),
+        )]
+        expected_leaves = np.setdiff1d(
+            np.arange(len(parent_indices)), parent_indices,
+        )
+        assert sorted(leaf.node_index for leaf in leaves) \
+            == expected_leaves.tolist()
+
+        for leaf in leaves:
+            assert leaf.num_strata_deposited \
+                == 1 + origin_times[leaf.node_index]
+            for configuration, condemner in self.condemners.items():
+                expected_ranks = RetainedRanksCache(condemner).get(
+                    leaf.num_strata_deposited,
+                )
+                np.testing.assert_array_equal(
+                    leaf.retained_ranks[configuration], expected_ranks,
+                )
+                assert len(leaf.differentia[configuration]) \
+                    == len(expected_ranks)
+
+    def test_shared_ancestry(self):
+        parent_indices, origin_times = make_phylogeny(200, 2)
+        leaves = [*replay_phylogeny(
+            parent_indices,
+            origin_times,
+            self.condemners,
+            self.differentia_bit_widths,
+            rng=np.random.default_rng(2),
+        )]
+        for first, second in zip(leaves, leaves[1:]):
+            first_ancestors = calc_ancestors(parent_indices, first.node_index)
+            second_ancestors = {
+                *calc_ancestors(parent_indices, second.node_index),
+            }
+            mrca = next(
+                node for node in first_ancestors if node in second_ancestors
+            )
+            mrca_num_deposited = 1 + origin_times[mrca]
+            for configuration in self.condemners:
+                ranks, first_indices, second_indices = np.intersect1d(
+                    first.retained_ranks[configuration],
+                    second.retained_ranks[configuration],
+                    return_indices=True,
+                )
+                same = first.differentia[configuration][first_indices] \
+                    == second.differentia[configuration][second_indices]
+                # 64-bit differentia practically never collide by chance
+                np.testing.assert_array_equal(
+                    same, ranks < mrca_num_deposited,
+                )
+
+    def test_long_unifurcation_chain(self):
+        num_nodes = 5000
+        parent_indices = np.arange(-1, num_nodes - 1)
+        parent_indices[-1] = 0  # a second branch off the root
+        origin_times = np.arange(num_nodes)
+        leaves = [*replay_phylogeny(
+            parent_indices,
+            origin_times,
+            self.condemners,
+            self.differentia_bit_widths,
+        )]
+        assert sorted(leaf.node_index for leaf in leaves) \
+            == [num_nodes - 2, num_nodes - 1]
+
+
+if __name__ == '__main__':
+    unittest.main()
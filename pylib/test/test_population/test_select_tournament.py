@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from pylib.population import (
+    calc_phenotype_frequency_fitnesses,
+    select_tournament,
+)
+
+
+class TestSelectTournament(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_full_tournament_picks_best(self):
+        rng = np.random.default_rng(1)
+        fitnesses = rng.random(10)
+        winners = select_tournament(fitnesses, 10, rng, num_tournaments=50)
+        assert (winners == np.argmax(fitnesses)).all()
+
+    def test_unit_tournament_is_uniform(self):
+        rng = np.random.default_rng(2)
+        winners = select_tournament(np.zeros(4), 1, rng, num_tournaments=4000)
+        counts = np.bincount(winners, minlength=4)
+        assert (np.abs(counts - 1000) < 150).all()
+
+    def test_worst_never_wins(self):
+        rng = np.random.default_rng(3)
+        fitnesses = np.arange(100.0)
+        for tournament_size in 2, 7, 99:
+            winners = select_tournament(fitnesses, tournament_size, rng)
+            assert len(winners) == 100
+            # contestants are drawn without replacement
+            assert (winners >= tournament_size - 1).all()
+
+    def test_phenotype_frequency_fitnesses(self):
+        fitnesses = calc_phenotype_frequency_fitnesses(
+            np.array([3, 1, 3, 2, 3, 2]),
+        )
+        np.testing.assert_allclose(
+            fitnesses, [1 / 3, 1, 1 / 3, 1 / 2, 1 / 3, 1 / 2],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+from io import StringIO
+import itertools as it
+import unittest
+
+from Bio import Phylo
+from Bio.Phylo.BaseTree import Clade, Tree
+import numpy as np
+
+from pylib.reconstruction import LcaIndex
+
+
+class TestLcaIndex(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_matches_common_ancestor(self):
+        tree = Phylo.read(
+            StringIO('((A,B)C,(D,(E,F,G)H)I,((J)K)L)M;'),
+            'newick',
+        )
+        index = LcaIndex(tree)
+        clades = [*tree.find_clades()]
+        assert index.clades == clades
+
+        for first, second in it.product(clades, clades):
+            expected = tree.common_ancestor(first, second)
+            actual = index.calc_lca(
+                index.get_node_id(first),
+                index.get_node_id(second),
+            )
+            assert index.get_clade(actual) is expected
+
+    def test_vectorized(self):
+        tree = Phylo.read(StringIO('((A,B)C,(D,E)F)G;'), 'newick')
+        index = LcaIndex(tree)
+        terminal_ids = index.get_node_ids(tree.get_terminals())
+
+        lcas = index.calc_lca(terminal_ids[:, None], terminal_ids[None, :])
+        assert lcas.shape == (4, 4)
+        assert np.array_equal(np.diag(lcas), terminal_ids)
+        assert index.get_clade(lcas[0, 1]).name == 'C'
+        assert index.get_clade(lcas[0, 3]).name == 'G'
+        assert index.get_clade(lcas[2, 3]).name == 'F'
+
+    def test_deep_caterpillar(self):
+        root = Clade(name='root')
+        clade = root
+        for __ in range(10000):
+            clade.clades = [Clade(), Clade()]
+            clade = clade.clades[-1]
+        index = LcaIndex(Tree(root=root))
+
+        assert len(index) == 20001
+        assert index.calc_lca(len(index) - 1, 1) == 0
+        assert index.calc_lca(len(index) - 1, len(index) - 2) \
+            == len(index) - 3
+
+
+if __name__ == '__main__':
+    unittest.main()
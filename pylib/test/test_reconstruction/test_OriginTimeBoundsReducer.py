@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from pylib.reconstruction import OriginTimeBoundsReducer
+
+
+class TestOriginTimeBoundsReducer(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_matches_list_consolidation(self):
+        rng = np.random.default_rng(1)
+        num_nodes = 10
+        node_ids = rng.integers(num_nodes, size=1000)
+        lbs = rng.integers(10, size=1000).astype(float)
+        ubs = lbs + rng.integers(1, 5, size=1000)
+
+        reducer = OriginTimeBoundsReducer(num_nodes)
+        for chunk in np.array_split(np.arange(1000), 7):
+            reducer.fold(node_ids[chunk], lbs[chunk], ubs[chunk])
+        actual_lbs, actual_ubs = reducer.get_bounds()
+
+        for node_id in range(num_nodes):
+            mask = node_ids == node_id
+            expected_ub = np.min(ubs[mask])
+            expected_lb = np.max([
+                lb
+                for lb, ub in zip(lbs[mask], ubs[mask])
+                if ub <= expected_ub
+            ])
+            assert actual_ubs[node_id] == expected_ub
+            assert actual_lbs[node_id] == expected_lb
+        assert reducer.num_contributions.sum() == 1000
+
+    def test_undercut_across_chunks(self):
+        reducer = OriginTimeBoundsReducer(1)
+        reducer.fold([0], [8], [10])
+        assert reducer.origin_time_lbs[0] == 8
+        reducer.fold([0, 0], [2, 3], [7, 7])
+        assert reducer.origin_time_lbs[0] == 3
+        assert reducer.origin_time_ubs[0] == 7
+        reducer.fold([0], [5], [7])
+        assert reducer.origin_time_lbs[0] == 5
+
+    def test_missing_contributions(self):
+        reducer = OriginTimeBoundsReducer(2)
+        reducer.fold([0], [1], [2])
+        with self.assertRaises(AssertionError):
+            reducer.get_bounds()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from pylib.reconstruction import calc_pairwise_mrca_matrices
+
+
+nan = np.nan
+
+
+class TestCalcPairwiseMrcaMatrices(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_fallback_rules(self):
+        # taxon 0 at generation 10, taxa 1 and 2 at generation 20
+        matrices = calc_pairwise_mrca_matrices(
+            taxon_from_codes=[0, 1, 0, 2, 1, 2],
+            taxon_to_codes=[1, 0, 2, 0, 2, 1],
+            mrca_lbs=[4, 4, nan, nan, nan, nan],
+            mrca_ubs=[7, 7, nan, nan, nan, nan],
+            earliest_detectable_mrca_ranks=[nan, nan, 0, 0, 9, nan],
+            taxon_from_generations=[10, 20, 10, 20, 20, 20],
+            taxon_to_generations=[20, 10, 20, 10, 20, 20],
+        )
+
+        # midpoint of bounds, ub exclusive: (4 + 7 - 1) / 2 == 5
+        assert matrices.distance_matrix[0, 1] == 2 * (10 + 20 - 2 * 5)
+        # no common ancestry detected
+        assert matrices.distance_matrix[0, 2] == 2 * (10 + 20)
+        # midpoint below earliest detectable mrca, then below earlier taxon
+        assert matrices.distance_matrix[1, 2] \
+            == (20 + 20 - 2 * 4) + (20 + 20 - 2 * 10)
+        assert np.array_equal(
+            matrices.distance_matrix,
+            matrices.distance_matrix.T,
+        )
+        assert np.array_equal(np.diag(matrices.distance_matrix), [0, 0, 0])
+
+        assert matrices.origin_time_lb_matrix.tolist() == [
+            [10, 4, 0],
+            [4, 20, 0],
+            [0, 0, 20],
+        ]
+        assert matrices.origin_time_ub_matrix.tolist() == [
+            [11, 7, 0],
+            [7, 21, 9],
+            [0, 21, 21],
+        ]
+
+    def test_upper_triangle_mirrored(self):
+        kwargs = dict(
+            mrca_lbs=[1, 2, 3],
+            mrca_ubs=[2, 4, 6],
+            earliest_detectable_mrca_ranks=[nan, nan, nan],
+            taxon_from_generations=[10, 10, 10],
+            taxon_to_generations=[10, 10, 10],
+            dtype=np.float32,
+        )
+        upper = calc_pairwise_mrca_matrices([0, 0, 1], [1, 2, 2], **kwargs)
+        lower = calc_pairwise_mrca_matrices([1, 2, 2], [0, 0, 1], **kwargs)
+
+        for actual, expected in zip(upper, lower):
+            assert actual.dtype == np.float32
+            assert np.array_equal(actual, expected)
+            assert np.array_equal(actual, actual.T)
+
+    def test_missing_pair(self):
+        with self.assertRaises(AssertionError):
+            calc_pairwise_mrca_matrices(
+                [0], [1], [nan], [nan], [nan], [1], [1], num_taxa=3,
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from Bio.Phylo.TreeConstruction import (
+    DistanceMatrix,
+    DistanceTreeConstructor,
+)
+import numpy as np
+
+from pylib.reconstruction import (
+    construct_distance_tree,
+    construct_nj_tree,
+    construct_upgma_tree,
+)
+
+
+def make_distance_matrix(num_taxa, seed):
+    rng = np.random.default_rng(seed)
+    # integer distances make ties common
+    points = rng.integers(0, 4, size=(num_taxa, 3))
+    return np.abs(
+        points[:, None, :] - points[None, :, :]
+    ).sum(axis=-1).astype(float)
+
+
+def to_biopython(distance_matrix, names):
+    return DistanceMatrix(
+        names,
+        [
+            [*map(float, distance_matrix[i, :i + 1])]
+            for i in range(len(names))
+        ],
+    )
+
+
+def calc_splits(tree):
+    names = frozenset(tip.name for tip in tree.get_terminals())
+    res = set()
+    for clade in tree.find_clades():
+        side = frozenset(tip.name for tip in clade.get_terminals())
+        res.add(min(side, names - side, key=sorted))
+    return res
+
+
+class TestConstructDistanceTree(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_upgma_matches_biopython(self):
+        for seed in range(40):
+            num_taxa = 2 + seed % 15
+            dm = make_distance_matrix(num_taxa, seed)
+            names = [f'T{i}' for i in range(num_taxa)]
+            expected = DistanceTreeConstructor().upgma(to_biopython(dm, names))
+            actual = construct_upgma_tree(dm, names)
+            assert format(actual, 'newick') == format(expected, 'newick')
+
+    def test_nj_matches_biopython_splits(self):
+        for seed in range(40):
+            num_taxa = 3 + seed % 15
+            dm = make_distance_matrix(num_taxa, seed)
+            names = [f'T{i}' for i in range(num_taxa)]
+            expected = DistanceTreeConstructor().nj(to_biopython(dm, names))
+            for prune_search in True, False:
+                actual = construct_nj_tree(
+                    dm, names, prune_search=prune_search,
+                )
+                assert calc_splits(actual) == calc_splits(expected)
+
+    def test_overwrite(self):
+        dm = make_distance_matrix(8, 1)
+        names = [*'abcdefgh']
+        expected = format(construct_upgma_tree(dm, names), 'newick')
+        scratch = dm.copy()
+        construct_upgma_tree(dm, names)
+        assert (scratch == dm).all()
+        actual = construct_upgma_tree(scratch, names, overwrite=True)
+        assert format(actual, 'newick') == expected
+
+    def test_dispatch(self):
+        dm = make_distance_matrix(6, 2)
+        names = [*'abcdef']
+        assert format(
+            construct_distance_tree(dm, names, 'upgma'), 'newick',
+        ) == format(construct_upgma_tree(dm, names), 'newick')
+        assert format(
+            construct_distance_tree(dm, names, 'nj'), 'newick',
+        ) == format(construct_nj_tree(dm, names), 'newick')
+        with self.assertRaises(ValueError):
+            construct_distance_tree(dm, names, 'wpgma')
+
+
+if __name__ == '__main__':
+    unittest.main()
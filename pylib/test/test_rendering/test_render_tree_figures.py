@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+import matplotlib.image as mpimage
+import matplotlib.pyplot as plt
+
+from pylib.rendering import RenderJob
+from pylib.rendering import render_tree_figures
+from pylib.test.test_draw_biopython_tree_with_origin_time_bounds \
+    import make_random_tree
+from pylib.test.test_draw_biopython_tree_with_origin_time_bounds \
+    import make_tree
+
+
+class TestRenderTreeFigures(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def _render(self, tmp_dir, num_processes):
+        bad_tree = make_tree()
+        del bad_tree.root.origin_time_lb
+        return render_tree_figures(
+            [
+                RenderJob(
+                    make_tree(),
+                    {
+                        'figsize': (4, 3),
+                        'dpi': 50,
+                        # applied to the job's axes, not pyplot's
+                        'title': ('small',),
+                        'xlabel': ('hello',),
+                    },
+                    os.path.join(tmp_dir, 'small.png'),
+                ),
+                RenderJob(
+                    bad_tree, {}, os.path.join(tmp_dir, 'bad.png'),
+                ),
+                (
+                    make_random_tree(200),
+                    {'batch_artists': True, 'level_of_detail': True},
+                    os.path.join(tmp_dir, 'large.pdf'),
+                ),
+            ],
+            num_processes=num_processes,
+            savefig_kwargs={'facecolor': 'white'},
+        )
+
+    def _test_render(self, num_processes):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results = self._render(tmp_dir, num_processes)
+            assert [result.output_path for result in results] == [
+                os.path.join(tmp_dir, filename)
+                for filename in ('small.png', 'bad.png', 'large.pdf')
+            ]
+            assert all(result.seconds > 0 for result in results)
+
+            assert results[0].error is None
+            assert mpimage.imread(results[0].output_path).shape[:2] \
+                == (150, 200)
+            assert 'AssertionError' in results[1].error
+            assert results[2].error is None
+            assert os.path.getsize(results[2].output_path)
+
+    def test_serial(self):
+        num_figures = len(plt.get_fignums())
+        self._test_render(1)
+        assert len(plt.get_fignums()) == num_figures
+
+    def test_parallel(self):
+        self._test_render(2)
+
+
+if __name__ == '__main__':
+    unittest.main()
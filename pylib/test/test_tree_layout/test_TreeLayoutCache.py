@@ -0,0 +1,69 @@
+from io import StringIO
+import unittest
+
+from Bio import Phylo
+import numpy as np
+
+from pylib.tree_layout import calc_tree_layout
+from pylib.tree_layout import TreeLayoutCache
+
+
+def read_tree(newick):
+    return Phylo.read(StringIO(newick), 'newick')
+
+
+class TestTreeLayoutCache(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_reuse(self):
+        cache = TreeLayoutCache()
+        first = read_tree('((A:1,B:2)C:1,(D:3,E:1)F:2)G:0;')
+        second = read_tree('((a:1,b:2):1,(d:3,e:1):2);')
+
+        first_layout = cache.get(first)
+        second_layout = cache.get(second)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+        assert second_layout.clades == [*second.find_clades()]
+
+        expected = calc_tree_layout(second)
+        for field in expected._fields[1:]:
+            assert np.array_equal(
+                getattr(second_layout, field), getattr(expected, field),
+            )
+            assert getattr(second_layout, field) \
+                is getattr(first_layout, field)
+            assert not getattr(second_layout, field).flags.writeable
+
+    def test_key(self):
+        cache = TreeLayoutCache()
+        for newick in (
+            '((A:1,B:2):1,(D:3,E:1):2);',
+            '((A:1,B:2):1,(D:3,E:2):2);',  # branch length
+            '((A:1,B:2,C:1):1,(D:3,E:1):2);',  # topology
+            '(A:1,B:2,(D:3,E:1):3);',  # topology
+            '((A,B),(D,E));',  # unit branch lengths
+        ):
+            cache.get(read_tree(newick))
+        assert (cache.hits, cache.misses) == (0, 5)
+
+    def test_eviction(self):
+        cache = TreeLayoutCache(max_entries=2)
+        trees = [read_tree(f'(A:{i},B:1);') for i in range(3)]
+        cache.get(trees[0])
+        cache.get(trees[1])
+        cache.get(trees[0])
+        cache.get(trees[2])  # evicts trees[1]
+        assert len(cache) == 2
+        cache.get(trees[0])
+        cache.get(trees[1])
+        assert (cache.hits, cache.misses) == (2, 4)
+
+        cache = TreeLayoutCache(max_entries=0)
+        assert cache.get(trees[0]).clades[0] is trees[0].root
+        assert len(cache) == 0
+
+
+if __name__ == '__main__':
+    unittest.main()
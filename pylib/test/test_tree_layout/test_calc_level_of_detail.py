@@ -0,0 +1,69 @@
+from io import StringIO
+import unittest
+
+from Bio import Phylo
+import numpy as np
+
+from pylib.benchmarks import make_synthetic_tree
+from pylib.tree_layout import calc_level_of_detail
+from pylib.tree_layout import calc_tree_layout
+
+
+class TestCalcLevelOfDetail(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_calc_level_of_detail(self):
+        # preorder ids: J=0 C=1 A=2 B=3 I=4 D=5 H=6 E=7 F=8 G=9
+        tree = Phylo.read(
+            StringIO('((A:1,B:2)C:1,(D:3,(E:1,F:1,G:2)H:1)I:2)J:0;'),
+            'newick',
+        )
+        layout = calc_tree_layout(tree)
+
+        lod = calc_level_of_detail(layout, 1.0)
+        assert lod.visible_mask.all()
+        assert not lod.collapsed_mask.any()
+        assert lod.subtree_ends.tolist() == [10, 4, 3, 4, 10, 6, 10, 8, 9, 10]
+
+        # C spans 2 rows and H spans 3, so both are under one pixel
+        lod = calc_level_of_detail(layout, 0.3)
+        assert np.flatnonzero(lod.collapsed_mask).tolist() == [1, 6]
+        assert np.flatnonzero(lod.visible_mask).tolist() == [0, 1, 4, 5, 6]
+        assert lod.glyph_ids.tolist() == [-1, -1, 1, 1, -1, -1, -1, 6, 6, 6]
+
+        lod = calc_level_of_detail(layout, 0.1)
+        assert np.flatnonzero(lod.collapsed_mask).tolist() == [0]
+        assert np.flatnonzero(lod.visible_mask).tolist() == [0]
+
+    def _check_bounded(self, tree, pixel_rows):
+        layout = calc_tree_layout(tree)
+        lod = calc_level_of_detail(
+            layout, pixel_rows / (layout.y_positions.max() + 0.6),
+        )
+        hidden_ids = np.flatnonzero(~lod.visible_mask)
+        assert lod.collapsed_mask[lod.glyph_ids[hidden_ids]].all()
+        assert lod.visible_mask[lod.glyph_ids[hidden_ids]].all()
+        assert (lod.glyph_ids[lod.visible_mask] == -1).all()
+        return lod.visible_mask.sum()
+
+    def test_star(self):
+        # tips sharing a pixel row merge into one glyph
+        tree = Phylo.read(
+            StringIO(f'({",".join(map(str, range(1000)))});'), 'newick',
+        )
+        assert self._check_bounded(tree, 100) == 101
+
+    def test_caterpillar(self):
+        # each tip hangs off a spine spanning all pixel rows
+        for num_tips in 2000, 20000:
+            for imbalance in 0.0, 0.5, 1.0:
+                num_visible = self._check_bounded(
+                    make_synthetic_tree(num_tips, imbalance=imbalance), 200,
+                )
+                assert num_visible <= 4 * 200
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+from io import StringIO
+import sys
+import unittest
+
+from Bio import Phylo
+from Bio.Phylo.BaseTree import Clade, Tree
+import numpy as np
+
+from pylib.tree_layout import calc_tree_layout
+
+
+class TestCalcTreeLayout(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_matches_biopython(self):
+        tree = Phylo.read(
+            StringIO('((A:1,B:2)C:1,(D:3,(E:1,F:1,G:2)H:1)I:2)J:0;'),
+            'newick',
+        )
+        layout = calc_tree_layout(tree)
+
+        depths = tree.depths()
+        terminals = tree.get_terminals()
+        for node_id, clade in enumerate(tree.find_clades()):
+            assert layout.clades[node_id] is clade
+            assert layout.x_positions[node_id] == depths[clade]
+            if clade.is_terminal():
+                assert layout.y_positions[node_id] \
+                    == terminals.index(clade) + 1
+            else:
+                child_ids = layout.get_child_ids(node_id)
+                assert [layout.clades[i] for i in child_ids] == clade.clades
+                assert layout.y_positions[node_id] == (
+                    layout.y_positions[child_ids[0]]
+                    + layout.y_positions[child_ids[-1]]
+                ) / 2
+
+        assert layout.parent_ids[0] == -1
+        assert np.all(layout.parent_ids[1:] < np.arange(1, layout.num_nodes))
+        assert np.count_nonzero(layout.tip_mask) == len(terminals)
+
+    def test_unit_branch_lengths(self):
+        tree = Phylo.read(StringIO('((A,B)C,D)E;'), 'newick')
+        layout = calc_tree_layout(tree)
+
+        depths = tree.depths(unit_branch_lengths=True)
+        assert layout.x_positions.tolist() \
+            == [depths[clade] for clade in tree.find_clades()]
+
+    def test_single_node(self):
+        layout = calc_tree_layout(Tree(root=Clade(name='A')))
+
+        assert layout.num_nodes == 1
+        assert layout.x_positions.tolist() == [0.0]
+        assert layout.y_positions.tolist() == [1.0]
+        assert layout.first_child_ids.tolist() == [-1]
+
+    def test_deep_caterpillar(self):
+        depth = sys.getrecursionlimit() * 4
+        root = Clade(branch_length=1)
+        clade = root
+        for __ in range(depth):
+            clade.clades = [Clade(branch_length=1), Clade(branch_length=1)]
+            clade = clade.clades[-1]
+        layout = calc_tree_layout(Tree(root=root))
+
+        assert layout.num_nodes == 2 * depth + 1
+        assert layout.x_positions.max() == depth + 1
+        assert layout.y_positions.max() == depth + 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import random
+import unittest
+
+import dendropy
+from dendropy.calculate import treecompare
+import numpy as np
+
+from pylib.treecompare import BipartitionIndex
+from pylib.treecompare import compare_trees
+from pylib.treecompare import dendropy_tree_to_arrays
+
+
+def make_random_tree(rng, num_taxa, taxon_namespace, allow_unifurcations):
+    """Random tree over taxa '0' ... 'num_taxa - 1', with taxa assigned to
+    every node and random edge lengths below the root."""
+    nodes = [
+        dendropy.Node(taxon=taxon_namespace.require_taxon(label=str(taxon)))
+        for taxon in rng.sample(range(num_taxa), num_taxa)
+    ]
+    while len(nodes) > 1 or allow_unifurcations and rng.random() < 0.5:
+        num_children = min(rng.choice([1, 2, 2, 3]), len(nodes))
+        if num_children == 1 and not allow_unifurcations:
+            continue
+        parent = dendropy.Node(taxon=taxon_namespace.require_taxon(
+            label=f'inner{len(taxon_namespace)}',
+        ))
+        for __ in range(num_children):
+            child = nodes.pop(rng.randrange(len(nodes)))
+            child.edge.length = rng.random()
+            parent.add_child(child)
+        nodes.append(parent)
+    return dendropy.Tree(seed_node=nodes[0], taxon_namespace=taxon_namespace)
+
+
+def compare_trees_dendropy(reference, candidate):
+    return (
+        treecompare.unweighted_robinson_foulds_distance(reference, candidate),
+        treecompare.weighted_robinson_foulds_distance(reference, candidate),
+        treecompare.euclidean_distance(reference, candidate),
+    )
+
+
+class TestCompareTrees(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def _test_matches_dendropy(self, is_rooted, allow_unifurcations):
+        rng = random.Random(1)
+        for num_taxa in 3, 5, 70, 150:
+            taxon_namespace = dendropy.TaxonNamespace()
+            trees = [
+                make_random_tree(
+                    rng, num_taxa, taxon_namespace, allow_unifurcations,
+                )
+                for __ in range(5)
+            ]
+            for tree in trees:
+                tree.is_rooted = is_rooted
+            arrays = [*map(dendropy_tree_to_arrays, trees)]
+            reference = BipartitionIndex(*arrays[0], is_rooted=is_rooted)
+            for tree, candidate in zip(trees, arrays):
+                expected = compare_trees_dendropy(trees[0], tree)
+                actual = reference.score(*candidate)
+                assert actual[0] == expected[0]
+                self.assertAlmostEqual(actual[1], expected[1])
+                self.assertAlmostEqual(actual[2], expected[2])
+
+    def test_matches_dendropy_rooted(self):
+        self._test_matches_dendropy(True, True)
+
+    def test_matches_dendropy_unrooted(self):
+        self._test_matches_dendropy(False, False)
+
+    def test_identical(self):
+        parents = np.array([-1, 0, 0, 2, 2])
+        lengths = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        labels = ['root', 'a', 'inner', 'b', 'c']
+        index = BipartitionIndex(parents, lengths, labels)
+        assert len(index) == 5
+        assert tuple(index.score(parents, lengths, labels)) == (0, 0.0, 0.0)
+
+        # reordered nodes, unifurcation, and unknown inner labels
+        assert tuple(index.score(
+            [4, 4, 5, -1, 3, 3],
+            [4.0, 3.0, 0.5, 0.0, 2.0, 0.5],
+            ['c', 'b', 'a', None, 'x', 'y'],
+        )) == (0, 0.0, 0.0)
+
+        # unknown leaf
+        comparison = index.score(
+            parents, lengths, ['root', 'a', 'x', 'b', 'd'],
+        )
+        assert comparison.unweighted_robinson_foulds == 6
+        assert comparison.weighted_robinson_foulds == 12.0
+        assert comparison.euclidean == np.sqrt(40)
+
+    def test_compare_trees(self):
+        rng = random.Random(2)
+        taxon_namespace = dendropy.TaxonNamespace()
+        arrays = [
+            dendropy_tree_to_arrays(
+                make_random_tree(rng, 20, taxon_namespace, True),
+            )
+            for __ in range(11)
+        ]
+        serial = compare_trees(
+            arrays[0], arrays, num_processes=1, chunk_size=3,
+        )
+        parallel = compare_trees(
+            BipartitionIndex(*arrays[0]), arrays, num_processes=2,
+            chunk_size=3,
+        )
+        assert serial.equals(parallel)
+        assert len(serial) == 11
+        assert [*serial.columns] == [
+            'Unweighted Robinson Foulds Distance Error',
+            'Weighted Robinson Foulds Distance Error',
+            'Euclidean Distance Error',
+        ]
+        assert serial.iloc[0].sum() == 0
+        assert (serial.iloc[1:, 0] > 0).all()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,280 @@
+import asyncio
+import collections
+import hashlib
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+import uuid
+
+from pylib.uploads import get_upload_destination
+from pylib.uploads import stash_keyname_keys
+from pylib.uploads import upload_files
+
+# S3-compatible stand-in (e.g., `moto_server` or MinIO) to test against
+endpoint_url = os.environ.get('PYLIB_TEST_S3_ENDPOINT_URL')
+test_bucket = os.environ.get('PYLIB_TEST_S3_BUCKET', 'pylib-test')
+
+
+class FakeS3Client:
+    """In-memory stand-in for the aiobotocore S3 client calls used by
+    upload_files_async, counting calls and requests in flight."""
+
+    def __init__(self, fail_part_number=None):
+        self.objects = {}  # (bucket, key) -> (body, metadata)
+        self.multipart_uploads = {}  # upload id -> (bucket, key, metadata)
+        self.parts = collections.defaultdict(dict)
+        self.calls = collections.Counter()
+        self.fail_part_number = fail_part_number
+        self.num_in_flight = 0
+        self.max_in_flight = 0
+
+    async def _request(self, name):
+        self.calls[name] += 1
+        self.num_in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.num_in_flight)
+        await asyncio.sleep(0.001)
+        self.num_in_flight -= 1
+
+    async def head_object(self, Bucket, Key):
+        from botocore.exceptions import ClientError
+
+        await self._request('head_object')
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+        return {'Metadata': self.objects[Bucket, Key][1]}
+
+    async def put_object(self, Bucket, Key, Body, Metadata):
+        await self._request('put_object')
+        self.objects[Bucket, Key] = (bytes(Body), Metadata)
+
+    async def create_multipart_upload(self, Bucket, Key, Metadata):
+        await self._request('create_multipart_upload')
+        upload_id = uuid.uuid4().hex
+        self.multipart_uploads[upload_id] = (Bucket, Key, Metadata)
+        return {'UploadId': upload_id}
+
+    async def upload_part(self, Bucket, Key, PartNumber, UploadId, Body):
+        from botocore.exceptions import ClientError
+
+        await self._request('upload_part')
+        assert self.multipart_uploads[UploadId][:2] == (Bucket, Key)
+        if PartNumber == self.fail_part_number:
+            raise ClientError({'Error': {'Code': '500'}}, 'UploadPart')
+        etag = hashlib.md5(Body).hexdigest()
+        self.parts[UploadId][PartNumber] = (etag, bytes(Body))
+        return {'ETag': etag}
+
+    async def complete_multipart_upload(
+        self, Bucket, Key, UploadId, MultipartUpload,
+    ):
+        await self._request('complete_multipart_upload')
+        bucket, key, metadata = self.multipart_uploads.pop(UploadId)
+        assert (bucket, key) == (Bucket, Key)
+        parts = self.parts.pop(UploadId)
+        assert [
+            part['PartNumber'] for part in MultipartUpload['Parts']
+        ] == sorted(parts)
+        assert [part['ETag'] for part in MultipartUpload['Parts']] \
+            == [parts[part_number][0] for part_number in sorted(parts)]
+        self.objects[bucket, key] = (
+            b''.join(parts[part_number][1] for part_number in sorted(parts)),
+            metadata,
+        )
+
+    async def abort_multipart_upload(self, Bucket, Key, UploadId):
+        await self._request('abort_multipart_upload')
+        del self.multipart_uploads[UploadId]
+        self.parts.pop(UploadId, None)
+
+
+class FakeSession:
+
+    def __init__(self, client):
+        self.client = client
+
+    def create_client(self, service_name, **kwargs):
+        assert service_name == 's3'
+        return self
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestUploadFiles(unittest.TestCase):
+
+    # tell nose to run tests in parallel
+    _multiprocess_can_split_ = True
+
+    def test_get_upload_destination_plotted(self):
+        assert get_upload_destination(
+            'binder/outplots/a=plot+bucket=b+endeavor=3+ext=.png',
+            'plotted',
+        ) == (
+            'b',
+            'endeavor=3/stage=9+what=plotted/'
+            'a=plot+bucket=b+endeavor=3+ext=.png',
+        )
+        assert get_upload_destination(
+            'outplots/a=plot+bucket=b+endeavor=3+ext=.png.meta',
+            'plotted',
+        )[1].endswith('ext=.png.meta')
+        assert get_upload_destination(
+            'outplots/a=plot+ext=.png', 'plotted',
+        ) is None
+
+    def test_get_upload_destination_notebooks(self):
+        assert get_upload_destination(
+            '/home/bucket=b+endeavor=3/binder/popsize/nb.ipynb',
+            'notebooks',
+        ) == ('b', 'endeavor=3/stage=9+what=notebooks/nb.ipynb')
+        assert get_upload_destination(
+            '/home/repo/binder/popsize/nb.ipynb', 'notebooks',
+        ) is None
+
+    def test_stash_keyname_keys(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(
+                tmp_dir, 'a=plot+bucket=b+_dfdigest=abc+ext=.png',
+            )
+            with open(path, 'w') as file:
+                file.write('png')
+            dest = stash_keyname_keys(path, ['_dfdigest'])
+            assert dest == os.path.join(tmp_dir, 'a=plot+bucket=b+ext=.png')
+            assert not os.path.exists(path)
+            with open(dest) as file:
+                assert file.read() == 'png'
+            with open(f'{dest}.meta') as file:
+                assert file.read() == '_dfdigest=abc\n'
+
+    def _write_files(self, tmp_dir):
+        small = os.path.join(tmp_dir, 'small')
+        large = os.path.join(tmp_dir, 'large')
+        with open(small, 'wb') as file:
+            file.write(b'small')
+        with open(large, 'wb') as file:
+            file.write(os.urandom(11 * 2**20))
+        return small, large
+
+    @unittest.skipUnless(
+        importlib.util.find_spec('aiobotocore'), 'requires aiobotocore',
+    )
+    def test_upload_files_stubbed(self):
+        client = FakeS3Client()
+        kwargs = dict(
+            max_concurrency=2,
+            multipart_threshold=8 * 2**20,
+            part_size=5 * 2**20,
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch(
+            'aiobotocore.session.get_session',
+            return_value=FakeSession(client),
+        ):
+            small, large = self._write_files(tmp_dir)
+            uploads = [
+                (small, 'bucket', 'small'),
+                (large, 'bucket', 'large'),
+            ]
+
+            results = upload_files(uploads, **kwargs)
+            assert [result.status for result in results] \
+                == ['uploaded', 'uploaded']
+            for path, bucket, key in uploads:
+                with open(path, 'rb') as file:
+                    content = file.read()
+                body, metadata = client.objects[bucket, key]
+                assert body == content
+                assert metadata == {
+                    'sha256': hashlib.sha256(content).hexdigest(),
+                }
+            assert client.calls['put_object'] == 1
+            assert client.calls['upload_part'] == 3
+            assert client.max_in_flight <= 2
+
+            results = upload_files(uploads, **kwargs)
+            assert [result.status for result in results] \
+                == ['skipped', 'skipped']
+
+            with open(small, 'wb') as file:
+                file.write(b'changed')
+            results = upload_files(uploads, **kwargs)
+            assert [result.status for result in results] \
+                == ['uploaded', 'skipped']
+            assert client.objects['bucket', 'small'][0] == b'changed'
+            assert client.calls['abort_multipart_upload'] == 0
+
+    @unittest.skipUnless(
+        importlib.util.find_spec('aiobotocore'), 'requires aiobotocore',
+    )
+    def test_upload_files_abort(self):
+        from botocore.exceptions import ClientError
+
+        client = FakeS3Client(fail_part_number=2)
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch(
+            'aiobotocore.session.get_session',
+            return_value=FakeSession(client),
+        ):
+            __, large = self._write_files(tmp_dir)
+            with self.assertRaises(ClientError):
+                upload_files(
+                    [(large, 'bucket', 'large')],
+                    multipart_threshold=8 * 2**20,
+                    part_size=5 * 2**20,
+                )
+        assert client.calls['abort_multipart_upload'] == 1
+        assert client.calls['complete_multipart_upload'] == 0
+        assert not client.multipart_uploads
+        assert not client.objects
+
+    @unittest.skipUnless(
+        endpoint_url and importlib.util.find_spec('aiobotocore'),
+        'set PYLIB_TEST_S3_ENDPOINT_URL to an S3 stand-in',
+    )
+    def test_upload_files(self):
+        import boto3
+
+        client = boto3.client('s3', endpoint_url=endpoint_url)
+        try:
+            client.create_bucket(Bucket=test_bucket)
+        except client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+        prefix = uuid.uuid4().hex
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            small, large = self._write_files(tmp_dir)
+            uploads = [
+                (small, test_bucket, f'{prefix}/small'),
+                (large, test_bucket, f'{prefix}/large'),
+            ]
+            kwargs = dict(
+                endpoint_url=endpoint_url,
+                multipart_threshold=8 * 2**20,
+                part_size=5 * 2**20,
+            )
+
+            results = upload_files(uploads, **kwargs)
+            assert [result.status for result in results] \
+                == ['uploaded', 'uploaded']
+            for path, bucket, key in uploads:
+                with open(path, 'rb') as file:
+                    assert client.get_object(
+                        Bucket=bucket, Key=key,
+                    )['Body'].read() == file.read()
+
+            results = upload_files(uploads, **kwargs)
+            assert [result.status for result in results] \
+                == ['skipped', 'skipped']
+
+            with open(small, 'wb') as file:
+                file.write(b'changed')
+            results = upload_files(uploads, **kwargs)
+            assert [result.status for result in results] \
+                == ['uploaded', 'skipped']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,19 @@
+import typing
+
+import numpy as np
+
+
+class LevelOfDetail(typing.NamedTuple):
+    """Which nodes of a `TreeLayout` to draw at a given output resolution,
+    stored as arrays indexed by node id."""
+
+    # nodes to draw, i.e., nodes not summarized by another node's glyph
+    visible_mask: np.ndarray
+    # nodes to draw with a single summary glyph in place of hidden nodes
+    collapsed_mask: np.ndarray
+    # collapsed node whose glyph summarizes each hidden node, -1 if visible
+    glyph_ids: np.ndarray
+    # each node's descendants have ids from node id + 1 up to (excluding) this
+    subtree_ends: np.ndarray
+    # output pixel rows per tip row
+    pixels_per_row: float
@@ -0,0 +1,63 @@
+import typing
+
+import numpy as np
+
+
+class TreeLayout(typing.NamedTuple):
+    """Drawing positions of a tree's clades, stored as arrays indexed by node
+    id.
+
+    Node ids are assigned in preorder, so the root has id 0, every clade's id
+    is greater than its parent's, and tips appear in top-to-bottom drawing
+    order. Children of node `i` are `child_ids[child_offsets[i]:child_offsets[i
+    + 1]]`, in the same order as `clades[i].clades`.
+    """
+
+    # clade objects, indexed by node id
+    clades: typing.List[typing.Any]
+    # parent node id of each node, -1 for the root
+    parent_ids: np.ndarray
+    # compressed sparse row (CSR) child adjacency
+    child_offsets: np.ndarray
+    child_ids: np.ndarray
+    # horizontal position of each node, i.e., its depth by branch length
+    x_positions: np.ndarray
+    # vertical position of each node, integers 1..num tips for tips
+    y_positions: np.ndarray
+
+    @property
+    def num_nodes(self: 'TreeLayout') -> int:
+        return len(self.clades)
+
+    @property
+    def num_children(self: 'TreeLayout') -> np.ndarray:
+        """Number of children of each node."""
+        return np.diff(self.child_offsets)
+
+    @property
+    def tip_mask(self: 'TreeLayout') -> np.ndarray:
+        """Boolean mask of nodes without children."""
+        return self.num_children == 0
+
+    @property
+    def first_child_ids(self: 'TreeLayout') -> np.ndarray:
+        """Id of each node's first child, -1 for tips."""
+        res = np.full(self.num_nodes, -1, dtype=self.child_ids.dtype)
+        has_children = ~self.tip_mask
+        res[has_children] = self.child_ids[self.child_offsets[:-1][has_children]]
+        return res
+
+    @property
+    def last_child_ids(self: 'TreeLayout') -> np.ndarray:
+        """Id of each node's last child, -1 for tips."""
+        res = np.full(self.num_nodes, -1, dtype=self.child_ids.dtype)
+        has_children = ~self.tip_mask
+        res[has_children] \
+            = self.child_ids[self.child_offsets[1:][has_children] - 1]
+        return res
+
+    def get_child_ids(self: 'TreeLayout', node_id: int) -> np.ndarray:
+        """Ids of children of node `node_id`, in drawing order."""
+        return self.child_ids[
+            self.child_offsets[node_id]:self.child_offsets[node_id + 1]
+        ]
@@ -0,0 +1,82 @@
+import collections
+import hashlib
+import typing
+
+import numpy as np
+
+from .calc_tree_layout import _get_branch_lengths
+from .calc_tree_layout import _layout_numbered_clades
+from .calc_tree_layout import _number_clades
+from .TreeLayout import TreeLayout
+
+
+class TreeLayoutCache:
+    """Least recently used cache of tree layouts, keyed by topology.
+
+    Trees with the same shape, tip order, and branch lengths have the same
+    layout, whatever their clade objects and names. Entries are keyed by a
+    hash of each node's number of children and branch length, in preorder.
+    Hits still number the tree's clades, but skip computing positions.
+
+    Cached arrays are shared between the layouts returned, and are made
+    read-only.
+    """
+
+    _max_entries: int
+    # map from topology key to layout, with clades dropped
+    _layouts: 'collections.OrderedDict[bytes, TreeLayout]'
+    _hits: int
+    _misses: int
+
+    def __init__(self: 'TreeLayoutCache', max_entries: int=64) -> None:
+        self._max_entries = max_entries
+        self._layouts = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self: 'TreeLayoutCache') -> int:
+        return len(self._layouts)
+
+    @property
+    def hits(self: 'TreeLayoutCache') -> int:
+        return self._hits
+
+    @property
+    def misses(self: 'TreeLayoutCache') -> int:
+        return self._misses
+
+    @staticmethod
+    def _calc_key(
+        parent_ids: np.ndarray,
+        branch_lengths: np.ndarray,
+    ) -> bytes:
+        num_children = np.bincount(parent_ids[1:], minlength=len(parent_ids))
+        digest = hashlib.sha256(num_children.astype(np.int64).tobytes())
+        digest.update(branch_lengths.tobytes())
+        return digest.digest()
+
+    def get(self: 'TreeLayoutCache', tree) -> TreeLayout:
+        """Layout of `tree`, as computed by `calc_tree_layout`."""
+        clades, parent_ids = _number_clades(tree)
+        branch_lengths = _get_branch_lengths(clades)
+        key = self._calc_key(parent_ids, branch_lengths)
+
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._hits += 1
+            self._layouts.move_to_end(key)
+        else:
+            self._misses += 1
+            layout = _layout_numbered_clades(
+                clades, parent_ids, branch_lengths,
+            )._replace(clades=None)
+            for array in layout[1:]:
+                array.flags.writeable = False
+            self._layouts[key] = layout
+            while len(self._layouts) > self._max_entries:
+                self._layouts.popitem(last=False)
+
+        return layout._replace(clades=clades)
+
+    def clear(self: 'TreeLayoutCache') -> None:
+        self._layouts.clear()
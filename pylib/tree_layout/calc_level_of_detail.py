@@ -0,0 +1,120 @@
+import numpy as np
+
+from .LevelOfDetail import LevelOfDetail
+from .TreeLayout import TreeLayout
+
+
+def calc_level_of_detail(
+    layout: TreeLayout,
+    pixels_per_row: float,
+) -> LevelOfDetail:
+    """Choose nodes to summarize with glyphs so that drawn detail is bounded
+    by output pixel rows rather than by tree size.
+
+    A subtree is small if its tips together span less than one pixel row.
+    Visible nodes, starting from the root, summarize nodes as follows.
+
+    * A small inner node is collapsed, hiding its descendants.
+    * A node with exactly one large child in its own pixel row starts a run
+      down that lineage, hiding each following node with a single large
+      child in the same pixel row, along with its small children. Long
+      unbranched or caterpillar-like lineages thus become one glyph per
+      pixel row.
+    * Otherwise, consecutive small children whose positions fall in the same
+      pixel row are merged: the first is collapsed, hiding the others'
+      subtrees along with its own descendants.
+
+    Parameters
+    ----------
+    layout : TreeLayout
+        Layout of the tree to draw.
+    pixels_per_row : float
+        Output pixel rows per tip row, e.g., the axes height in pixels divided
+        by the y-axis span in tip rows.
+    """
+    num_nodes = layout.num_nodes
+    parent_ids = layout.parent_ids
+
+    # preorder places each subtree on a contiguous run of node ids
+    subtree_sizes = np.ones(num_nodes, dtype=np.int64)
+    for node_id, parent_id in zip(
+        range(num_nodes - 1, 0, -1),
+        reversed(parent_ids[1:].tolist()),
+    ):
+        subtree_sizes[parent_id] += subtree_sizes[node_id]
+    subtree_ends = np.arange(num_nodes) + subtree_sizes
+
+    tips_before = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(layout.tip_mask, out=tips_before[1:])
+    num_subtree_tips = tips_before[subtree_ends] - tips_before[:-1]
+
+    is_small = (num_subtree_tips * pixels_per_row < 1).tolist()
+    is_tip = layout.tip_mask.tolist()
+    pixel_rows = np.floor(layout.y_positions * pixels_per_row).tolist()
+    child_offsets = layout.child_offsets.tolist()
+    child_ids = layout.child_ids.tolist()
+    ends = subtree_ends.tolist()
+
+    glyph_ids = [-1] * num_nodes
+    collapsed = [False] * num_nodes
+
+    def hide(begin: int, end: int, glyph_id: int) -> None:
+        glyph_ids[begin:end] = [glyph_id] * (end - begin)
+
+    def get_children(node_id: int) -> list:
+        return child_ids[child_offsets[node_id]:child_offsets[node_id + 1]]
+
+    def continues_run(large_children: list, glyph_id: int) -> bool:
+        return len(large_children) == 1 \
+            and pixel_rows[large_children[0]] == pixel_rows[glyph_id]
+
+    # parents precede children in preorder, so each node's visibility is
+    # settled before it is visited
+    for node_id in range(num_nodes):
+        if glyph_ids[node_id] >= 0:
+            continue
+        if is_small[node_id]:
+            if not is_tip[node_id]:
+                collapsed[node_id] = True
+                hide(node_id + 1, ends[node_id], node_id)
+            continue
+
+        children = get_children(node_id)
+        large_children = [child for child in children if not is_small[child]]
+        if continues_run(large_children, node_id):
+            collapsed[node_id] = True
+            while True:
+                for child in children:
+                    if is_small[child]:
+                        hide(child, ends[child], node_id)
+                if not continues_run(large_children, node_id):
+                    break
+                run_id = large_children[0]
+                glyph_ids[run_id] = node_id
+                children = get_children(run_id)
+                large_children = [
+                    child for child in children if not is_small[child]
+                ]
+            continue
+
+        # merge runs of small siblings sharing a pixel row
+        run = []
+        for child in children + [None]:
+            if child is not None and is_small[child] and run \
+                    and pixel_rows[child] == pixel_rows[run[0]]:
+                run.append(child)
+                continue
+            # single children are handled when visited
+            if len(run) > 1:
+                collapsed[run[0]] = True
+                hide(run[0] + 1, ends[run[-1]], run[0])
+            run = [child] if child is not None and is_small[child] else []
+
+    glyph_ids = np.array(glyph_ids, dtype=np.int64)
+    return LevelOfDetail(
+        visible_mask=glyph_ids < 0,
+        collapsed_mask=np.array(collapsed, dtype=bool),
+        glyph_ids=glyph_ids,
+        subtree_ends=subtree_ends,
+        pixels_per_row=pixels_per_row,
+    )
@@ -0,0 +1,105 @@
+import typing
+
+import numpy as np
+
+from .TreeLayout import TreeLayout
+
+
+def _number_clades(tree) -> typing.Tuple[typing.List, np.ndarray]:
+    """Clades of `tree` in preorder, and the parent id of each."""
+    clades = []
+    parent_ids = []
+    stack = [(tree.root, -1)]
+    while stack:
+        clade, parent_id = stack.pop()
+        node_id = len(clades)
+        clades.append(clade)
+        parent_ids.append(parent_id)
+        stack.extend((child, node_id) for child in reversed(clade.clades))
+    return clades, np.array(parent_ids, dtype=np.int64)
+
+
+def _get_branch_lengths(clades: typing.List) -> np.ndarray:
+    return np.fromiter(
+        (clade.branch_length or 0 for clade in clades),
+        dtype=float,
+        count=len(clades),
+    )
+
+
+def _layout_numbered_clades(
+    clades: typing.List,
+    parent_ids: np.ndarray,
+    branch_lengths: np.ndarray,
+) -> TreeLayout:
+    num_nodes = len(clades)
+
+    # preorder visits siblings in order, so a stable sort by parent id groups
+    # each node's children contiguously and in order
+    child_ids = np.argsort(parent_ids[1:], kind='stable') + 1
+    child_offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(parent_ids[1:], minlength=num_nodes),
+        out=child_offsets[1:],
+    )
+
+    # parents precede children in preorder, so one forward pass suffices
+    def calc_x_positions(branch_lengths: np.ndarray) -> np.ndarray:
+        res = np.empty(num_nodes, dtype=float)
+        res[0] = branch_lengths[0]
+        for node_id, parent_id in enumerate(parent_ids_list[1:], start=1):
+            res[node_id] = res[parent_id] + branch_lengths[node_id]
+        return res
+
+    parent_ids_list = parent_ids.tolist()
+    x_positions = calc_x_positions(branch_lengths)
+    # If there are no branch lengths, assume unit branch lengths
+    if not x_positions.max():
+        branch_lengths = branch_lengths.copy()
+        branch_lengths[1:] = 1
+        x_positions = calc_x_positions(branch_lengths)
+
+    # tips occupy consecutive rows in preorder,
+    # internal nodes sit at midpoint of first and last child
+    # children follow parents in preorder, so one backward pass suffices
+    num_children = np.diff(child_offsets)
+    y_positions = np.empty(num_nodes, dtype=float)
+    is_tip = num_children == 0
+    y_positions[is_tip] = np.arange(1, np.count_nonzero(is_tip) + 1)
+    first_child_ids = child_ids[child_offsets[:-1][~is_tip]].tolist()
+    last_child_ids = child_ids[child_offsets[1:][~is_tip] - 1].tolist()
+    inner_ids = np.flatnonzero(~is_tip).tolist()
+    for node_id, first, last in zip(
+        reversed(inner_ids),
+        reversed(first_child_ids),
+        reversed(last_child_ids),
+    ):
+        y_positions[node_id] = (y_positions[first] + y_positions[last]) / 2.0
+
+    return TreeLayout(
+        clades=clades,
+        parent_ids=parent_ids,
+        child_offsets=child_offsets,
+        child_ids=child_ids,
+        x_positions=x_positions,
+        y_positions=y_positions,
+    )
+
+
+def calc_tree_layout(tree) -> TreeLayout:
+    """Compute drawing positions for all clades of a Biopython tree.
+
+    Horizontal positions are cumulative branch lengths from the root, or
+    unit branch lengths if the tree has no branch lengths. Tips are placed on
+    consecutive integer rows starting from 1 and internal nodes are placed
+    midway between their first and last child, matching Biopython's
+    `Phylo.draw` layout.
+
+    Traversal uses an explicit stack and results are stored in NumPy arrays,
+    so time and memory scale linearly with tree size and arbitrarily deep
+    trees do not exceed the interpreter's recursion limit.
+    """
+    clades, parent_ids = _number_clades(tree)
+    return _layout_numbered_clades(
+        clades, parent_ids, _get_branch_lengths(clades),
+    )
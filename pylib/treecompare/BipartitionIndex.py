@@ -0,0 +1,217 @@
+import typing
+
+import numpy as np
+
+from .TreeComparison import TreeComparison
+
+
+def _calc_depths(parents: np.ndarray) -> np.ndarray:
+    """Number of edges between each node and the root, by pointer
+    jumping."""
+    depths = (parents >= 0).astype(np.int64)
+    ancestors = parents.copy()
+    while (ancestors >= 0).any():
+        has_ancestor = ancestors >= 0
+        safe_ancestors = np.where(has_ancestor, ancestors, 0)
+        depths = depths + np.where(has_ancestor, depths[safe_ancestors], 0)
+        ancestors = np.where(has_ancestor, ancestors[safe_ancestors], -1)
+    return depths
+
+
+def _encode_splits(
+    parents: np.ndarray,
+    edge_lengths: np.ndarray,
+    leaf_taxa: np.ndarray,
+    num_taxa: int,
+    is_rooted: bool,
+) -> typing.Tuple[typing.List[bytes], np.ndarray]:
+    """Hashable split keys and their summed edge lengths.
+
+    Leaf sets are packed into rows of little-endian uint64 words. Keys are
+    row bytes with trailing zero bytes stripped, so they do not depend on the
+    number of words.
+    """
+    num_nodes = len(parents)
+    num_words = max((num_taxa + 63) // 64, 1)
+    leafsets = np.zeros((num_nodes, num_words), dtype='<u8')
+
+    labeled = np.flatnonzero(leaf_taxa >= 0)
+    taxa = leaf_taxa[labeled]
+    leafsets[labeled, taxa // 64] = np.left_shift(
+        np.uint64(1), (taxa % 64).astype(np.uint64),
+    )
+
+    # or each level of the tree into the one above it, deepest first
+    depths = _calc_depths(parents)
+    order = np.argsort(-depths, kind='stable')
+    boundaries = np.flatnonzero(np.diff(depths[order])) + 1
+    for level in np.split(order, boundaries):
+        level = level[parents[level] >= 0]
+        np.bitwise_or.at(leafsets, parents[level], leafsets[level])
+
+    if not is_rooted:
+        # orient each split away from the lowest-indexed taxon in the tree
+        full = np.bitwise_or.reduce(leafsets[parents < 0], axis=0)
+        nonzero_words = np.flatnonzero(full)
+        if len(nonzero_words):
+            word = nonzero_words[0]
+            lowest_bit = full[word] & (~full[word] + np.uint64(1))
+            flip = (leafsets[:, word] & lowest_bit).astype(bool)
+            leafsets[flip] ^= full
+
+    # edges sharing a split, as along unifurcation chains, merge into one
+    splits, inverse = np.unique(leafsets, axis=0, return_inverse=True)
+    lengths = np.bincount(
+        inverse.ravel(), weights=edge_lengths, minlength=len(splits),
+    )
+    keys = [split.tobytes().rstrip(b'\0') for split in splits]
+    return keys, lengths
+
+
+class BipartitionIndex:
+    """Splits of a reference tree, encoded once, to score many candidate
+    trees against.
+
+    Each split is stored as the leaf set below an edge, packed into a bitset
+    keyed in a hash table. Scoring a candidate encodes its splits the same way
+    and looks each up in the table, computing unweighted and weighted
+    Robinson-Foulds distance and euclidean (branch length) distance together
+    in one pass.
+
+    Results match `dendropy.calculate.treecompare` for trees with bipartitions
+    encoded the dendropy way: unifurcations are suppressed, with their edge
+    lengths added to their child's, leaf sets include only leaves, and, for
+    unrooted trees, splits are oriented so that they exclude the tree's first
+    taxon. Leaves are matched between trees by label. Missing (None or NaN)
+    edge lengths count as zero.
+    """
+
+    # map from leaf label to bit index
+    _taxon_indices: typing.Dict[typing.Hashable, int]
+    # map from split key to index into _lengths
+    _splits: typing.Dict[bytes, int]
+    # summed length of the edges subtending each split
+    _lengths: np.ndarray
+    _is_rooted: bool
+
+    def __init__(
+        self: 'BipartitionIndex',
+        parents: np.ndarray,
+        edge_lengths: typing.Optional[np.ndarray],
+        leaf_labels: typing.Sequence[typing.Optional[typing.Hashable]],
+        *,
+        is_rooted: bool=True,
+    ) -> None:
+        """Encode the reference tree.
+
+        Parameters
+        ----------
+        parents : array of int
+            Index of each node's parent, or -1 for the root.
+        edge_lengths : array of float, optional
+            Length of the edge subtending each node. All zero if None.
+        leaf_labels : sequence
+            Label of each node. Only labels of leaf nodes are used; leaves
+            labeled None belong to no taxon.
+        is_rooted : bool, default True
+            Compare rooted splits (leaf sets below edges) rather than
+            unrooted bipartitions.
+        """
+        self._taxon_indices = {}
+        for label in self._get_leaf_labels(parents, leaf_labels):
+            if label is not None:
+                self._taxon_indices.setdefault(label, len(self._taxon_indices))
+        self._is_rooted = is_rooted
+
+        keys, lengths = self._encode(parents, edge_lengths, leaf_labels)
+        self._splits = {key: index for index, key in enumerate(keys)}
+        self._lengths = lengths
+
+    @staticmethod
+    def _get_leaf_labels(
+        parents: np.ndarray,
+        leaf_labels: typing.Sequence[typing.Optional[typing.Hashable]],
+    ) -> typing.List[typing.Optional[typing.Hashable]]:
+        parents = np.asarray(parents)
+        is_leaf = np.bincount(
+            parents[parents >= 0], minlength=len(parents),
+        ) == 0
+        return [
+            label if leaf else None
+            for label, leaf in zip(leaf_labels, is_leaf)
+        ]
+
+    def _encode(
+        self: 'BipartitionIndex',
+        parents: np.ndarray,
+        edge_lengths: typing.Optional[np.ndarray],
+        leaf_labels: typing.Sequence[typing.Optional[typing.Hashable]],
+    ) -> typing.Tuple[typing.List[bytes], np.ndarray]:
+        parents = np.asarray(parents, dtype=np.int64)
+        assert (parents < 0).sum() == 1, 'tree must have exactly one root'
+        if edge_lengths is None:
+            edge_lengths = np.zeros(len(parents))
+        edge_lengths = np.nan_to_num(
+            np.asarray(edge_lengths, dtype=float), nan=0.0,
+        )
+
+        # taxa absent from the reference get bits of their own
+        extra_indices = {}
+        leaf_taxa = np.full(len(parents), -1, dtype=np.int64)
+        for node, label in enumerate(
+            self._get_leaf_labels(parents, leaf_labels),
+        ):
+            if label is None:
+                continue
+            taxon = self._taxon_indices.get(label)
+            if taxon is None:
+                taxon = extra_indices.setdefault(
+                    label, len(self._taxon_indices) + len(extra_indices),
+                )
+            leaf_taxa[node] = taxon
+
+        return _encode_splits(
+            parents,
+            edge_lengths,
+            leaf_taxa,
+            len(self._taxon_indices) + len(extra_indices),
+            self._is_rooted,
+        )
+
+    def __len__(self: 'BipartitionIndex') -> int:
+        """Number of distinct splits in the reference tree."""
+        return len(self._splits)
+
+    @property
+    def is_rooted(self: 'BipartitionIndex') -> bool:
+        return self._is_rooted
+
+    def score(
+        self: 'BipartitionIndex',
+        parents: np.ndarray,
+        edge_lengths: typing.Optional[np.ndarray],
+        leaf_labels: typing.Sequence[typing.Optional[typing.Hashable]],
+    ) -> TreeComparison:
+        """Compare a candidate tree, given as for the reference tree, against
+        the reference."""
+        keys, lengths = self._encode(parents, edge_lengths, leaf_labels)
+        matches = np.array(
+            [self._splits.get(key, -1) for key in keys], dtype=np.int64,
+        )
+        shared = matches >= 0
+        is_matched = np.zeros(len(self._lengths), dtype=bool)
+        is_matched[matches[shared]] = True
+
+        # splits found in only one tree are compared against zero length
+        differences = np.concatenate([
+            lengths[shared] - self._lengths[matches[shared]],
+            lengths[~shared],
+            self._lengths[~is_matched],
+        ])
+        return TreeComparison(
+            unweighted_robinson_foulds=int(
+                len(keys) + len(self._lengths) - 2 * shared.sum()
+            ),
+            weighted_robinson_foulds=float(np.abs(differences).sum()),
+            euclidean=float(np.sqrt((differences ** 2).sum())),
+        )
@@ -0,0 +1,13 @@
+import typing
+
+
+class TreeComparison(typing.NamedTuple):
+    """Bipartition-based distances between a candidate and a reference
+    tree, as computed by `dendropy.calculate.treecompare`."""
+
+    # number of splits found in exactly one of the two trees
+    unweighted_robinson_foulds: int
+    # sum of absolute edge length differences over all splits
+    weighted_robinson_foulds: float
+    # square root of summed squared edge length differences over all splits
+    euclidean: float
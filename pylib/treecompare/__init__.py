@@ -0,0 +1,13 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'BipartitionIndex',
+    'compare_trees',
+    'dendropy_tree_to_arrays',
+    'TreeComparison',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__)
@@ -0,0 +1,93 @@
+from concurrent import futures
+import typing
+
+import pandas as pd
+
+from .BipartitionIndex import BipartitionIndex
+from .TreeComparison import TreeComparison
+
+# reference index shared by all chunks scored in this process
+_worker_state = {}
+
+_column_names = {
+    'unweighted_robinson_foulds': 'Unweighted Robinson Foulds Distance Error',
+    'weighted_robinson_foulds': 'Weighted Robinson Foulds Distance Error',
+    'euclidean': 'Euclidean Distance Error',
+}
+
+
+def _init_worker(reference: BipartitionIndex) -> None:
+    _worker_state['reference'] = reference
+
+
+def _score_chunk(
+    candidates: typing.Sequence[typing.Tuple],
+) -> typing.List[TreeComparison]:
+    reference = _worker_state['reference']
+    return [reference.score(*candidate) for candidate in candidates]
+
+
+def compare_trees(
+    reference: typing.Union[BipartitionIndex, typing.Tuple],
+    candidates: typing.Iterable[typing.Tuple],
+    *,
+    is_rooted: bool=True,
+    num_processes: typing.Optional[int]=None,
+    chunk_size: int=8,
+) -> pd.DataFrame:
+    """Score candidate trees against a reference tree by unweighted and
+    weighted Robinson-Foulds distance and euclidean distance.
+
+    The reference tree's splits are encoded once and sent to each worker
+    process once, at startup. Candidates are scored in chunks across a
+    process pool.
+
+    Parameters
+    ----------
+    reference : BipartitionIndex or tuple
+        Encoded reference tree, or parent indices, edge lengths, and leaf
+        labels to encode (see `BipartitionIndex`).
+    candidates : iterable of tuple
+        Parent indices, edge lengths, and leaf labels of each candidate tree
+        (e.g., from `dendropy_tree_to_arrays`).
+    is_rooted : bool, default True
+        Compare rooted splits. Ignored if `reference` is already encoded.
+    num_processes : int, optional
+        Number of worker processes. Defaults to the CPU count. If 1,
+        candidates are scored serially in this process.
+    chunk_size : int, default 8
+        Number of candidates scored per task.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per candidate, in order, with columns 'Unweighted Robinson
+        Foulds Distance Error', 'Weighted Robinson Foulds Distance Error', and
+        'Euclidean Distance Error'.
+    """
+    if not isinstance(reference, BipartitionIndex):
+        reference = BipartitionIndex(*reference, is_rooted=is_rooted)
+    candidates = [*candidates]
+    chunks = [
+        candidates[begin:begin + chunk_size]
+        for begin in range(0, len(candidates), chunk_size)
+    ]
+
+    if num_processes == 1:
+        _init_worker(reference)
+        try:
+            results = [*map(_score_chunk, chunks)]
+        finally:
+            _worker_state.clear()
+    else:
+        with futures.ProcessPoolExecutor(
+            max_workers=num_processes,
+            initializer=_init_worker,
+            initargs=(reference,),
+        ) as executor:
+            results = [*executor.map(_score_chunk, chunks)]
+
+    return pd.DataFrame.from_records(
+        [comparison for chunk in results for comparison in chunk],
+        columns=TreeComparison._fields,
+    ).rename(columns=_column_names)
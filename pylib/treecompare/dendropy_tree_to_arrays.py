@@ -0,0 +1,28 @@
+import typing
+
+import numpy as np
+
+
+def dendropy_tree_to_arrays(
+    tree,
+) -> typing.Tuple[np.ndarray, np.ndarray, typing.List[typing.Optional[str]]]:
+    """Flatten a dendropy tree into the parent indices, edge lengths, and
+    leaf labels taken by `BipartitionIndex`.
+
+    Nodes are numbered in preorder. Labels are taxon labels, or None for
+    nodes without a taxon.
+    """
+    nodes = [*tree.preorder_node_iter()]
+    node_indices = {id(node): index for index, node in enumerate(nodes)}
+    parents = np.array([
+        -1 if node.parent_node is None else node_indices[id(node.parent_node)]
+        for node in nodes
+    ], dtype=np.int64)
+    edge_lengths = np.array([
+        np.nan if node.edge.length is None else node.edge.length
+        for node in nodes
+    ], dtype=float)
+    labels = [
+        None if node.taxon is None else node.taxon.label for node in nodes
+    ]
+    return parents, edge_lengths, labels
@@ -0,0 +1,11 @@
+import typing
+
+
+class UploadResult(typing.NamedTuple):
+    """Outcome of uploading one file."""
+
+    path: str
+    bucket: str
+    key: str
+    # 'uploaded', or 'skipped' if identical content was already there
+    status: str
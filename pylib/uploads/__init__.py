@@ -0,0 +1,17 @@
+from ..helpers import install_lazy_attrs
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    'get_upload_destination',
+    'stash_keyname_keys',
+    'upload_files',
+    'upload_files_async',
+    'upload_outputs',
+    'UploadResult',
+]
+
+# names are imported from their submodules on first use, so importing the
+# package does not import every submodule's dependencies
+install_lazy_attrs(__name__, __all__, {
+    'upload_files_async': 'upload_files',
+})
@@ -0,0 +1,34 @@
+import argparse
+import collections
+
+from .upload_outputs import upload_outputs
+
+parser = argparse.ArgumentParser(
+    prog='python3 -m pylib.uploads',
+    description='Upload outplots and notebooks to S3, skipping files whose '
+    'content is already there.',
+)
+parser.add_argument('directory', help='directory to upload outputs of')
+parser.add_argument(
+    '--no-recursive', dest='recursive', action='store_false',
+    help='do not upload outputs of subdirectories',
+)
+parser.add_argument(
+    '-j', '--jobs', type=int, default=20, dest='max_concurrency',
+    help='maximum number of requests in flight (default: 20)',
+)
+parser.add_argument(
+    '--endpoint-url', default=None,
+    help='S3 endpoint, for S3-compatible stores',
+)
+args = parser.parse_args()
+
+results = upload_outputs(
+    args.directory,
+    recursive=args.recursive,
+    max_concurrency=args.max_concurrency,
+    endpoint_url=args.endpoint_url,
+)
+for result in results:
+    print(result.status, f's3://{result.bucket}/{result.key}')
+print(dict(collections.Counter(result.status for result in results)))
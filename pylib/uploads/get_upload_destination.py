@@ -0,0 +1,32 @@
+import os
+import typing
+
+from keyname import keyname as kn
+
+
+def get_upload_destination(
+    path: str,
+    what: str,
+) -> typing.Optional[typing.Tuple[str, str]]:
+    """S3 bucket and key that `execute_notebooks.sh` uploads a file to.
+
+    Outplots ('plotted') take bucket and endeavor from their keyname-packed
+    file name. Notebooks ('notebooks') take them from their directory path,
+    with path separators read as keyname separators. Either way, the key is
+    `endeavor={endeavor}/stage=9+what={what}/{file name}`.
+
+    Returns
+    -------
+    tuple of str, optional
+        Bucket and key, or None if bucket or endeavor is not specified.
+    """
+    basename = os.path.basename(path)
+    if what == 'notebooks':
+        source = os.path.dirname(os.path.abspath(path)).replace('/', '+')
+    else:
+        source = basename
+    attrs = kn.unpack(source)
+    bucket, endeavor = attrs.get('bucket'), attrs.get('endeavor')
+    if not bucket or not endeavor:
+        return None
+    return bucket, f'endeavor={endeavor}/stage=9+what={what}/{basename}'
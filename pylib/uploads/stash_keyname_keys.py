@@ -0,0 +1,26 @@
+import os
+import typing
+
+from keyname import keyname as kn
+
+
+def stash_keyname_keys(path: str, keys: typing.Iterable[str]) -> str:
+    """Drop `keys` from a keyname-packed file name, moving their values to a
+    `.meta` sidecar file, like `keyname stash --move --drop`.
+
+    Returns
+    -------
+    str
+        New path of the file. The sidecar is at this path plus '.meta'.
+    """
+    keys = {*keys}
+    dirname, basename = os.path.split(path)
+    attrs = kn.unpack(basename)
+    dest = os.path.join(dirname, kn.pack({
+        k: v for k, v in attrs.items() if k not in keys
+    }))
+    stash = kn.pack({k: v for k, v in attrs.items() if k in keys})
+    os.replace(path, dest)
+    with open(f'{dest}.meta', 'w') as file:
+        file.write(f'{stash}\n')
+    return dest
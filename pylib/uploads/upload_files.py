@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import os
+import typing
+
+from .UploadResult import UploadResult
+
+
+def _calc_file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(2**20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_part(path: str, offset: int, size: int) -> bytes:
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        return file.read(size)
+
+
+async def upload_files_async(
+    uploads: typing.Iterable[typing.Tuple[str, str, str]],
+    *,
+    max_concurrency: int=20,
+    multipart_threshold: int=64 * 2**20,
+    part_size: int=16 * 2**20,
+    endpoint_url: typing.Optional[str]=None,
+) -> typing.List[UploadResult]:
+    """Coroutine version of `upload_files`."""
+    # optional, only needed to upload
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+    from botocore.exceptions import ClientError
+
+    assert part_size >= 5 * 2**20, 'S3 requires parts of at least 5 MiB'
+    loop = asyncio.get_running_loop()
+    # bounds requests in flight, and so also part buffers held in memory
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload_one(client, path: str, bucket: str, key: str):
+        digest = await loop.run_in_executor(None, _calc_file_digest, path)
+        async with semaphore:
+            try:
+                head = await client.head_object(Bucket=bucket, Key=key)
+            except ClientError as e:
+                if e.response['Error']['Code'] not in ('404', 'NoSuchKey'):
+                    raise
+            else:
+                if head.get('Metadata', {}).get('sha256') == digest:
+                    return UploadResult(path, bucket, key, 'skipped')
+
+        size = os.path.getsize(path)
+        metadata = {'sha256': digest}
+        if size < multipart_threshold:
+            async with semaphore:
+                body = await loop.run_in_executor(
+                    None, _read_part, path, 0, size,
+                )
+                await client.put_object(
+                    Bucket=bucket, Key=key, Body=body, Metadata=metadata,
+                )
+            return UploadResult(path, bucket, key, 'uploaded')
+
+        async with semaphore:
+            upload_id = (await client.create_multipart_upload(
+                Bucket=bucket, Key=key, Metadata=metadata,
+            ))['UploadId']
+
+        async def upload_part(part_number: int, offset: int) -> dict:
+            async with semaphore:
+                body = await loop.run_in_executor(
+                    None, _read_part, path, offset, part_size,
+                )
+                response = await client.upload_part(
+                    Bucket=bucket,
+                    Key=key,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=body,
+                )
+            return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+        try:
+            parts = await asyncio.gather(*(
+                upload_part(part_number, offset)
+                for part_number, offset
+                in enumerate(range(0, size, part_size), start=1)
+            ))
+            async with semaphore:
+                await client.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': parts},
+                )
+        except BaseException:
+            await client.abort_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id,
+            )
+            raise
+        return UploadResult(path, bucket, key, 'uploaded')
+
+    session = get_session()
+    async with session.create_client(
+        's3',
+        endpoint_url=endpoint_url,
+        config=AioConfig(max_pool_connections=max_concurrency),
+    ) as client:
+        return [*await asyncio.gather(*(
+            upload_one(client, path, bucket, key)
+            for path, bucket, key in uploads
+        ))]
+
+
+def upload_files(
+    uploads: typing.Iterable[typing.Tuple[str, str, str]],
+    *,
+    max_concurrency: int=20,
+    multipart_threshold: int=64 * 2**20,
+    part_size: int=16 * 2**20,
+    endpoint_url: typing.Optional[str]=None,
+) -> typing.List[UploadResult]:
+    """Upload files to S3 concurrently, through a single pooled client.
+
+    Each object is stored with the SHA-256 digest of its content as `sha256`
+    metadata. Files whose destination already holds an object with the same
+    digest are skipped. Files of at least `multipart_threshold` bytes are
+    uploaded in parts.
+
+    Parameters
+    ----------
+    uploads : iterable of (str, str, str)
+        Local path, bucket, and key of each file.
+    max_concurrency : int, default 20
+        Maximum number of requests in flight, and size of the connection
+        pool.
+    multipart_threshold : int, default 64 MiB
+        Size at which to switch to multipart upload.
+    part_size : int, default 16 MiB
+        Multipart upload part size, at least 5 MiB.
+    endpoint_url : str, optional
+        S3 endpoint, for S3-compatible stores. Defaults to AWS. Credentials
+        and region come from the usual AWS configuration.
+
+    Returns
+    -------
+    list of UploadResult
+        One per file, in order.
+    """
+    return asyncio.run(upload_files_async(
+        uploads,
+        max_concurrency=max_concurrency,
+        multipart_threshold=multipart_threshold,
+        part_size=part_size,
+        endpoint_url=endpoint_url,
+    ))
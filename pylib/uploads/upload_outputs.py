@@ -0,0 +1,75 @@
+import os
+import typing
+
+from keyname import keyname as kn
+
+from .get_upload_destination import get_upload_destination
+from .stash_keyname_keys import stash_keyname_keys
+from .upload_files import upload_files
+from .UploadResult import UploadResult
+
+
+def _find_outputs(directory: str) -> typing.List[typing.Tuple[str, str]]:
+    res = []
+    outplots_dir = os.path.join(directory, 'outplots')
+    if os.path.isdir(outplots_dir):
+        for filename in sorted(os.listdir(outplots_dir)):
+            path = os.path.join(outplots_dir, filename)
+            if filename.endswith(('.pdf', '.png')) \
+                    and '_dfdigest' in kn.unpack(filename):
+                stash_keyname_keys(path, ['_dfdigest'])
+        res.extend(
+            (os.path.join(outplots_dir, filename), 'plotted')
+            for filename in sorted(os.listdir(outplots_dir))
+            if '.pdf' in filename or '.png' in filename
+        )
+    res.extend(
+        (os.path.join(directory, filename), 'notebooks')
+        for filename in sorted(os.listdir(directory))
+        if filename.endswith('.ipynb')
+    )
+    return res
+
+
+def upload_outputs(
+    directory: str,
+    *,
+    recursive: bool=True,
+    **kwargs,
+) -> typing.List[UploadResult]:
+    """Upload outplots and notebooks as the upload branch of
+    `execute_notebooks.sh` does, in one `upload_files` call.
+
+    Outplots' `_dfdigest` keys are first stashed into `.meta` sidecar files,
+    so outplots keep stable names; sidecars are uploaded alongside. Files
+    whose bucket or endeavor cannot be determined are not uploaded.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding notebooks and an `outplots` subdirectory.
+    recursive : bool, default True
+        Also upload outputs of subdirectories, skipping hidden and symlinked
+        ones.
+    **kwargs
+        Forwarded to `upload_files`.
+    """
+    directories = [directory]
+    if recursive:
+        for dirpath, dirnames, __ in os.walk(directory):
+            dirnames[:] = sorted(
+                dirname for dirname in dirnames
+                if not dirname.startswith('.') and dirname != 'outplots'
+                and not os.path.islink(os.path.join(dirpath, dirname))
+            )
+            directories.extend(
+                os.path.join(dirpath, dirname) for dirname in dirnames
+            )
+
+    uploads = []
+    for output_dir in directories:
+        for path, what in _find_outputs(output_dir):
+            destination = get_upload_destination(path, what)
+            if destination is not None:
+                uploads.append((path, *destination))
+    return upload_files(uploads, **kwargs)